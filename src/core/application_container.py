@@ -11,6 +11,7 @@ through dependency substitution.
 
 import os
 import sys
+import threading
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from rich.console import Console
@@ -50,6 +51,10 @@ class ApplicationContainer:
         """
         self._test_mode = test_mode
 
+        # Stateless services shared by every file and worker, built on first use
+        self._shared_services: Dict[Any, Any] = {}
+        self._shared_services_lock = threading.Lock()
+
         if console is not None:
             # Inject custom console (typically for testing)
             ConsoleManager.set_console_for_testing(console)
@@ -123,6 +128,36 @@ class ApplicationContainer:
         """
         return ConsoleManager.get_console_config()
 
+    def get_extraction_service(self, ocr_lang: str = "eng") -> Optional[Any]:
+        """
+        Get the shared content extraction service for an OCR language.
+
+        Extraction processors keep no per-file state, so one instance serves
+        every file and worker thread; building it resolves dependencies and
+        OCR setup once instead of per file.
+
+        Args:
+            ocr_lang: OCR language for content extraction
+
+        Returns:
+            ExtractionService: Shared extraction service
+        """
+        key = ("extraction", ocr_lang)
+        service = self._shared_services.get(key)
+        if service is not None:
+            return service
+
+        with self._shared_services_lock:
+            if key not in self._shared_services:
+                try:
+                    from domains.content.extraction_service import ExtractionService
+
+                    self._shared_services[key] = ExtractionService(ocr_lang)
+                except ImportError:
+                    self._warn_about_missing_domain_services("content")
+                    return None
+            return self._shared_services[key]
+
     def create_content_service(
         self, ocr_lang: str = "eng", max_content_length: int = 2000
     ) -> Optional[Any]:
@@ -140,7 +175,11 @@ class ApplicationContainer:
         try:
             from domains.content.content_service import ContentService
 
-            return ContentService(ocr_lang, max_content_length)
+            return ContentService(
+                ocr_lang,
+                max_content_length,
+                extraction_service=self.get_extraction_service(ocr_lang),
+            )
         except ImportError:
             # Fallback for when domain services not available
             self._warn_about_missing_domain_services("content")
@@ -185,6 +224,45 @@ class ApplicationContainer:
             self._warn_about_missing_domain_services("organization")
             return None
 
+    def create_template_naming_service(
+        self,
+        target_folder: str,
+        confidence_threshold: Optional[float] = None,
+        audit_rate: Optional[float] = None,
+    ) -> Optional[Any]:
+        """
+        Create the template naming fast path for an output folder.
+
+        Args:
+            target_folder: Output folder whose learned templates are used
+            confidence_threshold: Template confidence required to skip the AI (None: default)
+            audit_rate: Share of template names audited through the AI (None: default)
+
+        Returns:
+            TemplateNamingService: Service backed by the folder's LearningService
+        """
+        try:
+            from domains.organization.learning_service import LearningService
+            from domains.organization.template_naming import (
+                TemplateNamingConfig,
+                TemplateNamingService,
+            )
+
+            settings = {
+                name: value
+                for name, value in (
+                    ("confidence_threshold", confidence_threshold),
+                    ("audit_rate", audit_rate),
+                )
+                if value is not None
+            }
+            return TemplateNamingService(
+                LearningService(target_folder), TemplateNamingConfig(**settings)
+            )
+        except ImportError:
+            self._warn_about_missing_domain_services("organization")
+            return None
+
     def create_application_kernel(self) -> Optional[Any]:
         """
         Create application kernel with all domain services wired.
@@ -271,6 +349,7 @@ class TestApplicationContainer(ApplicationContainer):
         """
         # Clear cached services
         self._cached_services.clear()
+        self._shared_services.clear()
         self._service_overrides.clear()
 
         # Reset Console Manager state
@@ -430,6 +509,7 @@ def create_function_scoped_container(capture_output: bool = True) -> TestApplica
 
 # Global container instance for application-wide access
 _global_container: Optional[ApplicationContainer] = None
+_global_container_lock = threading.Lock()
 
 
 def get_global_container() -> ApplicationContainer:
@@ -442,9 +522,10 @@ def get_global_container() -> ApplicationContainer:
         ApplicationContainer: Global container instance
     """
     global _global_container  # pylint: disable=global-statement
-    if _global_container is None:
-        _global_container = ApplicationContainer()
-    return _global_container
+    with _global_container_lock:
+        if _global_container is None:
+            _global_container = ApplicationContainer()
+        return _global_container
 
 
 def set_global_container(container: ApplicationContainer) -> None:
@@ -13,19 +13,19 @@ Each domain contains:
 """
 
 # Import main domain services
-try:
-    from .content.content_service import ContentService
-except ImportError:
-    ContentService = None
+from shared.infrastructure.import_utilities import lazy_exports
 
-try:
-    from .ai_integration.ai_integration_service import AIIntegrationService
-except ImportError:
-    AIIntegrationService = None
-
-try:
-    from .organization.organization_service import OrganizationService
-except ImportError:
-    OrganizationService = None
+# Services are imported on first access: importing any domain submodule (e.g. for
+# provider names in CLI help) must not load PyMuPDF, scikit-learn or spaCy.
+# Services whose dependencies are missing are exported as None.
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "ContentService": ".content.content_service",
+        "AIIntegrationService": ".ai_integration.ai_integration_service",
+        "OrganizationService": ".organization.organization_service",
+    },
+    fallback=None,
+)
 
 __all__ = ["ContentService", "AIIntegrationService", "OrganizationService"]
@@ -8,11 +8,27 @@ Services:
 - ProviderService: Unified provider management and factory
 - ModelService: Hardware detection and model selection
 - RequestService: API calls, retry logic, and error handling
+- ConcurrencyController: Adaptive in-flight limits per provider and model
 """
 
-from .ai_integration_service import AIIntegrationService
-from .model_service import ModelService
-from .provider_service import ProviderService
-from .request_service import RequestService
+from shared.infrastructure.import_utilities import lazy_exports
 
-__all__ = ["ProviderService", "ModelService", "RequestService", "AIIntegrationService"]
+# Imported on first access (see domains/__init__.py)
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "AIIntegrationService": ".ai_integration_service",
+        "ConcurrencyController": ".concurrency_controller",
+        "ModelService": ".model_service",
+        "ProviderService": ".provider_service",
+        "RequestService": ".request_service",
+    },
+)
+
+__all__ = [
+    "ProviderService",
+    "ModelService",
+    "RequestService",
+    "AIIntegrationService",
+    "ConcurrencyController",
+]
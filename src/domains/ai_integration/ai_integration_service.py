@@ -7,12 +7,19 @@ Provides clean interface for AI operations across the application.
 
 import logging
 import os
+import threading
 import time
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
+from shared.infrastructure.filename_config import CHARS_PER_TOKEN_AVERAGE, MAX_OUTPUT_TOKENS
+from shared.infrastructure.tracing import span
+
 # Import request types that are used at runtime
 from .request_service import RequestResult, RequestStatus
 
+# Names validate_generated_filename falls back to; a hedged request keeps waiting for better
+PLACEHOLDER_FILENAMES = ("unnamed_document", "document")
+
 if TYPE_CHECKING:
     # Type hints only - not runtime imports
     from .model_service import ModelInfo, ModelService, SystemCapabilities
@@ -32,6 +39,9 @@ class AIIntegrationService:
         self._provider_service = None
         self._model_service = None
         self._request_service = None
+        self._request_service_lock = threading.Lock()
+        self._cascade_router = None
+        self._local_models_installed: Dict[str, bool] = {}
 
         # Cache for active providers
         self._active_providers: Dict[str, Any] = {}
@@ -56,13 +66,26 @@ class AIIntegrationService:
 
     @property
     def request_service(self):
-        """Lazy-load request service."""
+        """Lazy-load request service (once, since it holds the concurrency limits)."""
         if self._request_service is None:
-            from .request_service import RequestService
+            with self._request_service_lock:
+                if self._request_service is None:
+                    from .request_service import RequestService
 
-            self._request_service = RequestService(self.retry_config)
+                    self._request_service = RequestService(self.retry_config)
         return self._request_service
 
+    @property
+    def cascade_router(self):
+        """Lazy-load the cascade router (once, since it holds the routing statistics)."""
+        if self._cascade_router is None:
+            with self._request_service_lock:
+                if self._cascade_router is None:
+                    from .cascade_router import CascadeRouter
+
+                    self._cascade_router = CascadeRouter(self.generate_filename_with_ai)
+        return self._cascade_router
+
     def get_provider_capabilities(self) -> Dict[str, Any]:
         """Get comprehensive provider capabilities."""
         return {
@@ -124,6 +147,9 @@ class AIIntegrationService:
         provider: str,
         model: Optional[str] = None,
         api_key: Optional[str] = None,
+        hedge: bool = False,
+        hedge_provider: Optional[str] = None,
+        hedge_model: Optional[str] = None,
     ) -> Any:
         """Generate filename using AI with proper error handling and retry logic.
 
@@ -133,22 +159,48 @@ class AIIntegrationService:
             provider: AI provider to use
             model: Model to use (optional)
             api_key: API key (optional)
+            hedge: Send a duplicate request when an attempt is slower than usual
+            hedge_provider: Provider for the duplicate (implies ``hedge``; defaults to ``provider``)
+            hedge_model: Model for the duplicate (defaults to the hedge provider's default)
 
         Returns:
             RequestResult with generated filename or error information
         """
         try:
+            if model is None:
+                model = self.provider_service.get_default_model(provider)
+
             # Setup provider
-            provider_instance = self.setup_provider(provider, model, api_key)
+            with span("ai.setup_provider", provider=provider):
+                provider_instance = self.setup_provider(provider, model, api_key)
 
             # Create request function
             def make_request() -> str:
                 return provider_instance.generate_filename(content, original_filename)
 
+            hedge_func, hedge_key = None, None
+            if hedge or hedge_provider:
+                hedge_func, hedge_key = self._hedge_request(
+                    content,
+                    original_filename,
+                    provider,
+                    model,
+                    api_key,
+                    make_request,
+                    hedge_provider,
+                    hedge_model,
+                )
+
             # Execute request with retry logic
             request_id = f"filename_gen_{hash(original_filename)}_{int(time.time())}"
             result = self.request_service.make_ai_request(
-                provider_func=make_request, request_id=request_id
+                provider_func=make_request,
+                request_id=request_id,
+                concurrency_key=f"{provider}:{model}",
+                hedge_func=hedge_func,
+                hedge_key=hedge_key,
+                hedge_cost=len(content) / CHARS_PER_TOKEN_AVERAGE + MAX_OUTPUT_TOKENS,
+                validator=_is_usable_filename,
             )
 
             return result
@@ -159,6 +211,109 @@ class AIIntegrationService:
                 status=RequestStatus.FAILED, error=str(e), attempts=1, total_time=0.0
             )
 
+    def generate_filename_with_cascade(  # pylint: disable=too-many-arguments
+        self,
+        content: str,
+        original_filename: str,
+        provider: str,
+        model: Optional[str] = None,
+        api_key: Optional[str] = None,
+        extraction_quality: Optional[str] = None,
+        first_tier: Optional[str] = None,
+        **request_options: Any,
+    ) -> Any:
+        """Generate filename with a cheap model first, escalating to ``provider``/``model``.
+
+        Args:
+            content: Document content to analyze
+            original_filename: Original filename for context
+            provider: AI provider of the strong tier
+            model: Model of the strong tier (optional)
+            api_key: API key for the provider (optional)
+            extraction_quality: ContentQuality value; FAIR and POOR go to the strong tier
+            first_tier: Cheap tier as "provider:model" or a model of ``provider``
+            **request_options: Passed to generate_filename_with_ai (e.g. hedging)
+
+        Returns:
+            RequestResult with generated filename or error information
+        """
+        from .cascade_router import cascade_tiers
+
+        tiers = cascade_tiers(
+            provider,
+            model,
+            self.provider_service.get_default_model(provider),
+            first_tier,
+            is_available=self._cascade_tier_available,
+        )
+        return self.cascade_router.generate_filename(
+            content,
+            original_filename,
+            tiers,
+            api_key=api_key,
+            extraction_quality=extraction_quality,
+            **request_options,
+        )
+
+    def _cascade_tier_available(self, tier: Any) -> bool:
+        """Whether a cheap cascade tier can be used; local models must be installed."""
+        if tier.provider != "local":
+            return True
+        with self._request_service_lock:
+            installed = self._local_models_installed.get(tier.model)
+        if installed is None:
+            installed = self._local_model_installed(tier.model)
+            with self._request_service_lock:
+                self._local_models_installed[tier.model] = installed
+        return installed
+
+    def _local_model_installed(self, model: str) -> bool:
+        """Ask Ollama (via ModelManager) whether a local model has been pulled."""
+        try:
+            from shared.infrastructure.model_manager import ModelManager, ModelStatus
+            from shared.infrastructure.model_name_mapper import ModelNameMapper
+
+            info = ModelManager().get_model_info(ModelNameMapper.to_ollama_format(model))
+            return info is not None and info.status == ModelStatus.AVAILABLE
+        except Exception as e:
+            self.logger.debug("Could not check local model %s: %s", model, e)
+            return False
+
+    def _hedge_request(  # pylint: disable=too-many-arguments
+        self,
+        content: str,
+        original_filename: str,
+        provider: str,
+        model: str,
+        api_key: Optional[str],
+        make_request,
+        hedge_provider: Optional[str],
+        hedge_model: Optional[str],
+    ):
+        """Duplicate request for hedging, and its "provider:model" key.
+
+        A secondary provider is only set up if a duplicate is actually sent.
+        """
+        hedge_provider = hedge_provider or provider
+        if hedge_model is None:
+            hedge_model = (
+                model
+                if hedge_provider == provider
+                else self.provider_service.get_default_model(hedge_provider)
+            )
+        hedge_key = f"{hedge_provider}:{hedge_model}"
+        if hedge_key == f"{provider}:{model}":
+            return make_request, hedge_key
+
+        hedge_api_key = api_key if hedge_provider == provider else None
+
+        def make_hedge_request() -> str:
+            with span("ai.setup_provider", provider=hedge_provider):
+                secondary = self.setup_provider(hedge_provider, hedge_model, hedge_api_key)
+            return secondary.generate_filename(content, original_filename)
+
+        return make_hedge_request, hedge_key
+
     def validate_provider_setup(
         self, provider: str, api_key: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -375,6 +530,14 @@ class AIIntegrationService:
             "provider_service": self.provider_service.get_provider_statistics(),
             "model_service": self.model_service.get_system_summary(),
             "request_service": self.request_service.get_request_statistics(),
+            "cascade": (
+                self._cascade_router.get_statistics() if self._cascade_router else None
+            ),
             "active_providers": len(self._active_providers),
             "cached_providers": list(self._active_providers.keys()),
         }
+
+
+def _is_usable_filename(filename: Optional[str]) -> bool:
+    """Whether a generated filename is a real name rather than a placeholder."""
+    return bool(filename) and filename not in PLACEHOLDER_FILENAMES
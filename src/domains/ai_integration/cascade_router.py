@@ -0,0 +1,305 @@
+"""
+Cascade Router
+
+Names documents with a cheap, fast model first and escalates to a stronger
+model only when the cheap answer is not good enough: the request failed,
+``validate_generated_filename`` would change the name, the name is generic
+(``document``, ``scan_001``), or extraction quality is FAIR or POOR, in
+which case the cheap tier is skipped. Escalation only ever goes to the
+configured model; when that is the cheap model, or the cheap model is not
+available (e.g. a local model that was never pulled), the cascade is a single
+tier. A cheap tier that reports its model missing escalates at once and is
+skipped for the rest of the run. Routing decisions, escalation rates and
+per-tier latency are recorded.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from shared.infrastructure.filename_config import validate_generated_filename
+
+from .request_service import RequestResult, RequestStatus, is_model_not_found
+
+# First-tier model per provider when none is configured
+CHEAP_MODELS = {
+    "openai": "gpt-5-mini",
+    "claude": "claude-3.5-haiku",
+    "gemini": "gemini-2.0-flash",
+    "local": "gemma2-2b",
+}
+
+# Words that say nothing about a document; names made only of these (and numbers) are generic
+GENERIC_WORDS = frozenset(
+    {
+        "copy",
+        "doc",
+        "document",
+        "documents",
+        "file",
+        "image",
+        "img",
+        "new",
+        "page",
+        "pdf",
+        "scan",
+        "scanned",
+        "unnamed",
+        "untitled",
+    }
+)
+
+ESCALATE_QUALITIES = ("fair", "poor")
+
+_NAME_PARTS = re.compile(r"[_\-]+")
+
+
+@dataclass(frozen=True)
+class CascadeTier:
+    """One model of the cascade."""
+
+    provider: str
+    model: str
+
+    @property
+    def key(self) -> str:
+        """Provider and model, e.g. "openai:gpt-5-mini"."""
+        return f"{self.provider}:{self.model}"
+
+
+@dataclass
+class CascadeConfig:
+    """Configuration for the model cascade."""
+
+    escalate_qualities: Tuple[str, ...] = ESCALATE_QUALITIES
+    generic_words: frozenset = field(default_factory=lambda: GENERIC_WORDS)
+    latency_window: int = 500
+    history_size: int = 200
+
+
+def cascade_tiers(
+    provider: str,
+    model: Optional[str],
+    default_model: str,
+    first_tier: Optional[str] = None,
+    is_available: Optional[Callable[[CascadeTier], bool]] = None,
+) -> List[CascadeTier]:
+    """
+    Tiers for a run, cheapest first.
+
+    Args:
+        provider: Configured provider
+        model: Configured model (None for the provider's default)
+        default_model: The provider's default model
+        first_tier: First-tier override, "provider:model" or a model of ``provider``
+        is_available: Check whether the cheap tier's model can be used (optional)
+
+    Returns:
+        Cheap and configured tiers, or only the configured tier if the provider has
+        no cheaper model, the configured model is the cheap one or the cheap model
+        is not available
+    """
+    strong = CascadeTier(provider, model or default_model)
+    if first_tier:
+        cheap_provider, _, cheap_model = first_tier.rpartition(":")
+        cheap = CascadeTier(cheap_provider or provider, cheap_model)
+    elif provider in CHEAP_MODELS:
+        cheap = CascadeTier(provider, CHEAP_MODELS[provider])
+    else:
+        return [strong]
+
+    if cheap == strong:
+        return [strong]
+    if is_available is not None and not is_available(cheap):
+        return [strong]
+    return [cheap, strong]
+
+
+def escalation_reason(filename: Optional[str], generic_words=GENERIC_WORDS) -> Optional[str]:
+    """Why a generated filename is not good enough, or None if it is."""
+    if not filename:
+        return "invalid"
+    words = [
+        word
+        for word in _NAME_PARTS.split(filename.lower())
+        if word and not word.isdigit() and word not in generic_words
+    ]
+    if not words:
+        return "generic"
+    if validate_generated_filename(filename) != filename:
+        return "invalid"
+    return None
+
+
+class CascadeRouter:
+    """Routes filename requests through cheap-then-strong model tiers."""
+
+    def __init__(
+        self,
+        generate: Callable[..., RequestResult],
+        config: Optional[CascadeConfig] = None,
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            generate: Single-model request, called as
+                ``generate(content, original_filename, provider, model, api_key, **options)``
+            config: Cascade configuration
+        """
+        self.generate = generate
+        self.config = config or CascadeConfig()
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._logged_tiers: set = set()
+        self._missing_tiers: set = set()  # Tiers whose model the provider reported missing
+        self._decisions: Deque[Dict[str, Any]] = deque(maxlen=self.config.history_size)
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._tier_counts: Dict[str, Counter] = {}
+        self._reasons: Counter = Counter()
+        self._requests = 0
+        self._escalated = 0
+
+    def generate_filename(  # pylint: disable=too-many-arguments
+        self,
+        content: str,
+        original_filename: str,
+        tiers: List[CascadeTier],
+        api_key: Optional[str] = None,
+        extraction_quality: Optional[str] = None,
+        **options: Any,
+    ) -> RequestResult:
+        """
+        Generate a filename, escalating through ``tiers`` until one is good enough.
+
+        Args:
+            content: Document content to analyze
+            original_filename: Original filename for context
+            tiers: Models to try, cheapest first; the last tier's answer is final
+            api_key: API key for tiers on the configured (last) tier's provider
+            extraction_quality: ContentQuality value of the extraction, if known
+            **options: Passed to every request (e.g. hedging)
+
+        Returns:
+            RequestResult of the accepted tier; metadata names the tier and the
+            escalation reason
+        """
+        self._log_tiers(tiers)
+        start_index, reason = 0, None
+        if extraction_quality in self.config.escalate_qualities and len(tiers) > 1:
+            start_index, reason = len(tiers) - 1, f"quality_{extraction_quality}"
+
+        steps = []
+        attempts, total_time = 0, 0.0
+        result = RequestResult(status=RequestStatus.FAILED, error="No cascade tiers")
+        for index in range(start_index, len(tiers)):
+            tier = tiers[index]
+            if index < len(tiers) - 1 and tier.key in self._missing_tiers:
+                reason = reason or "model_not_found"
+                continue
+            tier_api_key = api_key if tier.provider == tiers[-1].provider else None
+            started = time.monotonic()
+            result = self.generate(
+                content, original_filename, tier.provider, tier.model, tier_api_key, **options
+            )
+            latency = time.monotonic() - started
+            attempts += result.attempts
+            total_time += result.total_time
+
+            if result.status != RequestStatus.SUCCESS:
+                outcome = "failed"
+                if index < len(tiers) - 1 and is_model_not_found(result.error):
+                    outcome = "model_not_found"
+                    self._mark_missing(tier)
+            else:
+                outcome = escalation_reason(result.content, self.config.generic_words) or "accepted"
+            steps.append({"tier": tier.key, "outcome": outcome, "latency_s": round(latency, 3)})
+            self._record_tier(tier.key, outcome, latency)
+            if outcome == "accepted" or index == len(tiers) - 1:
+                break
+            reason = reason or outcome
+
+        self._record_decision(original_filename, extraction_quality, steps, reason)
+        result.attempts = attempts
+        result.total_time = total_time
+        result.metadata.update(
+            {"cascade_tier": steps[-1]["tier"] if steps else None, "escalation_reason": reason}
+        )
+        return result
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Escalation rate and reasons, per-tier outcomes and latency, recent decisions."""
+        with self._lock:
+            tiers = {}
+            for key, counts in self._tier_counts.items():
+                latencies = sorted(self._latencies[key])
+                tiers[key] = {
+                    **counts,
+                    "p50_latency_s": round(latencies[len(latencies) // 2], 3),
+                    "p95_latency_s": round(latencies[int(0.95 * (len(latencies) - 1))], 3),
+                }
+            return {
+                "requests": self._requests,
+                "escalated": self._escalated,
+                "escalation_rate": (
+                    round(self._escalated / self._requests, 3) if self._requests else 0.0
+                ),
+                "escalation_reasons": dict(self._reasons),
+                "tiers": tiers,
+                "recent_decisions": list(self._decisions),
+            }
+
+    def _log_tiers(self, tiers: List[CascadeTier]) -> None:
+        """Log each tier list the first time it is used."""
+        keys = tuple(tier.key for tier in tiers)
+        with self._lock:
+            if keys in self._logged_tiers:
+                return
+            self._logged_tiers.add(keys)
+        if len(keys) > 1:
+            self.logger.info("Model cascade: %s", " -> ".join(keys))
+        else:
+            self.logger.info("Model cascade: single tier %s (no cheaper model)", "".join(keys))
+
+    def _mark_missing(self, tier: CascadeTier) -> None:
+        """Skip a tier whose model does not exist for the rest of the run."""
+        with self._lock:
+            if tier.key in self._missing_tiers:
+                return
+            self._missing_tiers.add(tier.key)
+        self.logger.warning("Model cascade: %s is not available, skipping that tier", tier.key)
+
+    def _record_tier(self, key: str, outcome: str, latency: float) -> None:
+        with self._lock:
+            counts = self._tier_counts.setdefault(key, Counter())
+            counts["requests"] += 1
+            counts[outcome] += 1
+            self._latencies.setdefault(key, deque(maxlen=self.config.latency_window)).append(
+                latency
+            )
+
+    def _record_decision(
+        self,
+        original_filename: str,
+        extraction_quality: Optional[str],
+        steps: List[Dict[str, Any]],
+        reason: Optional[str],
+    ) -> None:
+        with self._lock:
+            self._requests += 1
+            if reason:
+                self._escalated += 1
+                self._reasons[reason] += 1
+            self._decisions.append(
+                {
+                    "file": original_filename,
+                    "extraction_quality": extraction_quality,
+                    "steps": steps,
+                    "final_tier": steps[-1]["tier"] if steps else None,
+                    "escalation_reason": reason,
+                }
+            )
@@ -0,0 +1,394 @@
+"""
+Concurrency Controller
+
+Adaptive limit on in-flight AI requests, kept per provider and model.
+
+The limit follows additive-increase / multiplicative-decrease (AIMD): each
+window of healthy requests (as many as the current limit) raises it by one
+while the recent error rate stays low, and a rate limit (HTTP 429), a
+timeout or a p95 latency far above the best observed p95 halves it. Only
+requests started after the last cut can cut again, so one burst of failures
+counts as one congestion signal, and only requests started under the
+current limit count towards raising it. When the provider SDK attaches the HTTP
+response to its exception, Retry-After and rate-limit reset headers pause
+new requests for that provider and model until the reset.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from shared.infrastructure.tracing import span
+from shared.infrastructure.worker_sizing import ConcurrencyLimit, get_worker_sizing
+
+RATE_LIMIT_INDICATORS = (
+    "rate limit",
+    "rate_limit",
+    "ratelimit",
+    "too many requests",
+    "429",
+    "quota",
+    "throttl",
+)
+TIMEOUT_INDICATORS = ("timeout", "timed out")
+
+# Reset headers consulted once the matching "remaining" header reaches zero
+RATE_LIMIT_RESET_HEADERS = (
+    ("x-ratelimit-remaining-requests", "x-ratelimit-reset-requests"),
+    ("x-ratelimit-remaining-tokens", "x-ratelimit-reset-tokens"),
+    ("anthropic-ratelimit-requests-remaining", "anthropic-ratelimit-requests-reset"),
+    ("anthropic-ratelimit-tokens-remaining", "anthropic-ratelimit-tokens-reset"),
+)
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_RETRY_DELAY = re.compile(r"retryDelay['\"]?\s*[:=]\s*['\"]?(\d+(?:\.\d+)?)s")
+
+
+@dataclass
+class ConcurrencyConfig:  # pylint: disable=too-many-instance-attributes
+    """Configuration for adaptive request concurrency."""
+
+    initial_limit: int = 2
+    min_limit: int = 1
+    max_limit: Optional[int] = None  # None uses the worker sizing policy's ai_in_flight
+    decrease_factor: float = 0.5
+    latency_window: int = 20  # Recent requests used for p95 and the error rate
+    min_latency_samples: int = 5
+    latency_growth: float = 2.0  # p95 above this multiple of the best p95 counts as congestion
+    max_error_rate: float = 0.2  # Above this, the limit stops growing
+    max_pause_s: float = 300.0  # Upper bound for Retry-After pauses
+    history_size: int = 100
+
+
+def classify_error(error: BaseException) -> str:
+    """Congestion class of a failed request: "rate_limit", "timeout" or "error"."""
+    for exc in _exception_chain(error):
+        if _status_code(exc) == 429:
+            return "rate_limit"
+    message = " ".join(str(exc).lower() for exc in _exception_chain(error))
+    if any(indicator in message for indicator in RATE_LIMIT_INDICATORS):
+        return "rate_limit"
+    if any(isinstance(exc, TimeoutError) for exc in _exception_chain(error)) or any(
+        indicator in message for indicator in TIMEOUT_INDICATORS
+    ):
+        return "timeout"
+    return "error"
+
+
+def retry_after_from_error(error: BaseException) -> Optional[float]:
+    """
+    Seconds the provider asked to wait, from the exception or the ones it wraps.
+
+    Reads ``retry-after-ms``, ``retry-after`` (seconds or HTTP date), OpenAI
+    and Anthropic rate-limit reset headers whose remaining count is zero, and
+    the ``retryDelay`` of Gemini error details.
+
+    Returns:
+        Seconds to wait, or None if the provider gave no hint
+    """
+    for exc in _exception_chain(error):
+        headers = _response_headers(exc)
+        if headers:
+            delay = _retry_after_from_headers(headers)
+            if delay is not None:
+                return delay
+        details = getattr(exc, "details", None)
+        if details:
+            match = _RETRY_DELAY.search(str(details))
+            if match:
+                return float(match.group(1))
+    return None
+
+
+def _exception_chain(error: BaseException) -> List[BaseException]:
+    """The exception and those it was raised from (providers wrap SDK errors)."""
+    chain: List[BaseException] = []
+    current: Optional[BaseException] = error
+    while current is not None and current not in chain and len(chain) < 5:
+        chain.append(current)
+        current = current.__cause__ or current.__context__
+    return chain
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    for candidate in (
+        getattr(exc, "status_code", None),
+        getattr(getattr(exc, "response", None), "status_code", None),
+        getattr(exc, "code", None),
+    ):
+        if isinstance(candidate, int):
+            return candidate
+    return None
+
+
+def _response_headers(exc: BaseException) -> Optional[Dict[str, str]]:
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if headers is None:
+        return None
+    try:
+        return {str(name).lower(): str(value) for name, value in headers.items()}
+    except (AttributeError, TypeError):
+        return None
+
+
+def _retry_after_from_headers(headers: Dict[str, str]) -> Optional[float]:
+    if "retry-after-ms" in headers:
+        try:
+            return float(headers["retry-after-ms"]) / 1000
+        except ValueError:
+            pass
+    if "retry-after" in headers:
+        value = headers["retry-after"].strip()
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            try:
+                reset = parsedate_to_datetime(value)
+                return max(0.0, (reset - datetime.now(timezone.utc)).total_seconds())
+            except (TypeError, ValueError):
+                pass
+
+    delays = []
+    for remaining_header, reset_header in RATE_LIMIT_RESET_HEADERS:
+        if headers.get(remaining_header, "").strip() == "0" and reset_header in headers:
+            delay = _parse_reset(headers[reset_header])
+            if delay is not None:
+                delays.append(delay)
+    return max(delays) if delays else None
+
+
+def _parse_reset(value: str) -> Optional[float]:
+    """Parse a reset header: a duration like "6m0s" / "20ms" or an RFC 3339 timestamp."""
+    value = value.strip()
+    parts = _DURATION_PART.findall(value)
+    if parts and "".join(number + unit for number, unit in parts) == value:
+        scale = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+        return sum(float(number) * scale[unit] for number, unit in parts)
+    try:
+        reset = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if reset.tzinfo is None:
+            reset = reset.replace(tzinfo=timezone.utc)
+        return max(0.0, (reset - datetime.now(timezone.utc)).total_seconds())
+    except ValueError:
+        return None
+
+
+class AdaptiveLimit:  # pylint: disable=too-many-instance-attributes
+    """AIMD limit and request statistics for one provider and model."""
+
+    def __init__(self, key: str, config: ConcurrencyConfig, max_limit: int):
+        """
+        Initialize the limit.
+
+        Args:
+            key: Provider and model, e.g. "openai:gpt-5-mini"
+            config: Controller configuration
+            max_limit: Ceiling for additive increases
+        """
+        self.key = key
+        self.config = config
+        self.max_limit = max(config.min_limit, max_limit)
+        self.limit = min(max(config.initial_limit, config.min_limit), self.max_limit)
+        self.gate = ConcurrencyLimit(self.limit)
+
+        self._lock = threading.Lock()
+        self._latencies: Deque[float] = deque(maxlen=config.latency_window)
+        self._outcomes: Deque[bool] = deque(maxlen=config.latency_window)
+        self._best_p95: Optional[float] = None
+        self._healthy_since_change = 0
+        self._changed_at = 0.0
+        self._last_decrease_at = 0.0
+        self._paused_until = 0.0
+        self.counters = {
+            "requests": 0,
+            "successes": 0,
+            "failures": 0,
+            "rate_limited": 0,
+            "timeouts": 0,
+            "increases": 0,
+            "decreases": 0,
+        }
+        self.history: Deque[Tuple[float, int, str]] = deque(maxlen=config.history_size)
+        self.history.append((time.time(), self.limit, "initial"))
+
+    def set_max_limit(self, max_limit: int) -> None:
+        """Change the ceiling (a new run may plan a different ``ai_in_flight``)."""
+        with self._lock:
+            self.max_limit = max(self.config.min_limit, max_limit)
+            if self.limit > self.max_limit:
+                self._set_limit(self.max_limit, "ceiling")
+
+    def acquire(self) -> None:
+        """Wait out any Retry-After pause, then for a free slot."""
+        while True:
+            remaining = self._paused_until - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(remaining, 1.0))
+        self.gate.acquire()
+
+    def release(self) -> None:
+        """Give a slot back."""
+        self.gate.release()
+
+    def on_success(self, started_at: float) -> None:
+        """Record a successful request that started at ``started_at`` (monotonic)."""
+        latency = time.monotonic() - started_at
+        with self._lock:
+            self.counters["requests"] += 1
+            self.counters["successes"] += 1
+            self._outcomes.append(True)
+            self._latencies.append(latency)
+
+            p95 = self._p95()
+            if p95 is not None:
+                if self._best_p95 is None or p95 < self._best_p95:
+                    self._best_p95 = p95
+                elif p95 > self._best_p95 * self.config.latency_growth:
+                    if self._decrease(started_at, f"p95 {p95:.2f}s"):
+                        self._latencies.clear()  # Judge the new limit on fresh samples
+                    return
+
+            if started_at < self._changed_at:
+                return  # Started under the previous limit; says nothing about this one
+            self._healthy_since_change += 1
+            if (
+                self._healthy_since_change >= self.limit
+                and self.limit < self.max_limit
+                and self._error_rate() <= self.config.max_error_rate
+            ):
+                self._set_limit(self.limit + 1, "healthy")
+                self.counters["increases"] += 1
+
+    def on_failure(self, error: BaseException, started_at: float) -> None:
+        """Record a failed request that started at ``started_at`` (monotonic)."""
+        kind = classify_error(error)
+        with self._lock:
+            self.counters["requests"] += 1
+            self.counters["failures"] += 1
+            self._outcomes.append(False)
+
+            if kind == "rate_limit":
+                self.counters["rate_limited"] += 1
+                retry_after = retry_after_from_error(error)
+                if retry_after:
+                    pause = min(retry_after, self.config.max_pause_s)
+                    self._paused_until = max(self._paused_until, time.monotonic() + pause)
+            elif kind == "timeout":
+                self.counters["timeouts"] += 1
+
+            if kind in ("rate_limit", "timeout"):
+                self._decrease(started_at, kind)
+
+    def statistics(self) -> Dict[str, Any]:
+        """Current limit, latency percentiles, counters and limit history."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            return {
+                "limit": self.limit,
+                "max_limit": self.max_limit,
+                "in_flight": self.gate.active,
+                "paused_for_s": round(max(0.0, self._paused_until - time.monotonic()), 2),
+                "p50_latency_s": _percentile(latencies, 50),
+                "p95_latency_s": _percentile(latencies, 95),
+                "best_p95_latency_s": self._best_p95,
+                "error_rate": self._error_rate(),
+                **self.counters,
+                "history": [
+                    {"time": timestamp, "limit": limit, "reason": reason}
+                    for timestamp, limit, reason in self.history
+                ],
+            }
+
+    def _decrease(self, started_at: float, reason: str) -> bool:
+        """Cut the limit unless the request started before the previous cut."""
+        if started_at < self._last_decrease_at:
+            return False
+        self._last_decrease_at = time.monotonic()
+        self._set_limit(int(self.limit * self.config.decrease_factor), reason)
+        self.counters["decreases"] += 1
+        return True
+
+    def _set_limit(self, limit: int, reason: str) -> None:
+        limit = min(max(limit, self.config.min_limit), self.max_limit)
+        self._healthy_since_change = 0
+        self._changed_at = time.monotonic()
+        if limit == self.limit:
+            return
+        logging.debug("AI concurrency for %s: %d -> %d (%s)", self.key, self.limit, limit, reason)
+        self.limit = limit
+        self.gate.set_limit(limit)
+        self.history.append((time.time(), limit, reason))
+
+    def _p95(self) -> Optional[float]:
+        if len(self._latencies) < self.config.min_latency_samples:
+            return None
+        return _percentile(sorted(self._latencies), 95)
+
+    def _error_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return round(self._outcomes.count(False) / len(self._outcomes), 3)
+
+
+def _percentile(sorted_values: List[float], percent: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(percent / 100 * (len(sorted_values) - 1))))
+    return round(sorted_values[index], 4)
+
+
+class ConcurrencyController:
+    """Adaptive in-flight limits for AI requests, one per provider and model."""
+
+    def __init__(self, config: Optional[ConcurrencyConfig] = None):
+        """Initialize controller with configuration."""
+        self.config = config or ConcurrencyConfig()
+        self._limits: Dict[str, AdaptiveLimit] = {}
+        self._lock = threading.Lock()
+
+    def limiter(self, key: str) -> AdaptiveLimit:
+        """Get or create the limit for a provider and model."""
+        max_limit = self.config.max_limit or get_worker_sizing().limits.ai_in_flight
+        with self._lock:
+            limiter = self._limits.get(key)
+            if limiter is None:
+                limiter = self._limits[key] = AdaptiveLimit(key, self.config, max_limit)
+        if limiter.max_limit != max_limit:
+            limiter.set_max_limit(max_limit)
+        return limiter
+
+    @contextmanager
+    def request(self, key: str) -> Iterator[AdaptiveLimit]:
+        """
+        Hold a request slot for ``key`` while the enclosed block runs.
+
+        The outcome of the block (return or exception) adjusts the limit;
+        exceptions propagate.
+        """
+        limiter = self.limiter(key)
+        with span("ai.concurrency_wait", key=key):
+            limiter.acquire()
+        started_at = time.monotonic()
+        try:
+            yield limiter
+        except Exception as e:
+            limiter.on_failure(e, started_at)
+            raise
+        else:
+            limiter.on_success(started_at)
+        finally:
+            limiter.release()
+
+    def get_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """Statistics of every provider and model seen so far."""
+        with self._lock:
+            limits = list(self._limits.values())
+        return {limit.key: limit.statistics() for limit in limits}
@@ -7,21 +7,13 @@ Consolidates model management logic from scattered utilities.
 
 import logging
 import platform
-import subprocess
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional
 
 import psutil
 
-# Optional imports
-try:
-    import wmi  # type: ignore
-
-    HAVE_WMI = True
-except ImportError:
-    wmi = None  # type: ignore
-    HAVE_WMI = False
+from shared.infrastructure.environment_snapshot import get_environment_snapshot
 
 
 class ModelStatus(Enum):
@@ -107,105 +99,21 @@ class ModelService:
 
         # CPU information
         cpu_count = psutil.cpu_count(logical=True) or 1  # Fallback to 1 if None
-        cpu_brand = self._get_cpu_brand()
-
-        # Platform information
-        system_platform = platform.system()
 
-        # GPU detection (basic)
-        gpu_available, gpu_memory_gb, gpu_brand = self._detect_gpu()
+        # CPU brand and GPU come from the shared (cached) environment probes
+        snapshot = get_environment_snapshot()
 
         return SystemCapabilities(
             total_ram_gb=total_ram_gb,
             available_ram_gb=available_ram_gb,
             cpu_count=cpu_count,
-            cpu_brand=cpu_brand,
-            platform=system_platform,
-            gpu_available=gpu_available,
-            gpu_memory_gb=gpu_memory_gb,
-            gpu_brand=gpu_brand,
+            cpu_brand=snapshot.cpu_brand,
+            platform=platform.system(),
+            gpu_available=snapshot.gpu.available,
+            gpu_memory_gb=snapshot.gpu.memory_gb,
+            gpu_brand=snapshot.gpu.name,
         )
 
-    def _get_cpu_brand(self) -> str:
-        """Get CPU brand information."""
-        try:
-            if platform.system() == "Windows":
-                if HAVE_WMI and wmi is not None:
-                    try:
-                        c = wmi.WMI()
-                        for processor in c.Win32_Processor():
-                            return processor.Name.strip()
-                    except Exception:
-                        # wmi call failed, continue to fallback
-                        pass
-            elif platform.system() == "Darwin":  # macOS
-                result = subprocess.run(
-                    ["sysctl", "-n", "machdep.cpu.brand_string"],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-                return result.stdout.strip()
-            else:  # Linux
-                with open("/proc/cpuinfo", "r", encoding="utf-8") as f:
-                    for line in f:
-                        if line.startswith("model name"):
-                            return line.split(":")[1].strip()
-        except Exception:
-            pass
-
-        return "Unknown CPU"
-
-    def _detect_gpu(self) -> Tuple[bool, Optional[float], Optional[str]]:
-        """Detect GPU capabilities."""
-        try:
-            # Try NVIDIA GPU detection
-            result = subprocess.run(
-                ["nvidia-smi", "--query-gpu=memory.total,name", "--format=csv,noheader,nounits"],
-                capture_output=True,
-                check=False,
-                text=True,
-                timeout=5,
-            )
-
-            if result.returncode == 0:
-                lines = result.stdout.strip().split("\n")
-                if lines and lines[0]:
-                    parts = lines[0].split(", ")
-                    if len(parts) >= 2:
-                        memory_mb = float(parts[0])
-                        gpu_name = parts[1]
-                        return True, memory_mb / 1024, gpu_name  # Convert MB to GB
-        except Exception:
-            pass
-
-        # Try AMD GPU detection (basic) - safe subprocess call
-        try:
-            if platform.system() == "Linux":
-                # Use shell=False for security - pipe operations done in Python
-                try:
-                    lspci_result = subprocess.run(
-                        ["lspci"],
-                        capture_output=True,
-                        text=True,
-                        shell=False,
-                        timeout=5,
-                        check=False,
-                    )
-                    if lspci_result.returncode == 0:
-                        # Filter for AMD in Python instead of shell
-                        lspci_lines = lspci_result.stdout.lower()
-                        if "amd" in lspci_lines and (
-                            "vga" in lspci_lines or "display" in lspci_lines
-                        ):
-                            return True, None, "AMD GPU"
-                except (subprocess.TimeoutExpired, FileNotFoundError):
-                    pass  # lspci not available or timeout
-        except Exception:
-            pass
-
-        return False, None, None
-
     def _initialize_hardware_tiers(self) -> None:
         """Initialize hardware tier definitions."""
         self._hardware_tiers = [
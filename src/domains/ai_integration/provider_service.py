@@ -10,6 +10,7 @@ from typing import Any, Dict, List, Optional
 
 # Import from shared infrastructure (correct layer)
 from shared.infrastructure.filename_config import DEFAULT_SYSTEM_PROMPTS
+from shared.infrastructure.import_utilities import module_available
 
 # Import base provider interface
 from .base_provider import AIProvider
@@ -74,29 +75,10 @@ class ProviderCapabilities:
         """Detect which providers are available based on dependencies."""
         capabilities = {}
 
-        # OpenAI
-        try:
-            import openai  # pylint: disable=unused-import
-
-            capabilities["openai"] = True
-        except ImportError:
-            capabilities["openai"] = False
-
-        # Claude
-        try:
-            import anthropic  # pylint: disable=unused-import
-
-            capabilities["claude"] = True
-        except ImportError:
-            capabilities["claude"] = False
-
-        # Gemini
-        try:
-            import google.genai as genai  # pylint: disable=unused-import
-
-            capabilities["gemini"] = True
-        except ImportError:
-            capabilities["gemini"] = False
+        # Checked with find_spec so listing providers does not import their SDKs
+        capabilities["openai"] = module_available("openai")
+        capabilities["claude"] = module_available("anthropic")
+        capabilities["gemini"] = module_available("google.genai")
 
         # Deepseek (uses OpenAI-compatible API)
         capabilities["deepseek"] = capabilities["openai"]
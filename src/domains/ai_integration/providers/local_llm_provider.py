@@ -27,6 +27,7 @@ class LocalLLMProvider(AIProvider):
     def __init__(self, model: str) -> None:
         """Initialize local LLM provider with model."""
         super().__init__(None, model)  # No API key needed for local
+        self._model_manager = None
 
         # Check if Ollama is available
         try:
@@ -56,8 +57,11 @@ class LocalLLMProvider(AIProvider):
         # First check if Ollama is running
         from shared.infrastructure.model_manager import ModelManager
         from shared.infrastructure.model_name_mapper import ModelNameMapper
-        
-        model_manager = ModelManager()
+
+        # One manager per provider: its HTTP session and Ollama status check are reused
+        if self._model_manager is None:
+            self._model_manager = ModelManager()
+        model_manager = self._model_manager
         
         if not model_manager.is_ollama_running():
             self.logger.error("Ollama service is not running")
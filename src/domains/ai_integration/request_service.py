@@ -6,11 +6,35 @@ Consolidates request patterns and provides consistent error handling.
 """
 
 import asyncio
+import contextlib
 import logging
+import queue
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from shared.infrastructure.tracing import span
+
+from .concurrency_controller import AdaptiveLimit, ConcurrencyController, retry_after_from_error
+
+
+# Error text of a request for a model the provider does not have (not pulled, retired, misspelled)
+MODEL_NOT_FOUND_PATTERNS = (
+    "not found",
+    "does not exist",
+    "not available",
+    "no such model",
+    "model_not_found",
+)
+
+
+def is_model_not_found(error: Optional[str]) -> bool:
+    """Whether a request error says the requested model does not exist."""
+    message = (error or "").lower()
+    return "model" in message and any(pattern in message for pattern in MODEL_NOT_FOUND_PATTERNS)
 
 
 class RequestStatus(Enum):
@@ -58,21 +82,61 @@ class RetryConfig:  # pylint: disable=too-many-instance-attributes
     retry_on_timeout: bool = True
 
 
+@dataclass
+class HedgeConfig:
+    """Configuration for hedged requests.
+
+    An attempt that has not returned after the observed latency percentile of
+    its provider and model gets one duplicate; the first usable result wins.
+    """
+
+    percentile: float = 95.0
+    min_samples: int = 20  # Latencies observed before the percentile replaces initial_delay
+    initial_delay: float = 15.0
+    min_delay: float = 0.5
+    max_hedge_rate: float = 0.1  # Share of hedge-enabled attempts that may be duplicated
+    latency_window: int = 200
+
+
 class RequestService:
     """Centralized AI request handling with retry logic and error management."""
 
-    def __init__(self, retry_config: Optional[RetryConfig] = None):
-        """Initialize request service with retry configuration."""
+    def __init__(
+        self,
+        retry_config: Optional[RetryConfig] = None,
+        concurrency: Optional[ConcurrencyController] = None,
+        hedge_config: Optional[HedgeConfig] = None,
+    ):
+        """Initialize request service with retry, concurrency and hedging configuration."""
         self.retry_config = retry_config or RetryConfig()
+        self.concurrency = concurrency or ConcurrencyController()
+        self.hedge_config = hedge_config or HedgeConfig()
         self.logger = logging.getLogger(__name__)
         self._active_requests: Dict[str, RequestResult] = {}
 
+        # Hedging state: successful latencies per provider and model, and cost accounting
+        self._hedge_lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._hedge_stats: Dict[str, float] = {
+            "attempts": 0,
+            "hedges_started": 0,
+            "hedges_sent": 0,
+            "hedge_wins": 0,
+            "cancelled": 0,
+            "extra_cost": 0.0,
+        }
+
     def make_ai_request(
         self,
         provider_func: Callable[[], str],
         request_id: Optional[str] = None,
         timeout: Optional[float] = None,
         retry_config: Optional[RetryConfig] = None,
+        concurrency_key: Optional[str] = None,
+        hedge_func: Optional[Callable[[], str]] = None,
+        hedge_key: Optional[str] = None,
+        hedge_cost: float = 1.0,
+        validator: Optional[Callable[[str], bool]] = None,
     ) -> RequestResult:
         """Make AI request with retry logic and error handling.
 
@@ -81,6 +145,13 @@ class RequestService:
             request_id: Optional unique identifier for tracking
             timeout: Override timeout for this request
             retry_config: Override retry config for this request
+            concurrency_key: Provider and model ("provider:model") whose adaptive
+                in-flight limit every attempt is held to; None for no limit
+            hedge_func: Duplicate of the call, sent when an attempt is slower than the
+                hedge delay (None disables hedging)
+            hedge_key: Provider and model of ``hedge_func`` (defaults to ``concurrency_key``)
+            hedge_cost: Cost of one duplicate in the caller's unit (e.g. estimated tokens)
+            validator: Accepts a hedged result as the winner (defaults to non-empty)
 
         Returns:
             RequestResult with the outcome
@@ -109,7 +180,20 @@ class RequestService:
                 )
 
                 # Make the actual request with timeout
-                content = self._execute_with_timeout(provider_func, actual_timeout)
+                with span("ai.attempt", attempt=attempt):
+                    if hedge_func is not None:
+                        content = self._execute_hedged(
+                            provider_func,
+                            hedge_func,
+                            actual_timeout,
+                            concurrency_key,
+                            hedge_key or concurrency_key,
+                            hedge_cost,
+                            validator or bool,
+                        )
+                    else:
+                        with self._request_slot(concurrency_key):
+                            content = self._execute_with_timeout(provider_func, actual_timeout)
 
                 # Success
                 result.status = RequestStatus.SUCCESS
@@ -144,11 +228,16 @@ class RequestService:
                 # Calculate retry delay
                 result.status = RequestStatus.RETRYING
                 delay = self._calculate_retry_delay(attempt, config)
+                retry_after = retry_after_from_error(e)
+                if retry_after is not None:
+                    # The provider's own hint wins over the backoff schedule
+                    delay = min(max(delay, retry_after), self.concurrency.config.max_pause_s)
 
                 self.logger.info(
                     "Retrying AI request %s in %.1fs (attempt %d)", request_id, delay, attempt + 1
                 )
-                time.sleep(delay)
+                with span("ai.retry_wait", attempt=attempt):
+                    time.sleep(delay)
 
         # Clean up request tracking
         if request_id in self._active_requests:
@@ -159,9 +248,10 @@ class RequestService:
     def _execute_with_timeout(self, func: Callable[[], str], timeout: float) -> Optional[str]:
         """Execute function with timeout."""
         import signal
-        import threading
 
-        if hasattr(signal, "alarm"):  # Unix systems
+        # SIGALRM is only delivered to the main thread; concurrent requests from
+        # worker threads use the thread-based timeout
+        if hasattr(signal, "alarm") and threading.current_thread() is threading.main_thread():
 
             def timeout_handler(signum, frame):
                 raise TimeoutError(f"Request timed out after {timeout} seconds")
@@ -207,11 +297,181 @@ class RequestService:
                 raise RuntimeError("Function returned None unexpectedly")
             return result
 
+    def _request_slot(self, key: Optional[str]):
+        """Slot of the key's adaptive in-flight limit, or no limit without a key."""
+        return self.concurrency.request(key) if key else contextlib.nullcontext()
+
+    def _execute_hedged(  # pylint: disable=too-many-arguments,too-many-locals
+        self,
+        primary: Callable[[], str],
+        hedge: Callable[[], str],
+        timeout: float,
+        primary_key: Optional[str],
+        hedge_key: Optional[str],
+        hedge_cost: float,
+        validator: Callable[[str], bool],
+    ) -> str:
+        """Run ``primary``; if it is slower than the hedge delay, also run ``hedge``.
+
+        The first result accepted by ``validator`` wins. A duplicate still
+        waiting for a slot is cancelled; one already sent cannot be interrupted,
+        so it keeps its slot until it returns and its result is discarded without
+        counting it towards the adaptive limit. Requests still running at the
+        deadline are reported to their limiter as timeouts and their slots freed,
+        as for an unhedged request. If neither result is accepted, the first
+        returned value (or the first error) is the outcome.
+        """
+        outcomes: "queue.Queue" = queue.Queue()
+        primary_sent = threading.Event()
+        decided = threading.Event()
+        keys = {"primary": primary_key, "hedge": hedge_key}
+        slots: Dict[str, _HeldSlot] = {}
+
+        def run(label: str, func: Callable[[], str], sent: threading.Event) -> None:
+            try:
+                limiter = self.concurrency.limiter(keys[label]) if keys[label] else None
+                if decided.is_set():
+                    outcomes.put((label, None, None, None))
+                    return
+                if limiter is not None:
+                    limiter.acquire()
+                slot = slots[label] = _HeldSlot(limiter)
+                started = None if decided.is_set() else slot.start()
+                if started is None:
+                    slot.release()
+                    outcomes.put((label, None, None, None))
+                    return
+                if label == "hedge":
+                    with self._hedge_lock:
+                        self._hedge_stats["hedges_sent"] += 1
+                        self._hedge_stats["extra_cost"] += hedge_cost
+                sent.set()
+                try:
+                    value = func()
+                except Exception as e:
+                    if slot.claim_outcome() and limiter is not None:
+                        limiter.on_failure(e, started)
+                    raise
+                finally:
+                    slot.release()
+                if slot.claim_outcome() and limiter is not None:
+                    limiter.on_success(started)
+                outcomes.put((label, value, None, time.monotonic() - started))
+            except Exception as e:
+                outcomes.put((label, None, e, None))
+            finally:
+                sent.set()
+
+        deadline = time.monotonic() + timeout
+        with self._hedge_lock:
+            self._hedge_stats["attempts"] += 1
+        threading.Thread(target=run, args=("primary", primary, primary_sent), daemon=True).start()
+        # The hedge delay counts from when the request is sent, not from the concurrency wait
+        primary_sent.wait(timeout)
+        hedge_at = time.monotonic() + self._hedge_delay(primary_key)
+
+        launched, finished, hedged = 1, 0, False
+        first_value: Optional[str] = None
+        errors: List[Exception] = []
+        while finished < launched:
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            wait = deadline - now if hedged else max(0.0, min(deadline, hedge_at) - now)
+            try:
+                label, value, error, latency = outcomes.get(timeout=wait)
+            except queue.Empty:
+                if not hedged and time.monotonic() >= hedge_at:
+                    hedged = True  # One hedging decision per attempt
+                    if self._reserve_hedge():
+                        threading.Thread(
+                            target=run, args=("hedge", hedge, threading.Event()), daemon=True
+                        ).start()
+                        launched += 1
+                        self.logger.debug("Hedging AI request to %s", hedge_key)
+                continue
+
+            finished += 1
+            if error is not None:
+                errors.append(error)
+            elif latency is not None:
+                if validator(value):
+                    self._abandon(decided, slots, timed_out=False)
+                    self._record_hedged_win(keys[label], latency, label, launched - finished)
+                    return value
+                if first_value is None:
+                    first_value = value
+
+        self._abandon(decided, slots, timed_out=time.monotonic() >= deadline)
+        if first_value is not None:
+            return first_value
+        if errors:
+            raise errors[0]
+        raise TimeoutError(f"Request timed out after {timeout} seconds")
+
+    @staticmethod
+    def _abandon(
+        decided: threading.Event, slots: Dict[str, "_HeldSlot"], timed_out: bool
+    ) -> None:
+        """Stop waiting for the other requests of a hedged attempt.
+
+        Unsent requests give their slot back. Sent ones keep it until they return,
+        unless the attempt timed out: then they count as timeouts and free it.
+        """
+        decided.set()
+        for slot in list(slots.values()):
+            if slot.release_unsent() or slot.started is None:
+                continue
+            if timed_out and slot.claim_outcome():
+                if slot.limiter is not None:
+                    slot.limiter.on_failure(
+                        TimeoutError("Hedged request still running at the deadline"),
+                        slot.started,
+                    )
+                slot.release()
+
+    def _hedge_delay(self, key: Optional[str]) -> float:
+        """Observed latency percentile of the key, or the initial delay until enough samples."""
+        config = self.hedge_config
+        with self._hedge_lock:
+            latencies = sorted(self._latencies.get(key or "", ()))
+        if len(latencies) < config.min_samples:
+            return max(config.min_delay, config.initial_delay)
+        index = min(len(latencies) - 1, int(config.percentile / 100 * len(latencies)))
+        return max(config.min_delay, latencies[index])
+
+    def _reserve_hedge(self) -> bool:
+        """Count a hedge if it keeps the hedge rate within ``max_hedge_rate``."""
+        with self._hedge_lock:
+            stats = self._hedge_stats
+            allowed = max(1.0, self.hedge_config.max_hedge_rate * stats["attempts"])
+            if stats["hedges_started"] + 1 > allowed:
+                return False
+            stats["hedges_started"] += 1
+            return True
+
+    def _record_hedged_win(
+        self, key: Optional[str], latency: float, label: str, abandoned: int
+    ) -> None:
+        """Record the winner's latency and the duplicates left running or waiting."""
+        with self._hedge_lock:
+            window = self._latencies.setdefault(
+                key or "", deque(maxlen=self.hedge_config.latency_window)
+            )
+            window.append(latency)
+            if label == "hedge":
+                self._hedge_stats["hedge_wins"] += 1
+            self._hedge_stats["cancelled"] += abandoned
+
     def _should_retry_error(self, error: Exception, config: RetryConfig) -> bool:
         """Determine if an error should trigger a retry."""
         error_msg = str(error).lower()
         error_type = type(error).__name__.lower()
 
+        # Retrying cannot make a missing model appear
+        if is_model_not_found(error_msg):
+            return False
+
         # Network errors
         if config.retry_on_network_error:
             network_indicators = [
@@ -326,4 +586,67 @@ class RequestService:
                 "max_delay": self.retry_config.max_delay,
                 "timeout": self.retry_config.timeout,
             },
+            "concurrency": self.concurrency.get_statistics(),
+            "hedging": self.get_hedging_statistics(),
         }
+
+    def get_hedging_statistics(self) -> Dict[str, Any]:
+        """Hedge rate, wins, cancelled duplicates, extra cost and current hedge delays."""
+        with self._hedge_lock:
+            stats = dict(self._hedge_stats)
+            keys = list(self._latencies)
+        attempts = stats["attempts"]
+        stats["hedge_rate"] = round(stats["hedges_sent"] / attempts, 3) if attempts else 0.0
+        stats["hedge_delay_s"] = {key: round(self._hedge_delay(key), 3) for key in keys}
+        return stats
+
+
+class _HeldSlot:
+    """Slot of an adaptive limit held by one request of a hedged attempt.
+
+    The outcome is reported once, by the request or by the attempt timing it
+    out, and the slot is released once, by whichever side finishes first.
+    """
+
+    def __init__(self, limiter: Optional[AdaptiveLimit]):
+        self.limiter = limiter
+        self.started: Optional[float] = None
+        self._reported = False
+        self._released = False
+        self._lock = threading.Lock()
+
+    def start(self) -> Optional[float]:
+        """Mark the request as sent; its send time, or None if the slot was given back."""
+        with self._lock:
+            if self._released:
+                return None
+            self.started = time.monotonic()
+            return self.started
+
+    def release_unsent(self) -> bool:
+        """Release the slot if the request was never sent."""
+        with self._lock:
+            if self.started is not None or self._released:
+                return False
+            self._released = True
+        if self.limiter is not None:
+            self.limiter.release()
+        return True
+
+    def claim_outcome(self) -> bool:
+        """Claim reporting the request's outcome; False if it was already reported."""
+        with self._lock:
+            if self._reported:
+                return False
+            self._reported = True
+            return True
+
+    def release(self) -> bool:
+        """Release the slot; False if it was already released."""
+        with self._lock:
+            if self._released:
+                return False
+            self._released = True
+        if self.limiter is not None:
+            self.limiter.release()
+        return True
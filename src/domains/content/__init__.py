@@ -10,9 +10,17 @@ Services:
 - MetadataService: Document metadata extraction and analysis
 """
 
-from .content_service import ContentService
-from .enhancement_service import EnhancementService
-from .extraction_service import ExtractionService
-from .metadata_service import MetadataService
+from shared.infrastructure.import_utilities import lazy_exports
+
+# Imported on first access (see domains/__init__.py)
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "ContentService": ".content_service",
+        "EnhancementService": ".enhancement_service",
+        "ExtractionService": ".extraction_service",
+        "MetadataService": ".metadata_service",
+    },
+)
 
 __all__ = ["ExtractionService", "EnhancementService", "MetadataService", "ContentService"]
@@ -10,26 +10,48 @@ import os
 from typing import Any, Dict, List, Optional, Tuple
 
 from .enhancement_service import EnhancementService
-from .extraction_service import ContentQuality, ExtractedContent, ExtractionService
+from .extraction_service import (
+    ContentQuality,
+    ExtractedContent,
+    ExtractionService,
+    OCRBudget,
+    OCRPreprocessing,
+    ThreatPolicy,
+)
 from .metadata_service import MetadataService
 
 
 class ContentService:
     """Main service coordinating all content domain operations."""
 
-    def __init__(self, ocr_lang: str = "eng", max_content_length: int = 2000):
+    def __init__(
+        self,
+        ocr_lang: str = "eng",
+        max_content_length: int = 2000,
+        threat_policy: Optional[ThreatPolicy] = None,
+        ocr_budget: Optional[OCRBudget] = None,
+        ocr_preprocessing: Optional[OCRPreprocessing] = None,
+        extraction_service: Optional[ExtractionService] = None,
+    ):
         """Initialize content service.
 
         Args:
             ocr_lang: OCR language for text extraction
             max_content_length: Maximum content length for AI processing
+            threat_policy: Optional PDF threat policy deciding which files are extracted
+            ocr_budget: Optional per-document page/time limits for PDF OCR
+            ocr_preprocessing: Optional OCR resolution and image preparation options
+            extraction_service: Shared extraction service to use instead of building one
+                (the extraction options above are then ignored)
         """
         self.ocr_lang = ocr_lang
         self.max_content_length = max_content_length
         self.logger = logging.getLogger(__name__)
 
         # Initialize domain services
-        self.extraction_service = ExtractionService(ocr_lang)
+        self.extraction_service = extraction_service or ExtractionService(
+            ocr_lang, threat_policy, ocr_budget, ocr_preprocessing
+        )
         self.enhancement_service = EnhancementService(max_content_length)
         self.metadata_service = MetadataService()
 
@@ -102,6 +124,10 @@ class ContentService:
                 "error": str(e),
             }
 
+    def extraction_lane(self, file_path: str) -> str:
+        """Worker lane for a document: "ocr" for scans and images, "text" otherwise."""
+        return self.extraction_service.extraction_lane(file_path)
+
     def batch_process_documents(self, file_paths: List[str], progress_callback=None) -> Dict[str, Dict[str, Any]]:
         """Process multiple documents in batch with progress reporting.
 
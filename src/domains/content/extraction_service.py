@@ -8,8 +8,12 @@ Consolidates extraction logic from content_processors.py into domain service.
 import os
 import base64
 import io
+import queue
+import re
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Tuple, Optional, List, Dict, Any
+from typing import Callable, Tuple, Optional, List, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
 import logging
@@ -47,6 +51,41 @@ except ImportError:
     class SecurityError(Exception):
         pass
 
+try:
+    from shared.infrastructure.security import PDFThreatAnalysis, get_pdf_threat_scanner
+except ImportError:
+    PDFThreatAnalysis = Any  # type: ignore[misc,assignment]
+
+    def get_pdf_threat_scanner():  # type: ignore[misc]
+        return None
+
+try:
+    import tesserocr
+
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    tesserocr = None  # type: ignore
+    TESSEROCR_AVAILABLE = False
+
+from shared.infrastructure.tracing import span
+
+from .ocr_preprocessing import OCRPreprocessing, preprocess_image, render_page_for_ocr
+from .pdf_triage import PLAN_OCR, PLAN_SKIP, PLAN_TEXT, PDFTriage, triage_pdf
+from .pymupdf_lock import PYMUPDF_LOCK
+
+# Decides from a file's threat analysis whether extraction should proceed
+ThreatPolicy = Callable[["PDFThreatAnalysis"], bool]
+
+# A page text layer shorter than this (non-whitespace characters) is treated as missing
+MIN_PAGE_TEXT_CHARS = 50
+
+
+@dataclass
+class OCRBudget:
+    """Per-document limits for OCR of pages without a usable text layer."""
+    max_pages: int = 8  # Pages OCR'd per document
+    max_seconds: float = 45.0  # No new page is started after this much OCR time
+
 
 class ContentQuality(Enum):
     """Quality levels for extracted content."""
@@ -76,6 +115,125 @@ class ExtractedContent:
             self.security_warnings = []
 
 
+# Tesseract options used for all document OCR: LSTM engine, single uniform block of text
+TESSERACT_CONFIG = "--oem 3 --psm 6"
+
+
+class OCRBackend(ABC):
+    """Runs Tesseract on an in-memory PIL image."""
+
+    name = "ocr"
+
+    @abstractmethod
+    def image_to_string(self, image, lang: str, config: str = TESSERACT_CONFIG) -> str:
+        """Recognize the text in an image."""
+        pass
+
+    def close(self) -> None:
+        """Release engine resources."""
+
+
+class PytesseractBackend(OCRBackend):
+    """Fallback backend: one ``tesseract`` process (and temp image file) per call."""
+
+    name = "pytesseract"
+
+    def image_to_string(self, image, lang: str, config: str = TESSERACT_CONFIG) -> str:
+        import pytesseract
+
+        return pytesseract.image_to_string(image, lang=lang, config=config)
+
+
+class TesserocrPoolBackend(OCRBackend):
+    """Pool of initialized libtesseract engines (via tesserocr), keyed by language and mode.
+
+    Each engine loads its language data once and is reused for every page, and
+    images are handed over in memory. Up to ``max_engines`` engines exist per
+    (lang, oem, psm) so concurrent OCR workers do not serialize. Only ``--oem``
+    and ``--psm`` are honoured from the config string. Languages whose engine
+    cannot be initialized (e.g. missing traineddata) go to the fallback backend.
+    """
+
+    name = "tesserocr"
+
+    def __init__(self, max_engines: Optional[int] = None, fallback: Optional[OCRBackend] = None):
+        # Engines are created on demand, so the OCR worker count bounds the pool in practice
+        self.max_engines = max_engines or os.cpu_count() or 1
+        self.fallback = fallback or PytesseractBackend()
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._idle: Dict[Tuple[str, int, int], "queue.LifoQueue"] = {}
+        self._created: Dict[Tuple[str, int, int], int] = {}
+        self._failed: set = set()
+
+    def image_to_string(self, image, lang: str, config: str = TESSERACT_CONFIG) -> str:
+        key = (lang,) + _parse_tesseract_modes(config)
+        engine = self._acquire(key)
+        if engine is None:
+            return self.fallback.image_to_string(image, lang, config)
+        try:
+            engine.SetImage(image)
+            return engine.GetUTF8Text()
+        finally:
+            engine.Clear()
+            self._idle[key].put(engine)
+
+    def _acquire(self, key: Tuple[str, int, int]):
+        """Take an idle engine, create one below the limit, or wait for one to be released."""
+        with self._lock:
+            if key in self._failed:
+                return None
+            idle = self._idle.setdefault(key, queue.LifoQueue())
+            try:
+                return idle.get_nowait()
+            except queue.Empty:
+                pass
+            create = self._created.get(key, 0) < self.max_engines
+            if create:
+                self._created[key] = self._created.get(key, 0) + 1
+
+        if not create:
+            return idle.get()
+
+        lang, oem, psm = key
+        try:
+            return tesserocr.PyTessBaseAPI(lang=lang, oem=oem, psm=psm)
+        except Exception as e:
+            self.logger.warning("Tesseract engine for '%s' unavailable, using fallback: %s", lang, e)
+            with self._lock:
+                self._created[key] -= 1
+                self._failed.add(key)
+            return None
+
+    def close(self) -> None:
+        with self._lock:
+            for idle in self._idle.values():
+                while not idle.empty():
+                    idle.get_nowait().End()
+            self._idle.clear()
+            self._created.clear()
+
+
+def _parse_tesseract_modes(config: str) -> Tuple[int, int]:
+    """Read (oem, psm) from a Tesseract command-line config, defaulting like Tesseract."""
+    oem = re.search(r"--oem\s+(\d+)", config)
+    psm = re.search(r"--psm\s+(\d+)", config)
+    return (int(oem.group(1)) if oem else 3, int(psm.group(1)) if psm else 3)
+
+
+_ocr_backend: Optional[OCRBackend] = None
+_ocr_backend_lock = threading.Lock()
+
+
+def get_ocr_backend() -> OCRBackend:
+    """Get the shared OCR backend: the engine pool if tesserocr is installed, else pytesseract."""
+    global _ocr_backend
+    with _ocr_backend_lock:
+        if _ocr_backend is None:
+            _ocr_backend = TesserocrPoolBackend() if TESSEROCR_AVAILABLE else PytesseractBackend()
+        return _ocr_backend
+
+
 class ContentProcessor(ABC):
     """Abstract base for content processors."""
 
@@ -98,13 +256,28 @@ class ContentProcessor(ABC):
 class PDFContentProcessor(ContentProcessor):
     """PDF content extraction with multiple methods."""
 
-    def __init__(self, ocr_lang: str = "eng"):
+    def __init__(
+        self,
+        ocr_lang: str = "eng",
+        threat_policy: Optional[ThreatPolicy] = None,
+        ocr_budget: Optional[OCRBudget] = None,
+        ocr_preprocessing: Optional[OCRPreprocessing] = None,
+    ):
         """Initialize PDF processor.
 
         Args:
             ocr_lang: OCR language code (e.g., 'eng', 'eng+fra')
+            threat_policy: Returns False for files whose threat analysis should skip
+                extraction (e.g. ``skip_high_threat_pdfs``); None extracts every file
+            ocr_budget: Page/time limits for OCR per document (defaults to OCRBudget())
+            ocr_preprocessing: Render resolution and image preparation options for OCR
         """
         self.ocr_lang = ocr_lang
+        self.threat_policy = threat_policy
+        self.ocr_budget = ocr_budget or OCRBudget()
+        self.ocr_preprocessing = ocr_preprocessing or OCRPreprocessing()
+        self.threat_scanner = get_pdf_threat_scanner()
+        self.ocr_backend = get_ocr_backend()
         self.logger = logging.getLogger(__name__)
 
         # Import dependencies with availability checking
@@ -124,11 +297,11 @@ class PDFContentProcessor(ContentProcessor):
             import pytesseract
             from PIL import Image
             
-            # Try to get dependency manager
+            # Resolved once per environment and shared by all processors
             try:
-                from shared.infrastructure.dependency_manager import DependencyManager
-                dep_manager = DependencyManager()
-                tesseract_path = dep_manager.find_dependency("tesseract")
+                from shared.infrastructure.environment_snapshot import get_environment_snapshot
+
+                tesseract_path = get_environment_snapshot().dependency_path("tesseract")
                 self.tesseract_path = tesseract_path
             except ImportError:
                 # Fallback to checking common locations
@@ -158,6 +331,10 @@ class PDFContentProcessor(ContentProcessor):
             self.tesseract_path = None
             self.logger.warning("OCR dependencies not available: %s", e)
 
+        # The engine pool links libtesseract directly and needs no executable
+        if TESSEROCR_AVAILABLE:
+            self.have_tesseract = True
+
     def can_process(self, file_path: str) -> bool:
         """Check if file is a PDF."""
         return file_path.lower().endswith(".pdf")
@@ -177,65 +354,39 @@ class PDFContentProcessor(ContentProcessor):
                     error_message="File failed security validation"
                 )
 
-            # Try multiple extraction methods in order of preference
-            methods = [
-                ("pymupdf_text", self._extract_with_pymupdf),
-                ("pypdf_text", self._extract_with_pypdf),
-                ("ocr_extraction", self._extract_with_ocr)
-            ]
-
-            best_result = None
-            text_extraction_attempted = False
-            minimal_text_found = False
-
-            for method_name, method_func in methods:
-                if not self._method_available(method_name):
-                    continue
-
-                try:
-                    result = method_func(file_path)
-                    
-                    # Track if we've tried text extraction
-                    if method_name in ["pymupdf_text", "pypdf_text"]:
-                        text_extraction_attempted = True
-                        # Check if text extraction found minimal content (likely scanned PDF)
-                        if result and result.text:
-                            # Less than 100 chars per page suggests scanned document
-                            page_count = result.metadata.get("page_count", 1) if result.metadata else 1
-                            chars_per_page = len(result.text.strip()) / max(page_count, 1)
-                            if chars_per_page < 100:
-                                minimal_text_found = True
-                                self.logger.info("Minimal text found (%d chars/page), likely scanned PDF", chars_per_page)
-                    
-                    if result and result.quality != ContentQuality.FAILED:
-                        result.extraction_method = method_name
-
-                        # For OCR method or good quality text, return immediately
-                        if method_name == "ocr_extraction" or result.quality in [ContentQuality.EXCELLENT, ContentQuality.GOOD]:
-                            # But if text extraction found minimal content and OCR hasn't been tried, continue
-                            if minimal_text_found and method_name != "ocr_extraction" and self._method_available("ocr_extraction"):
-                                self.logger.info("Minimal text detected, will attempt OCR extraction")
-                                best_result = result
-                                continue
-                            return result
-
-                        # Keep best result as fallback
-                        if best_result is None or result.quality.value > best_result.quality.value:
-                            best_result = result
-
-                except Exception as e:
-                    self.logger.warning("Extraction method %s failed: %s", method_name, e)
-                    continue
-
-            # Return best result found, or failure
-            if best_result:
-                return best_result
+            with span("extract.threat_scan"):
+                threat_analysis = self._analyze_threats(file_path)
+            if threat_analysis is not None and self.threat_policy is not None:
+                if not self.threat_policy(threat_analysis):
+                    self.logger.warning(
+                        "Skipping extraction of %s by threat policy: %s",
+                        file_path, threat_analysis.summary
+                    )
+                    skipped = ExtractedContent(
+                        text="Extraction skipped by security policy",
+                        quality=ContentQuality.FAILED,
+                        error_message=f"Skipped by threat policy: {threat_analysis.summary}"
+                    )
+                    self._record_threat_analysis(skipped, threat_analysis)
+                    return skipped
+
+            with span("extract.triage"):
+                triage = triage_pdf(file_path) if self.have_pymupdf else None
+            if triage is not None and triage.plan == PLAN_SKIP:
+                self.logger.info("Skipping extraction of %s: %s", file_path, triage.reason)
+                result = ExtractedContent(
+                    text=f"Extraction skipped: {triage.reason}",
+                    quality=ContentQuality.FAILED,
+                    file_type="pdf",
+                    error_message=f"Skipped by triage: {triage.reason}"
+                )
+            else:
+                result = self._extract_best(file_path, triage)
 
-            return ExtractedContent(
-                text="No extraction method succeeded",
-                quality=ContentQuality.FAILED,
-                error_message="All extraction methods failed"
-            )
+            if triage is not None and result.metadata is not None:
+                result.metadata["triage_plan"] = triage.plan
+            self._record_threat_analysis(result, threat_analysis)
+            return result
 
         except Exception as e:
             self.logger.error("PDF extraction failed for %s: %s", file_path, e)
@@ -245,6 +396,91 @@ class PDFContentProcessor(ContentProcessor):
                 error_message=str(e)
             )
 
+    def _extract_best(
+        self, file_path: str, triage: Optional[PDFTriage] = None
+    ) -> ExtractedContent:
+        """Run extraction methods in order of preference and return the best result."""
+        # Try multiple extraction methods in order of preference
+        methods = self._plan_methods(triage)
+
+        best_result = None
+        text_extraction_attempted = False
+        minimal_text_found = False
+
+        for method_name, method_func in methods:
+            if not self._method_available(method_name):
+                continue
+
+            try:
+                with span(f"extract.{method_name}"):
+                    result = method_func(file_path)
+                
+                # Track if we've tried text extraction
+                if method_name in ["pymupdf_text", "pypdf_text"]:
+                    text_extraction_attempted = True
+                    # Check if text extraction found minimal content (likely scanned PDF)
+                    if result and result.text:
+                        # Less than 100 chars per page suggests scanned document
+                        page_count = result.metadata.get("page_count", 1) if result.metadata else 1
+                        chars_per_page = len(result.text.strip()) / max(page_count, 1)
+                        if chars_per_page < 100:
+                            minimal_text_found = True
+                            self.logger.info("Minimal text found (%d chars/page), likely scanned PDF", chars_per_page)
+                
+                if result and result.quality != ContentQuality.FAILED:
+                    result.extraction_method = method_name
+
+                    # For OCR method or good quality text, return immediately
+                    if method_name == "ocr_extraction" or result.quality in [ContentQuality.EXCELLENT, ContentQuality.GOOD]:
+                        # But if text extraction found minimal content and OCR hasn't been tried, continue
+                        if minimal_text_found and method_name != "ocr_extraction" and self._method_available("ocr_extraction"):
+                            self.logger.info("Minimal text detected, will attempt OCR extraction")
+                            best_result = result
+                            continue
+                        return result
+
+                    # Keep best result as fallback
+                    if best_result is None or result.quality.value > best_result.quality.value:
+                        best_result = result
+
+            except Exception as e:
+                self.logger.warning("Extraction method %s failed: %s", method_name, e)
+                continue
+
+        # Return best result found, or failure
+        if best_result:
+            return best_result
+
+        return ExtractedContent(
+            text="No extraction method succeeded",
+            quality=ContentQuality.FAILED,
+            error_message="All extraction methods failed"
+        )
+
+    def _plan_methods(self, triage: Optional[PDFTriage]) -> List[Tuple[str, Any]]:
+        """Order extraction methods using the triage plan (full cascade if unknown)."""
+        text_methods = [
+            ("pymupdf_text", self._extract_with_pymupdf),
+            ("pypdf_text", self._extract_with_pypdf),
+        ]
+        ocr_method = ("ocr_extraction", self._extract_with_ocr)
+
+        if triage is None:
+            return text_methods + [ocr_method]
+        if triage.plan == PLAN_TEXT and triage.pages_inspected == triage.page_count:
+            # Every page has a text layer or is blank: OCR cannot add anything
+            return text_methods
+        if triage.plan == PLAN_OCR:
+            # Scanned or mixed document: OCR only the image-only pages and merge them with
+            # the text layer, which a text-only method would return without the scans
+            return [ocr_method] + text_methods
+        return text_methods + [ocr_method]
+
+    def extraction_lane(self, file_path: str) -> str:
+        """Worker lane for this PDF: "ocr" if triage found image-only pages, else "text"."""
+        triage = triage_pdf(file_path) if self.have_pymupdf else None
+        return "ocr" if triage is not None and triage.ocr_heavy else "text"
+
     def _validate_file_security(self, file_path: str) -> bool:
         """Validate file security before processing."""
         try:
@@ -261,20 +497,34 @@ class PDFContentProcessor(ContentProcessor):
             if file_size == 0:
                 return False
 
-            # Perform PDF threat analysis
-            try:
-                analyzer = PDFAnalyzer()
-                analyzer.analyze_pdf(file_path)
-                # Continue processing regardless of threat level (non-destructive approach)
-                return True
-            except (NameError, Exception) as e:
-                self.logger.warning("PDF security analysis failed: %s", e)
-                return True  # Allow processing if security analysis fails
+            return True
 
         except Exception as e:
             self.logger.error("Security validation error for %s: %s", file_path, e)
             return False
 
+    def _analyze_threats(self, file_path: str) -> Optional["PDFThreatAnalysis"]:
+        """Scan the PDF for threat indicators (cached by content hash)."""
+        if self.threat_scanner is None:
+            return None
+        try:
+            return self.threat_scanner.analyze_pdf(file_path)
+        except Exception as e:
+            self.logger.warning("PDF security analysis failed: %s", e)
+            return None  # Allow processing if security analysis fails
+
+    def _record_threat_analysis(
+        self, result: ExtractedContent, threat_analysis: Optional["PDFThreatAnalysis"]
+    ) -> None:
+        """Attach the threat verdict to the extraction result."""
+        if threat_analysis is None:
+            return
+        if result.metadata is not None:
+            result.metadata["threat_level"] = threat_analysis.threat_level.value
+            result.metadata["threat_indicators"] = threat_analysis.indicators
+        if threat_analysis.should_warn and result.security_warnings is not None:
+            result.security_warnings.append(threat_analysis.summary)
+
     def _method_available(self, method_name: str) -> bool:
         """Check if extraction method is available."""
         if method_name == "pymupdf_text":
@@ -293,24 +543,25 @@ class PDFContentProcessor(ContentProcessor):
         import fitz
 
         try:
-            doc = fitz.open(file_path)
-            text_parts = []
-            image_data = None
+            with PYMUPDF_LOCK:
+                doc = fitz.open(file_path)
+                text_parts = []
+                image_data = None
 
-            # Extract text from all pages
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                text = page.get_text()  # type: ignore[attr-defined]
-                if text.strip():
-                    text_parts.append(text)
+                # Extract text from all pages
+                for page_num in range(len(doc)):
+                    page = doc[page_num]
+                    text = page.get_text()  # type: ignore[attr-defined]
+                    if text.strip():
+                        text_parts.append(text)
 
-                # Get image of first page for vision models
-                if page_num == 0:
-                    image_data = self._render_page_as_image(page)
+                    # Get image of first page for vision models
+                    if page_num == 0:
+                        image_data = self._render_page_as_image(page)
 
-            # Get page count before closing document
-            page_count = len(doc) 
-            doc.close()
+                # Get page count before closing document
+                page_count = len(doc)
+                doc.close()
 
             full_text = "\n".join(text_parts)
 
@@ -374,58 +625,105 @@ class PDFContentProcessor(ContentProcessor):
             raise RuntimeError(f"pypdf extraction failed: {e}")
 
     def _extract_with_ocr(self, file_path: str) -> ExtractedContent:
-        """Extract content using OCR."""
+        """Extract content with OCR for the pages that lack a usable text layer.
+
+        Pages with a text layer keep their extracted text; the remaining pages
+        with content are OCR'd within the processor's OCR budget. Text from
+        both sources is merged in page order. PyMuPDF calls hold PYMUPDF_LOCK;
+        the Tesseract call runs outside it so OCR workers stay parallel.
+        """
         if not (self.have_pymupdf and self.have_tesseract):
             raise RuntimeError("OCR dependencies not available")
 
         import fitz
-        import pytesseract
-        from PIL import Image
 
         try:
-            doc = fitz.open(file_path)
-            text_parts = []
-
-            # Process up to 4 pages for OCR
-            max_pages = min(4, len(doc))
+            with PYMUPDF_LOCK:
+                doc = fitz.open(file_path)
+                page_count = len(doc)
+            page_texts: List[str] = []
+            text_layer_pages, ocr_pages, skipped_pages = [], [], []
+            ocr_seconds = 0.0
+
+            for page_num in range(page_count):
+                with PYMUPDF_LOCK:
+                    page = doc[page_num]
+                    layer_text = page.get_text()  # type: ignore[attr-defined]
+                    has_images = bool(page.get_images())
+                    has_contents = bool(page.get_contents())
+                # Short text over a scan (stamps, page numbers) does not count as a text layer
+                if self._page_text_usable(layer_text) or (layer_text.strip() and not has_images):
+                    page_texts.append(layer_text)
+                    text_layer_pages.append(page_num)
+                    continue
+                if not (has_images or has_contents):
+                    continue  # Blank page
+
+                if (
+                    len(ocr_pages) >= self.ocr_budget.max_pages
+                    or ocr_seconds >= self.ocr_budget.max_seconds
+                ):
+                    skipped_pages.append(page_num)
+                    page_texts.append(layer_text)
+                    continue
 
-            for page_num in range(max_pages):
-                page = doc[page_num]
+                started = time.monotonic()
+                with span("extract.ocr_page", page=page_num):
+                    # Grayscale render at a resolution chosen for this page's text size
+                    with PYMUPDF_LOCK:
+                        pil_image = render_page_for_ocr(page, self.ocr_preprocessing)
 
-                # Render page as image
-                mat = fitz.Matrix(3.5, 3.5)  # High resolution for OCR
-                pix = page.get_pixmap(matrix=mat)  # type: ignore[attr-defined]
-                img_data = pix.tobytes("png")
+                    # Extract text with OCR
+                    ocr_text = self.ocr_backend.image_to_string(
+                        pil_image, self.ocr_lang, TESSERACT_CONFIG
+                    )
+                ocr_seconds += time.monotonic() - started
+                ocr_pages.append(page_num)
+                page_texts.append(ocr_text)
 
-                # Convert to PIL Image
-                pil_image = Image.open(io.BytesIO(img_data))
+            with PYMUPDF_LOCK:
+                doc.close()
 
-                # Extract text with OCR
-                ocr_text = pytesseract.image_to_string(
-                    pil_image,
-                    lang=self.ocr_lang,
-                    config='--oem 3 --psm 6'
+            if skipped_pages:
+                self.logger.info(
+                    "OCR budget reached for %s: %d page(s) not OCR'd",
+                    file_path, len(skipped_pages)
                 )
 
-                if ocr_text.strip():
-                    text_parts.append(ocr_text)
-
-            doc.close()
-
-            full_text = "\n".join(text_parts)
-            quality = self._assess_ocr_quality(full_text)
+            full_text = "\n".join(text for text in page_texts if text.strip())
+            if ocr_pages:
+                quality = self._assess_ocr_quality(full_text)
+            else:
+                quality = self._assess_text_quality(full_text)
 
             return ExtractedContent(
                 text=full_text,
                 quality=quality,
                 extraction_method="ocr",
                 file_type="pdf",
-                metadata={"pages_processed": max_pages, "ocr_lang": self.ocr_lang}
+                metadata={
+                    "page_count": page_count,
+                    "pages_processed": len(ocr_pages),
+                    "ocr_pages": ocr_pages,
+                    "text_layer_pages": text_layer_pages,
+                    "ocr_pages_skipped": skipped_pages,
+                    "ocr_seconds": round(ocr_seconds, 3),
+                    "ocr_lang": self.ocr_lang,
+                    "ocr_backend": self.ocr_backend.name,
+                }
             )
 
         except Exception as e:
             raise RuntimeError(f"OCR extraction failed: {e}")
 
+    @staticmethod
+    def _page_text_usable(text: str) -> bool:
+        """Whether a page's text layer is complete enough to skip OCR."""
+        stripped = "".join(text.split())
+        if len(stripped) < MIN_PAGE_TEXT_CHARS:
+            return False
+        return stripped.count("\ufffd") <= len(stripped) * 0.01
+
     def _render_page_as_image(self, page) -> Optional[str]:
         """Render page as base64 encoded image."""
         try:
@@ -496,9 +794,11 @@ class PDFContentProcessor(ContentProcessor):
 class ImageContentProcessor(ContentProcessor):
     """Image content extraction using OCR."""
 
-    def __init__(self, ocr_lang: str = "eng"):
+    def __init__(self, ocr_lang: str = "eng", ocr_preprocessing: Optional[OCRPreprocessing] = None):
         """Initialize image processor."""
         self.ocr_lang = ocr_lang
+        self.ocr_preprocessing = ocr_preprocessing or OCRPreprocessing()
+        self.ocr_backend = get_ocr_backend()
         self.logger = logging.getLogger(__name__)
         self._check_dependencies()
 
@@ -507,10 +807,9 @@ class ImageContentProcessor(ContentProcessor):
         try:
             import pytesseract
             from PIL import Image
-            from ...shared.infrastructure.dependency_manager import get_dependency_manager
+            from shared.infrastructure.environment_snapshot import get_environment_snapshot
 
-            dep_manager = get_dependency_manager()
-            tesseract_path = dep_manager.find_dependency("tesseract")
+            tesseract_path = get_environment_snapshot().dependency_path("tesseract")
 
             if tesseract_path:
                 pytesseract.pytesseract.tesseract_cmd = tesseract_path
@@ -520,6 +819,10 @@ class ImageContentProcessor(ContentProcessor):
         except ImportError:
             self.have_tesseract = False
 
+        # The engine pool links libtesseract directly and needs no executable
+        if TESSEROCR_AVAILABLE:
+            self.have_tesseract = True
+
     def can_process(self, file_path: str) -> bool:
         """Check if file is a supported image."""
         supported_extensions = ['.png', '.jpg', '.jpeg', '.tiff', '.tif', '.bmp', '.gif']
@@ -539,7 +842,6 @@ class ImageContentProcessor(ContentProcessor):
             )
 
         try:
-            import pytesseract
             from PIL import Image
 
             # Load and process image
@@ -549,12 +851,11 @@ class ImageContentProcessor(ContentProcessor):
             if image.mode != 'RGB':
                 image = image.convert('RGB')
 
-            # Extract text with OCR
-            ocr_text = pytesseract.image_to_string(
-                image,
-                lang=self.ocr_lang,
-                config='--oem 3 --psm 6'
-            )
+            # Extract text with OCR (grayscale, orientation-corrected, size-capped copy)
+            with span("extract.ocr_image"):
+                ocr_text = self.ocr_backend.image_to_string(
+                    preprocess_image(image, self.ocr_preprocessing), self.ocr_lang, TESSERACT_CONFIG
+                )
 
             # Convert image to base64 for vision models
             image_b64 = self._image_to_base64(image)
@@ -571,7 +872,8 @@ class ImageContentProcessor(ContentProcessor):
                 metadata={
                     "image_size": image.size,
                     "image_mode": image.mode,
-                    "ocr_lang": self.ocr_lang
+                    "ocr_lang": self.ocr_lang,
+                    "ocr_backend": self.ocr_backend.name,
                 }
             )
 
@@ -617,19 +919,28 @@ class ImageContentProcessor(ContentProcessor):
 class ExtractionService:
     """Main content extraction service."""
 
-    def __init__(self, ocr_lang: str = "eng"):
+    def __init__(
+        self,
+        ocr_lang: str = "eng",
+        threat_policy: Optional[ThreatPolicy] = None,
+        ocr_budget: Optional[OCRBudget] = None,
+        ocr_preprocessing: Optional[OCRPreprocessing] = None,
+    ):
         """Initialize extraction service.
 
         Args:
             ocr_lang: OCR language code for text extraction
+            threat_policy: Optional PDF threat policy (see PDFContentProcessor)
+            ocr_budget: Optional per-document PDF OCR limits (see PDFContentProcessor)
+            ocr_preprocessing: Optional OCR image preparation options for PDFs and images
         """
         self.ocr_lang = ocr_lang
         self.logger = logging.getLogger(__name__)
 
         # Initialize processors
         self.processors = [
-            PDFContentProcessor(ocr_lang),
-            ImageContentProcessor(ocr_lang)
+            PDFContentProcessor(ocr_lang, threat_policy, ocr_budget, ocr_preprocessing),
+            ImageContentProcessor(ocr_lang, ocr_preprocessing)
         ]
 
         # Create processor mapping
@@ -658,7 +969,8 @@ class ExtractionService:
                 )
 
             # Extract content
-            result = processor.extract_content(file_path)
+            with span("extract.file", processor=type(processor).__name__):
+                result = processor.extract_content(file_path)
 
             # Validate and sanitize content
             if result.quality != ContentQuality.FAILED and result.text:
@@ -681,6 +993,19 @@ class ExtractionService:
                 error_message=str(e)
             )
 
+    def extraction_lane(self, file_path: str) -> str:
+        """Worker lane for a file: "ocr" for scans and images, "text" otherwise.
+
+        Lets the pipeline run OCR-heavy documents on separate workers so text
+        documents are not queued behind them.
+        """
+        processor = self._find_processor_for_file(file_path)
+        if isinstance(processor, PDFContentProcessor):
+            return processor.extraction_lane(file_path)
+        if isinstance(processor, ImageContentProcessor):
+            return "ocr"
+        return "text"
+
     def _find_processor_for_file(self, file_path: str) -> Optional[ContentProcessor]:
         """Find appropriate processor for file."""
         # Get file extension
@@ -15,6 +15,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from shared.infrastructure.entity_scanner import EntityScanResult, scan_entities
+
 from .extraction_service import ContentQuality, ExtractedContent
 
 
@@ -56,6 +58,9 @@ class DocumentMetadata:
     # Additional properties
     properties: Dict[str, Any]
 
+    # Typed, position-annotated dates/amounts/numbers (scanned once at extraction)
+    entity_scan: Optional[EntityScanResult] = None
+
     def __post_init__(self):
         if self.properties is None:
             self.properties = {}
@@ -114,10 +119,15 @@ class MetadataExtractor:
             "paragraph_count": len(paragraphs),
         }
 
-    def extract_document_structure(self, text: str) -> Dict[str, Any]:
-        """Analyze document structure."""
-        import re
+    def extract_document_structure(
+        self, text: str, entity_scan: Optional[EntityScanResult] = None
+    ) -> Dict[str, Any]:
+        """Analyze document structure.
 
+        Args:
+            text: Document text
+            entity_scan: Precomputed entity scan of ``text`` (scanned here if None)
+        """
         if not text:
             return {
                 "has_headers": False,
@@ -134,26 +144,12 @@ class MetadataExtractor:
         )
 
         # Number detection
-        has_numbers = bool(re.search(r"\d+", text))
-
-        # Date detection (various formats)
-        date_patterns = [
-            r"\d{1,2}[/-]\d{1,2}[/-]\d{2,4}",  # MM/DD/YYYY, DD/MM/YYYY
-            r"\d{4}[/-]\d{1,2}[/-]\d{1,2}",  # YYYY/MM/DD
-            r"\b\d{1,2}\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\b",
-            r"\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}\b",
-        ]
-        has_dates = any(re.search(pattern, text, re.IGNORECASE) for pattern in date_patterns)
-
-        # Currency detection
-        currency_patterns = [
-            r"\$\d+",  # $123
-            r"USD\s*\d+",  # USD 123
-            r"€\d+",  # €123
-            r"£\d+",  # £123
-            r"\d+\.\d{2}\s*(USD|EUR|GBP|CAD|AUD)",  # 123.45 USD
-        ]
-        has_currency = any(re.search(pattern, text, re.IGNORECASE) for pattern in currency_patterns)
+        has_numbers = any(c.isdigit() for c in text)
+
+        # Date and currency detection from the single-pass entity scan
+        entity_scan = entity_scan if entity_scan is not None else scan_entities(text)
+        has_dates = bool(entity_scan.dates)
+        has_currency = any(amount.currency for amount in entity_scan.amounts)
 
         return {
             "has_headers": has_headers,
@@ -162,54 +158,28 @@ class MetadataExtractor:
             "has_currency": has_currency,
         }
 
-    def extract_entities(self, text: str) -> Dict[str, List[str]]:
-        """Extract entities (dates, numbers, currency) from text."""
-        import re
+    def extract_entities(
+        self, text: str, entity_scan: Optional[EntityScanResult] = None
+    ) -> Dict[str, List[str]]:
+        """Extract entities (dates, numbers, currency) from text.
 
+        Args:
+            text: Document text
+            entity_scan: Precomputed entity scan of ``text`` (scanned here if None)
+        """
         entities = {"dates_found": [], "numbers_found": [], "currency_found": []}
 
         if not text:
             return entities
 
-        # Date extraction
-        date_patterns = {
-            r"\d{1,2}[/-]\d{1,2}[/-]\d{2,4}": "date_slash",
-            r"\d{4}[/-]\d{1,2}[/-]\d{1,2}": "date_iso",
-            r"\b\d{1,2}\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\b": "date_abbrev",
-            r"\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}\b": "date_full",
-        }
-
-        for pattern, _date_type in date_patterns.items():
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            entities["dates_found"].extend(matches)
-
-        # Number extraction (significant numbers, not just any digit)
-        number_patterns = [
-            r"\b\d{1,3}(?:,\d{3})*(?:\.\d{2})?\b",  # Formatted numbers
-            r"\b\d+\.\d{2}\b",  # Decimal numbers
-            r"\b\d{4,}\b",  # Large numbers (years, IDs, etc.)
-        ]
-
-        for pattern in number_patterns:
-            matches = re.findall(pattern, text)
-            entities["numbers_found"].extend(matches)
-
-        # Currency extraction
-        currency_patterns = [
-            r"\$\d+(?:\.\d{2})?",
-            r"USD\s*\d+(?:\.\d{2})?",
-            r"€\d+(?:\.\d{2})?",
-            r"£\d+(?:\.\d{2})?",
-            r"\d+\.\d{2}\s*(?:USD|EUR|GBP|CAD|AUD)",
-        ]
-
-        for pattern in currency_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            entities["currency_found"].extend(matches)
+        entity_scan = entity_scan if entity_scan is not None else scan_entities(text)
 
-        # Deduplicate and limit results
-        for key in entities:
-            entities[key] = list(set(entities[key]))[:10]  # Keep top 10 unique entities
+        # Keep top 10 unique entities of each type
+        entities["dates_found"] = entity_scan.unique_texts("dates", 10)
+        entities["numbers_found"] = entity_scan.unique_texts("numbers", 10)
+        entities["currency_found"] = list(
+            dict.fromkeys(a.text for a in entity_scan.amounts if a.currency)
+        )[:10]
 
         return entities
 
@@ -230,10 +200,12 @@ class MetadataExtractor:
             file_meta = self.extract_file_metadata(file_path)
             # Extract content metadata
             content_meta = self.extract_content_metadata(content.text)
+            # Scan dates, amounts and numbers once for structure and entities
+            entity_scan = scan_entities(content.text)
             # Extract document structure
-            structure_meta = self.extract_document_structure(content.text)
+            structure_meta = self.extract_document_structure(content.text, entity_scan)
             # Extract entities
-            entities = self.extract_entities(content.text)
+            entities = self.extract_entities(content.text, entity_scan)
             # Calculate readability score
             readability = self._calculate_readability_score(content.text)
             return DocumentMetadata(
@@ -269,6 +241,7 @@ class MetadataExtractor:
                     "security_warnings": content.security_warnings,
                     **(content.metadata or {}),
                 },
+                entity_scan=entity_scan,
             )
 
         except Exception as e:
@@ -422,10 +395,12 @@ class MetadataAnalyzer:  # Renamed to avoid duplicate class names
             file_meta = self.extractor.extract_file_metadata(file_path)
             # Extract content metadata
             content_meta = self.extractor.extract_content_metadata(content.text)
+            # Scan dates, amounts and numbers once for structure and entities
+            entity_scan = scan_entities(content.text)
             # Extract document structure
-            structure_meta = self.extractor.extract_document_structure(content.text)
+            structure_meta = self.extractor.extract_document_structure(content.text, entity_scan)
             # Extract entities
-            entities = self.extractor.extract_entities(content.text)
+            entities = self.extractor.extract_entities(content.text, entity_scan)
             # Calculate readability score
             readability = self.extractor._calculate_readability_score(content.text)
             return DocumentMetadata(
@@ -461,6 +436,7 @@ class MetadataAnalyzer:  # Renamed to avoid duplicate class names
                     "security_warnings": content.security_warnings,
                     **(content.metadata or {}),
                 },
+                entity_scan=entity_scan,
             )
 
         except Exception as e:
@@ -784,10 +760,12 @@ class MetadataService:
             file_meta = self.extractor.extract_file_metadata(file_path)
             # Extract content metadata
             content_meta = self.extractor.extract_content_metadata(content.text)
+            # Scan dates, amounts and numbers once for structure and entities
+            entity_scan = scan_entities(content.text)
             # Extract document structure
-            structure_meta = self.extractor.extract_document_structure(content.text)
+            structure_meta = self.extractor.extract_document_structure(content.text, entity_scan)
             # Extract entities
-            entities = self.extractor.extract_entities(content.text)
+            entities = self.extractor.extract_entities(content.text, entity_scan)
             # Calculate readability score (need to implement this)
             readability = self.extractor._calculate_readability_score(content.text)
             return DocumentMetadata(
@@ -823,6 +801,7 @@ class MetadataService:
                     "security_warnings": content.security_warnings,
                     **(content.metadata or {}),
                 },
+                entity_scan=entity_scan,
             )
 
         except Exception as e:
@@ -0,0 +1,188 @@
+"""
+OCR Preprocessing
+
+Prepares page renders and photos for Tesseract.
+
+PDF pages are rendered straight to grayscale at a resolution chosen per page:
+enough for the estimated text height to land near the size Tesseract reads
+best, never above the native resolution of the embedded scan, and capped in
+total pixels. Images (e.g. phone photos) are orientation-corrected, converted
+to grayscale and downscaled to the same pixel cap. Binarization and deskew
+are optional steps.
+"""
+
+import statistics
+from dataclasses import dataclass
+from typing import List, Optional
+
+from PIL import Image, ImageOps, ImageStat
+
+try:
+    import fitz
+
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    fitz = None  # type: ignore
+    PYMUPDF_AVAILABLE = False
+
+# Cap height is roughly this fraction of the font size
+_CAP_HEIGHT_RATIO = 0.7
+
+
+@dataclass
+class OCRPreprocessing:
+    """Options for preparing images for OCR."""
+
+    target_text_height: int = 30  # Capital letter height in pixels Tesseract reads best
+    default_dpi: int = 300  # Used when a page gives no hint about its text size
+    min_dpi: int = 150
+    max_dpi: int = 400
+    max_pixels: int = 16_000_000  # About A4 at 400 DPI
+    binarize: bool = False  # Otsu threshold (Tesseract's LSTM engine reads grayscale well)
+    deskew: bool = False  # Straighten pages rotated by up to max_skew_degrees
+    max_skew_degrees: float = 5.0
+
+
+def choose_render_dpi(page, options: Optional[OCRPreprocessing] = None) -> float:
+    """Pick the render resolution for OCR of a PDF page.
+
+    Args:
+        page: PyMuPDF page
+        options: Preprocessing options
+
+    Returns:
+        Resolution in DPI (72 = 1:1 with PDF points)
+    """
+    options = options or OCRPreprocessing()
+
+    # Scans: rendering above the embedded image's resolution adds no detail
+    dpi = _native_image_dpi(page)
+    if dpi is None:
+        font_size = _median_font_size(page)
+        if font_size:
+            dpi = options.target_text_height * 72 / (font_size * _CAP_HEIGHT_RATIO)
+        else:
+            dpi = options.default_dpi
+    dpi = min(max(dpi, options.min_dpi), options.max_dpi)
+
+    # Cap the bitmap size for oversized pages
+    width_in, height_in = page.rect.width / 72, page.rect.height / 72
+    if width_in > 0 and height_in > 0:
+        dpi = min(dpi, (options.max_pixels / (width_in * height_in)) ** 0.5)
+    return dpi
+
+
+def render_page_for_ocr(page, options: Optional[OCRPreprocessing] = None) -> Image.Image:
+    """Render a PDF page to a grayscale image prepared for OCR."""
+    options = options or OCRPreprocessing()
+    scale = choose_render_dpi(page, options) / 72
+    pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), colorspace=fitz.csGRAY, alpha=False)
+    image = Image.frombytes("L", (pix.width, pix.height), pix.samples)
+    return _finish(image, options)
+
+
+def preprocess_image(
+    image: Image.Image, options: Optional[OCRPreprocessing] = None
+) -> Image.Image:
+    """Prepare a photo or scanned image for OCR.
+
+    Applies EXIF orientation, converts to grayscale and downscales to
+    ``options.max_pixels``.
+    """
+    options = options or OCRPreprocessing()
+    image = ImageOps.exif_transpose(image)
+    if image.mode != "L":
+        image = image.convert("L")
+
+    pixels = image.width * image.height
+    if pixels > options.max_pixels:
+        ratio = (options.max_pixels / pixels) ** 0.5
+        size = (max(1, int(image.width * ratio)), max(1, int(image.height * ratio)))
+        image = image.resize(size, Image.LANCZOS)
+    return _finish(image, options)
+
+
+def _finish(image: Image.Image, options: OCRPreprocessing) -> Image.Image:
+    if options.deskew:
+        image = deskew(image, options.max_skew_degrees)
+    if options.binarize:
+        threshold = otsu_threshold(image)
+        image = image.point(lambda value: 255 if value > threshold else 0)
+    return image
+
+
+def otsu_threshold(image: Image.Image) -> int:
+    """Otsu's global threshold for a grayscale image."""
+    histogram = image.histogram()[:256]
+    total = sum(histogram)
+    if total == 0:
+        return 127
+    sum_all = sum(value * count for value, count in enumerate(histogram))
+
+    best_threshold, best_variance = 127, -1.0
+    weight_bg = sum_bg = 0
+    for value, count in enumerate(histogram):
+        weight_bg += count
+        if weight_bg == 0:
+            continue
+        weight_fg = total - weight_bg
+        if weight_fg == 0:
+            break
+        sum_bg += value * count
+        mean_bg = sum_bg / weight_bg
+        mean_fg = (sum_all - sum_bg) / weight_fg
+        variance = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+        if variance > best_variance:
+            best_threshold, best_variance = value, variance
+    return best_threshold
+
+
+def estimate_skew(image: Image.Image, max_degrees: float = 5.0, step: float = 0.5) -> float:
+    """Estimate page rotation in degrees from the horizontal projection profile.
+
+    Text lines give the sharpest row profile (highest variance of row ink)
+    when they are horizontal.
+    """
+    # Work on a small inverted copy: ink is bright, so rotation fill adds none
+    sample = ImageOps.invert(image)
+    sample.thumbnail((800, 800))
+
+    best_angle, best_score = 0.0, -1.0
+    steps = int(max_degrees / step)
+    for i in range(-steps, steps + 1):
+        angle = i * step
+        rotated = sample.rotate(angle, resample=Image.BILINEAR, fillcolor=0)
+        row_means = rotated.resize((1, rotated.height), Image.BOX)
+        score = ImageStat.Stat(row_means).var[0]
+        if score > best_score:
+            best_angle, best_score = angle, score
+    return best_angle
+
+
+def deskew(image: Image.Image, max_degrees: float = 5.0) -> Image.Image:
+    """Rotate a grayscale page so its text lines are horizontal."""
+    angle = estimate_skew(image, max_degrees)
+    if angle == 0:
+        return image
+    return image.rotate(angle, resample=Image.BICUBIC, expand=True, fillcolor=255)
+
+
+def _median_font_size(page) -> Optional[float]:
+    """Median font size of the page's text spans (partial text layers), if any."""
+    sizes: List[float] = []
+    for block in page.get_text("dict").get("blocks", []):
+        for line in block.get("lines", []):
+            sizes.extend(span["size"] for span in line.get("spans", []) if span["text"].strip())
+    return statistics.median(sizes) if sizes else None
+
+
+def _native_image_dpi(page) -> Optional[float]:
+    """Resolution of the largest image drawn on the page, in pixels per inch."""
+    best_area, best_dpi = 0.0, None
+    for info in page.get_image_info():
+        x0, y0, x1, y1 = info["bbox"]
+        width_in = (x1 - x0) / 72
+        area = width_in * (y1 - y0) / 72
+        if width_in > 0 and area > best_area:
+            best_area, best_dpi = area, info["width"] / width_in
+    return best_dpi
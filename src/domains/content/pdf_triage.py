@@ -0,0 +1,164 @@
+"""
+PDF Triage
+
+Cheap pre-flight inspection of a PDF before extraction.
+
+Reads the xref/trailer state (encryption, page count, repair) and each
+page's resources and content stream, without extracting text or rendering,
+to decide up front whether a document can go straight to text extraction,
+needs OCR on specific pages, or should be skipped. The plan lets the
+extraction service avoid the text -> pypdf -> OCR cascade and lets the
+pipeline route OCR-heavy documents to a separate worker lane.
+"""
+
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .pymupdf_lock import PYMUPDF_LOCK
+
+try:
+    import fitz
+
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    fitz = None  # type: ignore
+    PYMUPDF_AVAILABLE = False
+
+# Text-showing operators in a page content stream
+_TEXT_OPERATOR = re.compile(rb"(?:\)|\]|>)\s*(?:Tj|TJ|'|\")")
+
+PLAN_TEXT = "text"  # No image-only pages: text extraction cascade
+PLAN_OCR = "ocr"  # OCR the pages listed in ocr_pages
+PLAN_SKIP = "skip"  # Nothing extractable (encrypted, empty, unreadable)
+
+# Matches the size limit enforced by PDFContentProcessor security validation
+MAX_TRIAGE_FILE_SIZE = 50 * 1024 * 1024
+
+
+@dataclass
+class PDFTriage:
+    """Pre-flight extraction plan for one PDF."""
+
+    plan: str
+    file_size: int = 0
+    page_count: int = 0
+    encrypted: bool = False
+    text_pages: List[int] = field(default_factory=list)
+    ocr_pages: List[int] = field(default_factory=list)  # Image-only pages (0-based)
+    blank_pages: List[int] = field(default_factory=list)
+    pages_inspected: int = 0
+    reason: str = ""
+
+    @property
+    def ocr_heavy(self) -> bool:
+        """Whether extraction will be dominated by OCR."""
+        return self.plan == PLAN_OCR
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly representation."""
+        return asdict(self)
+
+
+def triage_pdf(file_path: str, max_pages: int = 200) -> Optional[PDFTriage]:
+    """Inspect a PDF and plan its extraction.
+
+    Args:
+        file_path: Path to PDF file
+        max_pages: Inspect at most this many pages; the rest follow the
+            text-first cascade
+
+    Returns:
+        PDFTriage plan, or None if PyMuPDF is not available
+    """
+    if not PYMUPDF_AVAILABLE:
+        return None
+
+    try:
+        stat = os.stat(file_path)
+    except OSError as e:
+        return PDFTriage(plan=PLAN_SKIP, reason=f"unreadable: {e}")
+
+    cache_key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns, max_pages)
+    with _cache_lock:
+        cached = _triage_cache.get(cache_key)
+        if cached is not None:
+            _triage_cache.move_to_end(cache_key)
+            return cached
+
+    with PYMUPDF_LOCK:
+        triage = _inspect(file_path, stat.st_size, max_pages)
+
+    with _cache_lock:
+        _triage_cache[cache_key] = triage
+        while len(_triage_cache) > _TRIAGE_CACHE_SIZE:
+            _triage_cache.popitem(last=False)
+    return triage
+
+
+def _inspect(file_path: str, file_size: int, max_pages: int) -> PDFTriage:
+    if file_size == 0:
+        return PDFTriage(plan=PLAN_SKIP, reason="empty file")
+    if file_size > MAX_TRIAGE_FILE_SIZE:
+        return PDFTriage(plan=PLAN_SKIP, file_size=file_size, reason="file too large")
+
+    try:
+        doc = fitz.open(file_path)
+    except Exception as e:
+        return PDFTriage(plan=PLAN_SKIP, file_size=file_size, reason=f"unreadable: {e}")
+
+    try:
+        triage = PDFTriage(
+            plan=PLAN_TEXT,
+            file_size=file_size,
+            page_count=len(doc),
+            encrypted=bool(doc.is_encrypted),
+        )
+        if doc.needs_pass:
+            triage.plan = PLAN_SKIP
+            triage.reason = "encrypted"
+            return triage
+        if triage.page_count == 0:
+            triage.plan = PLAN_SKIP
+            triage.reason = "no pages"
+            return triage
+
+        for page_index in range(min(triage.page_count, max_pages)):
+            page = doc[page_index]
+            if _has_text_layer(page):
+                triage.text_pages.append(page_index)
+            elif page.get_images():
+                triage.ocr_pages.append(page_index)
+            else:
+                triage.blank_pages.append(page_index)
+        triage.pages_inspected = min(triage.page_count, max_pages)
+
+        if triage.ocr_pages:
+            triage.plan = PLAN_OCR
+            triage.reason = f"{len(triage.ocr_pages)} image-only page(s)"
+        else:
+            triage.reason = "no image-only pages"
+        return triage
+
+    except Exception as e:
+        logging.debug("PDF triage failed for %s: %s", file_path, e)
+        return PDFTriage(plan=PLAN_TEXT, file_size=file_size, reason=f"triage failed: {e}")
+    finally:
+        doc.close()
+
+
+def _has_text_layer(page) -> bool:
+    """Whether a page draws text (text-showing operators in its content stream)."""
+    if _TEXT_OPERATOR.search(page.read_contents()):
+        return True
+    # Text drawn inside form XObjects does not appear in the page stream
+    return bool(page.get_fonts()) and bool(page.get_xobjects())
+
+
+_TRIAGE_CACHE_SIZE = 512
+_triage_cache: "OrderedDict[tuple, PDFTriage]" = OrderedDict()
+_cache_lock = threading.Lock()
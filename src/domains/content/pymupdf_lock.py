@@ -0,0 +1,15 @@
+"""
+PyMuPDF Lock
+
+PyMuPDF does not support being called from several threads at once (even on
+different documents), and doing so can crash the interpreter. Extraction runs
+on the OCR and text-lane worker threads, so every PyMuPDF call (open, page
+inspection, text extraction, rendering) is made while holding PYMUPDF_LOCK.
+Work on plain Python objects, such as Tesseract OCR of a rendered page, runs
+outside the lock and stays parallel.
+"""
+
+import threading
+
+# Reentrant so helpers that take the lock can be called from locked sections
+PYMUPDF_LOCK = threading.RLock()
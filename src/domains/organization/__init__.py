@@ -9,11 +9,27 @@ Services:
 - FolderService: Directory operations and structure management
 - LearningService: State management and continuous improvement
 - OrganizationService: Main orchestrating service
+- TemplateNamingService: Filenames for recurring templated documents without the AI
 """
 
-from .clustering_service import ClusteringService
-from .folder_service import FolderService
-from .learning_service import LearningService
-from .organization_service import OrganizationService
+from shared.infrastructure.import_utilities import lazy_exports
 
-__all__ = ["ClusteringService", "FolderService", "LearningService", "OrganizationService"]
+# Imported on first access (see domains/__init__.py)
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "ClusteringService": ".clustering_service",
+        "FolderService": ".folder_service",
+        "LearningService": ".learning_service",
+        "OrganizationService": ".organization_service",
+        "TemplateNamingService": ".template_naming",
+    },
+)
+
+__all__ = [
+    "ClusteringService",
+    "FolderService",
+    "LearningService",
+    "OrganizationService",
+    "TemplateNamingService",
+]
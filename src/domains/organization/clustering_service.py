@@ -86,15 +86,19 @@ class ClusteringConfig:
 class ClusteringService:
     """Main document clustering service with progressive enhancement."""
 
-    def __init__(self, config: Optional[ClusteringConfig] = None, spacy_model=None):
+    def __init__(
+        self, config: Optional[ClusteringConfig] = None, spacy_model=None, reference_index=None
+    ):
         """Initialize clustering service.
 
         Args:
             config: Clustering configuration (uses defaults if None)
             spacy_model: Pre-loaded spaCy model to use (for performance optimization)
+            reference_index: Persistent ReferenceIndex for ML cluster interpretation (optional)
         """
         self.config = config or ClusteringConfig()
         self.spacy_model = spacy_model
+        self.reference_index = reference_index
         self.logger = logging.getLogger(__name__)
 
         # Initialize classifiers
@@ -121,7 +125,7 @@ class ClusteringService:
 
             # ML classifier (optional)
             if SelectiveMLRefinement:
-                self.ml_refiner = SelectiveMLRefinement()
+                self.ml_refiner = SelectiveMLRefinement(reference_index=self.reference_index)
                 self.have_ml_refiner = True
             else:
                 self.ml_refiner = None
@@ -147,11 +151,15 @@ class ClusteringService:
             self.have_ml_refiner = False
             self.have_uncertainty_detector = False
 
-    def classify_document(self, document: Dict[str, Any]) -> ClassificationResult:
+    def classify_document(
+        self, document: Dict[str, Any], allow_ml: bool = True
+    ) -> ClassificationResult:
         """Classify a single document using progressive enhancement.
 
         Args:
             document: Document dictionary with content, filename, metadata
+            allow_ml: Apply per-document ML enhancement to uncertain results; callers
+                that refine uncertain documents in batches pass False
 
         Returns:
             ClassificationResult with category and confidence
@@ -171,7 +179,11 @@ class ClusteringService:
                 return rule_result
 
             # Step 2: ML enhancement for uncertain cases (if available and threshold met)
-            if self.have_ml_refiner and self._should_apply_ml_enhancement(rule_result.confidence):
+            if (
+                allow_ml
+                and self.have_ml_refiner
+                and self._should_apply_ml_enhancement(rule_result.confidence)
+            ):
 
                 try:
                     ml_result = self._enhance_with_ml(document, rule_result)
@@ -268,7 +280,7 @@ class ClusteringService:
                 uncertain_docs, all_classified_docs
             )
             ml_result = ml_results.get(
-                document.get("filename", ""),
+                document.get("id") or document.get("filename", ""),
                 {
                     "category": rule_result.category,
                     "confidence": rule_result.confidence,
@@ -312,13 +324,35 @@ class ClusteringService:
         Returns:
             Dictionary mapping document IDs to classification results
         """
+        self.logger.info("Starting batch classification of %d documents", len(documents))
+        results, uncertain_documents, references = self.classify_with_rules(documents)
+        return self.refine_batch_results(results, uncertain_documents, references)
+
+    def classify_with_rules(
+        self, documents: List[Dict[str, Any]], start_index: int = 0
+    ) -> Tuple[
+        Dict[str, ClassificationResult],
+        List[Tuple[str, Dict[str, Any], ClassificationResult]],
+        List[Tuple[Dict[str, Any], ClassificationResult]],
+    ]:
+        """Run the per-document pass of batch classification.
+
+        Streams can call this chunk by chunk and pass the collected outputs to
+        refine_batch_results once, so batch ML refinement sees the whole run.
+
+        Args:
+            documents: Document dictionaries
+            start_index: Position of the first document in the run (for fallback IDs)
+
+        Returns:
+            (results by document ID, uncertain (doc_id, document, result) tuples,
+            confident (reference document, result) pairs with content trimmed)
+        """
         results = {}
         uncertain_documents = []
+        references = []
 
-        self.logger.info("Starting batch classification of %d documents", len(documents))
-
-        # Step 1: Classify all documents with rules
-        for i, doc in enumerate(documents):
+        for i, doc in enumerate(documents, start_index):
             # Use the document path as ID if available
             # Check for various path keys that might be used
             doc_id = (
@@ -336,33 +370,117 @@ class ClusteringService:
                 # Track uncertain documents for potential batch ML processing
                 if result.confidence < self.config.ml_threshold:
                     uncertain_documents.append((doc_id, doc, result))
+                else:
+                    # Keep only what the reference index embeds
+                    reference = {
+                        "filename": doc.get("filename", ""),
+                        "content": doc.get("content", "")[:500],
+                    }
+                    references.append((reference, result))
 
             except Exception as e:
                 self.logger.error("Classification failed for %s: %s", doc_id, e)
                 results[doc_id] = self._create_fallback_result(doc, str(e))
 
-        # Step 2: Batch ML processing for uncertain documents (if threshold met)
-        if self.have_ml_refiner and len(uncertain_documents) >= self.config.min_ml_documents:
+        return results, uncertain_documents, references
 
-            try:
-                self.logger.info(
-                    "Applying ML enhancement to %d uncertain documents", len(uncertain_documents)
-                )
-                enhanced_results = self._batch_ml_enhancement(uncertain_documents)
+    def refine_batch_results(
+        self,
+        results: Dict[str, ClassificationResult],
+        uncertain_documents: List[Tuple[str, Dict[str, Any], ClassificationResult]],
+        references: List[Tuple[Dict[str, Any], ClassificationResult]],
+    ) -> Dict[str, ClassificationResult]:
+        """Finish batch classification over the outputs of classify_with_rules.
+
+        Args:
+            results: Results by document ID; refined results replace entries in place
+            uncertain_documents: Uncertain (doc_id, document, result) tuples
+            references: Confident (document, result) pairs
+
+        Returns:
+            The updated results
+        """
+        # Confident results grow the persistent reference index for future sessions
+        self.record_reference_documents(references)
 
-                # Update results with ML enhancements
-                for doc_id, enhanced_result in enhanced_results.items():
-                    if doc_id in results:
-                        results[doc_id] = enhanced_result
+        # Batch ML processing for uncertain documents (if threshold met)
+        if len(uncertain_documents) >= self.config.min_ml_documents:
+            enhanced_results = self.refine_uncertain_documents(uncertain_documents)
 
-            except Exception as e:
-                self.logger.warning("Batch ML enhancement failed: %s", e)
+            # Update results with ML enhancements
+            for doc_id, enhanced_result in enhanced_results.items():
+                if doc_id in results:
+                    results[doc_id] = enhanced_result
 
         # Log batch summary
         self._log_batch_summary(results)
 
         return results
 
+    def record_reference_documents(
+        self, classified: List[Tuple[Dict[str, Any], ClassificationResult]]
+    ) -> int:
+        """Add confidently classified documents to the reference index.
+
+        Args:
+            classified: (document, result) pairs
+
+        Returns:
+            Number of references added (0 without an index or ML refiner)
+        """
+        if self.reference_index is None or not self.have_ml_refiner or self.ml_refiner is None:
+            return 0
+
+        references = [
+            {
+                "filename": doc.get("filename", ""),
+                "content_preview": doc.get("content", "")[:500],
+                "category": result.category,
+                "confidence": result.confidence,
+            }
+            for doc, result in classified
+            if result.confidence >= self.config.ml_threshold
+        ]
+        if not references:
+            return 0
+
+        try:
+            return self.ml_refiner.add_reference_documents(references)
+        except Exception as e:
+            self.logger.warning("Failed to update reference index: %s", e)
+            return 0
+
+    def save_reference_index(self) -> bool:
+        """Persist references recorded this session (one index write per run).
+
+        Returns:
+            True if the index was written
+        """
+        if self.reference_index is None:
+            return False
+        return self.reference_index.save()
+
+    def refine_uncertain_documents(
+        self, uncertain_docs: List[Tuple[str, Dict[str, Any], ClassificationResult]]
+    ) -> Dict[str, ClassificationResult]:
+        """Apply batch ML enhancement to uncertain rule-based results.
+
+        Args:
+            uncertain_docs: (doc_id, document, rule_result) tuples
+
+        Returns:
+            Dictionary mapping document IDs to refined results (empty if ML unavailable)
+        """
+        if not self.have_ml_refiner or not uncertain_docs:
+            return {}
+
+        try:
+            self.logger.info("Applying ML enhancement to %d uncertain documents", len(uncertain_docs))
+            return self._batch_ml_enhancement(uncertain_docs)
+        except Exception as e:
+            self.logger.warning("Batch ML enhancement failed: %s", e)
+            return {}
+
     def _batch_ml_enhancement(
         self, uncertain_docs: List[Tuple[str, Dict[str, Any], ClassificationResult]]
     ) -> Dict[str, ClassificationResult]:
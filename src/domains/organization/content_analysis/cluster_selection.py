@@ -0,0 +1,192 @@
+"""
+Cluster Selection Engine
+
+Scalable choice of cluster count for the ML refinement layer.
+
+The k-search no longer fits an independent full KMeans and exact O(n²)
+silhouette for every candidate k:
+- Large inputs use MiniBatchKMeans; small inputs keep exact KMeans
+- Centroids are warm-started across k (the k+1 solution starts from the k
+  solution plus the worst-fit point)
+- Silhouette is exact for small inputs and sampled or simplified
+  (centroid-based, O(n·k)) for large ones
+- Candidate k values can optionally be evaluated in parallel
+
+All estimators use fixed seeds, so assignments are deterministic.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from shared.infrastructure.import_utilities import module_available
+
+# scikit-learn takes seconds to import; it is loaded when a selection first runs
+SKLEARN_AVAILABLE = module_available("sklearn")
+
+
+@dataclass
+class ClusterSelectionConfig:
+    """Configuration for cluster count selection."""
+
+    max_k: int = 8
+    random_state: int = 42
+    silhouette: str = "auto"  # "exact", "sampled", "simplified" or "auto"
+    silhouette_sample_size: int = 2000  # Exact silhouette at or below this size
+    minibatch_threshold: int = 2000  # Use MiniBatchKMeans above this many documents
+    minibatch_batch_size: int = 1024
+    warm_start: bool = True  # Seed k+1 from the k solution (sequential search only)
+    parallel_k: int = 1  # Worker threads for evaluating k values independently
+
+
+@dataclass
+class ClusterSelection:
+    """Result of cluster count selection."""
+
+    k: int
+    labels: List[int]
+    score: float
+    scores_by_k: Dict[int, float] = field(default_factory=dict)
+
+
+class ClusterSelectionEngine:
+    """Chooses the number of clusters and returns the chosen assignment."""
+
+    def __init__(self, config: Optional[ClusterSelectionConfig] = None):
+        """Initialize engine.
+
+        Args:
+            config: Selection configuration (defaults if None)
+        """
+        self.config = config or ClusterSelectionConfig()
+        self.logger = logging.getLogger(__name__)
+
+    def is_available(self) -> bool:
+        """Check if scikit-learn is available."""
+        return SKLEARN_AVAILABLE
+
+    def select(self, embeddings: np.ndarray) -> ClusterSelection:
+        """Pick the best k in [2, max_k] by silhouette and return its assignment.
+
+        Args:
+            embeddings: Document embeddings (n_docs x dims)
+
+        Returns:
+            ClusterSelection with chosen k, labels and per-k scores
+        """
+        n_docs = len(embeddings)
+        max_k = min(self.config.max_k, n_docs // 2)
+        if max_k < 2 or not SKLEARN_AVAILABLE:
+            return ClusterSelection(k=1, labels=[0] * n_docs, score=-1.0)
+
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        candidates = list(range(2, max_k + 1))
+
+        if self.config.parallel_k > 1:
+            with ThreadPoolExecutor(max_workers=self.config.parallel_k) as executor:
+                fits = list(executor.map(lambda k: self._fit(embeddings, k, None), candidates))
+        else:
+            fits = []
+            init = None
+            for k in candidates:
+                labels, centroids = self._fit(embeddings, k, init)
+                fits.append((labels, centroids))
+                if self.config.warm_start:
+                    init = self._split_worst_cluster(embeddings, labels, centroids)
+
+        best: Optional[Tuple[int, np.ndarray, float]] = None
+        scores_by_k = {}
+        for k, (labels, centroids) in zip(candidates, fits):
+            if len(np.unique(labels)) < 2:
+                continue
+            score = self._score(embeddings, labels, centroids)
+            scores_by_k[k] = score
+            if best is None or score > best[2]:
+                best = (k, labels, score)
+
+        if best is None:
+            return ClusterSelection(k=1, labels=[0] * n_docs, score=-1.0, scores_by_k=scores_by_k)
+
+        k, labels, score = best
+        return ClusterSelection(k=k, labels=labels.tolist(), score=score, scores_by_k=scores_by_k)
+
+    def _fit(
+        self, embeddings: np.ndarray, k: int, init: Optional[np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Fit k clusters, optionally from explicit initial centroids."""
+        from sklearn.cluster import KMeans, MiniBatchKMeans
+
+        # Explicit centroids need a single init; k-means++ keeps sklearn's defaults
+        init_arg = init if init is not None else "k-means++"
+
+        if len(embeddings) > self.config.minibatch_threshold:
+            estimator = MiniBatchKMeans(
+                n_clusters=k,
+                init=init_arg,
+                n_init=1 if init is not None else 3,
+                batch_size=self.config.minibatch_batch_size,
+                random_state=self.config.random_state,
+            )
+        else:
+            estimator = KMeans(
+                n_clusters=k,
+                init=init_arg,
+                n_init=1 if init is not None else "auto",
+                random_state=self.config.random_state,
+            )
+
+        labels = estimator.fit_predict(embeddings)
+        return labels, estimator.cluster_centers_
+
+    @staticmethod
+    def _split_worst_cluster(
+        embeddings: np.ndarray, labels: np.ndarray, centroids: np.ndarray
+    ) -> np.ndarray:
+        """Initial centroids for k+1: current centroids plus the worst-fit point."""
+        distances = np.linalg.norm(embeddings - centroids[labels], axis=1)
+        return np.vstack([centroids, embeddings[int(np.argmax(distances))]])
+
+    def _score(self, embeddings: np.ndarray, labels: np.ndarray, centroids: np.ndarray) -> float:
+        """Silhouette score using the configured strategy."""
+        from sklearn.metrics import silhouette_score
+
+        mode = self.config.silhouette
+        n_docs = len(embeddings)
+        if mode == "auto":
+            mode = "exact" if n_docs <= self.config.silhouette_sample_size else "sampled"
+
+        if mode == "simplified":
+            return self._simplified_silhouette(embeddings, labels, centroids)
+        if mode == "sampled" and n_docs > self.config.silhouette_sample_size:
+            return float(
+                silhouette_score(
+                    embeddings,
+                    labels,
+                    sample_size=self.config.silhouette_sample_size,
+                    random_state=self.config.random_state,
+                )
+            )
+        return float(silhouette_score(embeddings, labels))
+
+    @staticmethod
+    def _simplified_silhouette(
+        embeddings: np.ndarray, labels: np.ndarray, centroids: np.ndarray
+    ) -> float:
+        """Centroid-based silhouette: O(n·k) instead of O(n²)."""
+        # Squared distances via the dot-product expansion, one matrix op for all points
+        distances = (
+            np.sum(embeddings**2, axis=1)[:, None]
+            - 2.0 * embeddings @ centroids.T
+            + np.sum(centroids**2, axis=1)[None, :]
+        )
+        distances = np.sqrt(np.maximum(distances, 0.0))
+        rows = np.arange(len(embeddings))
+        own = distances[rows, labels]
+        distances[rows, labels] = np.inf
+        nearest_other = distances.min(axis=1)
+        denom = np.maximum(own, nearest_other)
+        scores = np.where(denom > 0, (nearest_other - own) / np.where(denom > 0, denom, 1.0), 0.0)
+        return float(scores.mean())
@@ -0,0 +1,220 @@
+"""
+Embedding Backend
+
+Pluggable sentence-embedding backends for the ML refinement layer.
+
+The reference backend is sentence-transformers ``all-mpnet-base-v2`` in fp32.
+CPU-only hosts can opt into an ONNX Runtime export (int8-quantized if asked
+for) and/or run a smaller MiniLM model chosen from the hardware tier. All backends expose the
+``encode(texts, convert_to_numpy=True)`` call the refiner already uses, with
+configurable batch size, thread count and a sequence length sized for the
+refiner's document summaries (filename + 500 characters + a few entities).
+"""
+
+import logging
+import platform
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+from shared.infrastructure.import_utilities import module_available
+from shared.infrastructure.worker_sizing import get_worker_sizing
+
+# Both pull in torch or a native runtime; they are imported when a model loads
+SENTENCE_TRANSFORMERS_AVAILABLE = module_available("sentence_transformers")
+ONNXRUNTIME_AVAILABLE = module_available("onnxruntime")
+
+REFERENCE_MODEL = "all-mpnet-base-v2"
+
+# Smaller models for hosts that cannot afford the reference model
+MODEL_BY_TIER = {
+    "premium": REFERENCE_MODEL,
+    "enhanced": REFERENCE_MODEL,
+    "standard": "all-MiniLM-L12-v2",
+    "ultra_lightweight": "all-MiniLM-L6-v2",
+}
+
+# Summaries are ~600 characters, roughly 150-180 word pieces
+DEFAULT_MAX_SEQ_LENGTH = 192
+
+
+@dataclass
+class EmbeddingBackendConfig:
+    """Configuration for embedding backend selection."""
+
+    backend: str = "auto"  # "auto"/"sentence_transformers" (fp32) or "onnx" (opt-in)
+    model_name: Optional[str] = None  # None selects by hardware tier
+    batch_size: Optional[int] = None  # None follows the worker sizing policy
+    num_threads: Optional[int] = None  # None leaves the runtime default
+    max_seq_length: int = DEFAULT_MAX_SEQ_LENGTH
+    quantized: bool = False  # Use the int8 export with the ONNX backend (opt-in)
+
+
+class SentenceTransformerBackend:
+    """sentence-transformers on PyTorch in fp32 (the reference backend)."""
+
+    name = "sentence_transformers"
+
+    def __init__(self, model_name: str, config: EmbeddingBackendConfig):
+        """Load model.
+
+        Args:
+            model_name: sentence-transformers model id
+            config: Backend configuration
+        """
+        if not SENTENCE_TRANSFORMERS_AVAILABLE:
+            raise RuntimeError("sentence-transformers is not installed")
+
+        self.model_name = model_name
+        self.config = config
+        self.model = self._load_model()
+        if getattr(self.model, "max_seq_length", None):
+            self.model.max_seq_length = min(self.model.max_seq_length, config.max_seq_length)
+
+    def _load_model(self):
+        if self.config.num_threads:
+            try:
+                import torch
+
+                torch.set_num_threads(self.config.num_threads)
+            except ImportError:
+                pass
+        from sentence_transformers import SentenceTransformer
+
+        return SentenceTransformer(self.model_name, device="cpu")
+
+    def encode(self, texts: List[str], convert_to_numpy: bool = True) -> np.ndarray:
+        """Embed texts in configured batches.
+
+        Args:
+            texts: Texts to embed
+            convert_to_numpy: Accepted for SentenceTransformer compatibility (always NumPy)
+
+        Returns:
+            Embedding matrix (len(texts) x dims)
+        """
+        return self.model.encode(
+            texts,
+            batch_size=self.config.batch_size or get_worker_sizing().limits.embedding_batch_size,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+
+    @property
+    def identity(self) -> str:
+        """Backend + model identity (embeddings are only comparable within one identity).
+
+        The fp32 reference backend is identified by the model alone, so indexes
+        built before other backends existed stay valid.
+        """
+        if self.name == SentenceTransformerBackend.name:
+            return self.model_name
+        return f"{self.model_name}:{self.name}"
+
+
+class OnnxEmbeddingBackend(SentenceTransformerBackend):
+    """sentence-transformers running an (int8-quantized) ONNX Runtime export on CPU."""
+
+    name = "onnx"
+
+    def _load_model(self):
+        from sentence_transformers import SentenceTransformer
+
+        model_kwargs = {"provider": "CPUExecutionProvider"}
+        if self.config.quantized:
+            model_kwargs["file_name"] = _quantized_onnx_file()
+            self.name = "onnx_int8"
+        if self.config.num_threads:
+            import onnxruntime
+
+            session_options = onnxruntime.SessionOptions()
+            session_options.intra_op_num_threads = self.config.num_threads
+            model_kwargs["session_options"] = session_options
+        return SentenceTransformer(
+            self.model_name, device="cpu", backend="onnx", model_kwargs=model_kwargs
+        )
+
+
+def _quantized_onnx_file() -> str:
+    """Pick the published int8 export matching this CPU's instruction set."""
+    machine = platform.machine().lower()
+    if machine in ("arm64", "aarch64"):
+        return "onnx/model_qint8_arm64.onnx"
+
+    flags = ""
+    try:
+        with open("/proc/cpuinfo", "r", encoding="utf-8") as f:
+            flags = f.read()
+    except OSError:
+        pass
+    if "avx512_vnni" in flags:
+        return "onnx/model_qint8_avx512_vnni.onnx"
+    if "avx512" in flags:
+        return "onnx/model_qint8_avx512.onnx"
+    return "onnx/model_quint8_avx2.onnx"
+
+
+def select_model_for_hardware(hardware_detector=None) -> str:
+    """Choose an embedding model for this host's hardware tier.
+
+    Args:
+        hardware_detector: HardwareDetector instance (created if None)
+
+    Returns:
+        sentence-transformers model id
+    """
+    try:
+        if hardware_detector is None:
+            from shared.infrastructure.hardware_detector import HardwareDetector
+
+            hardware_detector = HardwareDetector()
+        return MODEL_BY_TIER.get(hardware_detector.get_system_tier(), REFERENCE_MODEL)
+    except Exception as e:
+        logging.debug("Hardware tier detection failed, using reference model: %s", e)
+        return REFERENCE_MODEL
+
+
+def create_embedding_backend(
+    config: Optional[EmbeddingBackendConfig] = None, hardware_detector=None
+) -> Optional[SentenceTransformerBackend]:
+    """Create the best available embedding backend for the configuration.
+
+    ``auto`` is the PyTorch fp32 reference backend. ONNX Runtime, and its int8
+    export with ``quantized``, changes the embeddings and is only used when
+    requested; an ONNX request that cannot be served returns None rather
+    than silently using another backend.
+
+    Args:
+        config: Backend configuration (defaults if None)
+        hardware_detector: HardwareDetector used when no model is configured
+
+    Returns:
+        Loaded backend, or None if no embedding runtime is installed
+    """
+    config = config or EmbeddingBackendConfig()
+    if not SENTENCE_TRANSFORMERS_AVAILABLE:
+        return None
+
+    if config.backend == "onnx" and not ONNXRUNTIME_AVAILABLE:
+        logging.warning("ONNX embedding backend requested but onnxruntime is not installed")
+        return None
+
+    model_name = config.model_name or select_model_for_hardware(hardware_detector)
+
+    if config.backend == "onnx":
+        try:
+            backend = OnnxEmbeddingBackend(model_name, config)
+            logging.info("Embedding backend: %s (%s)", model_name, backend.name)
+            return backend
+        except Exception as e:
+            logging.warning("ONNX embedding backend failed to load: %s", e)
+            return None
+
+    try:
+        backend = SentenceTransformerBackend(model_name, config)
+        logging.info("Embedding backend: %s (%s)", model_name, backend.name)
+        return backend
+    except Exception as e:
+        logging.warning("Failed to load embedding model: %s", e)
+        return None
@@ -9,10 +9,12 @@ import logging
 import re
 import warnings
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-import spacy
-from dateutil import parser as date_parser
+from shared.infrastructure.entity_scanner import EntityScanResult, scan_entities
+
+# Display symbols for scanned currency codes; other codes are shown as a prefix
+CURRENCY_SYMBOLS = {"USD": "$", "EUR": "€", "GBP": "£"}
 
 
 class ContentMetadataExtractor:
@@ -21,8 +23,10 @@ class ContentMetadataExtractor:
     _spacy_warning_shown = False  # Class-level flag to prevent warning spam
 
     def __init__(self):
-        """Initialize metadata extractor with spaCy and date parsing."""
+        """Initialize metadata extractor with spaCy."""
         try:
+            import spacy  # Deferred: importing spaCy takes seconds
+
             # Suppress spaCy warnings during model loading
             with warnings.catch_warnings():
                 warnings.filterwarnings("ignore", category=UserWarning, module="spacy")
@@ -30,35 +34,23 @@ class ContentMetadataExtractor:
                 # Keep tagger, attribute_ruler, and lemmatizer for better text analysis
                 # Only disable parser since we don't need dependency parsing for metadata extraction
                 self.nlp = spacy.load("en_core_web_sm", disable=["parser"])
-        except OSError:
+        except (ImportError, OSError):
             # Graceful fallback if spaCy not available - warn only once
             if not ContentMetadataExtractor._spacy_warning_shown:
                 logging.warning("spaCy model not available, using basic fallback")
                 ContentMetadataExtractor._spacy_warning_shown = True
             self.nlp = None
 
-        # Date patterns for extraction
-        self.date_patterns = [
-            r"\b\d{1,2}[-/]\d{1,2}[-/]\d{2,4}\b",  # MM/DD/YYYY or MM-DD-YYYY
-            r"\b\d{4}[-/]\d{1,2}[-/]\d{1,2}\b",  # YYYY/MM/DD or YYYY-MM-DD
-            r"\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+\d{1,2},?\s+\d{4}\b",  # Month DD, YYYY
-            r"\b\d{1,2}\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+\d{4}\b",  # DD Month YYYY
-        ]
-
-        # Amount/currency patterns
-        self.amount_patterns = [
-            r"\$[\d,]+\.?\d*",  # Dollar amounts
-            r"[\d,]+\.\d{2}\s*(?:USD|dollars?)",  # Explicit currency
-            r"amount[:\s]+\$?[\d,]+\.?\d*",  # Amount labels
-        ]
-
-    def extract_metadata(self, content: str, filename: str) -> Dict[str, Any]:
+    def extract_metadata(
+        self, content: str, filename: str, entity_scan: Optional[EntityScanResult] = None
+    ) -> Dict[str, Any]:
         """
         Extract comprehensive metadata from document content.
 
         Args:
             content: Document content text (from OCR processing)
             filename: Document filename for additional context
+            entity_scan: Entity scan from content extraction (scanned here if None)
 
         Returns:
             Dictionary containing extracted metadata
@@ -81,11 +73,16 @@ class ContentMetadataExtractor:
         # Extract key entities using spaCy if available
         metadata["key_entities"] = self._extract_entities(content)
 
+        # Dates and amounts come from the single-pass entity scan
+        if entity_scan is None:
+            entity_scan = scan_entities(content)
+        metadata["entity_scan"] = entity_scan
+
         # Extract dates from content
-        metadata["date_detected"] = self._extract_dates(content)
+        metadata["date_detected"] = self._extract_dates(entity_scan)
 
         # Extract amounts/financial information
-        metadata["amounts_detected"] = self._extract_amounts(content)
+        metadata["amounts_detected"] = self._extract_amounts(entity_scan)
 
         # Extract document structure information
         metadata["structure_info"] = self._analyze_document_structure(content)
@@ -142,58 +139,35 @@ class ContentMetadataExtractor:
 
         return entities
 
-    def _extract_dates(self, content: str) -> List[Dict[str, Any]]:
-        """Extract dates from content using multiple methods."""
-        dates_found = []
-
-        # Use regex patterns first
-        for pattern in self.date_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            for match in matches:
-                try:
-                    # Try to parse the date
-                    parsed_date = date_parser.parse(match, fuzzy=False)
-                    dates_found.append(
-                        {
-                            "raw_text": match,
-                            "parsed_date": parsed_date.isoformat()[:10],  # YYYY-MM-DD format
-                            "year": parsed_date.year,
-                            "method": "regex",
-                        }
-                    )
-                except (ValueError, TypeError):
-                    continue
-
-        # Remove duplicates based on parsed date
+    def _extract_dates(self, entity_scan: EntityScanResult) -> List[Dict[str, Any]]:
+        """Summarize scanned dates, one entry per distinct day."""
         unique_dates = {}
-        for date_info in dates_found:
-            date_key = date_info.get("parsed_date")
-            if date_key and date_key not in unique_dates:
-                unique_dates[date_key] = date_info
+        for entity in entity_scan.dates:
+            parsed_date = entity.value
+            date_key = parsed_date.date().isoformat()  # YYYY-MM-DD format
+            if date_key not in unique_dates:
+                unique_dates[date_key] = {
+                    "raw_text": entity.text,
+                    "parsed_date": date_key,
+                    "year": parsed_date.year,
+                    "month": parsed_date.month,
+                    "day": parsed_date.day,
+                    "method": "regex",
+                }
 
         return list(unique_dates.values())[:10]  # Limit to 10 dates
 
-    def _extract_amounts(self, content: str) -> List[Dict[str, Any]]:
-        """Extract monetary amounts from content."""
-        amounts_found = []
-
-        for pattern in self.amount_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            for match in matches:
-                # Clean up the amount
-                clean_amount = re.sub(r"[^\d.,]", "", match)
-                try:
-                    # Try to convert to float
-                    numeric_value = float(clean_amount.replace(",", ""))
-                    amounts_found.append(
-                        {
-                            "raw_text": match.strip(),
-                            "numeric_value": numeric_value,
-                            "formatted": f"${numeric_value:,.2f}",
-                        }
-                    )
-                except ValueError:
-                    continue
+    def _extract_amounts(self, entity_scan: EntityScanResult) -> List[Dict[str, Any]]:
+        """Summarize scanned monetary amounts, largest first."""
+        amounts_found = [
+            {
+                "raw_text": entity.text,
+                "numeric_value": entity.value,
+                "currency": entity.currency,
+                "formatted": _format_amount(entity.value, entity.currency),
+            }
+            for entity in entity_scan.amounts
+        ]
 
         # Sort by value and limit results
         amounts_found.sort(key=lambda x: x["numeric_value"], reverse=True)
@@ -272,3 +246,11 @@ class ContentMetadataExtractor:
                 fiscal_hints["fiscal_keywords"].append(keyword)
 
         return fiscal_hints
+
+
+def _format_amount(value: float, currency: Optional[str]) -> str:
+    """Format an amount with its currency; amounts without one keep the dollar sign."""
+    symbol = CURRENCY_SYMBOLS.get(currency or "USD")
+    if symbol is None:
+        return f"{currency} {value:,.2f}"
+    return f"{symbol}{value:,.2f}"
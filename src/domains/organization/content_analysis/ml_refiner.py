@@ -12,49 +12,61 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
-try:
-    from sentence_transformers import SentenceTransformer
-    from sklearn.cluster import KMeans
-    from sklearn.metrics import silhouette_score
-
-    # StandardScaler imported but not used - keeping for future ML enhancements
-    from sklearn.preprocessing import StandardScaler  # pylint: disable=unused-import
-
-    TRANSFORMERS_AVAILABLE = True
-    SentenceTransformer_available = SentenceTransformer
-    KMeans_available = KMeans
-    silhouette_score_available = silhouette_score
-except ImportError:
+from .cluster_selection import ClusterSelectionConfig, ClusterSelectionEngine
+from .embedding_backend import (
+    REFERENCE_MODEL,
+    SENTENCE_TRANSFORMERS_AVAILABLE,
+    EmbeddingBackendConfig,
+    create_embedding_backend,
+)
+from .reference_index import ReferenceIndex
+
+TRANSFORMERS_AVAILABLE = SENTENCE_TRANSFORMERS_AVAILABLE
+if not TRANSFORMERS_AVAILABLE:
     logging.warning("ML dependencies not available - ML refinement will be skipped")
-    TRANSFORMERS_AVAILABLE = False
-    SentenceTransformer_available = None  # type: ignore
-    KMeans_available = None  # type: ignore
-    silhouette_score_available = None  # type: ignore
+
+EMBEDDING_MODEL_NAME = REFERENCE_MODEL
 
 
 class SelectiveMLRefinement:
     """Selective ML enhancement for uncertain document classifications."""
 
-    def __init__(self):
-        """Initialize ML refinement with state-of-the-art models."""
+    def __init__(
+        self,
+        cluster_config: Optional[ClusterSelectionConfig] = None,
+        reference_index: Optional[ReferenceIndex] = None,
+        embedding_config: Optional[EmbeddingBackendConfig] = None,
+    ):
+        """Initialize ML refinement with state-of-the-art models.
+
+        Args:
+            cluster_config: Cluster count selection settings (defaults if None)
+            reference_index: Persistent index of high-confidence documents (optional)
+            embedding_config: Embedding backend selection (hardware-tier default if None)
+        """
         self.embedding_model = None
         self.confidence_threshold = 0.7  # Apply ML when rule confidence < 70%
         self.min_documents_for_ml = 3  # Skip ML for very small sets
+        self.reference_top_k = 10  # Neighbours consulted per uncertain document
+        self.cluster_engine = ClusterSelectionEngine(cluster_config)
+        self.reference_index = reference_index
 
         if TRANSFORMERS_AVAILABLE:
-            try:
-                # Use MTEB leaderboard winner for document classification
-                if SentenceTransformer_available is not None:
-                    self.embedding_model = SentenceTransformer_available("all-mpnet-base-v2")
-                else:
-                    self.embedding_model = None
-                logging.info("ML refinement initialized with all-mpnet-base-v2")
-            except Exception as e:
-                logging.warning("Failed to load embedding model: %s", e)
-                self.embedding_model = None
+            # Reference backend in fp32 (smaller model on low tiers), or ONNX if configured
+            self.embedding_model = create_embedding_backend(embedding_config)
+            if self.embedding_model is not None:
+                logging.info(
+                    "ML refinement initialized with %s (%s)",
+                    self.embedding_model.model_name,
+                    self.embedding_model.name,
+                )
         else:
             logging.info("ML refinement disabled - dependencies not available")
 
+        if reference_index is not None and reference_index.model_name is None:
+            # Vectors from different backends or quantizations must not share an index
+            reference_index.model_name = getattr(self.embedding_model, "identity", self.model_name)
+
     def refine_uncertain_classifications(
         self,
         uncertain_docs: List[Dict[str, Any]],
@@ -68,7 +80,7 @@ class SelectiveMLRefinement:
             all_classified_docs: All classified documents for context
 
         Returns:
-            Dictionary mapping document filenames to refined classifications
+            Dictionary mapping document ids (filenames if absent) to refined classifications
         """
         if not self.embedding_model or not TRANSFORMERS_AVAILABLE:
             return {}
@@ -99,6 +111,34 @@ class SelectiveMLRefinement:
             logging.warning("ML refinement failed: %s", e)
             return {}
 
+    def add_reference_documents(self, classified_docs: List[Dict[str, Any]]) -> int:
+        """Add high-confidence documents to the persistent reference index.
+
+        The index is not written here; callers save it once the session is done.
+
+        Args:
+            classified_docs: Documents with category, confidence, filename and content_preview
+
+        Returns:
+            Number of references added
+        """
+        if self.reference_index is None or self.embedding_model is None:
+            return 0
+
+        references = [
+            doc for doc in classified_docs if doc.get("confidence", 0) >= self.confidence_threshold
+        ]
+        if not references:
+            return 0
+
+        embeddings = self._generate_embeddings(references)
+        if embeddings is None:
+            return 0
+
+        return self.reference_index.add(
+            embeddings, [doc.get("category", "other") for doc in references]
+        )
+
     def _generate_embeddings(self, documents: List[Dict[str, Any]]) -> Optional[np.ndarray]:
         """Generate sentence embeddings for documents."""
         try:
@@ -150,57 +190,19 @@ class SelectiveMLRefinement:
             # Not enough documents for clustering
             return list(range(n_docs))
 
-        # Determine optimal number of clusters
-        optimal_k = self._determine_optimal_cluster_count(embeddings, n_docs)
-
-        # Apply clustering with optimal parameters
-        if optimal_k <= 1:
-            # Single cluster - all documents similar
-            return [0] * n_docs
-
         try:
-            # Use KMeans for interpretable results
-            if KMeans_available is None:
-                raise RuntimeError("KMeans not available")
-            clusterer = KMeans_available(n_clusters=optimal_k, random_state=42, n_init="auto")
-            cluster_labels = clusterer.fit_predict(embeddings)
-
-            return cluster_labels.tolist()
+            # The k-search already produced the chosen assignment; no refit needed
+            return self.cluster_engine.select(embeddings).labels
 
         except Exception as e:
             logging.warning("Clustering failed: %s", e)
             return list(range(n_docs))  # Each doc in its own cluster
 
     def _determine_optimal_cluster_count(self, embeddings: np.ndarray, n_docs: int) -> int:
-        """Determine optimal number of clusters using multiple methods."""
-        max_k = min(8, n_docs // 2)  # Don't create too many small clusters
-        if max_k < 2:
+        """Determine optimal number of clusters by silhouette score."""
+        if min(self.cluster_engine.config.max_k, n_docs // 2) < 2:
             return 1
-
-        best_k = 2
-        best_score = -1
-
-        # Try different cluster counts and evaluate
-        for k in range(2, max_k + 1):
-            try:
-                if KMeans_available is None:
-                    continue
-                clusterer = KMeans_available(n_clusters=k, random_state=42, n_init="auto")
-                cluster_labels = clusterer.fit_predict(embeddings)
-
-                # Use silhouette score to evaluate clustering quality
-                if silhouette_score_available is None:
-                    continue
-                score = silhouette_score_available(embeddings, cluster_labels)
-
-                if score > best_score:
-                    best_score = score
-                    best_k = k
-
-            except Exception:
-                continue
-
-        return best_k
+        return self.cluster_engine.select(embeddings).k
 
     def _interpret_clusters_semantically(
         self,
@@ -217,18 +219,27 @@ class SelectiveMLRefinement:
         for i, label in enumerate(cluster_labels):
             clusters[label].append((i, uncertain_docs[i]))
 
-        # Get high-confidence reference categories
-        reference_categories = self._get_reference_categories(all_classified_docs)
+        # Session references are already in the index (recorded by the classification
+        # service), so clusters are labeled by kNN vote without re-adding them
+        use_index = self.reference_index is not None and len(self.reference_index) > 0
+        reference_centroids: Dict[str, np.ndarray] = {}
+        if not use_index:
+            reference_centroids = self._get_reference_centroids(
+                self._get_reference_categories(all_classified_docs)
+            )
 
         # Classify each cluster
         for cluster_id, cluster_docs in clusters.items():
-            cluster_category = self._classify_cluster(
-                cluster_docs, embeddings, reference_categories
-            )
+            if use_index:
+                cluster_category = self._classify_cluster_by_index(cluster_docs, embeddings)
+            else:
+                cluster_category = self._classify_cluster(
+                    cluster_docs, embeddings, reference_centroids
+                )
 
             # Assign refined classification to all documents in cluster
             for _doc_idx, doc in cluster_docs:
-                refined_classifications[doc["filename"]] = {
+                refined_classifications[doc.get("id") or doc["filename"]] = {
                     "category": cluster_category["category"],
                     "confidence": cluster_category["confidence"],
                     "method": "ml_refinement",
@@ -258,14 +269,37 @@ class SelectiveMLRefinement:
 
         return dict(reference_categories)
 
+    def _get_reference_centroids(
+        self, reference_categories: Dict[str, List[str]]
+    ) -> Dict[str, np.ndarray]:
+        """Embed all reference texts in one batch and average them per category."""
+        categories = [c for c, texts in reference_categories.items() if texts]
+        if not categories or self.embedding_model is None:
+            return {}
+
+        texts = [text for category in categories for text in reference_categories[category]]
+        try:
+            ref_embeddings = self.embedding_model.encode(texts, convert_to_numpy=True)
+        except Exception as e:
+            logging.debug("Failed to embed reference documents: %s", e)
+            return {}
+
+        centroids = {}
+        start = 0
+        for category in categories:
+            end = start + len(reference_categories[category])
+            centroids[category] = np.mean(ref_embeddings[start:end], axis=0)
+            start = end
+        return centroids
+
     def _classify_cluster(
         self,
         cluster_docs: List[Tuple[int, Dict[str, Any]]],
         embeddings: np.ndarray,
-        reference_categories: Dict[str, List[str]],
+        reference_centroids: Dict[str, np.ndarray],
     ) -> Dict[str, Any]:
-        """Classify a cluster of documents using reference categories."""
-        if not reference_categories:
+        """Classify a cluster of documents using reference category centroids."""
+        if not reference_centroids:
             # No reference available - use pattern analysis
             return self._classify_cluster_by_patterns(cluster_docs)
 
@@ -279,41 +313,47 @@ class SelectiveMLRefinement:
             best_category = "other"
             best_similarity = -1
 
-            for category, reference_texts in reference_categories.items():
-                if not reference_texts:
-                    continue
-
-                # Generate embeddings for reference texts
-                try:
-                    if self.embedding_model is None:
-                        continue
-                    ref_embeddings = self.embedding_model.encode(
-                        reference_texts, convert_to_numpy=True
-                    )
-                    ref_centroid = np.mean(ref_embeddings, axis=0)
+            for category, ref_centroid in reference_centroids.items():
+                # Calculate cosine similarity
+                similarity = np.dot(cluster_centroid, ref_centroid) / (
+                    np.linalg.norm(cluster_centroid) * np.linalg.norm(ref_centroid)
+                )
 
-                    # Calculate cosine similarity
-                    similarity = np.dot(cluster_centroid, ref_centroid) / (
-                        np.linalg.norm(cluster_centroid) * np.linalg.norm(ref_centroid)
-                    )
+                if similarity > best_similarity:
+                    best_similarity = similarity
+                    best_category = category
 
-                    if similarity > best_similarity:
-                        best_similarity = similarity
-                        best_category = category
+            return {
+                "category": best_category,
+                "confidence": self._similarity_to_confidence(best_similarity),
+            }
 
-                except Exception as e:
-                    logging.debug("Failed to process reference category %s: %s", category, e)
-                    continue
-
-            # Convert similarity to confidence score
-            confidence = max(0.4, min(0.9, best_similarity)) if best_similarity > 0.3 else 0.4
+        except Exception as e:
+            logging.warning("Cluster classification failed: %s", e)
+            return self._classify_cluster_by_patterns(cluster_docs)
 
-            return {"category": best_category, "confidence": confidence}
+    def _classify_cluster_by_index(
+        self, cluster_docs: List[Tuple[int, Dict[str, Any]]], embeddings: np.ndarray
+    ) -> Dict[str, Any]:
+        """Classify a cluster by nearest-neighbour vote against the reference index."""
+        try:
+            cluster_indices = [idx for idx, _ in cluster_docs]
+            category, similarity = self.reference_index.vote(  # type: ignore[union-attr]
+                embeddings[cluster_indices], top_k=self.reference_top_k
+            )
+            if category is None:
+                return self._classify_cluster_by_patterns(cluster_docs)
+            return {"category": category, "confidence": self._similarity_to_confidence(similarity)}
 
         except Exception as e:
-            logging.warning("Cluster classification failed: %s", e)
+            logging.warning("Reference index lookup failed: %s", e)
             return self._classify_cluster_by_patterns(cluster_docs)
 
+    @staticmethod
+    def _similarity_to_confidence(similarity: float) -> float:
+        """Convert cosine similarity to a confidence score."""
+        return max(0.4, min(0.9, similarity)) if similarity > 0.3 else 0.4
+
     def _classify_cluster_by_patterns(
         self, cluster_docs: List[Tuple[int, Dict[str, Any]]]
     ) -> Dict[str, Any]:
@@ -340,6 +380,11 @@ class SelectiveMLRefinement:
         else:
             return {"category": "other", "confidence": 0.4}
 
+    @property
+    def model_name(self) -> str:
+        """Name of the embedding model in use (the reference model if none is loaded)."""
+        return getattr(self.embedding_model, "model_name", EMBEDDING_MODEL_NAME)
+
     def is_ml_available(self) -> bool:
         """Check if ML refinement is available."""
         return self.embedding_model is not None and TRANSFORMERS_AVAILABLE
@@ -348,8 +393,10 @@ class SelectiveMLRefinement:
         """Get statistics about ML refinement capabilities."""
         return {
             "ml_available": self.is_ml_available(),
-            "model_name": "all-mpnet-base-v2" if self.embedding_model else None,
+            "model_name": self.model_name if self.embedding_model else None,
+            "embedding_backend": getattr(self.embedding_model, "name", None),
             "confidence_threshold": self.confidence_threshold,
             "min_documents_threshold": self.min_documents_for_ml,
             "transformers_available": TRANSFORMERS_AVAILABLE,
+            "reference_documents": len(self.reference_index) if self.reference_index else 0,
         }
@@ -0,0 +1,264 @@
+"""
+Reference Index
+
+Persistent nearest-neighbour index of high-confidence classified documents.
+
+Normalized embeddings are kept in a NumPy matrix (float16 on disk) with a
+parallel array of category ids, stored in the target folder's
+``.content_tamer`` state directory. Every session appends its confident
+documents, so cluster interpretation improves over time instead of starting
+from scratch. Uncertain documents are labeled by a single batched top-k
+similarity query. Large histories switch to an inverted-file (IVF) layout:
+a k-means coarse quantizer limits each query to the nearest few lists.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from shared.infrastructure.import_utilities import module_available
+
+# scikit-learn is only needed once an index grows past the IVF threshold
+SKLEARN_AVAILABLE = module_available("sklearn")
+
+INDEX_FILE = "reference_index.npz"
+INDEX_META_FILE = "reference_index.json"
+
+
+class ReferenceIndex:
+    """Similarity index over embeddings of confidently classified documents."""
+
+    def __init__(
+        self,
+        state_dir: str,
+        model_name: Optional[str] = None,
+        max_entries: int = 50000,
+        ivf_threshold: int = 20000,
+        ivf_probe: int = 8,
+    ):
+        """Initialize index (loaded lazily on first use).
+
+        Args:
+            state_dir: Directory holding the index files (e.g. <target>/.content_tamer)
+            model_name: Embedding identity (model, plus backend and quantization unless
+                fp32 sentence-transformers); an index built by another identity is discarded
+            max_entries: Maximum stored references (oldest dropped first)
+            ivf_threshold: Entry count above which queries use the IVF layout
+            ivf_probe: Inverted lists searched per query in IVF mode
+        """
+        self.state_dir = state_dir
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self.ivf_threshold = ivf_threshold
+        self.ivf_probe = ivf_probe
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+        self._vectors: Optional[np.ndarray] = None  # float32, L2-normalized rows
+        self._labels = np.zeros(0, dtype=np.int32)
+        self._categories: List[str] = []
+        self._category_ids: Dict[str, int] = {}
+        self._ivf: Optional[Tuple[np.ndarray, np.ndarray]] = None  # (centroids, list assignment)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._ensure_loaded()
+            return len(self._labels)
+
+    def add(self, embeddings: np.ndarray, categories: Sequence[str]) -> int:
+        """Add reference documents.
+
+        Args:
+            embeddings: Embeddings of confidently classified documents
+            categories: Category of each document
+
+        Returns:
+            Number of entries added
+        """
+        if len(categories) == 0:
+            return 0
+
+        vectors = self._normalize(np.asarray(embeddings, dtype=np.float32))
+        with self._lock:
+            self._ensure_loaded()
+            if self._vectors is not None and self._vectors.shape[1] != vectors.shape[1]:
+                self.logger.info("Embedding dimension changed; rebuilding reference index")
+                self._reset()
+
+            label_ids = np.array([self._category_id(c) for c in categories], dtype=np.int32)
+            if self._vectors is None:
+                self._vectors, self._labels = vectors, label_ids
+            else:
+                self._vectors = np.vstack([self._vectors, vectors])
+                self._labels = np.concatenate([self._labels, label_ids])
+
+            if len(self._labels) > self.max_entries:
+                self._vectors = self._vectors[-self.max_entries :]
+                self._labels = self._labels[-self.max_entries :]
+
+            self._ivf = None
+            self._dirty = True
+            return len(label_ids)
+
+    def query(self, embeddings: np.ndarray, top_k: int = 10) -> List[List[Tuple[str, float]]]:
+        """Find the most similar references for each query embedding.
+
+        Args:
+            embeddings: Query embeddings (n_queries x dims)
+            top_k: Neighbours returned per query
+
+        Returns:
+            Per query, a list of (category, cosine similarity) pairs, best first
+        """
+        queries = self._normalize(np.asarray(embeddings, dtype=np.float32))
+        with self._lock:
+            self._ensure_loaded()
+            if self._vectors is None or len(self._labels) == 0:
+                return [[] for _ in range(len(queries))]
+            if queries.shape[1] != self._vectors.shape[1]:
+                return [[] for _ in range(len(queries))]
+
+            if len(self._labels) > self.ivf_threshold and SKLEARN_AVAILABLE:
+                return self._query_ivf(queries, top_k)
+            return self._query_flat(queries, np.arange(len(self._labels)), top_k)
+
+    def vote(self, embeddings: np.ndarray, top_k: int = 10) -> Tuple[Optional[str], float]:
+        """Label a group of embeddings (e.g. a cluster) by similarity-weighted kNN vote.
+
+        Returns:
+            Tuple of (winning category or None, mean similarity of its neighbours)
+        """
+        weights: Dict[str, float] = defaultdict(float)
+        similarities: Dict[str, List[float]] = defaultdict(list)
+        for neighbours in self.query(embeddings, top_k):
+            for category, similarity in neighbours:
+                if similarity > 0:
+                    weights[category] += similarity
+                    similarities[category].append(similarity)
+
+        if not weights:
+            return None, 0.0
+        best = max(weights, key=weights.get)
+        return best, float(np.mean(similarities[best]))
+
+    def save(self) -> bool:
+        """Persist the index if it changed since loading.
+
+        Returns:
+            True if written
+        """
+        with self._lock:
+            if not self._dirty or self._vectors is None:
+                return False
+            try:
+                os.makedirs(self.state_dir, mode=0o700, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self.state_dir, suffix=".npz.tmp")
+                with os.fdopen(fd, "wb") as f:
+                    np.savez(f, vectors=self._vectors.astype(np.float16), labels=self._labels)
+                os.replace(tmp_path, os.path.join(self.state_dir, INDEX_FILE))
+
+                meta = {"model_name": self.model_name, "categories": self._categories}
+                meta_path = os.path.join(self.state_dir, INDEX_META_FILE)
+                with open(meta_path, "w", encoding="utf-8") as f:
+                    json.dump(meta, f)
+                self._dirty = False
+                return True
+            except OSError as e:
+                self.logger.warning("Failed to save reference index: %s", e)
+                return False
+
+    def _ensure_loaded(self) -> None:
+        """Load index files on first use. Caller must hold the lock."""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        index_path = os.path.join(self.state_dir, INDEX_FILE)
+        meta_path = os.path.join(self.state_dir, INDEX_META_FILE)
+        if not (os.path.exists(index_path) and os.path.exists(meta_path)):
+            return
+
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if self.model_name and meta.get("model_name") not in (None, self.model_name):
+                self.logger.info(
+                    "Reference index built with %s; starting fresh for %s",
+                    meta.get("model_name"),
+                    self.model_name,
+                )
+                return
+
+            with np.load(index_path) as data:
+                self._vectors = data["vectors"].astype(np.float32)
+                self._labels = data["labels"].astype(np.int32)
+            self._categories = list(meta.get("categories", []))
+            self._category_ids = {c: i for i, c in enumerate(self._categories)}
+        except (OSError, ValueError, KeyError) as e:
+            self.logger.warning("Could not load reference index, starting fresh: %s", e)
+            self._reset()
+
+    def _reset(self) -> None:
+        self._vectors = None
+        self._labels = np.zeros(0, dtype=np.int32)
+        self._categories = []
+        self._category_ids = {}
+        self._ivf = None
+
+    def _category_id(self, category: str) -> int:
+        if category not in self._category_ids:
+            self._category_ids[category] = len(self._categories)
+            self._categories.append(category)
+        return self._category_ids[category]
+
+    def _query_flat(
+        self, queries: np.ndarray, candidates: np.ndarray, top_k: int
+    ) -> List[List[Tuple[str, float]]]:
+        """Exact top-k over a candidate subset with one matrix product."""
+        similarities = queries @ self._vectors[candidates].T  # type: ignore[index]
+        k = min(top_k, len(candidates))
+        top = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+        results = []
+        for row, columns in enumerate(top):
+            ordered = columns[np.argsort(-similarities[row, columns])]
+            results.append(
+                [
+                    (self._categories[self._labels[candidates[c]]], float(similarities[row, c]))
+                    for c in ordered
+                ]
+            )
+        return results
+
+    def _query_ivf(self, queries: np.ndarray, top_k: int) -> List[List[Tuple[str, float]]]:
+        """Approximate top-k searching only the lists nearest each query."""
+        if self._ivf is None:
+            from sklearn.cluster import MiniBatchKMeans
+
+            n_lists = max(2, int(np.sqrt(len(self._labels))))
+            quantizer = MiniBatchKMeans(n_clusters=n_lists, random_state=42, n_init=3)
+            assignment = quantizer.fit_predict(self._vectors)
+            self._ivf = (self._normalize(quantizer.cluster_centers_.astype(np.float32)), assignment)
+
+        centroids, assignment = self._ivf
+        probe = min(self.ivf_probe, len(centroids))
+        nearest_lists = np.argsort(-(queries @ centroids.T), axis=1)[:, :probe]
+
+        results = []
+        for row, lists in enumerate(nearest_lists):
+            candidates = np.flatnonzero(np.isin(assignment, lists))
+            results.extend(self._query_flat(queries[row : row + 1], candidates, top_k))
+        return results
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        vectors = np.atleast_2d(vectors)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms > 0, norms, 1.0)
@@ -14,25 +14,28 @@ import warnings
 from datetime import datetime  # pylint: disable=unused-import
 from typing import Dict, List, Tuple
 
-import spacy
-
 
 class EnhancedRuleBasedClassifier:
     """Enhanced rule-based classifier with spaCy NLP integration."""
 
     _spacy_warning_shown = False  # Class-level flag to prevent warning spam
 
-    def __init__(self, spacy_model=None):
+    def __init__(self, spacy_model=None, use_spacy: bool = True):
         """Initialize classifier with enhanced patterns and spaCy model.
         
         Args:
             spacy_model: Pre-loaded spaCy model to use (for performance optimization)
+            use_spacy: Load spaCy when no model is given (False classifies with rules only)
         """
         if spacy_model is not None:
             # Use provided spaCy model (performance optimization for tests)
             self.nlp = spacy_model
+        elif not use_spacy:
+            self.nlp = None
         else:
             try:
+                import spacy  # Deferred: importing spaCy takes seconds
+
                 # Suppress spaCy warnings during model loading
                 with warnings.catch_warnings():
                     warnings.filterwarnings("ignore", category=UserWarning, module="spacy")
@@ -40,7 +43,7 @@ class EnhancedRuleBasedClassifier:
                     # Keep tagger, attribute_ruler, and lemmatizer for better text analysis
                     # Only disable parser (slowest component) since we don't need dependency parsing
                     self.nlp = spacy.load("en_core_web_sm", disable=["parser"])
-            except OSError:
+            except (ImportError, OSError):
                 # Graceful fallback if spaCy not available - warn only once
                 if not EnhancedRuleBasedClassifier._spacy_warning_shown:
                     logging.warning("spaCy model not available, using basic fallback")
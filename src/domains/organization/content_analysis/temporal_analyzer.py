@@ -11,11 +11,67 @@ import calendar
 # logging imported but not used - keeping for future enhancements
 import logging  # pylint: disable=unused-import
 from collections import Counter, defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List
 
 import numpy as np
 
+from shared.infrastructure.entity_scanner import entity_scan_from_metadata
+
+QUARTER_LABELS = ("Q1", "Q2", "Q3", "Q4")
+FISCAL_QUARTER_LABELS = ("FQ1", "FQ2", "FQ3", "FQ4")
+
+
+@dataclass
+class TemporalColumns:
+    """Columnar view of every extracted document date.
+
+    One entry per date (a document contributes one entry per date it
+    mentions), so distributions, quarter buckets, gaps and fiscal scoring are
+    array operations instead of loops over per-document date dicts.
+    """
+
+    dates: np.ndarray  # datetime64[D]
+    years: np.ndarray
+    months: np.ndarray  # 1-12
+    quarters: np.ndarray  # 0-3 (index into QUARTER_LABELS)
+    doc_index: np.ndarray  # Position of the source document
+    category_codes: np.ndarray  # Index into categories
+    confidences: np.ndarray
+    categories: List[str] = field(default_factory=list)
+    filenames: List[str] = field(default_factory=list)  # Per document
+    fiscal_hints: List[str] = field(default_factory=list)
+    total_documents: int = 0
+
+    @property
+    def documents_with_dates(self) -> int:
+        """Number of documents with at least one valid date."""
+        return int(len(np.unique(self.doc_index)))
+
+
+def _first_seen_counts(values: np.ndarray) -> Dict[int, int]:
+    """Count each value, keyed in order of first occurrence (matches incremental counting)."""
+    unique, first_index, counts = np.unique(values, return_index=True, return_counts=True)
+    order = np.argsort(first_index)
+    return dict(zip(unique[order].tolist(), counts[order].tolist()))
+
+
+def _group_positions(keys: np.ndarray) -> List[np.ndarray]:
+    """Positions of each distinct key, groups in first-seen order, positions ascending."""
+    if not len(keys):
+        return []
+    order = np.argsort(keys, kind="stable")
+    boundaries = np.flatnonzero(np.diff(keys[order])) + 1
+    groups = np.split(order, boundaries)
+    groups.sort(key=lambda group: group[0])
+    return groups
+
+
+def _to_datetime(day: np.datetime64) -> datetime:
+    """Convert a datetime64 day to a midnight datetime."""
+    return day.astype("datetime64[s]").item()
+
 
 class AdvancedTemporalAnalyzer:
     """Advanced temporal pattern analysis for intelligent document organization."""
@@ -51,14 +107,14 @@ class AdvancedTemporalAnalyzer:
         if not classified_documents:
             return self._get_empty_analysis()
 
-        # Extract temporal data from documents
-        temporal_data = self._extract_temporal_data(classified_documents)
+        # Extract temporal data from documents into date/category columns
+        columns = self._extract_temporal_columns(classified_documents)
 
         # Analyze patterns
-        date_patterns = self._analyze_date_patterns(temporal_data)
-        seasonal_insights = self._analyze_seasonal_patterns(temporal_data)
-        fiscal_analysis = self._detect_fiscal_patterns(temporal_data)
-        workflow_patterns = self._analyze_workflow_patterns(temporal_data, classified_documents)
+        date_patterns = self._analyze_date_patterns(columns)
+        seasonal_insights = self._analyze_seasonal_patterns(columns)
+        fiscal_analysis = self._detect_fiscal_patterns(columns)
+        workflow_patterns = self._analyze_workflow_patterns(columns)
 
         # Generate organization recommendations
         organization_strategy = self._generate_organization_strategy(
@@ -66,12 +122,12 @@ class AdvancedTemporalAnalyzer:
         )
 
         # Calculate confidence metrics
-        confidence_metrics = self._calculate_temporal_confidence(temporal_data)
+        confidence_metrics = self._calculate_temporal_confidence(columns)
 
         return {
             "temporal_data_summary": {
                 "total_documents": len(classified_documents),
-                "documents_with_dates": len([d for d in temporal_data if d["dates"]]),
+                "documents_with_dates": columns.documents_with_dates,
                 "date_range": date_patterns.get("date_range"),
                 "years_covered": date_patterns.get("years_covered", []),
             },
@@ -86,103 +142,131 @@ class AdvancedTemporalAnalyzer:
             ),
         }
 
-    def _extract_temporal_data(self, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Extract and normalize temporal data from documents."""
-        temporal_data = []
-
-        for doc in documents:
-            metadata = doc.get("metadata", {})
-            dates = metadata.get("date_detected", [])
-
-            # Normalize dates to datetime objects
-            normalized_dates = []
-            for date_info in dates:
-                try:
-                    if "year" in date_info and "month" in date_info:
-                        day = date_info.get("day", 1)
-                        dt = datetime(date_info["year"], date_info["month"], day)
-                        normalized_dates.append(
-                            {
-                                "datetime": dt,
-                                "year": date_info["year"],
-                                "month": date_info["month"],
-                                "day": day,
-                                "quarter": self._get_quarter(date_info["month"]),
-                                "confidence": date_info.get("confidence", 0.5),
-                            }
-                        )
-                except (ValueError, KeyError):
-                    continue
-
-            temporal_data.append(
-                {
-                    "filename": doc.get("filename", ""),
-                    "category": doc.get("category", "other"),
-                    "confidence": doc.get("confidence", 0.0),
-                    "dates": normalized_dates,
-                    "fiscal_hints": metadata.get("fiscal_year_hints", {}),
-                    "classification_method": doc.get("classification_method", "rule_based"),
-                }
-            )
+    def _extract_temporal_columns(self, documents: List[Dict[str, Any]]) -> TemporalColumns:
+        """Extract dates from documents into a columnar representation (one pass)."""
+        years, months, days, confidences, doc_index = [], [], [], [], []
+        filenames, doc_categories, fiscal_hints = [], [], []
+
+        for index, doc in enumerate(documents):
+            metadata = doc.get("metadata") or {}
+            filenames.append(doc.get("filename", ""))
+            doc_categories.append(doc.get("category", "other"))
+
+            # Prefer typed dates from the extraction-time entity scan
+            entity_scan = entity_scan_from_metadata(metadata)
+            if entity_scan is not None:
+                for day in list(dict.fromkeys(e.value.date() for e in entity_scan.dates))[:10]:
+                    years.append(day.year)
+                    months.append(day.month)
+                    days.append(day.day)
+                    confidences.append(0.5)
+                    doc_index.append(index)
+            elif isinstance(metadata, dict):
+                for date_info in metadata.get("date_detected", []):
+                    try:
+                        if "year" in date_info and "month" in date_info:
+                            year, month = int(date_info["year"]), int(date_info["month"])
+                            day = int(date_info.get("day", 1))
+                            confidence = float(date_info.get("confidence", 0.5))
+                        else:
+                            continue
+                    except (TypeError, ValueError):
+                        continue
+                    years.append(year)
+                    months.append(month)
+                    days.append(day)
+                    confidences.append(confidence)
+                    doc_index.append(index)
+
+            hints = metadata.get("fiscal_year_hints", {}) if isinstance(metadata, dict) else {}
+            if isinstance(hints, dict) and hints.get("fiscal_year_pattern"):
+                fiscal_hints.append(hints["fiscal_year_pattern"])
 
-        return temporal_data
+        year_array = np.array(years, dtype=np.int64)
+        month_array = np.array(months, dtype=np.int64)
+        day_array = np.array(days, dtype=np.int64)
+
+        # Build datetime64 days and drop impossible dates (e.g. Feb 30, month 13)
+        in_range = (
+            (year_array >= 1)
+            & (year_array <= 9999)
+            & (month_array >= 1)
+            & (month_array <= 12)
+            & (day_array >= 1)
+            & (day_array <= 31)
+        )
+        safe_years = np.where(in_range, year_array, 1970)
+        safe_months = np.where(in_range, month_array, 1)
+        month_starts = ((safe_years - 1970) * 12 + (safe_months - 1)).astype("datetime64[M]")
+        dates = month_starts.astype("datetime64[D]") + np.where(in_range, day_array - 1, 0)
+        valid = in_range & (dates.astype("datetime64[M]") == month_starts)
+
+        category_names, category_codes = np.unique(
+            np.array(doc_categories, dtype=object).astype(str), return_inverse=True
+        )
+        doc_index_array = np.array(doc_index, dtype=np.int64)[valid]
+
+        return TemporalColumns(
+            dates=dates[valid],
+            years=year_array[valid],
+            months=month_array[valid],
+            quarters=(month_array[valid] - 1) // 3,
+            doc_index=doc_index_array,
+            category_codes=category_codes.astype(np.int64)[doc_index_array],
+            confidences=np.array(confidences, dtype=np.float64)[valid],
+            categories=category_names.tolist(),
+            filenames=filenames,
+            fiscal_hints=fiscal_hints,
+            total_documents=len(documents),
+        )
 
-    def _analyze_date_patterns(self, temporal_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_date_patterns(self, columns: TemporalColumns) -> Dict[str, Any]:
         """Analyze date distribution patterns."""
-        all_dates = []
-        yearly_distribution = defaultdict(int)
-        monthly_distribution = defaultdict(int)
-        quarterly_distribution = defaultdict(int)
-
-        for doc in temporal_data:
-            for date_info in doc["dates"]:
-                all_dates.append(date_info["datetime"])
-                yearly_distribution[date_info["year"]] += 1
-                monthly_distribution[date_info["month"]] += 1
-                quarterly_distribution[date_info["quarter"]] += 1
-
-        if not all_dates:
+        if not len(columns.dates):
             return {"pattern_detected": False}
 
+        yearly_distribution = _first_seen_counts(columns.years)
+        monthly_distribution = _first_seen_counts(columns.months)
+        quarterly_distribution = {
+            QUARTER_LABELS[q]: count for q, count in _first_seen_counts(columns.quarters).items()
+        }
+
         # Calculate date range and coverage
-        min_date = min(all_dates)
-        max_date = max(all_dates)
-        date_span_days = (max_date - min_date).days
+        min_date = columns.dates.min()
+        max_date = columns.dates.max()
+        date_span_days = int((max_date - min_date).astype(np.int64))
 
         # Detect temporal density patterns
-        density_pattern = self._analyze_temporal_density(all_dates)
+        density_pattern = self._analyze_temporal_density(columns.dates)
 
         return {
             "pattern_detected": True,
             "date_range": {
-                "earliest": min_date.isoformat(),
-                "latest": max_date.isoformat(),
+                "earliest": _to_datetime(min_date).isoformat(),
+                "latest": _to_datetime(max_date).isoformat(),
                 "span_days": date_span_days,
                 "span_years": date_span_days / 365.25,
             },
             "years_covered": sorted(yearly_distribution.keys()),
-            "yearly_distribution": dict(yearly_distribution),
-            "monthly_distribution": dict(monthly_distribution),
-            "quarterly_distribution": dict(quarterly_distribution),
+            "yearly_distribution": yearly_distribution,
+            "monthly_distribution": monthly_distribution,
+            "quarterly_distribution": quarterly_distribution,
             "density_pattern": density_pattern,
             "peak_periods": self._identify_peak_periods(
                 monthly_distribution, quarterly_distribution
             ),
         }
 
-    def _analyze_seasonal_patterns(self, temporal_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_seasonal_patterns(self, columns: TemporalColumns) -> Dict[str, Any]:
         """Analyze seasonal and cyclical patterns in document creation."""
         seasonal_analysis = {}
 
-        # Group documents by category and season
-        category_seasons = defaultdict(lambda: defaultdict(int))
-
-        for doc in temporal_data:
-            category = doc["category"]
-            for date_info in doc["dates"]:
-                quarter = date_info["quarter"]
-                _month = date_info["month"]  # Used in future seasonal analysis
-                category_seasons[category][quarter] += 1
+        # Count (category, quarter) pairs in one pass over a combined code
+        category_seasons = defaultdict(dict)
+        pair_counts = _first_seen_counts(columns.category_codes * 4 + columns.quarters)
+        for pair, count in pair_counts.items():
+            category = columns.categories[pair // 4]
+            category_seasons[category][QUARTER_LABELS[pair % 4]] = count
 
         # Analyze seasonal patterns for each category
         for category, quarters in category_seasons.items():
@@ -199,19 +283,10 @@ class AdvancedTemporalAnalyzer:
             "seasonal_recommendations": self._generate_seasonal_recommendations(seasonal_analysis),
         }
 
-    def _detect_fiscal_patterns(self, temporal_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _detect_fiscal_patterns(self, columns: TemporalColumns) -> Dict[str, Any]:
         """Detect and analyze fiscal year patterns."""
-        fiscal_hints = []
-        document_months = []
-
-        # Collect fiscal year hints and document months
-        for doc in temporal_data:
-            hints = doc.get("fiscal_hints", {})
-            if hints.get("fiscal_year_pattern"):
-                fiscal_hints.append(hints["fiscal_year_pattern"])
-
-            for date_info in doc["dates"]:
-                document_months.append(date_info["month"])
+        fiscal_hints = columns.fiscal_hints
+        month_counts = np.bincount(columns.months, minlength=13)
 
         # Analyze fiscal year patterns
         detected_fiscal_type = None
@@ -220,58 +295,45 @@ class AdvancedTemporalAnalyzer:
             detected_fiscal_type = most_common_hint
         else:
             # Infer fiscal year from document distribution
-            detected_fiscal_type = self._infer_fiscal_year_pattern(document_months)
+            detected_fiscal_type = self._infer_fiscal_year_pattern(month_counts)
 
         fiscal_info = self.fiscal_year_patterns.get(
             detected_fiscal_type, self.fiscal_year_patterns["calendar"]
         )
 
         # Generate fiscal year organization structure
-        fiscal_structure = self._generate_fiscal_structure(temporal_data, fiscal_info)
+        fiscal_structure = self._generate_fiscal_structure(columns, fiscal_info)
 
         return {
             "detected_fiscal_type": detected_fiscal_type,
             "fiscal_info": fiscal_info,
-            "confidence": self._calculate_fiscal_confidence(fiscal_hints, document_months),
+            "confidence": self._calculate_fiscal_confidence(fiscal_hints, month_counts),
             "fiscal_structure": fiscal_structure,
             "fiscal_recommendations": self._generate_fiscal_recommendations(
                 detected_fiscal_type, fiscal_structure
             ),
         }
 
-    def _analyze_workflow_patterns(
-        self,
-        temporal_data: List[Dict[str, Any]],
-        classified_documents: List[Dict[str, Any]],
-    ) -> Dict[str, Any]:
+    def _analyze_workflow_patterns(self, columns: TemporalColumns) -> Dict[str, Any]:
         """Analyze document workflow and business process patterns."""
-        _workflow_sequences = []  # Used in future workflow analysis
-        category_timing = defaultdict(list)
-
-        # Group documents by category and analyze timing patterns
-        for doc_data, doc_info in zip(temporal_data, classified_documents):
-            category = doc_data["category"]
-            method = doc_data["classification_method"]
-
-            for date_info in doc_data["dates"]:
-                category_timing[category].append(
-                    {
-                        "datetime": date_info["datetime"],
-                        "month": date_info["month"],
-                        "quarter": date_info["quarter"],
-                        "classification_method": method,
-                        "confidence": doc_info.get("confidence", 0.0),
-                    }
-                )
+        # Group date positions by category (categories in first-seen order)
+        category_timing = {
+            columns.categories[columns.category_codes[group[0]]]: group
+            for group in _group_positions(columns.category_codes)
+        }
 
         # Analyze workflow patterns
         workflow_insights = {}
-        for category, timing_data in category_timing.items():
-            if len(timing_data) >= 2:  # Need multiple documents for pattern analysis
-                workflow_insights[category] = self._analyze_category_workflow(timing_data)
+        for category, positions in category_timing.items():
+            if len(positions) >= 2:  # Need multiple documents for pattern analysis
+                workflow_insights[category] = self._analyze_category_workflow(
+                    columns.dates[positions]
+                )
 
         # Detect business process cycles
-        process_cycles = self._detect_process_cycles(category_timing)
+        process_cycles = self._detect_process_cycles(
+            {category: columns.months[positions] for category, positions in category_timing.items()}
+        )
 
         return {
             "category_workflows": workflow_insights,
@@ -327,12 +389,10 @@ class AdvancedTemporalAnalyzer:
 
         return strategy
 
-    def _calculate_temporal_confidence(
-        self, temporal_data: List[Dict[str, Any]]
-    ) -> Dict[str, float]:
+    def _calculate_temporal_confidence(self, columns: TemporalColumns) -> Dict[str, float]:
         """Calculate confidence metrics for temporal analysis."""
-        total_docs = len(temporal_data)
-        docs_with_dates = len([d for d in temporal_data if d["dates"]])
+        total_docs = columns.total_documents
+        docs_with_dates = columns.documents_with_dates
 
         if total_docs == 0:
             return {"overall_confidence": 0.0}
@@ -341,15 +401,10 @@ class AdvancedTemporalAnalyzer:
         date_coverage = docs_with_dates / total_docs
 
         # Date quality confidence (based on extracted date confidence)
-        date_qualities = []
-        for doc in temporal_data:
-            for date_info in doc["dates"]:
-                date_qualities.append(date_info.get("confidence", 0.5))
-
-        avg_date_quality = np.mean(date_qualities) if date_qualities else 0.0
+        avg_date_quality = columns.confidences.mean() if len(columns.confidences) else 0.0
 
         # Pattern detection confidence
-        pattern_strength = self._calculate_pattern_strength(temporal_data)
+        pattern_strength = self._calculate_pattern_strength(columns)
 
         overall_confidence = date_coverage * 0.4 + avg_date_quality * 0.3 + pattern_strength * 0.3
 
@@ -424,29 +479,18 @@ class AdvancedTemporalAnalyzer:
             "recommendations": ["No temporal data available - use category-based organization"],
         }
 
-    def _get_quarter(self, month: int) -> str:
-        """Get quarter name for a given month."""
-        if month in [1, 2, 3]:
-            return "Q1"
-        elif month in [4, 5, 6]:
-            return "Q2"
-        elif month in [7, 8, 9]:
-            return "Q3"
-        else:
-            return "Q4"
-
-    def _analyze_temporal_density(self, dates: List[datetime]) -> Dict[str, Any]:
+    def _analyze_temporal_density(self, dates: np.ndarray) -> Dict[str, Any]:
         """Analyze temporal density and distribution patterns."""
-        if not dates:
+        if not len(dates):
             return {"pattern_type": "none"}
 
         # Sort dates
-        sorted_dates = sorted(dates)
+        sorted_dates = np.sort(dates)
 
-        # Calculate gaps between dates
-        gaps = [(sorted_dates[i + 1] - sorted_dates[i]).days for i in range(len(sorted_dates) - 1)]
+        # Calculate gaps between dates (in days)
+        gaps = np.diff(sorted_dates).astype(np.int64)
 
-        if not gaps:
+        if not len(gaps):
             return {"pattern_type": "single_point"}
 
         # Analyze gap patterns
@@ -455,7 +499,7 @@ class AdvancedTemporalAnalyzer:
 
         if gap_std < avg_gap * 0.3:  # Low variance = regular pattern
             pattern_type = "regular"
-        elif len(set(gaps)) < len(gaps) * 0.5:  # Many repeated gaps = periodic
+        elif len(np.unique(gaps)) < len(gaps) * 0.5:  # Many repeated gaps = periodic
             pattern_type = "periodic"
         else:
             pattern_type = "irregular"
@@ -464,7 +508,7 @@ class AdvancedTemporalAnalyzer:
             "pattern_type": pattern_type,
             "average_gap_days": avg_gap,
             "gap_variability": gap_std,
-            "total_span_days": (sorted_dates[-1] - sorted_dates[0]).days,
+            "total_span_days": int((sorted_dates[-1] - sorted_dates[0]).astype(np.int64)),
         }
 
     def _identify_peak_periods(self, monthly_dist: Dict, quarterly_dist: Dict) -> Dict[str, Any]:
@@ -584,25 +628,23 @@ class AdvancedTemporalAnalyzer:
 
         return recommendations
 
-    def _infer_fiscal_year_pattern(self, document_months: List[int]) -> str:
-        """Infer fiscal year pattern from document month distribution."""
-        if not document_months:
+    def _infer_fiscal_year_pattern(self, month_counts: np.ndarray) -> str:
+        """Infer fiscal year pattern from document month counts (indexed by month)."""
+        if not month_counts.sum():
             return "calendar"
 
-        month_counts = Counter(document_months)
-
         # Look for patterns that suggest non-calendar fiscal years
         # Financial year (Apr-Mar) typically has more activity in Apr and Mar
-        financial_score = month_counts.get(4, 0) + month_counts.get(3, 0)
+        financial_score = int(month_counts[4] + month_counts[3])
 
         # Academic year (Sep-Aug) typically has more activity in Sep
-        academic_score = month_counts.get(9, 0) * 1.5
+        academic_score = int(month_counts[9]) * 1.5
 
         # Federal FY (Oct-Sep) typically has more activity in Sep-Oct
-        federal_score = month_counts.get(9, 0) + month_counts.get(10, 0)
+        federal_score = int(month_counts[9] + month_counts[10])
 
         # Calendar year baseline
-        calendar_score = sum(month_counts.values()) / 12
+        calendar_score = int(month_counts.sum()) / 12
 
         scores = {
             "financial": financial_score,
@@ -613,71 +655,58 @@ class AdvancedTemporalAnalyzer:
 
         return max(scores.keys(), key=lambda k: scores[k])
 
-    def _calculate_fiscal_confidence(self, fiscal_hints: List, document_months: List[int]) -> float:
+    def _calculate_fiscal_confidence(self, fiscal_hints: List, month_counts: np.ndarray) -> float:
         """Calculate confidence in fiscal year detection."""
-        if not fiscal_hints and not document_months:
+        total_months = int(month_counts.sum())
+        if not fiscal_hints and not total_months:
             return 0.0
 
         # Higher confidence if we have explicit fiscal hints
         hint_confidence = (
-            len(fiscal_hints) / max(1, len(fiscal_hints) + len(document_months))
-            if fiscal_hints
-            else 0
+            len(fiscal_hints) / max(1, len(fiscal_hints) + total_months) if fiscal_hints else 0
         )
 
         # Pattern confidence based on month distribution
-        if document_months:
-            month_variety = len(set(document_months)) / 12.0  # How many different months
+        if total_months:
+            month_variety = np.count_nonzero(month_counts) / 12.0  # How many different months
             pattern_confidence = min(1.0, month_variety * 2)  # More months = higher confidence
         else:
             pattern_confidence = 0
 
         return hint_confidence * 0.7 + pattern_confidence * 0.3
 
-    def _generate_fiscal_structure(self, temporal_data: List, fiscal_info: Dict) -> Dict[str, Any]:
+    def _generate_fiscal_structure(
+        self, columns: TemporalColumns, fiscal_info: Dict
+    ) -> Dict[str, Any]:
         """Generate fiscal year-based organization structure."""
         fiscal_start_month = fiscal_info["start_month"]
-        fiscal_years = defaultdict(list)
-
-        for doc in temporal_data:
-            for date_info in doc["dates"]:
-                # Calculate fiscal year
-                actual_year = date_info["year"]
-                actual_month = date_info["month"]
-
-                if actual_month >= fiscal_start_month:
-                    fiscal_year = actual_year
-                else:
-                    fiscal_year = actual_year - 1
-
-                fiscal_years[fiscal_year].append(
-                    {
-                        "filename": doc["filename"],
-                        "category": doc["category"],
-                        "month": actual_month,
-                        "quarter": self._get_fiscal_quarter(actual_month, fiscal_start_month),
-                    }
+
+        # Fiscal year and quarter for every date at once
+        fiscal_year_of = columns.years - (columns.months < fiscal_start_month)
+        fiscal_quarter_of = ((columns.months - fiscal_start_month) % 12) // 3
+
+        fiscal_years = {}
+        for positions in _group_positions(fiscal_year_of):
+            fiscal_years[int(fiscal_year_of[positions[0]])] = [
+                {
+                    "filename": columns.filenames[doc],
+                    "category": columns.categories[category],
+                    "month": month,
+                    "quarter": FISCAL_QUARTER_LABELS[quarter],
+                }
+                for doc, category, month, quarter in zip(
+                    columns.doc_index[positions].tolist(),
+                    columns.category_codes[positions].tolist(),
+                    columns.months[positions].tolist(),
+                    fiscal_quarter_of[positions].tolist(),
                 )
+            ]
 
         return {
-            "fiscal_years": dict(fiscal_years),
+            "fiscal_years": fiscal_years,
             "structure_recommendation": self._recommend_fiscal_structure(fiscal_years),
         }
 
-    def _get_fiscal_quarter(self, month: int, fiscal_start_month: int) -> str:
-        """Get fiscal quarter for a month given the fiscal year start month."""
-        # Normalize month relative to fiscal year start
-        normalized_month = ((month - fiscal_start_month) % 12) + 1
-
-        if 1 <= normalized_month <= 3:
-            return "FQ1"
-        elif 4 <= normalized_month <= 6:
-            return "FQ2"
-        elif 7 <= normalized_month <= 9:
-            return "FQ3"
-        else:
-            return "FQ4"
-
     def _recommend_fiscal_structure(self, fiscal_years: Dict) -> Dict[str, Any]:
         """Recommend fiscal year organization structure."""
         total_fiscal_years = len(fiscal_years)
@@ -718,18 +747,12 @@ class AdvancedTemporalAnalyzer:
 
         return recommendations
 
-    def _analyze_category_workflow(self, timing_data: List[Dict]) -> Dict[str, Any]:
-        """Analyze workflow patterns for a specific category."""
-        # Sort by datetime
-        sorted_timing = sorted(timing_data, key=lambda x: x["datetime"])
+    def _analyze_category_workflow(self, dates: np.ndarray) -> Dict[str, Any]:
+        """Analyze workflow patterns for a specific category's dates."""
+        # Gaps in days between consecutive dates
+        time_gaps = np.diff(np.sort(dates)).astype(np.int64)
 
-        # Analyze timing patterns
-        time_gaps = []
-        for i in range(len(sorted_timing) - 1):
-            gap = (sorted_timing[i + 1]["datetime"] - sorted_timing[i]["datetime"]).days
-            time_gaps.append(gap)
-
-        if not time_gaps:
+        if not len(time_gaps):
             return {"workflow_detected": False}
 
         # Detect regular patterns
@@ -752,11 +775,11 @@ class AdvancedTemporalAnalyzer:
             "workflow_type": workflow_type,
             "average_interval_days": avg_gap,
             "interval_consistency": 1.0 - (gap_std / avg_gap) if avg_gap > 0 else 0,
-            "document_frequency": len(timing_data),
+            "document_frequency": len(dates),
         }
 
-    def _detect_process_cycles(self, category_timing: Dict) -> Dict[str, Any]:
-        """Detect business process cycles across categories."""
+    def _detect_process_cycles(self, category_timing: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        """Detect business process cycles across categories (category -> date months)."""
         process_cycles = {}
 
         # Look for categories that might be part of business processes
@@ -773,10 +796,9 @@ class AdvancedTemporalAnalyzer:
             "cycle_recommendations": self._generate_cycle_recommendations(process_cycles),
         }
 
-    def _analyze_process_cycle(self, timing_data: List[Dict]) -> Dict[str, Any]:
+    def _analyze_process_cycle(self, months: np.ndarray) -> Dict[str, Any]:
         """Analyze process cycle for a category."""
-        months = [data["month"] for data in timing_data]
-        month_counts = Counter(months)
+        month_counts = Counter(_first_seen_counts(months))
 
         # Check for cyclical patterns
         if len(month_counts) >= 3:
@@ -837,28 +859,14 @@ class AdvancedTemporalAnalyzer:
 
         return recommendations
 
-    def _calculate_pattern_strength(self, temporal_data: List[Dict[str, Any]]) -> float:
+    def _calculate_pattern_strength(self, columns: TemporalColumns) -> float:
         """Calculate overall pattern strength in temporal data."""
-        if not temporal_data:
-            return 0.0
-
-        # Count documents with dates
-        docs_with_dates = len([d for d in temporal_data if d["dates"]])
-        if docs_with_dates == 0:
-            return 0.0
-
         # Calculate date distribution variance (higher = more pattern)
-        all_months = []
-        for doc in temporal_data:
-            for date_info in doc["dates"]:
-                all_months.append(date_info["month"])
-
-        if len(all_months) < 2:
+        if len(columns.months) < 2:
             return 0.0
 
         # Normalized variance indicates pattern strength
-        month_counts = Counter(all_months)
-        values = list(month_counts.values())
+        values = list(_first_seen_counts(columns.months).values())
         mean_val = np.mean(values)
 
         if mean_val == 0:
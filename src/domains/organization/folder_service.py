@@ -8,11 +8,17 @@ Handles safe file operations and intelligent folder organization.
 import logging
 import os
 import re
-import shutil
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 
+from shared.file_operations.file_transfer import (
+    FileTransferService,
+    TransferResult,
+    get_transfer_service,
+)
+from shared.file_operations.name_index import get_name_index
+
 from .clustering_service import ClassificationResult
 
 
@@ -234,10 +240,15 @@ class FolderAnalyzer:
 class FolderService:
     """Main folder management service."""
 
-    def __init__(self):
-        """Initialize folder service."""
+    def __init__(self, transfer_service: Optional[FileTransferService] = None):
+        """Initialize folder service.
+
+        Args:
+            transfer_service: Transfer backend for file moves and copies (default: the shared one)
+        """
         self.logger = logging.getLogger(__name__)
         self.analyzer = FolderAnalyzer()
+        self.transfer_service = transfer_service or get_transfer_service()
 
     def create_folder_structure(
         self,
@@ -274,6 +285,31 @@ class FolderService:
             self.logger.error("Folder structure creation failed: %s", e)
             raise RuntimeError(f"Failed to create folder structure: {e}") from e
 
+    def plan_incremental_operations(
+        self,
+        target_path: str,
+        classifications: Dict[str, ClassificationResult],
+        structure: Optional[FolderStructure] = None,
+    ) -> Tuple[FolderStructure, List[FileOperation]]:
+        """Plan file operations for one micro-batch of an incremental session.
+
+        The first batch determines the folder structure; later batches extend it
+        with any new categories so documents already moved keep their folders.
+
+        Args:
+            target_path: Base path for organization
+            classifications: Classification results for this micro-batch
+            structure: Structure established by earlier batches (None for the first)
+
+        Returns:
+            Tuple of (folder_structure, file_operations)
+        """
+        if structure is None:
+            return self.create_folder_structure(target_path, classifications)
+
+        structure = self._extend_existing_structure(structure, classifications)
+        return structure, self._plan_file_operations(classifications, structure)
+
     def _determine_optimal_structure(
         self,
         target_path: str,
@@ -458,23 +494,35 @@ class FolderService:
             "failed_operations": 0,
             "created_directories": 0,
             "moved_files": 0,
+            "bytes_moved": 0,
+            "transfer_methods": {},
+            "moved_paths": {},
             "errors": [],
         }
 
         for operation in operations:
             try:
+                transfer = None
                 if operation.operation_type == "create_dir":
                     self._safe_create_directory(operation.target_path)
                     results["created_directories"] += 1
 
                 elif operation.operation_type == "move":
-                    self._safe_move_file(operation.source_path, operation.target_path)
+                    transfer = self._safe_move_file(operation.source_path, operation.target_path)
                     results["moved_files"] += 1
+                    results["moved_paths"][operation.source_path] = transfer.target_path
 
                 elif operation.operation_type == "copy":
-                    self._safe_copy_file(operation.source_path, operation.target_path)
+                    transfer = self._safe_copy_file(operation.source_path, operation.target_path)
                     # Note: copy operations would increment a copy counter if we tracked them
 
+                if transfer is not None:
+                    results["bytes_moved"] += transfer.bytes_moved
+                    method = transfer.method.value
+                    results["transfer_methods"][method] = (
+                        results["transfer_methods"].get(method, 0) + 1
+                    )
+
                 results["successful_operations"] += 1
 
             except Exception as e:
@@ -483,6 +531,9 @@ class FolderService:
                 results["errors"].append(error_msg)
                 results["failed_operations"] += 1
 
+        # Batch commit point: flush everything moved in this batch to disk once
+        self.transfer_service.commit()
+
         # Log summary
         success_rate = (results["successful_operations"] / results["total_operations"]) * 100
         self.logger.info("File operations complete: %.1f%% success rate", success_rate)
@@ -497,58 +548,51 @@ class FolderService:
         except Exception as e:
             raise RuntimeError(f"Failed to create directory {dir_path}: {e}") from e
 
-    def _safe_move_file(self, source_path: str, target_path: str) -> None:
+    def _safe_move_file(self, source_path: str, target_path: str) -> TransferResult:
         """Safely move file with conflict resolution."""
         try:
-            # Check if target already exists
-            if os.path.exists(target_path):
-                target_path = self._resolve_filename_conflict(target_path)
+            # Reserve a collision-free target name
+            target_path = self._resolve_filename_conflict(target_path)
 
             # Ensure target directory exists
             target_dir = os.path.dirname(target_path)
             if not os.path.exists(target_dir):
                 self._safe_create_directory(target_dir)
 
-            # Move file atomically
-            shutil.move(source_path, target_path)
+            # Move file atomically (rename, or zero-copy transfer across filesystems)
+            transfer = self.transfer_service.move(source_path, target_path)
             self.logger.debug("Moved file: %s → %s", source_path, target_path)
+            return transfer
 
         except Exception as e:
             raise RuntimeError(f"Failed to move {source_path} to {target_path}: {e}") from e
 
-    def _safe_copy_file(self, source_path: str, target_path: str) -> None:
+    def _safe_copy_file(self, source_path: str, target_path: str) -> TransferResult:
         """Safely copy file with conflict resolution."""
         try:
-            # Check if target already exists
-            if os.path.exists(target_path):
-                target_path = self._resolve_filename_conflict(target_path)
+            # Reserve a collision-free target name
+            target_path = self._resolve_filename_conflict(target_path)
 
             # Ensure target directory exists
             target_dir = os.path.dirname(target_path)
             if not os.path.exists(target_dir):
                 self._safe_create_directory(target_dir)
 
-            # Copy file
-            shutil.copy2(source_path, target_path)  # copy2 preserves metadata
+            # Copy file with metadata (reflink or kernel copy where supported)
+            transfer = self.transfer_service.copy(source_path, target_path)
             self.logger.debug("Copied file: %s → %s", source_path, target_path)
+            return transfer
 
         except Exception as e:
             raise RuntimeError(f"Failed to copy {source_path} to {target_path}: {e}") from e
 
     def _resolve_filename_conflict(self, target_path: str) -> str:
-        """Resolve filename conflicts by appending counter."""
-        base_name, extension = os.path.splitext(target_path)
-        counter = 1
+        """Resolve filename conflicts by appending counter.
 
-        while os.path.exists(target_path):
-            target_path = f"{base_name}_{counter}{extension}"
-            counter += 1
-
-            # Prevent infinite loop
-            if counter > 1000:
-                raise RuntimeError(f"Could not resolve filename conflict for {base_name}")
-
-        return target_path
+        Names are reserved in the shared per-directory name index, so
+        concurrent moves into the same category never collide.
+        """
+        return get_name_index(os.path.dirname(target_path)).reserve_path(target_path)
 
     def validate_folder_structure(self, structure: FolderStructure) -> Dict[str, Any]:
         """Validate proposed folder structure.
@@ -739,7 +783,7 @@ class FolderService:
                 target_drive = os.path.splitdrive(target_path)[0]
                 if source_drive != target_drive:
                     # Cross-device move might require copy+delete
-                    pass  # This is handled by shutil.move()
+                    pass  # This is handled by FileTransferService.move()
 
             return True, None
 
@@ -0,0 +1,282 @@
+"""
+Incremental Organizer
+
+Organizes documents while the processing pipeline is still running.
+
+Each completed document is classified immediately with the rule classifier
+and moved into its category folder in micro-batches. Uncertain documents are
+moved provisionally and queued; once enough have accumulated they are refined
+together by the batch ML path, and any whose category changes are reassigned
+in the next micro-batch. A final reconciliation pass refines the remaining
+queue, applies outstanding reassignments and records the session for
+learning.
+"""
+
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from .clustering_service import ClassificationResult, ClusteringService
+from .folder_service import FolderService, FolderStructure
+from .learning_service import LearningService
+
+DEFAULT_MICRO_BATCH_SIZE = 25
+DEFAULT_ML_BATCH_SIZE = 100
+
+
+class IncrementalOrganizer:
+    """Streams documents into category folders as they finish processing."""
+
+    def __init__(
+        self,
+        target_folder: str,
+        clustering_service: ClusteringService,
+        folder_service: FolderService,
+        learning_service: Optional[LearningService] = None,
+        content_store=None,
+        micro_batch_size: int = DEFAULT_MICRO_BATCH_SIZE,
+        ml_batch_size: int = DEFAULT_ML_BATCH_SIZE,
+    ):
+        """Initialize incremental organization session.
+
+        Args:
+            target_folder: Folder being organized
+            clustering_service: Classifier for incoming documents
+            folder_service: Plans and executes folder moves
+            learning_service: Records the session when finalized (optional)
+            content_store: Content handoff store discarded when the session commits
+            micro_batch_size: Documents classified before their moves are executed
+            ml_batch_size: Uncertain documents queued before batch ML refinement
+        """
+        self.target_folder = target_folder
+        self.clustering_service = clustering_service
+        self.folder_service = folder_service
+        self.learning_service = learning_service
+        self.content_store = content_store
+        self.micro_batch_size = max(1, micro_batch_size)
+        self.ml_batch_size = max(ml_batch_size, clustering_service.config.min_ml_documents, 1)
+        self.logger = logging.getLogger(__name__)
+
+        self.session_id = f"org_session_{int(datetime.now().timestamp())}"
+        self.structure: Optional[FolderStructure] = None
+        self.classifications: Dict[str, ClassificationResult] = {}
+
+        self._lock = threading.RLock()
+        self._locations: Dict[str, str] = {}  # doc_id -> current file location
+        self._pending: Dict[str, ClassificationResult] = {}  # doc_id -> result awaiting move
+        self._uncertain: List[Tuple[str, Dict[str, Any], ClassificationResult]] = []
+        self._uncertain_total = 0
+        self._references: List[Tuple[Dict[str, Any], ClassificationResult]] = []
+        self._finalized = False
+
+        self.stats = {
+            "documents_added": 0,
+            "micro_batches": 0,
+            "ml_batches": 0,
+            "reassignments": 0,
+        }
+        self.operation_totals: Dict[str, Any] = {
+            "total_operations": 0,
+            "successful_operations": 0,
+            "failed_operations": 0,
+            "created_directories": 0,
+            "moved_files": 0,
+            "bytes_moved": 0,
+            "transfer_methods": {},
+            "errors": [],
+        }
+
+    def add_document(self, document: Dict[str, Any]) -> ClassificationResult:
+        """Classify a completed document and queue its move.
+
+        Args:
+            document: Processed document with content, filename, metadata and path
+
+        Returns:
+            Rule-based classification result
+        """
+        doc_id = (
+            document.get("id")
+            or document.get("current_path")
+            or document.get("path")
+            or document.get("original_path")
+        )
+        if not doc_id:
+            raise ValueError("Document has no path for incremental organization")
+
+        result = self.clustering_service.classify_document(document, allow_ml=False)
+
+        with self._lock:
+            if self._finalized:
+                raise RuntimeError("Incremental organization session already finalized")
+
+            self.stats["documents_added"] += 1
+            self.classifications[doc_id] = result
+            self._locations[doc_id] = doc_id
+            self._pending[doc_id] = result
+
+            if result.confidence < self.clustering_service.config.ml_threshold:
+                self._uncertain.append((doc_id, document, result))
+                self._uncertain_total += 1
+                if len(self._uncertain) >= self.ml_batch_size:
+                    self._refine_uncertain()
+            else:
+                self._references.append((document, result))
+
+            if len(self._pending) >= self.micro_batch_size:
+                self.flush()
+
+        return result
+
+    def flush(self) -> Dict[str, Any]:
+        """Execute the moves queued since the last micro-batch.
+
+        Returns:
+            Execution results for this micro-batch
+        """
+        with self._lock:
+            if not self._pending:
+                return {}
+
+            batch = {self._locations[doc_id]: result for doc_id, result in self._pending.items()}
+            doc_ids = {self._locations[doc_id]: doc_id for doc_id in self._pending}
+            self._pending = {}
+
+            self.structure, operations = self.folder_service.plan_incremental_operations(
+                self.target_folder, batch, self.structure
+            )
+            # Skip documents already in their category folder
+            operations = [
+                op
+                for op in operations
+                if op.operation_type != "move" or op.source_path != op.target_path
+            ]
+            if not operations:
+                return {}
+
+            results = self.folder_service.execute_file_operations(operations)
+            for source_path, target_path in results.get("moved_paths", {}).items():
+                self._locations[doc_ids[source_path]] = target_path
+
+            self.stats["micro_batches"] += 1
+            self._accumulate(results)
+            return results
+
+    def finalize(self, enable_learning: bool = True) -> Dict[str, Any]:
+        """Reconcile the session: refine remaining uncertain documents and apply reassignments.
+
+        Args:
+            enable_learning: Whether to record the session for learning
+
+        Returns:
+            Organization results in the same shape as a batch organization session
+        """
+        with self._lock:
+            if (
+                self._uncertain
+                and self._uncertain_total >= self.clustering_service.config.min_ml_documents
+            ):
+                self._refine_uncertain()
+            self._uncertain = []
+            self._record_references()
+            self.clustering_service.save_reference_index()
+            self.flush()
+            self._finalized = True
+
+            quality_validation = self.clustering_service.validate_clustering_quality(
+                self.classifications
+            )
+            totals = self.operation_totals
+
+            learning_results = {}
+            if (
+                enable_learning
+                and self.learning_service is not None
+                and totals["successful_operations"] > 0
+            ):
+                learning_results = self.learning_service.learn_from_session(
+                    self.classifications,
+                    self.structure,
+                    {
+                        "overall_quality": quality_validation["overall_score"],
+                        "success_rate": totals["successful_operations"] / totals["total_operations"],
+                        "method_distribution": self._method_distribution(),
+                    },
+                )
+
+            success = totals["failed_operations"] == 0 or totals["successful_operations"] > 0
+            if success and self.content_store is not None:
+                self.content_store.discard()
+
+            self.logger.info(
+                "Incremental organization session %s completed: %d files organized in %d micro-batches",
+                self.session_id,
+                totals["moved_files"],
+                self.stats["micro_batches"],
+            )
+
+            return {
+                "session_id": self.session_id,
+                "success": success,
+                "incremental": True,
+                "documents_processed": len(self.classifications),
+                "files_organized": totals["moved_files"],
+                "directories_created": totals["created_directories"],
+                "classification_results": dict(self.classifications),
+                "final_locations": dict(self._locations),
+                "folder_structure": self.structure,
+                "operation_results": dict(totals),
+                "quality_metrics": quality_validation,
+                "learning_results": learning_results,
+                "recommendations": quality_validation.get("recommendations", []),
+                "incremental_stats": dict(self.stats),
+            }
+
+    def _refine_uncertain(self) -> None:
+        """Refine queued uncertain documents and queue reassignments. Caller holds the lock."""
+        queued, self._uncertain = self._uncertain, []
+        self._record_references()
+        refined = self.clustering_service.refine_uncertain_documents(queued)
+        self.stats["ml_batches"] += 1
+
+        for doc_id, result in refined.items():
+            previous = self.classifications.get(doc_id)
+            if previous is None:
+                continue
+            self.classifications[doc_id] = result
+            if doc_id in self._pending:
+                # Not moved yet: the refined category applies to the pending move
+                self._pending[doc_id] = result
+            elif result.category != previous.category:
+                self._pending[doc_id] = result
+                self.stats["reassignments"] += 1
+
+    def _record_references(self) -> None:
+        """Add confident documents seen so far to the reference index. Caller holds the lock."""
+        references, self._references = self._references, []
+        if references:
+            self.clustering_service.record_reference_documents(references)
+
+    def _accumulate(self, results: Dict[str, Any]) -> None:
+        """Add micro-batch execution results to the session totals."""
+        totals = self.operation_totals
+        for key in (
+            "total_operations",
+            "successful_operations",
+            "failed_operations",
+            "created_directories",
+            "moved_files",
+            "bytes_moved",
+        ):
+            totals[key] += results.get(key, 0)
+        for method, count in results.get("transfer_methods", {}).items():
+            totals["transfer_methods"][method] = totals["transfer_methods"].get(method, 0) + count
+        totals["errors"].extend(results.get("errors", []))
+
+    def _method_distribution(self) -> Dict[str, int]:
+        distribution: Dict[str, int] = {}
+        for result in self.classifications.values():
+            method = result.method.value if result.method else "unknown"
+            distribution[method] = distribution.get(method, 0) + 1
+        return distribution
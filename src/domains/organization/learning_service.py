@@ -18,6 +18,10 @@ from typing import Any, Dict, List, Optional, Tuple
 from .clustering_service import ClassificationResult, ClusteringMethod
 from .folder_service import FolderStructure
 
+# Bounds on filename templates learned from AI-generated names
+MAX_NAMING_VENDORS = 500
+MAX_NAMING_TEMPLATES = 5  # Per vendor and category
+
 
 @dataclass
 class OrganizationSession:
@@ -262,15 +266,17 @@ class StateManager:
 class LearningService:
     """Service for continuous learning and improvement."""
 
-    def __init__(self, target_folder: str, spacy_model=None):
+    def __init__(self, target_folder: str, spacy_model=None, content_store=None):
         """Initialize learning service.
 
         Args:
             target_folder: Target folder for organization
             spacy_model: Pre-loaded spaCy model to use (for performance optimization)
+            content_store: Content handoff store with phase-1 entities (optional)
         """
         self.target_folder = target_folder
         self.spacy_model = spacy_model
+        self.content_store = content_store
         self.logger = logging.getLogger(__name__)
         self.state_manager = StateManager(target_folder)
 
@@ -382,7 +388,7 @@ class LearningService:
         """Extract indicators from file that led to successful classification."""
         filename = os.path.basename(file_path)
 
-        return {
+        indicators = {
             "filename_pattern": filename,
             "file_extension": os.path.splitext(filename)[1].lower(),
             "confidence": result.confidence,
@@ -390,6 +396,15 @@ class LearningService:
             "pattern_matched": result.metadata.get("rule_patterns_matched", []),
         }
 
+        # Entities from phase-1 extraction, without re-reading the document
+        record = self.content_store.get(file_path) if self.content_store else None
+        if record:
+            indicators["entity_types"] = sorted(
+                entity_type for entity_type, values in record.entities.items() if values
+            )
+
+        return indicators
+
     def _update_learned_patterns(self, improvements: Dict[str, Any]) -> None:
         """Update learned patterns with new successful patterns."""
         # Merge with existing patterns
@@ -412,6 +427,53 @@ class LearningService:
         # Save updated patterns
         self.state_manager.save_learned_patterns(self.learned_patterns)
 
+    def get_naming_vendors(self) -> List[str]:
+        """Vendors with filename templates learned from AI-generated names."""
+        return list(self.learned_patterns.get("naming_templates", {}))
+
+    def get_naming_templates(self, vendor: str, category: str) -> Tuple[Dict[str, int], int]:
+        """Filename templates learned for a vendor's documents of one category.
+
+        Args:
+            vendor: Normalized vendor name
+            category: Rule-based document category
+
+        Returns:
+            Tuple of (template -> number of AI names it matched, AI names observed)
+        """
+        entry = self.learned_patterns.get("naming_templates", {}).get(vendor, {})
+        stats = entry.get("categories", {}).get(category, {})
+        return dict(stats.get("templates", {})), stats.get("observations", 0)
+
+    def record_naming_observation(
+        self, vendor: str, category: str, template: Optional[str]
+    ) -> None:
+        """Record how the AI named a vendor's document (kept in memory until saved).
+
+        Args:
+            vendor: Normalized vendor name
+            category: Rule-based document category
+            template: Template derived from the AI's name, None if none could be derived
+        """
+        vendors = self.learned_patterns.setdefault("naming_templates", {})
+        entry = vendors.setdefault(vendor, {"categories": {}})
+        entry["last_seen"] = datetime.now().isoformat()
+        stats = entry["categories"].setdefault(category, {"observations": 0, "templates": {}})
+        stats["observations"] += 1
+
+        templates = stats["templates"]
+        if template:
+            templates[template] = templates.get(template, 0) + 1
+        if len(templates) > MAX_NAMING_TEMPLATES:
+            rarest = min((t for t in templates if t != template), key=templates.get)
+            del templates[rarest]
+        if len(vendors) > MAX_NAMING_VENDORS:
+            del vendors[min(vendors, key=lambda v: vendors[v].get("last_seen", ""))]
+
+    def save_naming_templates(self) -> bool:
+        """Persist filename templates recorded since loading."""
+        return self.state_manager.save_learned_patterns(self.learned_patterns)
+
     def _evaluate_preference_updates(
         self, session: OrganizationSession, quality_metrics: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -8,7 +8,10 @@ Implements the progressive enhancement architecture from PRD_04.
 import logging
 import os
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from shared.infrastructure.tracing import span
 
 from .clustering_service import (
     ClassificationResult,
@@ -17,8 +20,39 @@ from .clustering_service import (
     ClusteringService,
 )
 from .folder_service import FiscalYearType, FolderService, FolderStructure, FolderStructureType
+from .incremental_organizer import DEFAULT_MICRO_BATCH_SIZE, IncrementalOrganizer
+from .content_analysis.reference_index import ReferenceIndex
 from .learning_service import LearningService
 
+try:
+    from shared.infrastructure.content_handoff import get_content_handoff_store
+except ImportError:
+    get_content_handoff_store = None  # type: ignore
+
+# Content produced by FileOrganizer when no phase-1 text is available
+PLACEHOLDER_CONTENT_PREFIX = "Document: "
+
+# Documents classified per chunk when organizing a stream (matches the buffer's in-memory limit)
+CLASSIFY_CHUNK_SIZE = 256
+
+# Keys kept from streamed documents once their chunk has been classified
+_PATH_KEYS = ("id", "path", "file_path", "original_path", "current_path", "filename")
+
+
+def _iter_chunks(documents: Iterable[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+    """Yield lists of up to CLASSIFY_CHUNK_SIZE documents from a stream."""
+    iterator = iter(documents)
+    while True:
+        chunk = list(islice(iterator, CLASSIFY_CHUNK_SIZE))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _path_stub(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the identifying paths of a document, dropping its content."""
+    return {key: document[key] for key in _PATH_KEYS if key in document}
+
 
 class OrganizationService:
     """Main service coordinating all organization domain operations."""
@@ -34,21 +68,34 @@ class OrganizationService:
         self.target_folder = target_folder or "./output"  # Default if not provided
         self.logger = logging.getLogger(__name__)
 
+        # Phase-1 extraction results handed off by the processing pipeline
+        self.content_store = (
+            get_content_handoff_store(self.target_folder) if get_content_handoff_store else None
+        )
+
+        # Reference embeddings persist across sessions in the target's state directory
+        self.reference_index = ReferenceIndex(os.path.join(self.target_folder, ".content_tamer"))
+
         # Initialize domain services with shared spacy model
-        self.clustering_service = ClusteringService(config, spacy_model=spacy_model)
+        self.clustering_service = ClusteringService(
+            config, spacy_model=spacy_model, reference_index=self.reference_index
+        )
         self.folder_service = FolderService()
-        self.learning_service = LearningService(self.target_folder, spacy_model=spacy_model)
+        self.learning_service = LearningService(
+            self.target_folder, spacy_model=spacy_model, content_store=self.content_store
+        )
 
         # Load learned preferences
         self.preferences = self.learning_service.preferences
 
     def organize_processed_documents(
-        self, documents: List[Dict[str, Any]], enable_learning: bool = True, ml_enhancement_level: int = 2
+        self, documents: Iterable[Dict[str, Any]], enable_learning: bool = True, ml_enhancement_level: int = 2
     ) -> Dict[str, Any]:
         """Organize processed documents using progressive enhancement.
 
         Args:
-            documents: List of processed documents with content, filename, metadata
+            documents: Processed documents with content, filename, metadata (list or
+                stream, e.g. from a ProcessedDocumentBuffer)
             enable_learning: Whether to learn from this session
 
         Returns:
@@ -56,47 +103,51 @@ class OrganizationService:
         """
         session_id = f"org_session_{int(datetime.now().timestamp())}"
         try:
-            self.logger.info(
-                "Starting organization session %s for %d documents", session_id, len(documents)
-            )
+            self.logger.info("Starting organization session %s", session_id)
 
-            # Step 1: Classify documents using clustering service
+            # Step 1: Classify documents using clustering service. Streams get the
+            # rule pass in chunks so only one chunk's content is held at a time;
+            # path-only stubs are kept for the time-based fallback. Uncertain
+            # documents are collected across chunks and refined in one ML pass.
             self.logger.info("Step 1: Classifying documents...")
-            classifications = self.clustering_service.batch_classify_documents(documents)
-            
-            # Map classifications to actual file paths
-            # The classifications dict might have doc IDs as keys, but we need actual file paths
-            path_classifications = {}
-            for doc_id, classification in classifications.items():
-                # Find the corresponding document to get its actual path
-                matching_doc = None
-                for doc in documents:
-                    # Check if this doc matches the doc_id
-                    if (doc.get("current_path") == doc_id or 
-                        doc.get("path") == doc_id or
-                        doc.get("original_path") == doc_id or
-                        doc.get("id") == doc_id):
-                        matching_doc = doc
-                        break
-                
-                if matching_doc:
-                    # Use the current_path (renamed file) as the key for folder operations
-                    actual_path = matching_doc.get("current_path") or matching_doc.get("path") or matching_doc.get("original_path")
-                    if actual_path:
-                        path_classifications[actual_path] = classification
-                    else:
-                        self.logger.warning("No valid path found for document: %s", doc_id)
-                else:
-                    # If doc_id is already a path, use it directly
-                    if os.path.exists(doc_id) or os.path.isabs(doc_id):
-                        path_classifications[doc_id] = classification
-                    else:
-                        self.logger.warning("Could not map classification for: %s", doc_id)
+            path_classifications: Dict[str, ClassificationResult] = {}
+            classifications: Dict[str, ClassificationResult] = {}
+            uncertain: List[Tuple[str, Dict[str, Any], ClassificationResult]] = []
+            references: List[Tuple[Dict[str, Any], ClassificationResult]] = []
+            streamed = not isinstance(documents, list)
+            chunks = _iter_chunks(documents) if streamed else [documents]
+            if streamed:
+                documents = []
+            classified_count = 0
+            for chunk in chunks:
+                self._hydrate_documents(chunk)
+                with span("organize.classify", documents=len(chunk)):
+                    chunk_results, chunk_uncertain, chunk_references = (
+                        self.clustering_service.classify_with_rules(chunk, classified_count)
+                    )
+                path_classifications.update(self._map_classifications(chunk_results, chunk))
+                classifications.update(chunk_results)
+                uncertain.extend(chunk_uncertain)
+                references.extend(chunk_references)
+                classified_count += len(chunk)
+                if streamed:
+                    documents.extend(_path_stub(doc) for doc in chunk)
+
+            with span("organize.refine", documents=len(uncertain)):
+                classifications = self.clustering_service.refine_batch_results(
+                    classifications, uncertain, references
+                )
+            refined = {doc_id: classifications[doc_id] for doc_id, _, _ in uncertain}
+            path_classifications.update(
+                self._map_classifications(refined, [doc for _, doc, _ in uncertain])
+            )
+            self.logger.info("Classified %d documents", len(documents))
 
             # Step 2: Validate clustering quality
-            quality_validation = self.clustering_service.validate_clustering_quality(
-                path_classifications
-            )
+            with span("organize.validate_quality"):
+                quality_validation = self.clustering_service.validate_clustering_quality(
+                    path_classifications
+                )
             if not quality_validation["valid"]:
                 self.logger.warning(
                     "Clustering quality below threshold: %.1f", quality_validation['overall_score']
@@ -108,9 +159,10 @@ class OrganizationService:
 
             # Step 3: Create folder structure
             self.logger.info("Step 3: Creating folder structure...")
-            folder_structure, file_operations = self.folder_service.create_folder_structure(
-                self.target_folder, path_classifications
-            )
+            with span("organize.create_folders"):
+                folder_structure, file_operations = self.folder_service.create_folder_structure(
+                    self.target_folder, path_classifications
+                )
 
             # Step 4: Validate folder structure
             structure_validation = self.folder_service.validate_folder_structure(folder_structure)
@@ -119,22 +171,26 @@ class OrganizationService:
 
             # Step 5: Execute file operations
             self.logger.info("Step 5: Executing %d file operations...", len(file_operations))
-            operation_results = self.folder_service.execute_file_operations(file_operations)
+            with span("organize.move_files", operations=len(file_operations)):
+                operation_results = self.folder_service.execute_file_operations(file_operations)
 
             # Step 6: Learn from session (if enabled)
             learning_results = {}
             if enable_learning and operation_results["successful_operations"] > 0:
                 self.logger.info("Step 6: Learning from session results...")
-                learning_results = self.learning_service.learn_from_session(
-                    path_classifications,
-                    folder_structure,
-                    {
-                        "overall_quality": quality_validation["overall_score"],
-                        "success_rate": operation_results["successful_operations"]
-                        / operation_results["total_operations"],
-                        "method_distribution": self._get_method_distribution(path_classifications),
-                    },
-                )
+                with span("organize.learn"):
+                    learning_results = self.learning_service.learn_from_session(
+                        path_classifications,
+                        folder_structure,
+                        {
+                            "overall_quality": quality_validation["overall_score"],
+                            "success_rate": operation_results["successful_operations"]
+                            / operation_results["total_operations"],
+                            "method_distribution": self._get_method_distribution(
+                                path_classifications
+                            ),
+                        },
+                    )
 
             # Compile final results with expected API contract
             organization_results = {
@@ -165,6 +221,11 @@ class OrganizationService:
             self.logger.info(
                 "Organization session %s completed: %d files organized", session_id, operation_results['moved_files']
             )
+
+            # Session committed: handed-off content is no longer needed
+            if organization_results["success"] and self.content_store is not None:
+                self.content_store.discard()
+
             return organization_results
 
         except Exception as e:
@@ -177,6 +238,97 @@ class OrganizationService:
                 "files_organized": 0,
                 "recommendations": ["Manual organization recommended due to processing error"],
             }
+        finally:
+            # References recorded during classification are written once per session
+            self.clustering_service.save_reference_index()
+
+    def create_incremental_session(
+        self, micro_batch_size: int = DEFAULT_MICRO_BATCH_SIZE
+    ) -> IncrementalOrganizer:
+        """Start an incremental session that organizes documents as processing completes.
+
+        Args:
+            micro_batch_size: Documents classified before their folder moves are executed
+
+        Returns:
+            IncrementalOrganizer sharing this service's classifiers and folder service
+        """
+        return IncrementalOrganizer(
+            self.target_folder,
+            self.clustering_service,
+            self.folder_service,
+            learning_service=self.learning_service,
+            content_store=self.content_store,
+            micro_batch_size=micro_batch_size,
+        )
+
+    def _map_classifications(
+        self, classifications: Dict[str, ClassificationResult], documents: List[Dict[str, Any]]
+    ) -> Dict[str, ClassificationResult]:
+        """Map classifications to actual file paths.
+
+        The classifications dict might have doc IDs as keys, but folder operations
+        need the actual (renamed) file paths.
+        """
+        path_classifications = {}
+        for doc_id, classification in classifications.items():
+            # Find the corresponding document to get its actual path
+            matching_doc = None
+            for doc in documents:
+                # Check if this doc matches the doc_id
+                if (doc.get("current_path") == doc_id or 
+                    doc.get("path") == doc_id or
+                    doc.get("original_path") == doc_id or
+                    doc.get("id") == doc_id):
+                    matching_doc = doc
+                    break
+            
+            if matching_doc:
+                # Use the current_path (renamed file) as the key for folder operations
+                actual_path = matching_doc.get("current_path") or matching_doc.get("path") or matching_doc.get("original_path")
+                if actual_path:
+                    path_classifications[actual_path] = classification
+                else:
+                    self.logger.warning("No valid path found for document: %s", doc_id)
+            else:
+                # If doc_id is already a path, use it directly
+                if os.path.exists(doc_id) or os.path.isabs(doc_id):
+                    path_classifications[doc_id] = classification
+                else:
+                    self.logger.warning("Could not map classification for: %s", doc_id)
+        return path_classifications
+
+    def _hydrate_documents(self, documents: List[Dict[str, Any]]) -> int:
+        """Fill document content, metadata and entities from the content handoff store.
+
+        Documents that already carry real content are left untouched; documents with
+        no content or only a filename placeholder get the phase-1 extraction results.
+
+        Returns:
+            Number of documents hydrated
+        """
+        if self.content_store is None:
+            return 0
+
+        hydrated = 0
+        for doc in documents:
+            content = doc.get("content") or ""
+            if content and not content.startswith(PLACEHOLDER_CONTENT_PREFIX):
+                continue
+
+            path = doc.get("current_path") or doc.get("path") or doc.get("original_path")
+            record = self.content_store.get(path) if path else None
+            if record is None:
+                continue
+
+            doc["content"] = record.content
+            doc["metadata"] = {**record.metadata, **(doc.get("metadata") or {})}
+            doc.setdefault("entities", record.entities)
+            hydrated += 1
+
+        if hydrated:
+            self.logger.debug("Hydrated %d documents from content handoff store", hydrated)
+        return hydrated
 
     def _get_method_distribution(
         self, classifications: Dict[str, ClassificationResult]
@@ -297,6 +449,8 @@ class OrganizationService:
             Preview of proposed organization structure
         """
         try:
+            self._hydrate_documents(documents)
+
             # Classify documents
             classifications = self.clustering_service.batch_classify_documents(documents)
 
@@ -0,0 +1,371 @@
+"""
+Template Naming
+
+Deterministic filenames for templated documents (utility bills, bank
+statements, payroll slips from recurring vendors) without an AI request.
+
+Each AI-generated name is turned into a template for the document's vendor
+and rule-based category by replacing the dates, amounts and reference number
+found in the document with placeholders, e.g.
+``Acme_Energy_Electric_Bill_{date0_ym}``, and recorded by the LearningService.
+Once enough of a vendor's documents of a category were named the same way,
+new ones are named from the template in microseconds. A sample of template
+names is still sent to the AI and compared as a quality audit.
+"""
+
+import re
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+
+from shared.infrastructure.entity_scanner import (
+    EntityScanResult,
+    entity_scan_from_metadata,
+    scan_entities,
+)
+from shared.infrastructure.filename_config import validate_generated_filename
+
+from .content_analysis.rule_classifier import EnhancedRuleBasedClassifier
+
+# Date renderings recognized in AI-generated names (placeholder suffix -> strftime format)
+DATE_FORMATS = {
+    "ymd": "%Y-%m-%d",
+    "ymd_": "%Y_%m_%d",
+    "ymd_compact": "%Y%m%d",
+    "mdy": "%m-%d-%Y",
+    "ym": "%Y-%m",
+    "ym_": "%Y_%m",
+    "month_year": "%B_%Y",
+    "mon_year": "%b_%Y",
+    "year": "%Y",
+}
+MAX_DATES = 5
+MAX_AMOUNTS = 3
+
+# A letterhead line ending in a legal suffix or one of these words names the vendor
+LEGAL_SUFFIXES = frozenset(
+    {"co", "company", "corp", "corporation", "gmbh", "inc", "llc", "llp", "ltd", "limited", "plc"}
+)
+VENDOR_WORDS = frozenset(
+    {
+        "bank",
+        "electric",
+        "energy",
+        "gas",
+        "insurance",
+        "mobile",
+        "payroll",
+        "power",
+        "telecom",
+        "union",
+        "utilities",
+        "utility",
+        "water",
+        "wireless",
+    }
+)
+
+_WORD = re.compile(r"[A-Za-z0-9&]+")
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_REFERENCE = re.compile(
+    r"\b(?:invoice|inv|bill|statement|account|acct|policy|order|reference|ref)"
+    r"\s*(?:no\.?|number|num|#)?\s*[:#]?\s*(?P<ref>[A-Z0-9][A-Z0-9\-/]*\d[A-Z0-9\-/]*)",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class TemplateNamingConfig:
+    """Configuration for the template naming fast path."""
+
+    confidence_threshold: float = 0.8  # Share of a vendor's AI names matching the template
+    audit_rate: float = 0.05  # Share of template names also sent to the AI for comparison
+    max_scan_chars: int = 4000
+    vendor_lines: int = 15  # Letterhead lines searched for a new vendor
+    history_size: int = 200
+
+
+@dataclass
+class NamingDecision:
+    """Fast-path outcome for one document."""
+
+    category: str
+    vendor: Optional[str] = None
+    fields: Dict[str, str] = field(default_factory=dict)
+    template: Optional[str] = None
+    filename: Optional[str] = None
+    confidence: float = 0.0
+    reason: str = "no_vendor"  # "accepted", or why the AI names the document instead
+    audit: bool = False
+
+    @property
+    def use_template(self) -> bool:
+        """Whether the template name is used without an AI request."""
+        return self.reason == "accepted" and not self.audit
+
+
+def vendor_from_text(text: str, max_lines: int = 15) -> Optional[str]:
+    """Vendor named on a document's letterhead, normalized (e.g. "acme energy"), or None."""
+    for line in text.splitlines()[:max_lines]:
+        words = [word.lower() for word in _WORD.findall(line)]
+        if not 1 < len(words) <= 6:
+            continue
+        if words[-1] in LEGAL_SUFFIXES:
+            words = words[:-1]
+        elif words[-1] not in VENDOR_WORDS:
+            continue
+        if any(word.isalpha() for word in words):
+            return " ".join(words)
+    return None
+
+
+def reference_from_text(text: str, exclude: List[str]) -> Optional[str]:
+    """First invoice, account or statement number in the text, filename-safe."""
+    for match in _REFERENCE.finditer(text):
+        reference = match.group("ref").strip("-/")
+        if reference not in exclude:
+            return re.sub(r"[^A-Za-z0-9\-]+", "_", reference)
+    return None
+
+
+def template_fields(entity_scan: EntityScanResult, reference: Optional[str]) -> Dict[str, str]:
+    """Renderings of a document's dates, amounts and reference that templates may use."""
+    fields = {}
+    dates = list(dict.fromkeys(entity.value for entity in entity_scan.dates))
+    for index, date in enumerate(dates[:MAX_DATES]):
+        for name, date_format in DATE_FORMATS.items():
+            fields[f"date{index}_{name}"] = date.strftime(date_format)
+    amounts = list(dict.fromkeys(entity.value for entity in entity_scan.amounts))
+    for index, amount in enumerate(amounts[:MAX_AMOUNTS]):
+        fields[f"amount{index}"] = f"{amount:.2f}".replace(".", "_")
+    if reference:
+        fields["reference"] = reference
+    return fields
+
+
+def derive_template(filename: str, fields: Dict[str, str]) -> Optional[str]:
+    """
+    Turn a generated filename into a template by replacing field values with placeholders.
+
+    Longer values are replaced first, each at most once and only at word boundaries,
+    so ``2024-03-01`` becomes ``{date0_ymd}`` rather than ``{date0_year}-03-01``.
+    Returns None when no field was found, since a constant name would give every
+    later document from the vendor the same filename.
+    """
+    if not filename or "{" in filename or "}" in filename:
+        return None
+    segments = [(filename, False)]
+    for name, value in sorted(fields.items(), key=lambda item: -len(item[1])):
+        pattern = re.compile(
+            rf"(?<![A-Za-z0-9]){re.escape(value)}(?![A-Za-z0-9])", re.IGNORECASE
+        )
+        for index, (text, is_field) in enumerate(segments):
+            match = None if is_field else pattern.search(text)
+            if match:
+                segments[index : index + 1] = [
+                    (text[: match.start()], False),
+                    (f"{{{name}}}", True),
+                    (text[match.end() :], False),
+                ]
+                break
+    if not any(is_field for _, is_field in segments):
+        return None
+    return "".join(text for text, _ in segments)
+
+
+def _mentions(filename: str, vendor: str) -> bool:
+    """Whether a filename contains the vendor, ignoring case and separators."""
+    return vendor.replace(" ", "") in _NON_ALNUM.sub("", filename.lower())
+
+
+class TemplateNamingService:
+    """Names recurring templated documents from templates learned from the AI."""
+
+    def __init__(
+        self,
+        learning_service,
+        config: Optional[TemplateNamingConfig] = None,
+        classifier: Optional[EnhancedRuleBasedClassifier] = None,
+    ):
+        """
+        Initialize the service.
+
+        Args:
+            learning_service: LearningService of the output folder, holding the templates
+            config: Fast-path configuration
+            classifier: Rule-based classifier (default: rules only, without spaCy)
+        """
+        self.learning = learning_service
+        self.config = config or TemplateNamingConfig()
+        self.classifier = classifier or EnhancedRuleBasedClassifier(use_spacy=False)
+        self._lock = threading.Lock()
+        self._vendor_pattern: Optional[re.Pattern] = None
+        self._vendors_changed = True
+        self._unsaved = False
+        self._counts: Counter = Counter()
+        self._reasons: Counter = Counter()
+        self._decision_times: Deque[float] = deque(maxlen=1000)
+        self._audits: Deque[Dict[str, Any]] = deque(maxlen=self.config.history_size)
+
+    def propose(
+        self, content: str, original_filename: str, metadata: Any = None
+    ) -> NamingDecision:
+        """
+        Decide whether a document can be named from a learned template.
+
+        Args:
+            content: AI-ready document text
+            original_filename: Original filename, used for classification
+            metadata: Document metadata carrying the extraction-time entity scan (optional)
+
+        Returns:
+            NamingDecision; ``use_template`` tells whether to skip the AI request
+        """
+        started = time.perf_counter()
+        decision = self._propose(content or "", original_filename, metadata)
+        with self._lock:
+            self._decision_times.append(time.perf_counter() - started)
+            self._counts["documents"] += 1
+            if decision.reason == "accepted":
+                self._counts["eligible"] += 1
+                decision.audit = self._audit_due(self._counts["eligible"])
+                self._counts["audited" if decision.audit else "fast_path"] += 1
+            else:
+                self._reasons[decision.reason] += 1
+        return decision
+
+    def observe(self, decision: NamingDecision, filename: str) -> None:
+        """
+        Learn from the AI's name for a document the fast path did not name.
+
+        Args:
+            decision: The document's NamingDecision
+            filename: Name generated by the AI
+        """
+        if decision.vendor is None or not filename:
+            return
+        with self._lock:
+            known = decision.template is not None
+            if _mentions(filename, decision.vendor):
+                template = derive_template(filename, decision.fields)
+            elif known:
+                template = None  # The AI named a known vendor's document differently
+            else:
+                return
+
+            self.learning.record_naming_observation(decision.vendor, decision.category, template)
+            self._counts["observed"] += 1
+            self._vendors_changed = self._vendors_changed or not known
+            self._unsaved = True
+
+            if decision.audit:
+                matched = filename.lower() == (decision.filename or "").lower()
+                self._counts["audit_matches"] += int(matched)
+                self._audits.append(
+                    {
+                        "vendor": decision.vendor,
+                        "category": decision.category,
+                        "template_name": decision.filename,
+                        "ai_name": filename,
+                        "matched": matched,
+                    }
+                )
+
+    def save(self) -> bool:
+        """Persist templates learned since the last save."""
+        with self._lock:
+            if not self._unsaved:
+                return True
+            self._unsaved = False
+        return self.learning.save_naming_templates()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Fast-path rate, AI fallback reasons, audit results and decision latency."""
+        with self._lock:
+            counts = self._counts
+            times = sorted(self._decision_times)
+            audited = counts["audited"]
+            return {
+                "documents": counts["documents"],
+                "fast_path": counts["fast_path"],
+                "fast_path_rate": (
+                    round(counts["fast_path"] / counts["documents"], 3)
+                    if counts["documents"]
+                    else 0.0
+                ),
+                "audited": audited,
+                "audit_matches": counts["audit_matches"],
+                "audit_match_rate": (
+                    round(counts["audit_matches"] / audited, 3) if audited else None
+                ),
+                "ai_fallback_reasons": dict(self._reasons),
+                "observed": counts["observed"],
+                "learned_vendors": len(self.learning.get_naming_vendors()),
+                "p50_decision_ms": round(times[len(times) // 2] * 1000, 3) if times else None,
+                "p95_decision_ms": (
+                    round(times[int(0.95 * (len(times) - 1))] * 1000, 3) if times else None
+                ),
+                "recent_audits": list(self._audits),
+            }
+
+    def _propose(self, content: str, original_filename: str, metadata: Any) -> NamingDecision:
+        text = content[: self.config.max_scan_chars]
+        decision = NamingDecision(
+            category=self.classifier.classify_document(text, original_filename)
+        )
+        decision.vendor = self._known_vendor(text) or vendor_from_text(
+            text, self.config.vendor_lines
+        )
+        if decision.vendor is None:
+            return decision
+
+        entity_scan = entity_scan_from_metadata(metadata) or scan_entities(text)
+        date_texts = [entity.text for entity in entity_scan.dates]
+        decision.fields = template_fields(entity_scan, reference_from_text(text, date_texts))
+
+        templates, observations = self.learning.get_naming_templates(
+            decision.vendor, decision.category
+        )
+        if not templates:
+            decision.reason = "new_vendor" if not observations else "no_template"
+            return decision
+        decision.template, matches = max(templates.items(), key=lambda item: item[1])
+        decision.confidence = round(matches / (observations + 1), 3)
+        if decision.confidence < self.config.confidence_threshold:
+            decision.reason = "low_confidence"
+            return decision
+
+        try:
+            filename = decision.template.format(**decision.fields)
+        except (KeyError, IndexError, ValueError):
+            decision.reason = "missing_fields"
+            return decision
+        if validate_generated_filename(filename) != filename:
+            decision.reason = "invalid"
+            return decision
+        decision.filename = filename
+        decision.reason = "accepted"
+        return decision
+
+    def _known_vendor(self, text: str) -> Optional[str]:
+        """First vendor with learned templates mentioned in the text."""
+        with self._lock:
+            if self._vendors_changed:
+                vendors = sorted(self.learning.get_naming_vendors(), key=len, reverse=True)
+                alternatives = [r"\W*".join(map(re.escape, vendor.split())) for vendor in vendors]
+                self._vendor_pattern = (
+                    re.compile(rf"\b(?:{'|'.join(alternatives)})\b", re.IGNORECASE)
+                    if alternatives
+                    else None
+                )
+                self._vendors_changed = False
+            pattern = self._vendor_pattern
+        match = pattern.search(text) if pattern is not None else None
+        return " ".join(_WORD.findall(match.group().lower())) if match else None
+
+    def _audit_due(self, eligible: int) -> bool:
+        """Whether the n-th template name is audited (evenly spread at ``audit_rate``)."""
+        rate = self.config.audit_rate
+        return int(eligible * rate) > int((eligible - 1) * rate)
@@ -35,10 +35,25 @@ class ParsedArguments:
     provider: str = "openai"
     model: Optional[str] = None
     api_key: Optional[str] = None
+    hedge_requests: bool = False
+    hedge_provider: Optional[str] = None
+    hedge_model: Optional[str] = None
+    cascade: bool = False
+    cascade_model: Optional[str] = None
+    fast_path: bool = False
+    fast_path_threshold: Optional[float] = None
+    fast_path_audit_rate: Optional[float] = None
 
     # Processing options
     ocr_language: str = "eng"
     reset_progress: bool = False
+    profile: Optional[str] = None  # Chrome trace output path
+
+    # Concurrency overrides (None = sized from the hardware)
+    ocr_workers: Optional[int] = None
+    extraction_workers: Optional[int] = None
+    ai_in_flight: Optional[int] = None
+    embedding_batch_size: Optional[int] = None
 
     # Local LLM options
     setup_local_llm: bool = False
@@ -57,6 +72,7 @@ class ParsedArguments:
     organize: bool = False
     no_organize: bool = False
     ml_level: int = 2
+    incremental_organize: bool = False
 
     # Feature management
     show_feature_flags: bool = False
@@ -116,6 +132,9 @@ Examples:
         # Processing arguments
         self._add_processing_arguments(parser)
 
+        # Concurrency arguments
+        self._add_concurrency_arguments(parser)
+
         # Local LLM arguments
         self._add_local_llm_arguments(parser)
 
@@ -183,6 +202,53 @@ Examples:
             help="Model to use for the selected provider (run with --list-models to see options)",
         )
         parser.add_argument("--api-key", "-k", help="API key for the selected provider")
+        parser.add_argument(
+            "--hedge",
+            action="store_true",
+            help="Send a duplicate request when one is slower than the provider's observed "
+            "p95 latency; the first usable filename wins (at most 10%% of requests)",
+        )
+        parser.add_argument(
+            "--hedge-provider",
+            choices=AI_PROVIDERS.keys(),
+            help="Provider for duplicate requests (implies --hedge; default: --provider)",
+        )
+        parser.add_argument(
+            "--hedge-model",
+            help="Model for duplicate requests (default: the hedge provider's default model)",
+        )
+        parser.add_argument(
+            "--cascade",
+            action="store_true",
+            help="Name documents with a cheap model first and escalate to --model only for "
+            "invalid or generic names and fair/poor extractions",
+        )
+        parser.add_argument(
+            "--cascade-model",
+            metavar="[PROVIDER:]MODEL",
+            help="First-tier model for --cascade (implies --cascade; default: the "
+            "provider's cheapest model, e.g. gpt-5-mini or gemma2-2b)",
+        )
+        parser.add_argument(
+            "--fast-path",
+            action="store_true",
+            help="Name recurring vendors' templated documents (bills, statements, payslips) "
+            "from templates learned from earlier AI names, without an AI request",
+        )
+        parser.add_argument(
+            "--fast-path-threshold",
+            type=float,
+            metavar="CONFIDENCE",
+            help="Share of a vendor's AI names a template must match to be used "
+            "(implies --fast-path; default: 0.8)",
+        )
+        parser.add_argument(
+            "--fast-path-audit-rate",
+            type=float,
+            metavar="RATE",
+            help="Share of template names also sent to the AI for comparison "
+            "(implies --fast-path; default: 0.05)",
+        )
         parser.add_argument(
             "--list-models",
             "-l",
@@ -202,6 +268,44 @@ Examples:
             action="store_true",
             help="Ignore and delete existing .progress file before run",
         )
+        parser.add_argument(
+            "--profile",
+            nargs="?",
+            const="content-tamer-profile.json",
+            metavar="TRACE_FILE",
+            help="Record stage timings: write a Chrome/Perfetto trace (default: "
+            "content-tamer-profile.json) and a per-stage p50/p95/p99 summary",
+        )
+
+    def _add_concurrency_arguments(self, parser: argparse.ArgumentParser) -> None:
+        """Add worker limit overrides (sized from the hardware by default)."""
+        concurrency_group = parser.add_argument_group(
+            "Concurrency", "Override worker limits sized from detected cores and free memory"
+        )
+        concurrency_group.add_argument(
+            "--ocr-workers",
+            type=int,
+            metavar="N",
+            help="Threads running OCR on scans and images (0 = inline)",
+        )
+        concurrency_group.add_argument(
+            "--extraction-workers",
+            type=int,
+            metavar="N",
+            help="Threads extracting text documents ahead of filename generation",
+        )
+        concurrency_group.add_argument(
+            "--ai-in-flight",
+            type=int,
+            metavar="N",
+            help="Maximum concurrent AI requests",
+        )
+        concurrency_group.add_argument(
+            "--embedding-batch-size",
+            type=int,
+            metavar="N",
+            help="Texts embedded per batch during ML organization",
+        )
 
     def _add_local_llm_arguments(self, parser: argparse.ArgumentParser) -> None:
         """Add Local LLM related arguments."""
@@ -281,6 +385,11 @@ Examples:
             default=2,
             help="ML enhancement level: 1=Basic rules, 2=Selective ML, 3=Temporal intelligence (default: 2)",
         )
+        organization_group.add_argument(
+            "--incremental-organize",
+            action="store_true",
+            help="Organize documents into folders while processing continues (implies --organize)",
+        )
 
     def _add_feature_arguments(self, parser: argparse.ArgumentParser) -> None:
         """Add feature management arguments."""
@@ -335,9 +444,27 @@ Examples:
             provider=parsed.provider,
             model=parsed.model,
             api_key=parsed.api_key,
+            hedge_requests=parsed.hedge or parsed.hedge_provider is not None,
+            hedge_provider=parsed.hedge_provider,
+            hedge_model=parsed.hedge_model,
+            cascade=parsed.cascade or parsed.cascade_model is not None,
+            cascade_model=parsed.cascade_model,
+            fast_path=(
+                parsed.fast_path
+                or parsed.fast_path_threshold is not None
+                or parsed.fast_path_audit_rate is not None
+            ),
+            fast_path_threshold=parsed.fast_path_threshold,
+            fast_path_audit_rate=parsed.fast_path_audit_rate,
             # Processing options
             ocr_language=parsed.ocr_lang,
             reset_progress=parsed.reset_progress,
+            profile=parsed.profile,
+            # Concurrency overrides
+            ocr_workers=parsed.ocr_workers,
+            extraction_workers=parsed.extraction_workers,
+            ai_in_flight=parsed.ai_in_flight,
+            embedding_batch_size=parsed.embedding_batch_size,
             # Local LLM options
             setup_local_llm=parsed.setup_local_llm,
             list_local_models=parsed.list_local_models,
@@ -353,6 +480,7 @@ Examples:
             organize=parsed.organize,
             no_organize=parsed.no_organize,
             ml_level=parsed.ml_level,
+            incremental_organize=parsed.incremental_organize,
             # Feature management
             show_feature_flags=parsed.show_feature_flags,
             enable_organization_features=parsed.enable_organization_features,
@@ -414,6 +542,8 @@ Examples:
         # Conflicting organization arguments
         if args.organize and args.no_organize:
             errors.append("Cannot specify both --organize and --no-organize")
+        if args.incremental_organize and args.no_organize:
+            errors.append("Cannot specify both --incremental-organize and --no-organize")
 
         # Conflicting display modes
         if args.quiet_mode and args.verbose_mode:
@@ -428,6 +558,24 @@ Examples:
         if args.enable_organization_features and args.disable_organization_features:
             errors.append("Cannot both enable and disable organization features")
 
+        # Worker limits
+        if args.ocr_workers is not None and args.ocr_workers < 0:
+            errors.append("--ocr-workers must be 0 or greater")
+        for flag, value in (
+            ("--extraction-workers", args.extraction_workers),
+            ("--ai-in-flight", args.ai_in_flight),
+            ("--embedding-batch-size", args.embedding_batch_size),
+        ):
+            if value is not None and value < 1:
+                errors.append(f"{flag} must be 1 or greater")
+
+        if args.hedge_model and not args.hedge_requests:
+            errors.append("--hedge-model requires --hedge or --hedge-provider")
+        if args.fast_path_threshold is not None and not 0 < args.fast_path_threshold <= 1:
+            errors.append("--fast-path-threshold must be greater than 0 and at most 1")
+        if args.fast_path_audit_rate is not None and not 0 <= args.fast_path_audit_rate <= 1:
+            errors.append("--fast-path-audit-rate must be between 0 and 1")
+
         # Dependency configuration validation
         if args.configure_dependency:
             if len(args.configure_dependency) != 2:
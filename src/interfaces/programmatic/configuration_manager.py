@@ -28,14 +28,29 @@ class ProcessingConfiguration:
     provider: str = "openai"
     model: Optional[str] = None
     api_key: Optional[str] = None
+    hedge_requests: bool = False  # Duplicate AI requests slower than the observed p95
+    hedge_provider: Optional[str] = None  # None hedges to the same provider
+    hedge_model: Optional[str] = None
+    cascade: bool = False  # Cheap model first, escalating to provider/model when needed
+    cascade_model: Optional[str] = None  # First tier, "provider:model" or a model of provider
+    fast_path: bool = False  # Name recurring templated documents without the AI
+    fast_path_threshold: Optional[float] = None  # None uses the default of 0.8
+    fast_path_audit_rate: Optional[float] = None  # None uses the default of 0.05
 
     # Processing options
     ocr_language: str = "eng"
     reset_progress: bool = False
+    # Concurrency limits; None sizes them from the hardware (see shared.infrastructure.worker_sizing)
+    ocr_workers: Optional[int] = None  # Background threads for OCR-heavy documents (0 = inline)
+    extraction_workers: Optional[int] = None  # Threads extracting text documents ahead
+    ai_in_flight: Optional[int] = None  # Concurrent AI requests
+    embedding_batch_size: Optional[int] = None
+    profile_path: Optional[str] = None  # Write a stage trace and timing summary here
 
     # Organization options
     organization_enabled: bool = False
     ml_level: int = 2
+    incremental_organization: bool = False  # Organize while processing instead of afterwards
 
     # Display options
     quiet_mode: bool = False
@@ -273,12 +288,28 @@ class ConfigurationManager:
             config.model = args.model
         if args.api_key:
             config.api_key = args.api_key
+        if args.hedge_requests:
+            config.hedge_requests = True
+            config.hedge_provider = args.hedge_provider
+            config.hedge_model = args.hedge_model
+        if args.cascade:
+            config.cascade = True
+            config.cascade_model = args.cascade_model
+        if args.fast_path:
+            config.fast_path = True
+            config.fast_path_threshold = args.fast_path_threshold
+            config.fast_path_audit_rate = args.fast_path_audit_rate
 
         # Processing options
         if args.ocr_language != "eng":  # Only if not default
             config.ocr_language = args.ocr_language
         if args.reset_progress:
             config.reset_progress = args.reset_progress
+        if args.profile:
+            config.profile_path = args.profile
+        for limit in ("ocr_workers", "extraction_workers", "ai_in_flight", "embedding_batch_size"):
+            if getattr(args, limit) is not None:
+                setattr(config, limit, getattr(args, limit))
 
         # Organization options
         if args.organize:
@@ -287,6 +318,9 @@ class ConfigurationManager:
             config.organization_enabled = False
         if args.ml_level != 2:  # Only if not default
             config.ml_level = args.ml_level
+        if args.incremental_organize:
+            config.organization_enabled = True
+            config.incremental_organization = True
 
         # Display options
         if args.quiet_mode:
@@ -5,7 +5,6 @@ Provides clean Python API for programmatic use cases.
 Enables Content Tamer AI to be used as a library in other applications.
 """
 
-import asyncio
 import logging
 
 # dataclass imported but not used - keeping for future data structures
@@ -237,6 +236,8 @@ class ContentTamerAPI(ProgrammaticInterface):
         Returns:
             ProcessingResult with processing outcome
         """
+        import asyncio  # Only async callers pay for it; the event loop has loaded it already
+
         # Run synchronous processing in executor
         loop = asyncio.get_event_loop()
 
@@ -66,8 +66,7 @@ def main():
                 if args.setup_local_llm:
                     # Interactive setup for local LLM
                     dep_manager = DependencyManager()
-                    model_manager = ModelManager()
-                    
+
                     # Check and setup Ollama
                     if main_console:
                         main_console.print("\n[bold cyan]Setting up Local LLM...[/bold cyan]")
@@ -86,6 +85,7 @@ def main():
                         main_console.print("\nAvailable models for your system:")
                     
                     # List available models
+                    model_manager = ModelManager()
                     models = model_manager.list_available_models()
                     for model in models:
                         if main_console:
@@ -137,9 +137,14 @@ def main():
             
             # Check if this is a list/info command that doesn't need processing
             if hasattr(args, 'list_models') and args.list_models:
-                from domains.ai_integration.provider_registry import ProviderRegistry
-                registry = ProviderRegistry()
-                registry.list_all_models()
+                # Static model tables only; no provider SDK is imported
+                from domains.ai_integration.provider_service import ProviderConfiguration
+
+                for provider, models in ProviderConfiguration.AI_PROVIDERS.items():
+                    default = ProviderConfiguration.DEFAULT_MODELS.get(provider)
+                    print(f"{provider}:")
+                    for model in models:
+                        print(f"  {model}{' (default)' if model == default else ''}")
                 return True
             
             # Check for dependency management commands
@@ -166,8 +171,22 @@ def main():
                 provider=args.provider,
                 model=args.model,
                 api_key=args.api_key,
-                organization_enabled=args.organize,
+                hedge_requests=args.hedge_requests,
+                hedge_provider=args.hedge_provider,
+                hedge_model=args.hedge_model,
+                cascade=args.cascade,
+                cascade_model=args.cascade_model,
+                fast_path=args.fast_path,
+                fast_path_threshold=args.fast_path_threshold,
+                fast_path_audit_rate=args.fast_path_audit_rate,
+                organization_enabled=args.organize or args.incremental_organize,
+                incremental_organization=args.incremental_organize,
                 quiet_mode=args.quiet_mode,
+                profile_path=args.profile,
+                ocr_workers=args.ocr_workers,
+                extraction_workers=args.extraction_workers,
+                ai_in_flight=args.ai_in_flight,
+                embedding_batch_size=args.embedding_batch_size,
             )
 
             # Execute through kernel
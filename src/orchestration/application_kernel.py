@@ -5,17 +5,19 @@ Main application coordination component that orchestrates all domain services
 to implement complete user workflows following the persona-driven architecture.
 """
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from ..interfaces.base_interfaces import ProcessingResult
     from ..interfaces.programmatic.configuration_manager import ProcessingConfiguration
 
 import datetime
+import json
 import logging
 import os
-import shutil
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 
 # Import display manager for Rich UI progress tracking
@@ -25,9 +27,51 @@ except ImportError:
     # Try with src prefix if running from outside src/
     from ..shared.display.unified_display_manager import UnifiedDisplayManager
 
+try:
+    from shared.file_operations.file_transfer import get_transfer_service
+    from shared.file_operations.name_index import get_name_index
+    from shared.infrastructure.content_handoff import (
+        close_content_handoff_store,
+        entities_from_metadata,
+        open_content_handoff_store,
+        record_content_handoff,
+    )
+    from shared.infrastructure.document_buffer import DocumentRecord, ProcessedDocumentBuffer
+    from shared.infrastructure.import_utilities import module_available
+    from shared.infrastructure.tracing import span, start_tracing, stop_tracing
+    from shared.infrastructure.worker_sizing import (
+        ADJUST_INTERVAL_S,
+        LIMIT_NAMES,
+        ConcurrencyLimit,
+        WorkerSizingPolicy,
+        Workload,
+        set_worker_sizing,
+    )
+except ImportError:
+    from ..shared.file_operations.file_transfer import get_transfer_service
+    from ..shared.file_operations.name_index import get_name_index
+    from ..shared.infrastructure.content_handoff import (
+        close_content_handoff_store,
+        entities_from_metadata,
+        open_content_handoff_store,
+        record_content_handoff,
+    )
+    from ..shared.infrastructure.document_buffer import DocumentRecord, ProcessedDocumentBuffer
+    from ..shared.infrastructure.import_utilities import module_available
+    from ..shared.infrastructure.tracing import span, start_tracing, stop_tracing
+    from ..shared.infrastructure.worker_sizing import (
+        ADJUST_INTERVAL_S,
+        LIMIT_NAMES,
+        ConcurrencyLimit,
+        WorkerSizingPolicy,
+        Workload,
+        set_worker_sizing,
+    )
+
 # Import domain services
 try:
     from domains.ai_integration.ai_integration_service import AIIntegrationService
+    from domains.ai_integration.request_service import RequestResult, RequestStatus
     from domains.content.content_service import ContentService
     from domains.organization.organization_service import OrganizationService
 except ImportError:
@@ -35,6 +79,8 @@ except ImportError:
     ContentService = None
     AIIntegrationService = None
     OrganizationService = None
+    RequestResult = None
+    RequestStatus = None
 
 # Runtime imports with fallbacks
 if not TYPE_CHECKING:
@@ -94,11 +140,20 @@ class ApplicationKernel:
         # Initialize display manager for Rich UI progress tracking
         self.display_manager = UnifiedDisplayManager()
 
+        # Zero-copy move backend shared with the file managers; fsyncs are batched at
+        # pipeline commit points
+        self.file_transfer = get_transfer_service()
+
         # Domain services will be created lazily
         self._content_service = None
         self._ai_service = None
         self._organization_service = None
 
+        # Worker limits of the current run, planned when extraction is scheduled
+        self.worker_policy: Optional[WorkerSizingPolicy] = None
+        self._worker_gates: Dict[str, ConcurrencyLimit] = {}
+        self._workers_adjusted_at = 0.0
+
     @property
     def content_service(self):
         """Get or create content service."""
@@ -166,8 +221,17 @@ class ApplicationKernel:
                     metadata={"no_documents": True},
                 )
 
-            # Execute processing pipeline
-            results = self._execute_processing_pipeline(documents, config)
+            # Execute processing pipeline (traced when profiling is requested)
+            profile_path = getattr(config, "profile_path", None)
+            if profile_path:
+                start_tracing()
+            try:
+                with span("pipeline.run", documents=len(documents)):
+                    results = self._execute_processing_pipeline(documents, config)
+            finally:
+                profile = self._write_profile(profile_path) if profile_path else None
+            if profile:
+                results.metadata["profile"] = profile
 
             # Calculate processing time
             processing_time = time.time() - start_time
@@ -247,7 +311,12 @@ class ApplicationKernel:
         files_failed = 0
         errors = []
         warnings = []
-        processed_documents = []
+        # Bounded buffer: records beyond the in-memory limit are spilled to disk
+        processed_documents = ProcessedDocumentBuffer()
+        ocr_prefetcher = None
+        ai_pool = None
+        text_prefetcher = None
+        template_naming = None
 
         try:
             # Single progress bar for all processing phases
@@ -256,13 +325,119 @@ class ApplicationKernel:
                 "Processing documents"
             )
             
+            # OCR-heavy documents are extracted ahead of time on their own workers
+            documents, text_lane, ocr_prefetcher, prefetched = self._schedule_extraction_lanes(
+                documents, config
+            )
+            # Text documents are extracted a few files ahead of filename generation
+            text_prefetcher = self._start_text_prefetch(text_lane, prefetched)
+
             total_files = len(documents)
             current_file = 0
+
+            # Phase-1 results are handed to organization and learning via the content store
+            incremental_session = None
+            if config.organization_enabled:
+                open_content_handoff_store(config.output_dir)
+                if getattr(config, "incremental_organization", False):
+                    org_service = self.get_organization_service(config.output_dir)
+                    if org_service:
+                        incremental_session = org_service.create_incremental_session()
             
+            # Up to ai_in_flight filenames are requested concurrently; the provider's
+            # adaptive limit in the request service decides how many are on the wire
+            ai_window = self.worker_policy.limits.ai_in_flight if self.worker_policy else 1
+            pending_ai: Deque[
+                Tuple[int, str, Dict[str, Any], Future, List[str], Optional[Any]]
+            ] = deque()
+            if self.ai_service:
+                ai_pool = ThreadPoolExecutor(max_workers=ai_window, thread_name_prefix="ai")
+                template_naming = self._create_template_naming(config)
+
+            def finish_ai(position, doc_path, content_result, future, retry_notes, naming):
+                """Move and queue a document once its filename is generated."""
+                nonlocal files_processed, files_failed
+                base_name = os.path.basename(doc_path)
+                with span("pipeline.ai_wait"):
+                    future.exception()
+                for note in retry_notes:
+                    self.display_manager.warning(note)
+
+                try:
+                    filename_result = future.result()
+                    if naming is not None and not naming.use_template:
+                        if filename_result.status.value == "success":
+                            # AI names (including audits) teach and check the templates
+                            template_naming.observe(naming, filename_result.content)
+                        elif naming.audit:
+                            # A failed audit request falls back to the template name
+                            filename_result = self._template_result(naming)
+                    if filename_result.status.value != "success":
+                        errors.append(
+                            f"AI filename generation failed for {doc_path}: {filename_result.error}"
+                        )
+                        files_failed += 1
+                        return
+
+                    # Phase 3: Move/organize file
+                    self.display_manager.update_progress(
+                        progress_id,
+                        position,
+                        total_files,
+                        f"[3/3] Organizing: {base_name}"
+                    )
+
+                    ai_content = content_result["ai_ready_content"]
+                    with span("pipeline.move"):
+                        # Reserve a collision-free name in the output directory
+                        new_path = get_name_index(config.output_dir).reserve_path(
+                            os.path.join(config.output_dir, filename_result.content)
+                        )
+                        new_filename = os.path.basename(new_path)
+
+                        # Ensure output directory exists
+                        os.makedirs(config.output_dir, exist_ok=True)
+
+                        # Move file
+                        self.file_transfer.move(doc_path, new_path)
+                        record_content_handoff(
+                            new_path, ai_content, content_result.get("metadata")
+                        )
+
+                    # Prepare for organization
+                    if config.organization_enabled:
+                        metadata = content_result.get("metadata", {})
+                        self._queue_for_organization(
+                            DocumentRecord(
+                                original_path=doc_path,
+                                current_path=new_path,
+                                filename=new_filename,
+                                content=ai_content,
+                                metadata=metadata,
+                                features=entities_from_metadata(metadata),
+                            ),
+                            processed_documents,
+                            incremental_session,
+                            warnings,
+                        )
+
+                    files_processed += 1
+                except Exception as e:
+                    self.display_manager.error(
+                        f"Processing failed for {base_name}: {e}"
+                    )
+                    errors.append(f"Processing error for {doc_path}: {e}")
+                    files_failed += 1
+
             # Process each file through the complete pipeline
             for doc_path in documents:
                 current_file += 1
                 base_name = os.path.basename(doc_path)
+                if text_prefetcher is not None:
+                    text_prefetcher.advance(current_file - 1)
+                if ocr_prefetcher is not None:
+                    ocr_prefetcher.advance(current_file - 1)
+                self._adjust_workers()
                 
                 try:
                     # Phase 1: Extract content for this file
@@ -273,12 +448,19 @@ class ApplicationKernel:
                         f"[1/3] Extracting: {base_name}"
                     )
                     
-                    if self.content_service:
-                        # Process single document
-                        content_result = self.content_service.process_document_complete(doc_path)
-                    else:
-                        # Legacy fallback
-                        content_result = self._legacy_single_content_processing(doc_path, config)
+                    with span("pipeline.extract", prefetched=doc_path in prefetched):
+                        if doc_path in prefetched:
+                            content_result = prefetched.pop(doc_path).result()
+                        elif self.content_service:
+                            # Process single document
+                            content_result = self.content_service.process_document_complete(
+                                doc_path
+                            )
+                        else:
+                            # Legacy fallback
+                            content_result = self._legacy_single_content_processing(
+                                doc_path, config
+                            )
                     
                     if not content_result.get("ready_for_ai", False):
                         errors.append(f"Content not ready for AI: {doc_path}")
@@ -295,69 +477,34 @@ class ApplicationKernel:
                     
                     ai_content = content_result["ai_ready_content"]
 
-                    # Generate filename using AI with retry logic
                     if self.ai_service:
-                        max_retries = 3
-                        for attempt in range(max_retries):
-                            try:
-                                filename_result = self.ai_service.generate_filename_with_ai(
-                                    content=ai_content,
-                                    original_filename=base_name,
-                                    provider=config.provider,
-                                    model=config.model,
-                                    api_key=config.api_key,
+                        # Filenames are generated on the AI workers and applied in input order
+                        retry_notes: List[str] = []
+                        naming = None
+                        if template_naming is not None:
+                            with span("pipeline.template_naming"):
+                                naming = template_naming.propose(
+                                    ai_content, base_name, content_result.get("metadata")
                                 )
-                                
-                                if filename_result.status.value == "success":
-                                    # Phase 3: Move/organize file
-                                    self.display_manager.update_progress(
-                                        progress_id,
-                                        current_file,
-                                        total_files,
-                                        f"[3/3] Organizing: {base_name}"
-                                    )
-                                    
-                                    new_filename = filename_result.content
-                                    new_path = os.path.join(config.output_dir, new_filename)
-                                    
-                                    # Ensure output directory exists
-                                    os.makedirs(config.output_dir, exist_ok=True)
-                                    
-                                    # Move file
-                                    shutil.move(doc_path, new_path)
-                                    
-                                    # Prepare for organization
-                                    processed_documents.append(
-                                        {
-                                            "original_path": doc_path,
-                                            "current_path": new_path,
-                                            "filename": new_filename,
-                                            "content": ai_content,
-                                            "metadata": content_result.get("metadata", {}),
-                                        }
-                                    )
-                                    
-                                    files_processed += 1
-                                    break  # Success, exit retry loop
-                                else:
-                                    if attempt < max_retries - 1:
-                                        self.display_manager.warning(
-                                            f"Retry {attempt + 1}/{max_retries} for {base_name}"
-                                        )
-                                        continue
-                                    else:
-                                        errors.append(
-                                            f"AI filename generation failed for {doc_path}: {filename_result.error}"
-                                        )
-                                        files_failed += 1
-                            except Exception as retry_error:
-                                if attempt < max_retries - 1:
-                                    self.display_manager.warning(
-                                        f"Retry {attempt + 1}/{max_retries} for {base_name}: {retry_error}"
-                                    )
-                                    continue
-                                else:
-                                    raise
+                        if naming is not None and naming.use_template:
+                            # Recurring templated document: named without an AI request
+                            future = Future()
+                            future.set_result(self._template_result(naming))
+                        else:
+                            extraction = content_result.get("extraction")
+                            future = ai_pool.submit(
+                                self._generate_document_filename,
+                                ai_content,
+                                base_name,
+                                config,
+                                retry_notes,
+                                getattr(getattr(extraction, "quality", None), "value", None),
+                            )
+                        pending_ai.append(
+                            (current_file, doc_path, content_result, future, retry_notes, naming)
+                        )
+                        while len(pending_ai) > ai_window:
+                            finish_ai(*pending_ai.popleft())
                     else:
                         # Fallback filename generation
                         self.display_manager.update_progress(
@@ -366,9 +513,16 @@ class ApplicationKernel:
                             total_files,
                             f"[3/3] Organizing: {base_name}"
                         )
-                        processed_documents.append(
-                            self._legacy_filename_generation(doc_path, content_result, config)
+                        legacy_document = self._legacy_filename_generation(
+                            doc_path, content_result, config
                         )
+                        if config.organization_enabled:
+                            self._queue_for_organization(
+                                DocumentRecord.from_dict(legacy_document),
+                                processed_documents,
+                                incremental_session,
+                                warnings,
+                            )
                         files_processed += 1
                         
                 except Exception as e:
@@ -378,6 +532,15 @@ class ApplicationKernel:
                     errors.append(f"Processing error for {doc_path}: {e}")
                     files_failed += 1
             
+            while pending_ai:
+                finish_ai(*pending_ai.popleft())
+            if template_naming is not None:
+                template_naming.save()
+
+            # Batch commit point: flush all renamed files to disk once
+            with span("pipeline.commit"):
+                self.file_transfer.commit()
+
             self.display_manager.finish_progress(progress_id)
             self.display_manager.success(
                 f"Document processing completed - processed: {files_processed}, failed: {files_failed}"
@@ -385,7 +548,20 @@ class ApplicationKernel:
 
             # Phase 3: Organization (if enabled)
             organization_results = {}
-            if config.organization_enabled and processed_documents:
+            if incremental_session is not None:
+                # Documents were organized during processing; reconcile reassignments
+                self.display_manager.info("Finalizing incremental organization...")
+                with span("organize.finalize_incremental"):
+                    organization_results = incremental_session.finalize()
+                if organization_results.get("success"):
+                    self.display_manager.success(
+                        f"Successfully organized {organization_results.get('files_organized', 0)} files into folders"
+                    )
+                else:
+                    org_error = organization_results.get("error", "Unknown organization error")
+                    self.display_manager.warning(f"Organization failed: {org_error}")
+                    warnings.append(f"Organization failed: {org_error}")
+            elif config.organization_enabled and processed_documents:
                 self.display_manager.info("Starting document organization...")
                 org_progress = self.display_manager.start_progress(
                     "Phase 3: Organizing documents into folders"
@@ -398,9 +574,10 @@ class ApplicationKernel:
                         org_progress, 1, 2, "Analyzing document content for clustering"
                     )
 
-                    organization_results = org_service.organize_processed_documents(
-                        processed_documents
-                    )
+                    with span("organize.batch", documents=len(processed_documents)):
+                        organization_results = org_service.organize_processed_documents(
+                            processed_documents.iter_dicts()
+                        )
 
                     # Complete progress
                     self.display_manager.update_progress(
@@ -466,6 +643,14 @@ class ApplicationKernel:
                     "ai_service_available": self.ai_service is not None,
                     "provider": config.provider,
                     "model": config.model,
+                    "file_transfers": self.file_transfer.get_transfer_statistics(),
+                    "worker_limits": (
+                        self.worker_policy.get_statistics() if self.worker_policy else None
+                    ),
+                    "ai_routing": self._ai_routing_statistics(config),
+                    "naming_fast_path": (
+                        template_naming.get_statistics() if template_naming else None
+                    ),
                 },
             )
 
@@ -480,6 +665,262 @@ class ApplicationKernel:
                 warnings=warnings,
                 metadata={"pipeline_error": str(e)},
             )
+        finally:
+            if ocr_prefetcher is not None:
+                ocr_prefetcher.shutdown()
+            if ai_pool is not None:
+                # Cancelled by hand: shutdown(cancel_futures=True) needs Python 3.9
+                for entry in pending_ai:
+                    entry[3].cancel()
+                ai_pool.shutdown(wait=True)
+            if text_prefetcher is not None:
+                text_prefetcher.shutdown()
+            processed_documents.close()
+            if config.organization_enabled:
+                # Also on failure, so the store is not left open in the output directory
+                close_content_handoff_store(config.output_dir, discard=True)
+
+    def _schedule_extraction_lanes(
+        self, documents: List[str], config: "ProcessingConfiguration"
+    ):
+        """Plan worker limits, split documents into lanes and start OCR extraction early.
+
+        Text documents are processed first in the main loop while OCR-heavy
+        documents (scans, images) are extracted by up to ``ocr_workers``
+        background threads, so cheap documents never wait behind OCR. At most
+        two OCR documents per worker are extracted ahead of the loop, so
+        finished OCR results never pile up in memory on scan-heavy folders.
+
+        Returns:
+            Tuple of (documents in processing order, text-lane documents, OCR lane
+            prefetcher or None, dict mapping prefetched document paths to
+            extraction futures)
+        """
+        policy = self._plan_workers(config)
+        ocr_workers = policy.limits.ocr_workers
+        lane_of = getattr(self.content_service, "extraction_lane", None)
+        if not self.content_service or ocr_workers <= 0 or lane_of is None:
+            return documents, documents, None, {}
+
+        text_lane, ocr_lane = [], []
+        for doc_path in documents:
+            try:
+                lane = lane_of(doc_path)
+            except Exception as e:
+                self.logger.debug(f"Lane triage failed for {doc_path}: {e}")
+                lane = "text"
+            (ocr_lane if lane == "ocr" else text_lane).append(doc_path)
+
+        if not ocr_lane:
+            return documents, documents, None, {}
+
+        prefetched: Dict[str, Future] = {}
+        ocr_prefetcher = _LanePrefetcher(
+            ocr_lane,
+            ThreadPoolExecutor(max_workers=ocr_workers, thread_name_prefix="ocr"),
+            self._worker_gate("ocr_workers"),
+            self.content_service.process_document_complete,
+            lookahead=2 * ocr_workers,
+            prefetched=prefetched,
+            offset=len(text_lane),
+        )
+        # OCR starts right away, while the loop is still on the text lane
+        ocr_prefetcher.advance(0)
+        return text_lane + ocr_lane, text_lane, ocr_prefetcher, prefetched
+
+    def _start_text_prefetch(
+        self, text_lane: List[str], prefetched: Dict[str, Future]
+    ) -> Optional["_LanePrefetcher"]:
+        """Extract text-lane documents on ``extraction_workers`` threads ahead of the loop."""
+        if not self.content_service or self.worker_policy is None:
+            return None
+        if not text_lane:
+            return None
+
+        workers = self.worker_policy.limits.extraction_workers
+        return _LanePrefetcher(
+            text_lane,
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="extract"),
+            self._worker_gate("extraction_workers"),
+            self.content_service.process_document_complete,
+            lookahead=2 * workers,
+            prefetched=prefetched,
+        )
+
+    def _generate_document_filename(
+        self,
+        ai_content: str,
+        base_name: str,
+        config: "ProcessingConfiguration",
+        retry_notes: List[str],
+        extraction_quality: Optional[str] = None,
+    ):
+        """Generate a document's filename with up to three attempts (runs on the AI workers).
+
+        Retry warnings are appended to ``retry_notes`` for the main thread to display.
+        In cascade mode each attempt starts at the cheap tier; ``extraction_quality``
+        (a ContentQuality value) lets fair and poor extractions skip it.
+
+        Returns:
+            RequestResult of the last attempt
+
+        Raises:
+            Exception: Raised by the last attempt
+        """
+        request = {
+            "content": ai_content,
+            "original_filename": base_name,
+            "provider": config.provider,
+            "model": config.model,
+            "api_key": config.api_key,
+            "hedge": getattr(config, "hedge_requests", False) is True,
+            "hedge_provider": getattr(config, "hedge_provider", None),
+            "hedge_model": getattr(config, "hedge_model", None),
+        }
+        generate = self.ai_service.generate_filename_with_ai
+        if getattr(config, "cascade", False) is True:
+            generate = self.ai_service.generate_filename_with_cascade
+            request["extraction_quality"] = extraction_quality
+            request["first_tier"] = getattr(config, "cascade_model", None)
+
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
+                with span("pipeline.ai_filename", attempt=attempt + 1):
+                    filename_result = generate(**request)
+            except Exception as retry_error:
+                if attempt == max_retries - 1:
+                    raise
+                retry_notes.append(
+                    f"Retry {attempt + 1}/{max_retries} for {base_name}: {retry_error}"
+                )
+                continue
+
+            if filename_result.status.value == "success" or attempt == max_retries - 1:
+                return filename_result
+            retry_notes.append(f"Retry {attempt + 1}/{max_retries} for {base_name}")
+        return filename_result
+
+    def _create_template_naming(self, config: "ProcessingConfiguration") -> Optional[Any]:
+        """Template naming fast path for the output folder, or None when not enabled."""
+        if getattr(config, "fast_path", False) is not True or RequestResult is None:
+            return None
+        try:
+            return self.container.create_template_naming_service(
+                config.output_dir,
+                getattr(config, "fast_path_threshold", None),
+                getattr(config, "fast_path_audit_rate", None),
+            )
+        except Exception as e:
+            self.logger.warning(f"Template naming unavailable, using the AI for all files: {e}")
+            return None
+
+    @staticmethod
+    def _template_result(naming) -> "RequestResult":
+        """Successful request result carrying a fast-path template name."""
+        return RequestResult(
+            status=RequestStatus.SUCCESS,
+            content=naming.filename,
+            metadata={"naming": "template", "template_confidence": naming.confidence},
+        )
+
+    def _ai_routing_statistics(self, config: "ProcessingConfiguration") -> Optional[Dict[str, Any]]:
+        """Cascade routing statistics of the AI service, or None outside cascade mode."""
+        if getattr(config, "cascade", False) is not True or not self.ai_service:
+            return None
+        try:
+            return self.ai_service.cascade_router.get_statistics()
+        except Exception as e:
+            self.logger.debug(f"Cascade statistics unavailable: {e}")
+            return None
+
+    def _plan_workers(self, config: "ProcessingConfiguration") -> WorkerSizingPolicy:
+        """Size this run's workers from the hardware, the models it loads and config overrides."""
+        overrides = {}
+        for name in LIMIT_NAMES:
+            value = getattr(config, name, None)
+            if isinstance(value, int) and not isinstance(value, bool):
+                overrides[name] = value
+
+        organize = getattr(config, "organization_enabled", False) is True
+        local_model = None
+        if getattr(config, "provider", None) == "local":
+            # Models missing from the catalog are sized with a default footprint
+            local_model = getattr(config, "model", None) or "default"
+        workload = Workload(
+            local_model=local_model,
+            spacy=organize,
+            embeddings=organize
+            and getattr(config, "ml_level", 2) >= 2
+            and module_available("sentence_transformers"),
+        )
+
+        self.worker_policy = WorkerSizingPolicy(overrides=overrides, workload=workload)
+        self._worker_gates = {}
+        self._workers_adjusted_at = time.monotonic()
+        set_worker_sizing(self.worker_policy)
+        return self.worker_policy
+
+    def _worker_gate(self, limit_name: str) -> ConcurrencyLimit:
+        """Concurrency gate for a pool, following the policy's current limit."""
+        gate = ConcurrencyLimit(getattr(self.worker_policy.limits, limit_name))
+        self._worker_gates[limit_name] = gate
+        return gate
+
+    def _adjust_workers(self) -> None:
+        """Re-apply the policy's limits to the pools from observed RSS and CPU use."""
+        now = time.monotonic()
+        if self.worker_policy is None or now - self._workers_adjusted_at < ADJUST_INTERVAL_S:
+            return
+        self._workers_adjusted_at = now
+        limits = self.worker_policy.adjust()
+        for limit_name, gate in self._worker_gates.items():
+            gate.set_limit(getattr(limits, limit_name))
+
+    def _write_profile(self, profile_path: str) -> Optional[Dict[str, Any]]:
+        """Stop tracing and write the Chrome trace plus a per-stage summary next to it.
+
+        Returns:
+            Profile metadata (file paths and stage statistics), or None if tracing was off
+        """
+        tracer = stop_tracing()
+        if tracer is None:
+            return None
+
+        stages = tracer.summary()
+        summary_path = os.path.splitext(profile_path)[0] + ".summary.json"
+        try:
+            tracer.export_chrome_trace(profile_path)
+            with open(summary_path, "w", encoding="utf-8") as f:
+                json.dump({"stages": stages}, f, indent=2)
+        except OSError as e:
+            self.display_manager.warning(f"Could not write profile: {e}")
+            return {"stages": stages}
+
+        self.display_manager.info(f"Profile trace written to {profile_path}")
+        for line in tracer.format_summary():
+            self.display_manager.info(line)
+        return {"trace_file": profile_path, "summary_file": summary_path, "stages": stages}
+
+    def _queue_for_organization(
+        self,
+        record: DocumentRecord,
+        processed_documents: ProcessedDocumentBuffer,
+        incremental_session,
+        warnings: List[str],
+    ) -> None:
+        """Hand a processed document to incremental organization, or buffer it for the batch pass."""
+        if incremental_session is None:
+            processed_documents.append(record)
+            return
+
+        try:
+            with span("organize.incremental_add"):
+                incremental_session.add_document(record.to_dict())
+        except Exception as e:
+            # Organization problems never fail document processing
+            self.display_manager.warning(f"Incremental organization failed for {record.filename}: {e}")
+            warnings.append(f"Incremental organization failed for {record.filename}: {e}")
 
     def _legacy_content_processing(
         self,
@@ -492,11 +933,11 @@ class ApplicationKernel:
             "Using legacy content processing - domain service not available"
         )
 
-        # Import domain content extraction service with fallback
+        # Shared domain extraction service, with fallback
         try:
-            from ..domains.content.extraction_service import ExtractionService
-
-            extraction_service = ExtractionService()
+            extraction_service = self.container.get_extraction_service()
+            if extraction_service is None:
+                raise ImportError("Content extraction service not available")
             results = {}
 
             # Use the new domain service with progress tracking
@@ -540,9 +981,9 @@ class ApplicationKernel:
     ) -> Dict[str, Any]:
         """Process a single document with legacy extraction service."""
         try:
-            from ..domains.content.extraction_service import ExtractionService
-            
-            extraction_service = ExtractionService()
+            extraction_service = self.container.get_extraction_service()
+            if extraction_service is None:
+                raise ImportError("Content extraction service not available")
             extracted = extraction_service.extract_from_file(doc_path)
             
             if extracted and extracted.quality.value != "failed":
@@ -572,15 +1013,17 @@ class ApplicationKernel:
 
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         base_name = os.path.splitext(os.path.basename(file_path))[0]
-        new_filename = f"{base_name}_{timestamp}.pdf"
-
-        new_path = os.path.join(config.output_dir, new_filename)
+        new_path = get_name_index(config.output_dir).reserve_path(
+            os.path.join(config.output_dir, f"{base_name}_{timestamp}.pdf")
+        )
+        new_filename = os.path.basename(new_path)
 
         # Move file
-        import shutil
-
         os.makedirs(config.output_dir, exist_ok=True)
-        shutil.move(file_path, new_path)
+        self.file_transfer.move(file_path, new_path)
+        record_content_handoff(
+            new_path, content_result.get("ai_ready_content", ""), content_result.get("metadata")
+        )
 
         return {
             "original_path": file_path,
@@ -688,3 +1131,63 @@ class ApplicationKernel:
             health["healthy"] = False
 
         return health
+
+
+def _run_limited(gate: ConcurrencyLimit, func, *args):
+    """Run ``func`` while holding a slot of ``gate``."""
+    with gate:
+        return func(*args)
+
+
+class _LanePrefetcher:
+    """Submits a lane's documents for extraction a bounded number of files ahead."""
+
+    def __init__(
+        self,
+        documents: List[str],
+        pool: ThreadPoolExecutor,
+        gate: ConcurrencyLimit,
+        extract,
+        lookahead: int,
+        prefetched: Dict[str, Future],
+        offset: int = 0,
+    ):
+        """Initialize prefetcher.
+
+        Args:
+            documents: The lane's documents in processing order
+            pool: Executor running the extractions
+            gate: Concurrency gate shared with the lane's worker limit
+            extract: Extraction function called with a document path
+            lookahead: Documents extracted ahead of the loop's position in the lane
+            prefetched: Map the extraction futures are stored in
+            offset: Processing position of the lane's first document; until the
+                loop gets there, the lane's first ``lookahead`` documents are extracted
+        """
+        self.documents = documents
+        self.pool = pool
+        self.gate = gate
+        self.extract = extract
+        self.lookahead = max(1, lookahead)
+        self.prefetched = prefetched
+        self.offset = offset
+        self._next = 0
+
+    def advance(self, position: int) -> None:
+        """Submit documents up to ``lookahead`` files past ``position`` into ``prefetched``."""
+        end = min(len(self.documents), max(0, position - self.offset) + self.lookahead)
+        while self._next < end:
+            doc_path = self.documents[self._next]
+            self.prefetched[doc_path] = self.pool.submit(
+                _run_limited, self.gate, self.extract, doc_path
+            )
+            self._next += 1
+
+    def shutdown(self) -> None:
+        """Stop the workers, dropping documents that were not started."""
+        # Cancelled by hand: shutdown(cancel_futures=True) needs Python 3.9
+        for doc_path in self.documents[: self._next]:
+            future = self.prefetched.get(doc_path)
+            if future is not None:
+                future.cancel()
+        self.pool.shutdown(wait=True)
@@ -8,6 +8,10 @@ import os
 from typing import Any, Dict, List, Optional, Tuple
 
 from core.application_container import ApplicationContainer
+from shared.infrastructure.content_handoff import (
+    close_content_handoff_store,
+    open_content_handoff_store,
+)
 from shared.infrastructure.directory_manager import (
     DEFAULT_PROCESSED_DIR,
     DEFAULT_PROCESSING_DIR,
@@ -521,6 +525,10 @@ def organize_content(
         else set()
     )
 
+    # Keep phase-1 extraction results for post-processing organization
+    if enable_post_processing:
+        open_content_handoff_store(renamed_dir)
+
     # Initialize retry handler and process files
     session_retry_handler = create_retry_handler(max_attempts=3)
     success, successful_count, failed_count, error_details = _process_files_batch(
@@ -538,6 +546,7 @@ def organize_content(
     )
 
     if not success:
+        close_content_handoff_store(renamed_dir, discard=True)
         return False
 
     # Display completion summary
@@ -615,4 +624,5 @@ def organize_content(
             )
             # Don't fail the entire workflow due to post-processing issues
 
+    close_content_handoff_store(renamed_dir, discard=True)
     return True
@@ -10,6 +10,7 @@ import os
 import time
 from typing import Any, Optional, Tuple
 
+from shared.infrastructure.content_handoff import record_content_handoff
 from shared.infrastructure.error_handling import RetryHandler, create_retry_handler
 
 # Constants
@@ -23,33 +24,34 @@ DEFAULT_PROCESSING_DIR = os.path.join(DEFAULT_DATA_DIR, ".processing")
 ERROR_LOG_FILE = os.path.join(DEFAULT_PROCESSING_DIR, "errors.log")
 
 
-def _extract_file_content(input_path: str, ocr_lang: str, display_context: Any) -> Tuple[str, str]:
-    """Extract content from file using appropriate processor."""
-    display_context.set_status("extracting_content")
+def _get_extraction_service(ocr_lang: str = "eng") -> Optional[Any]:
+    """Shared extraction service from the application container (built once per language).
 
-    # Use domain extraction service with fallback
+    Returns None when the container is not importable, so callers apply their fallbacks.
+    """
     try:
-        # Import path adjustments for workflow_processor location
-        import os
-        import sys
+        from core.application_container import get_global_container
+    except ImportError:
+        return None
 
-        sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+    return get_global_container().get_extraction_service(ocr_lang)
 
-        from domains.content.extraction_service import ExtractionService
 
-        extraction_service = ExtractionService(ocr_lang)
-        result = extraction_service.extract_from_file(input_path)
+def _extract_file_content(input_path: str, ocr_lang: str, display_context: Any) -> Tuple[str, str]:
+    """Extract content from file using appropriate processor."""
+    display_context.set_status("extracting_content")
 
-        if result.quality.value == "failed":
-            raise ValueError(
-                f"Content extraction failed: {result.error_message or 'Unknown error'}"
-            )
+    extraction_service = _get_extraction_service(ocr_lang)
+    if extraction_service is None:
+        raise ValueError(f"Content extraction service not available for: {input_path}")
 
-        text = result.text
-        img_b64 = result.image_data or ""
+    result = extraction_service.extract_from_file(input_path)
 
-    except ImportError:
-        raise ValueError(f"Content extraction service not available for: {input_path}")
+    if result.quality.value == "failed":
+        raise ValueError(f"Content extraction failed: {result.error_message or 'Unknown error'}")
+
+    text = result.text
+    img_b64 = result.image_data or ""
 
     # If the extractor returned an error message, treat it as an unprocessable file.
     if text.startswith("Error"):
@@ -237,6 +239,15 @@ def process_file_enhanced_core(
         except Exception as e:
             raise
 
+        # Hand extracted text to post-processing organization (no-op unless enabled),
+        # keyed on the path the file was actually moved to
+        moved_path = getattr(organizer, "last_moved_path", None)
+        if not isinstance(moved_path, str):
+            moved_path = os.path.join(
+                renamed_folder, final_file_name + os.path.splitext(input_path)[1]
+            )
+        record_content_handoff(moved_path, text, {"original_filename": filename})
+
         result = final_file_name
 
     except (ValueError, FileNotFoundError) as e:
@@ -628,23 +639,12 @@ def pdfs_to_text_string(
     """
     Legacy function for extracting text, kept for compatibility.
     """
-    try:
-        # Use domain extraction service instead of direct PDF processor
-        import os
-        import sys
-
-        sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-
-        from domains.content.extraction_service import ExtractionService
-
-        extraction_service = ExtractionService()
-        result = extraction_service.extract_from_file(filepath)
-
-        if result.quality.value != "failed" and result.text:
-            return result.text
-        else:
-            return ""
-
-    except ImportError:
+    extraction_service = _get_extraction_service()
+    if extraction_service is None:
         # Fallback when domain service not available
         return ""
+
+    result = extraction_service.extract_from_file(filepath)
+    if result.quality.value != "failed" and result.text:
+        return result.text
+    return ""
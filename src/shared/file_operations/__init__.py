@@ -10,10 +10,29 @@ Provides:
 - Atomic file operations with proper locking
 - Cross-platform path validation and security
 - Content sanitization and validation
+- Zero-copy file transfers with batched fsync
+- In-memory output name index for collision-free naming
 """
 
 from .content_sanitizer import ContentSanitizer
+from .file_transfer import (
+    FileTransferService,
+    TransferMethod,
+    TransferResult,
+    get_transfer_service,
+)
+from .name_index import OutputNameIndex, get_name_index
 from .path_validator import PathValidator
 from .safe_file_manager import SafeFileManager
 
-__all__ = ["SafeFileManager", "PathValidator", "ContentSanitizer"]
+__all__ = [
+    "SafeFileManager",
+    "PathValidator",
+    "ContentSanitizer",
+    "FileTransferService",
+    "TransferMethod",
+    "TransferResult",
+    "get_transfer_service",
+    "OutputNameIndex",
+    "get_name_index",
+]
@@ -16,7 +16,9 @@ import re
 import shutil
 import time
 import unicodedata
-from typing import TYPE_CHECKING, Any, Dict, List, Set, TextIO, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, TextIO, Union
+
+from .name_index import get_name_index
 
 if TYPE_CHECKING:
     import fcntl
@@ -95,25 +97,41 @@ class FileManager:
                 if fcntl is not None:
                     fcntl.flock(file_obj.fileno(), fcntl.LOCK_UN)  # type: ignore[attr-defined]
 
-    def safe_move(self, src: str, dst: str, attempts: int = 3, delay: float = 0.75) -> None:
-        """Robust file move with retry logic and copy-delete fallback."""
+    def safe_move(self, src: str, dst: str, attempts: int = 3, delay: float = 0.75) -> str:
+        """Robust file move with retry logic and copy-delete fallback.
+
+        Collisions are resolved through the destination folder's name index.
+
+        Returns:
+            Path the file was moved to (``dst`` or ``dst`` with a numeric suffix)
+        """
         if self._unified_manager:
             # Use new unified file manager
             success = self._unified_manager.safe_move(src, dst, attempts, delay)
             if not success:
                 raise OSError(f"Failed to move {src} to {dst}")
+            transfer = self._unified_manager.get_last_transfer()
+            return transfer.target_path if transfer else dst
         else:
             # Legacy implementation
+            name_index = get_name_index(os.path.dirname(dst) or ".")
+            dst = name_index.reserve_path(dst)
             last_err = None
             for i in range(attempts):
                 try:
                     shutil.move(src, dst)
-                    return
+                    return dst
                 except OSError as e:
                     last_err = e
                     time.sleep(delay * (i + 1))
             # Fallback: copy then delete if move fails
-            shutil.copy2(src, dst)
+            try:
+                shutil.copy2(src, dst)
+            except OSError:
+                if not os.path.exists(dst):
+                    # Nothing was written: free the name so later files don't get a suffix
+                    name_index.release(dst)
+                raise
             try:
                 os.remove(src)
             except OSError as e:
@@ -121,6 +139,7 @@ class FileManager:
                 raise (
                     e if e is not None else (last_err or OSError("Unknown file operation error"))
                 )
+            return dst
 
     @staticmethod
     def get_unified_manager() -> Any:  # type: ignore
@@ -206,13 +225,12 @@ class FilenameHandler:
 
     @staticmethod
     def handle_duplicate_filename(filename: str, folder: str, extension: str = ".pdf") -> str:
-        """Resolve filename collisions by appending numeric suffix."""
-        base_filename = filename
-        counter = 1
-        while os.path.exists(os.path.join(folder, f"{filename}{extension}")):
-            filename = f"{base_filename}_{counter}"
-            counter += 1
-        return filename
+        """Resolve filename collisions by appending numeric suffix.
+
+        The returned name is reserved in the folder's shared name index, so
+        concurrent workers never receive the same name.
+        """
+        return get_name_index(folder).reserve(filename, extension)
 
 
 class FileOrganizer:
@@ -222,6 +240,8 @@ class FileOrganizer:
         self.file_manager = FileManager()
         self.progress_tracker = ProgressTracker()
         self.filename_handler = FilenameHandler()
+        # Path of the last file moved by move_file_to_category
+        self.last_moved_path: Optional[str] = None
 
     def create_directories(self, *directories: str) -> None:
         """Ensures all specified directories exist."""
@@ -236,18 +256,19 @@ class FileOrganizer:
         new_name: str,
         file_extension: str = ".pdf",
     ) -> str:
-        """Move file to category with collision-safe naming."""
-        final_name = self.filename_handler.handle_duplicate_filename(
-            new_name, category_dir, file_extension
-        )
+        """Move file to category with collision-safe naming.
 
+        Returns:
+            Name the file was given, without extension (``last_moved_path`` has the path)
+        """
         # Auto-detect extension if default doesn't match source
         if file_extension == ".pdf" and not src_path.lower().endswith(".pdf"):
             file_extension = os.path.splitext(src_path)[1]
 
-        dest_path = os.path.join(category_dir, final_name + file_extension)
-        self.file_manager.safe_move(src_path, dest_path)
-        return final_name
+        # The move reserves the collision-free name, once
+        dest_path = os.path.join(category_dir, new_name + file_extension)
+        self.last_moved_path = self.file_manager.safe_move(src_path, dest_path)
+        return os.path.basename(self.last_moved_path)[: -len(file_extension) or None]
 
     def get_file_stats(self, directory: str) -> Dict[str, Union[int, Dict[str, int]]]:
         """Get file statistics by type for directory analysis."""
@@ -413,16 +434,26 @@ class FileOrganizer:
             engine = OrganizationService(target_folder, clustering_config)
             engine_type = f"Enhanced (Level {ml_enhancement_level})" if ml_enhancement_level >= 2 else f"Domain Architecture (Level {ml_enhancement_level})"
 
-            # Prepare document info for organization
+            # Prepare document info for organization, reusing phase-1 extraction results
+            content_store = engine.content_store
             processed_docs = []
             for file_path in processed_files:
                 if os.path.exists(file_path):
-                    # Extract document info
-                    doc_info = {
-                        "filename": os.path.basename(file_path),
-                        "path": file_path,
-                        "content": self._extract_file_content_for_organization(file_path),
-                    }
+                    record = content_store.get(file_path) if content_store else None
+                    if record:
+                        doc_info = {
+                            "filename": os.path.basename(file_path),
+                            "path": file_path,
+                            "content": record.content,
+                            "metadata": record.metadata,
+                            "entities": record.entities,
+                        }
+                    else:
+                        doc_info = {
+                            "filename": os.path.basename(file_path),
+                            "path": file_path,
+                            "content": self._extract_file_content_for_organization(file_path),
+                        }
                     processed_docs.append(doc_info)
 
             if not processed_docs:
@@ -463,7 +494,7 @@ class FileOrganizer:
         """
         Extract content from processed files for organization analysis.
 
-        This method reuses OCR content when possible to avoid reprocessing.
+        Fallback for files without an entry in the content handoff store.
         """
         try:
             # For text files, read content directly
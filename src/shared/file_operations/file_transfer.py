@@ -0,0 +1,365 @@
+"""
+File Transfer Service
+
+Zero-copy file moves and copies for the processing and organization pipelines.
+
+Transfers try the cheapest mechanism the platform and filesystems allow:
+1. os.replace (same filesystem - metadata only)
+2. Reflink clone via FICLONE (copy-on-write filesystems such as btrfs/XFS)
+3. os.copy_file_range / os.sendfile in large chunks (kernel-side copy)
+4. Buffered userspace copy (portable fallback)
+
+Durability is batched: transferred files are fsynced when commit() is called
+at batch boundaries rather than once per file. The exception is a move across
+filesystems, whose copy is flushed before the source is removed so the
+document always has one durable copy. One service is shared per process
+(get_transfer_service) so every pipeline stage reaches the same commit point.
+"""
+
+import errno
+import hashlib
+import logging
+import os
+import shutil
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Deque, Dict, List, Optional, Set
+
+from .name_index import forget_path, record_path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore
+
+# Linux ioctl request for cloning a whole file: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+# 64 MiB chunks keep syscall counts low for multi-GB scan archives
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+class TransferMethod(Enum):
+    """Mechanism used to transfer file data."""
+
+    RENAME = "rename"
+    REFLINK = "reflink"
+    COPY_FILE_RANGE = "copy_file_range"
+    SENDFILE = "sendfile"
+    BUFFERED_COPY = "buffered_copy"
+
+
+@dataclass
+class TransferResult:
+    """Outcome of a single file transfer."""
+
+    source_path: str
+    target_path: str
+    method: TransferMethod
+    bytes_moved: int  # File data physically copied; 0 for same-filesystem renames
+    duration: float
+    checksum_verified: Optional[bool] = None
+
+
+class FileTransferService:
+    """Moves and copies files using the cheapest available mechanism."""
+
+    def __init__(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        verify_checksums: bool = False,
+        fsync_on_commit: bool = True,
+    ):
+        """Initialize file transfer service.
+
+        Args:
+            chunk_size: Bytes per kernel copy call for data-copying transfers
+            verify_checksums: Compare SHA-256 of source and target after data copies
+            fsync_on_commit: Flush transferred files to disk when commit() is called
+        """
+        self.logger = logging.getLogger(__name__)
+        self.chunk_size = chunk_size
+        self.verify_checksums = verify_checksums
+        self.fsync_on_commit = fsync_on_commit
+
+        self._lock = threading.Lock()
+        self._pending_sync: Set[str] = set()
+        self._method_stats: Dict[str, Dict[str, int]] = {}
+        self._recent_transfers: Deque[TransferResult] = deque(maxlen=1000)
+
+        # Methods that failed with "not supported" are skipped for the rest of the session
+        self._reflink_supported = fcntl is not None and hasattr(fcntl, "ioctl")
+        self._copy_file_range_supported = hasattr(os, "copy_file_range")
+        self._sendfile_supported = hasattr(os, "sendfile")
+
+    def move(self, src: str, dst: str) -> TransferResult:
+        """Move a file, copying data only when crossing filesystems.
+
+        Args:
+            src: Source file path
+            dst: Destination file path (overwritten if it exists)
+
+        Returns:
+            TransferResult describing the method and bytes moved
+
+        Raises:
+            OSError: If the file cannot be moved
+        """
+        start_time = time.time()
+        try:
+            os.replace(src, dst)
+            result = TransferResult(
+                source_path=src,
+                target_path=dst,
+                method=TransferMethod.RENAME,
+                bytes_moved=0,
+                duration=time.time() - start_time,
+            )
+            forget_path(src)
+            self._record(result, dst)
+            return result
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+
+        # Cross-device: copy data, make the copy durable, then remove the source
+        result = self.copy(src, dst)
+        self._fsync(dst)
+        self._fsync_directory(os.path.dirname(dst) or ".")
+        with self._lock:
+            self._pending_sync.discard(dst)
+        os.remove(src)
+        forget_path(src)
+        result.source_path = src
+        result.duration = time.time() - start_time
+        return result
+
+    def copy(self, src: str, dst: str) -> TransferResult:
+        """Copy a file and its metadata using the cheapest data path available.
+
+        Args:
+            src: Source file path
+            dst: Destination file path (overwritten if it exists)
+
+        Returns:
+            TransferResult describing the method and bytes copied
+
+        Raises:
+            OSError: If the copy fails or checksum verification does not match
+        """
+        start_time = time.time()
+        file_size = os.path.getsize(src)
+        target_opened = False
+
+        try:
+            with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+                target_opened = True
+                method = self._copy_data(src_file, dst_file, file_size)
+            shutil.copystat(src, dst)
+
+            checksum_verified = None
+            if self.verify_checksums:
+                checksum_verified = self._checksum(src) == self._checksum(dst)
+                if not checksum_verified:
+                    raise OSError(f"Checksum mismatch after copying {src} to {dst}")
+
+        except Exception:
+            # Never leave a partial target behind
+            if target_opened and os.path.exists(dst):
+                try:
+                    os.remove(dst)
+                except OSError:
+                    pass
+            raise
+
+        result = TransferResult(
+            source_path=src,
+            target_path=dst,
+            method=method,
+            bytes_moved=file_size,
+            duration=time.time() - start_time,
+            checksum_verified=checksum_verified,
+        )
+        self._record(result, dst)
+        return result
+
+    def commit(self) -> int:
+        """Flush all files transferred since the last commit to stable storage.
+
+        Returns:
+            Number of files synced
+        """
+        with self._lock:
+            pending = list(self._pending_sync)
+            self._pending_sync.clear()
+
+        if not self.fsync_on_commit:
+            return 0
+
+        synced = 0
+        directories = set()
+        for path in pending:
+            try:
+                self._fsync(path)
+                synced += 1
+                directories.add(os.path.dirname(path) or ".")
+            except OSError as e:
+                # File may have been moved on by a later stage
+                self.logger.debug("Skipping fsync for %s: %s", path, e)
+
+        # Persist the directory entries created by renames
+        for directory in directories:
+            try:
+                self._fsync_directory(directory)
+            except OSError as e:
+                self.logger.debug("Skipping directory fsync for %s: %s", directory, e)
+
+        return synced
+
+    def get_transfer_statistics(self) -> Dict[str, Any]:
+        """Get per-method transfer counts and byte totals."""
+        with self._lock:
+            by_method = {method: dict(entry) for method, entry in self._method_stats.items()}
+            pending_sync = len(self._pending_sync)
+
+        return {
+            "files_transferred": sum(entry["files"] for entry in by_method.values()),
+            "bytes_moved": sum(entry["bytes_moved"] for entry in by_method.values()),
+            "by_method": by_method,
+            "pending_sync": pending_sync,
+        }
+
+    def get_recent_transfers(self) -> List[TransferResult]:
+        """Get the per-file log of the most recent transfers."""
+        with self._lock:
+            return list(self._recent_transfers)
+
+    def _record(self, result: TransferResult, dst: str) -> None:
+        """Record a completed transfer and queue it for the next commit."""
+        with self._lock:
+            entry = self._method_stats.setdefault(
+                result.method.value, {"files": 0, "bytes_moved": 0}
+            )
+            entry["files"] += 1
+            entry["bytes_moved"] += result.bytes_moved
+            self._recent_transfers.append(result)
+            self._pending_sync.add(dst)
+        record_path(dst)
+        self.logger.debug(
+            "Transferred %s → %s via %s (%d bytes)",
+            result.source_path,
+            result.target_path,
+            result.method.value,
+            result.bytes_moved,
+        )
+
+    def _copy_data(self, src_file, dst_file, file_size: int) -> TransferMethod:
+        """Copy file data, falling through progressively more expensive methods."""
+        src_fd = src_file.fileno()
+        dst_fd = dst_file.fileno()
+
+        if self._reflink_supported and file_size > 0:
+            try:
+                fcntl.ioctl(dst_fd, FICLONE, src_fd)  # type: ignore[union-attr]
+                return TransferMethod.REFLINK
+            except OSError as e:
+                if e.errno in (errno.ENOTTY, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOSYS):
+                    self._reflink_supported = False
+                # EXDEV and others: not clonable here, try the next method
+
+        if self._copy_file_range_supported:
+            try:
+                if self._kernel_copy(os.copy_file_range, src_fd, dst_fd, file_size):
+                    return TransferMethod.COPY_FILE_RANGE
+            except OSError as e:
+                if e.errno in (errno.ENOSYS, errno.EOPNOTSUPP):
+                    self._copy_file_range_supported = False
+                elif e.errno not in (errno.EXDEV, errno.EINVAL):
+                    raise
+            self._rewind(src_fd, dst_fd)
+
+        if self._sendfile_supported:
+            try:
+                if self._kernel_copy(self._sendfile, src_fd, dst_fd, file_size):
+                    return TransferMethod.SENDFILE
+            except OSError as e:
+                if e.errno in (errno.ENOSYS, errno.EINVAL, errno.ENOTSOCK, errno.EOPNOTSUPP):
+                    self._sendfile_supported = False
+                else:
+                    raise
+            self._rewind(src_fd, dst_fd)
+
+        shutil.copyfileobj(src_file, dst_file, min(self.chunk_size, 16 * 1024 * 1024))
+        return TransferMethod.BUFFERED_COPY
+
+    def _kernel_copy(self, copy_func, src_fd: int, dst_fd: int, file_size: int) -> bool:
+        """Drive a kernel copy primitive until the whole file is transferred.
+
+        Returns:
+            True if all bytes were copied, False if the primitive made no progress
+        """
+        copied = 0
+        while copied < file_size:
+            sent = copy_func(src_fd, dst_fd, min(self.chunk_size, file_size - copied))
+            if sent == 0:
+                # Zero progress before EOF means the primitive can't handle this pair
+                return copied == file_size
+            copied += sent
+        return True
+
+    @staticmethod
+    def _sendfile(src_fd: int, dst_fd: int, count: int) -> int:
+        """Adapt os.sendfile to the copy_file_range calling convention."""
+        return os.sendfile(dst_fd, src_fd, None, count)
+
+    @staticmethod
+    def _rewind(src_fd: int, dst_fd: int) -> None:
+        """Reset offsets and truncate the target before retrying with another method."""
+        os.lseek(src_fd, 0, os.SEEK_SET)
+        os.lseek(dst_fd, 0, os.SEEK_SET)
+        os.ftruncate(dst_fd, 0)
+
+    @staticmethod
+    def _fsync(path: str) -> None:
+        """Flush a file's data to stable storage."""
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _fsync_directory(directory: str) -> None:
+        """Flush a directory's entries to stable storage (no-op where unsupported)."""
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _checksum(self, path: str) -> str:
+        """Compute SHA-256 of a file in chunks."""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+
+# Module-level instance shared by the kernel and file managers in the same process
+_transfer_service_instance: Optional[FileTransferService] = None
+_transfer_service_lock = threading.Lock()
+
+
+def get_transfer_service() -> FileTransferService:
+    """Get global file transfer service instance."""
+    global _transfer_service_instance  # pylint: disable=global-statement
+    with _transfer_service_lock:
+        if _transfer_service_instance is None:
+            _transfer_service_instance = FileTransferService()
+        return _transfer_service_instance
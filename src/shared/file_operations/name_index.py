@@ -0,0 +1,163 @@
+"""
+Output Name Index
+
+In-memory index of filenames per output directory for collision-free naming.
+
+Each directory is scanned once with os.scandir; afterwards name lookups and
+reservations are served from memory. Per-base-name counters remember the last
+suffix handed out, so finding the next free "name_N" does not re-probe every
+earlier candidate. Reservations are atomic, so concurrent workers never receive
+the same target name.
+"""
+
+import logging
+import os
+import threading
+from typing import Dict, Optional, Set, Tuple
+
+
+class OutputNameIndex:
+    """Tracks taken filenames in a single directory and hands out free ones."""
+
+    def __init__(self, directory: str):
+        """Initialize and load the index for a directory.
+
+        Args:
+            directory: Directory whose filenames are indexed
+        """
+        self.logger = logging.getLogger(__name__)
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._names: Set[str] = set()
+        self._next_suffix: Dict[Tuple[str, str], int] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """Scan the directory once to seed the index."""
+        try:
+            with os.scandir(self.directory) as entries:
+                self._names = {self._key(entry.name) for entry in entries}
+        except FileNotFoundError:
+            # Directory will be created on first move
+            self._names = set()
+        except OSError as e:
+            self.logger.warning("Could not scan %s for name index: %s", self.directory, e)
+            self._names = set()
+
+    @staticmethod
+    def _key(filename: str) -> str:
+        """Normalize a filename for comparison (case-insensitive on Windows)."""
+        return os.path.normcase(filename)
+
+    def reserve(self, stem: str, extension: str = "") -> str:
+        """Reserve a free filename, appending a numeric suffix on collision.
+
+        Args:
+            stem: Desired filename without extension
+            extension: File extension including the dot
+
+        Returns:
+            Reserved stem (``stem`` or ``stem_N``); the caller appends the extension
+        """
+        with self._lock:
+            candidate = stem
+            if self._is_taken(candidate + extension):
+                counter_key = (self._key(stem), self._key(extension))
+                counter = self._next_suffix.get(counter_key, 1)
+                candidate = f"{stem}_{counter}"
+                while self._is_taken(candidate + extension):
+                    counter += 1
+                    candidate = f"{stem}_{counter}"
+                self._next_suffix[counter_key] = counter + 1
+
+            self._names.add(self._key(candidate + extension))
+            return candidate
+
+    def reserve_path(self, file_path: str) -> str:
+        """Reserve a free full path inside this directory.
+
+        Args:
+            file_path: Desired target path
+
+        Returns:
+            Reserved target path
+        """
+        directory, filename = os.path.split(file_path)
+        stem, extension = os.path.splitext(filename)
+        return os.path.join(directory, self.reserve(stem, extension) + extension)
+
+    def _is_taken(self, filename: str) -> bool:
+        """Check the index, with a single stat to catch files written by other processes."""
+        if self._key(filename) in self._names:
+            return True
+        if os.path.exists(os.path.join(self.directory, filename)):
+            self._names.add(self._key(filename))
+            return True
+        return False
+
+    def add(self, filename: str) -> None:
+        """Record a filename that now exists in the directory."""
+        with self._lock:
+            self._names.add(self._key(filename))
+
+    def discard(self, filename: str) -> None:
+        """Forget a filename that was moved out of or deleted from the directory."""
+        with self._lock:
+            self._names.discard(self._key(filename))
+
+    def release(self, file_path: str) -> None:
+        """Release a reservation whose move did not happen."""
+        self.discard(os.path.basename(file_path))
+
+    def __contains__(self, filename: str) -> bool:
+        with self._lock:
+            return self._key(filename) in self._names
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._names)
+
+
+# Module-level registry: one index per directory, shared across workers
+_indexes: Dict[str, OutputNameIndex] = {}
+_registry_lock = threading.Lock()
+
+
+def _directory_key(directory: str) -> str:
+    return os.path.normcase(os.path.abspath(directory))
+
+
+def get_name_index(directory: str) -> OutputNameIndex:
+    """Get the shared name index for a directory, loading it on first use."""
+    key = _directory_key(directory)
+    with _registry_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = OutputNameIndex(os.path.abspath(directory))
+            _indexes[key] = index
+        return index
+
+
+def _loaded_index(directory: str) -> Optional[OutputNameIndex]:
+    with _registry_lock:
+        return _indexes.get(_directory_key(directory))
+
+
+def record_path(file_path: str) -> None:
+    """Mark a path as taken if its directory is indexed."""
+    index = _loaded_index(os.path.dirname(file_path) or ".")
+    if index is not None:
+        index.add(os.path.basename(file_path))
+
+
+def forget_path(file_path: str) -> None:
+    """Mark a path as free if its directory is indexed."""
+    index = _loaded_index(os.path.dirname(file_path) or ".")
+    if index is not None:
+        index.discard(os.path.basename(file_path))
+
+
+def reset_name_indexes() -> None:
+    """Drop all loaded indexes so the next lookup rescans the directory."""
+    with _registry_lock:
+        _indexes.clear()
@@ -13,6 +13,9 @@ import tempfile
 import time
 from typing import TYPE_CHECKING, Any, Dict, Optional, TextIO, Union
 
+from .file_transfer import FileTransferService, TransferResult, get_transfer_service
+from .name_index import get_name_index
+
 # Cross-platform file locking imports with proper type safety
 if TYPE_CHECKING:
     import fcntl
@@ -72,9 +75,15 @@ class FileLockManager:
 class AtomicFileOperations:
     """Atomic file operations with rollback capability."""
 
-    def __init__(self):
-        """Initialize atomic file operations."""
+    def __init__(self, transfer_service: Optional[FileTransferService] = None):
+        """Initialize atomic file operations.
+
+        Args:
+            transfer_service: Transfer backend for moves and copies (default: the shared one)
+        """
         self.logger = logging.getLogger(__name__)
+        self.transfer_service = transfer_service or get_transfer_service()
+        self.last_transfer: Optional[TransferResult] = None
 
     def atomic_write(self, file_path: str, content: str, encoding: str = "utf-8") -> bool:
         """Write content to file atomically.
@@ -150,67 +159,72 @@ class AtomicFileOperations:
 
         last_err = None
         for attempt in range(attempts):
+            actual_dst_path = None
             try:
                 # Handle filename conflicts
                 actual_dst_path = self._resolve_filename_conflict(dst_path)
 
-                # Try direct move first
-                shutil.move(src_path, actual_dst_path)
-                self.logger.debug("Successfully moved: %s → %s", src_path, actual_dst_path)
+                # Rename in place, or zero-copy transfer across filesystems
+                self.last_transfer = self.transfer_service.move(src_path, actual_dst_path)
+                self.logger.debug(
+                    "Successfully moved: %s → %s (%s)",
+                    src_path,
+                    actual_dst_path,
+                    self.last_transfer.method.value,
+                )
                 return True
 
             except OSError as e:
                 last_err = e
                 self.logger.warning("Move attempt %d failed: %s", attempt + 1, e)
+                if actual_dst_path is not None:
+                    # Free the reserved name so the retry can reuse it
+                    get_name_index(os.path.dirname(actual_dst_path)).release(actual_dst_path)
 
                 if attempt < attempts - 1:  # Not last attempt
                     time.sleep(delay * (attempt + 1))
                     continue
 
         # Final attempt: copy then delete
+        actual_dst_path = None
         try:
             actual_dst_path = self._resolve_filename_conflict(dst_path)
-            shutil.copy2(src_path, actual_dst_path)
+            self.last_transfer = self.transfer_service.copy(src_path, actual_dst_path)
             os.remove(src_path)
             self.logger.info("Fallback copy-delete successful: %s → %s", src_path, actual_dst_path)
             return True
 
         except Exception as e:
+            if actual_dst_path is not None and not os.path.exists(actual_dst_path):
+                # Nothing was written: free the name so later files don't get a suffix
+                get_name_index(os.path.dirname(actual_dst_path)).release(actual_dst_path)
             self.logger.error(
                 "All move attempts failed. Last error: %s, Fallback error: %s", last_err, e
             )
             return False
 
     def _resolve_filename_conflict(self, file_path: str) -> str:
-        """Resolve filename conflicts by appending counter."""
-        if not os.path.exists(file_path):
-            return file_path
-
-        base_name, extension = os.path.splitext(file_path)
-        counter = 1
+        """Reserve a collision-free path by appending a counter.
 
-        while os.path.exists(file_path):
-            file_path = f"{base_name}_{counter}{extension}"
-            counter += 1
-
-            # Prevent infinite loop
-            if counter > 1000:
-                # Use timestamp as last resort
-                timestamp = int(time.time())
-                file_path = f"{base_name}_{timestamp}{extension}"
-                break
-
-        return file_path
+        Uses the shared per-directory name index, so concurrent workers never
+        receive the same name and repeated collisions don't re-stat every suffix.
+        """
+        return get_name_index(os.path.dirname(file_path) or ".").reserve_path(file_path)
 
 
 class SafeFileManager:
     """Main safe file management service consolidating all file operations."""
 
-    def __init__(self):
-        """Initialize safe file manager."""
+    def __init__(self, transfer_service: Optional[FileTransferService] = None):
+        """Initialize safe file manager.
+
+        Args:
+            transfer_service: Transfer backend for moves and copies (default: the shared one)
+        """
         self.logger = logging.getLogger(__name__)
         self.lock_manager = FileLockManager()
-        self.atomic_ops = AtomicFileOperations()
+        self.transfer_service = transfer_service or get_transfer_service()
+        self.atomic_ops = AtomicFileOperations(self.transfer_service)
 
         # Statistics tracking
         self._operation_stats = {
@@ -219,6 +233,8 @@ class SafeFileManager:
             "directories_created": 0,
             "operations_failed": 0,
         }
+        # Per-manager transfer counts; the shared transfer service counts the whole process
+        self._transfer_stats: Dict[str, Dict[str, int]] = {}
 
     def safe_move(self, src: str, dst: str, attempts: int = 3, delay: float = 0.75) -> bool:
         """Safely move file with retry logic.
@@ -236,6 +252,7 @@ class SafeFileManager:
 
         if success:
             self._operation_stats["files_moved"] += 1
+            self._record_transfer(self.atomic_ops.last_transfer)
         else:
             self._operation_stats["operations_failed"] += 1
 
@@ -262,10 +279,11 @@ class SafeFileManager:
                 dst
             )  # pylint: disable=protected-access
 
-            # Copy with metadata preservation
-            shutil.copy2(src, actual_dst)
+            # Copy with metadata preservation (reflink/kernel copy where supported)
+            self.atomic_ops.last_transfer = self.transfer_service.copy(src, actual_dst)
 
             self._operation_stats["files_copied"] += 1
+            self._record_transfer(self.atomic_ops.last_transfer)
             self.logger.debug("Successfully copied: {src} → {actual_dst}")
             return True
 
@@ -274,6 +292,28 @@ class SafeFileManager:
             self.logger.error("Copy failed: %s → %s: %s", src, dst, e)
             return False
 
+    def get_last_transfer(self) -> Optional[TransferResult]:
+        """Get the transfer details (method, bytes moved) of the most recent move or copy."""
+        return self.atomic_ops.last_transfer
+
+    def _record_transfer(self, result: Optional[TransferResult]) -> None:
+        """Count a transfer made by this manager."""
+        if result is None:
+            return
+        entry = self._transfer_stats.setdefault(result.method.value, {"files": 0, "bytes_moved": 0})
+        entry["files"] += 1
+        entry["bytes_moved"] += result.bytes_moved
+
+    def commit(self) -> int:
+        """Flush files moved or copied since the last commit to stable storage.
+
+        Call at batch boundaries; individual transfers are not fsynced.
+
+        Returns:
+            Number of files synced
+        """
+        return self.transfer_service.commit()
+
     def safe_create_directory(self, dir_path: str, mode: int = 0o755) -> bool:
         """Safely create directory with proper permissions.
 
@@ -385,6 +425,11 @@ class SafeFileManager:
             **self._operation_stats,
             "success_rate": self._calculate_success_rate(),
             "total_operations": sum(self._operation_stats.values()),
+            "transfers": {
+                "files_transferred": sum(e["files"] for e in self._transfer_stats.values()),
+                "bytes_moved": sum(e["bytes_moved"] for e in self._transfer_stats.values()),
+                "by_method": {method: dict(e) for method, e in self._transfer_stats.items()},
+            },
         }
 
     def _calculate_success_rate(self) -> float:
@@ -402,6 +447,7 @@ class SafeFileManager:
         """Reset operation statistics."""
         for key in self._operation_stats:
             self._operation_stats[key] = 0
+        self._transfer_stats.clear()
 
 
 # Legacy compatibility - module-level instance cache
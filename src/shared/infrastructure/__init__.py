@@ -3,11 +3,13 @@ Infrastructure Services
 
 Core infrastructure components used across all domains:
 - Dependency detection and management
+- Cached environment probing (dependency versions, CPU, GPU)
 - Directory utilities and configuration
 - Feature flag control
 - System configuration loading
 - Security and error handling
 - Hardware detection and model management
+- Resource-aware worker sizing
 - Text and path utilities
 """
 
@@ -19,6 +21,20 @@ try:
 except ImportError:
     DEPENDENCY_MANAGER_AVAILABLE = False
 
+try:
+    from .environment_snapshot import (
+        DependencyInfo,
+        EnvironmentProbe,
+        EnvironmentSnapshot,
+        GPUInfo,
+        get_environment_probe,
+        get_environment_snapshot,
+    )
+
+    ENVIRONMENT_SNAPSHOT_AVAILABLE = True
+except ImportError:
+    ENVIRONMENT_SNAPSHOT_AVAILABLE = False
+
 try:
     from .directory_manager import ensure_default_directories, get_api_details, setup_directories
 
@@ -89,13 +105,135 @@ try:
 except ImportError:
     TEXT_UTILITIES_AVAILABLE = False
 
+try:
+    from .content_handoff import (
+        ContentHandoffStore,
+        HandoffRecord,
+        close_content_handoff_store,
+        entities_from_metadata,
+        get_content_handoff_store,
+        json_default,
+        metadata_to_dict,
+        open_content_handoff_store,
+        record_content_handoff,
+    )
+
+    CONTENT_HANDOFF_AVAILABLE = True
+except ImportError:
+    CONTENT_HANDOFF_AVAILABLE = False
+
+try:
+    from .document_buffer import DocumentRecord, ProcessedDocumentBuffer
+
+    DOCUMENT_BUFFER_AVAILABLE = True
+except ImportError:
+    DOCUMENT_BUFFER_AVAILABLE = False
+
+try:
+    from .entity_scanner import (
+        EntityScanner,
+        EntityScanResult,
+        ScannedEntity,
+        entity_scan_from_metadata,
+        get_entity_scanner,
+        scan_entities,
+    )
+
+    ENTITY_SCANNER_AVAILABLE = True
+except ImportError:
+    ENTITY_SCANNER_AVAILABLE = False
+
+try:
+    from .tracing import SpanRecord, Tracer, get_tracer, span, start_tracing, stop_tracing
+
+    TRACING_AVAILABLE = True
+except ImportError:
+    TRACING_AVAILABLE = False
+
+try:
+    from .worker_sizing import (
+        ConcurrencyLimit,
+        ResourceSample,
+        WorkerLimits,
+        WorkerSizingPolicy,
+        Workload,
+        get_worker_sizing,
+        sample_resources,
+        set_worker_sizing,
+    )
+
+    WORKER_SIZING_AVAILABLE = True
+except ImportError:
+    WORKER_SIZING_AVAILABLE = False
+
 # Export available components
 available_exports = []
 
 if DEPENDENCY_MANAGER_AVAILABLE:
     available_exports.extend(["DependencyManager", "get_dependency_manager"])
 
+if ENVIRONMENT_SNAPSHOT_AVAILABLE:
+    available_exports.extend(
+        [
+            "DependencyInfo",
+            "EnvironmentProbe",
+            "EnvironmentSnapshot",
+            "GPUInfo",
+            "get_environment_probe",
+            "get_environment_snapshot",
+        ]
+    )
+
 if DIRECTORY_MANAGER_AVAILABLE:
     available_exports.extend(["ensure_default_directories", "setup_directories", "get_api_details"])
 
+if CONTENT_HANDOFF_AVAILABLE:
+    available_exports.extend(
+        [
+            "ContentHandoffStore",
+            "HandoffRecord",
+            "open_content_handoff_store",
+            "get_content_handoff_store",
+            "record_content_handoff",
+            "close_content_handoff_store",
+            "entities_from_metadata",
+            "json_default",
+            "metadata_to_dict",
+        ]
+    )
+
+if DOCUMENT_BUFFER_AVAILABLE:
+    available_exports.extend(["DocumentRecord", "ProcessedDocumentBuffer"])
+
+if ENTITY_SCANNER_AVAILABLE:
+    available_exports.extend(
+        [
+            "EntityScanner",
+            "EntityScanResult",
+            "ScannedEntity",
+            "entity_scan_from_metadata",
+            "get_entity_scanner",
+            "scan_entities",
+        ]
+    )
+
+if TRACING_AVAILABLE:
+    available_exports.extend(
+        ["SpanRecord", "Tracer", "get_tracer", "span", "start_tracing", "stop_tracing"]
+    )
+
+if WORKER_SIZING_AVAILABLE:
+    available_exports.extend(
+        [
+            "ConcurrencyLimit",
+            "ResourceSample",
+            "WorkerLimits",
+            "WorkerSizingPolicy",
+            "Workload",
+            "get_worker_sizing",
+            "sample_resources",
+            "set_worker_sizing",
+        ]
+    )
+
 __all__ = available_exports
@@ -0,0 +1,258 @@
+"""
+Content Handoff Store
+
+Compact on-disk map from processed output path to the AI-ready text,
+metadata and entities produced during phase-1 extraction.
+
+Post-processing organization, preview and learning read from the store
+instead of re-extracting PDFs and images. Text is zlib-compressed and held
+in a SQLite file under the target folder's ``.content_tamer`` state
+directory. The store is deleted once the organization session commits.
+"""
+
+import dataclasses
+import datetime
+import json
+import logging
+import os
+import sqlite3
+import threading
+import zlib
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+HANDOFF_DB_NAME = "content_handoff.db"
+
+
+@dataclass
+class HandoffRecord:
+    """Phase-1 results for a single processed document."""
+
+    path: str
+    content: str
+    metadata: Dict[str, Any]
+    entities: Dict[str, List[Any]]
+
+
+def json_default(value: Any) -> Any:
+    """Serialize metadata values that json doesn't handle natively."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    return str(value)
+
+
+def metadata_to_dict(value: Any) -> Dict[str, Any]:
+    """Normalize metadata (dict or dataclass such as DocumentMetadata) to a plain dict."""
+    if value is None:
+        return {}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {field.name: getattr(value, field.name) for field in dataclasses.fields(value)}
+    if isinstance(value, dict):
+        return value
+    return {"value": value}
+
+
+def entities_from_metadata(metadata: Any) -> Dict[str, List[Any]]:
+    """Collect entity lists (``dates_found``, ``currency_found``, ...) from document metadata."""
+    fields = metadata_to_dict(metadata)
+    return {
+        key[: -len("_found")]: list(value)
+        for key, value in fields.items()
+        if key.endswith("_found") and isinstance(value, (list, tuple))
+    }
+
+
+class ContentHandoffStore:
+    """SQLite-backed handoff of extracted content between processing and organization."""
+
+    def __init__(self, target_folder: str):
+        """Initialize store for a target folder.
+
+        The database file is only created on the first write.
+
+        Args:
+            target_folder: Folder whose processed documents are tracked
+        """
+        self.target_folder = target_folder
+        self.db_path = os.path.join(target_folder, ".content_tamer", HANDOFF_DB_NAME)
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+    def _connect(self, create: bool) -> Optional[sqlite3.Connection]:
+        """Open (and optionally create) the database. Caller must hold the lock."""
+        if self._conn is not None:
+            return self._conn
+        if not create and not os.path.exists(self.db_path):
+            return None
+
+        os.makedirs(os.path.dirname(self.db_path), mode=0o700, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS handoff (
+                path TEXT PRIMARY KEY,
+                content BLOB NOT NULL,
+                metadata TEXT,
+                entities TEXT
+            )
+        """
+        )
+        self._conn = conn
+        return conn
+
+    def put(
+        self,
+        path: str,
+        content: str,
+        metadata: Any = None,
+        entities: Optional[Dict[str, List[Any]]] = None,
+    ) -> bool:
+        """Store phase-1 results for a processed document.
+
+        Args:
+            path: Output path of the processed document
+            content: AI-ready text
+            metadata: Metadata dict or dataclass (e.g. DocumentMetadata)
+            entities: Extracted entities keyed by type (defaults to those in metadata)
+
+        Returns:
+            True if stored
+        """
+        if entities is None:
+            entities = entities_from_metadata(metadata)
+        try:
+            row = (
+                self._key(path),
+                zlib.compress((content or "").encode("utf-8"), 6),
+                json.dumps(metadata_to_dict(metadata), default=json_default, ensure_ascii=False),
+                json.dumps(entities, default=json_default, ensure_ascii=False),
+            )
+            with self._lock:
+                conn = self._connect(create=True)
+                conn.execute("INSERT OR REPLACE INTO handoff VALUES (?, ?, ?, ?)", row)
+                conn.commit()
+            return True
+        except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+            self.logger.warning("Failed to store handoff content for %s: %s", path, e)
+            return False
+
+    def get(self, path: str) -> Optional[HandoffRecord]:
+        """Get phase-1 results for a document, or None if not stored."""
+        try:
+            with self._lock:
+                conn = self._connect(create=False)
+                if conn is None:
+                    return None
+                row = conn.execute(
+                    "SELECT content, metadata, entities FROM handoff WHERE path = ?",
+                    (self._key(path),),
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.warning("Failed to read handoff content for %s: %s", path, e)
+            return None
+
+        if row is None:
+            return None
+
+        content, metadata, entities = row
+        return HandoffRecord(
+            path=path,
+            content=zlib.decompress(content).decode("utf-8"),
+            metadata=json.loads(metadata) if metadata else {},
+            entities=json.loads(entities) if entities else {},
+        )
+
+    def get_content(self, path: str) -> Optional[str]:
+        """Get only the AI-ready text for a document."""
+        record = self.get(path)
+        return record.content if record else None
+
+    def __len__(self) -> int:
+        with self._lock:
+            conn = self._connect(create=False)
+            if conn is None:
+                return 0
+            return conn.execute("SELECT COUNT(*) FROM handoff").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def discard(self) -> None:
+        """Delete the store once the organization session has committed."""
+        self.close()
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.remove(self.db_path + suffix)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.warning("Failed to remove handoff store %s: %s", self.db_path, e)
+
+
+# Module-level registry: producers only record into stores a consumer has opened
+_stores: Dict[str, ContentHandoffStore] = {}
+_registry_lock = threading.Lock()
+
+
+def _folder_key(target_folder: str) -> str:
+    return os.path.normcase(os.path.abspath(target_folder))
+
+
+def open_content_handoff_store(target_folder: str) -> ContentHandoffStore:
+    """Open the handoff store for a folder so phase-1 results are recorded into it."""
+    key = _folder_key(target_folder)
+    with _registry_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = ContentHandoffStore(target_folder)
+            _stores[key] = store
+        return store
+
+
+def get_content_handoff_store(target_folder: str) -> ContentHandoffStore:
+    """Get the handoff store for a folder for reading (does not enable recording)."""
+    with _registry_lock:
+        store = _stores.get(_folder_key(target_folder))
+    return store or ContentHandoffStore(target_folder)
+
+
+def record_content_handoff(
+    path: str,
+    content: str,
+    metadata: Any = None,
+    entities: Optional[Dict[str, List[Any]]] = None,
+) -> bool:
+    """Record phase-1 results if a handoff store is open for the path's folder."""
+    with _registry_lock:
+        store = _stores.get(_folder_key(os.path.dirname(path) or "."))
+    if store is None:
+        return False
+    return store.put(path, content, metadata, entities)
+
+
+def close_content_handoff_store(target_folder: str, discard: bool = False) -> None:
+    """Stop recording into a folder's store, optionally deleting it."""
+    with _registry_lock:
+        store = _stores.pop(_folder_key(target_folder), None)
+    if store is None:
+        store = ContentHandoffStore(target_folder)
+    if discard:
+        store.discard()
+    else:
+        store.close()
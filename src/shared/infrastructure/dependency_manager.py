@@ -238,6 +238,10 @@ class DependencyManager:
         for dep_name in ["ollama", "tesseract"]:
             results[dep_name] = self.find_dependency(dep_name, force_refresh=True)
 
+        # Versions and hardware in the environment snapshot are re-probed on next use
+        from .environment_snapshot import EnvironmentProbe
+
+        EnvironmentProbe(self).invalidate()
         return results
 
     def get_config_path(self) -> Path:
@@ -0,0 +1,190 @@
+"""
+Processed Document Buffer
+
+Bounded buffer for documents awaiting organization.
+
+Only the most recent records are held in memory. Once the in-memory limit is
+reached, records are spilled to append-only column files (paths, compressed
+text, metadata, classification features) and streamed back in processing
+order when organization runs, so memory use stays flat regardless of batch
+size. Records hold their metadata in the same JSON form whether they stay in
+memory or are spilled, so organization sees identical types on both paths.
+"""
+
+import json
+import logging
+import os
+import shutil
+import struct
+import tempfile
+import zlib
+from typing import Any, Dict, Iterator, List, Optional
+
+from .content_handoff import json_default, metadata_to_dict
+
+DEFAULT_MAX_IN_MEMORY = 256
+
+_LENGTH = struct.Struct("<I")
+
+
+def _json_form(value: Any) -> Any:
+    """Convert metadata to the plain JSON types a spilled record is read back as."""
+    return json.loads(json.dumps(value, default=json_default, ensure_ascii=False))
+
+
+class DocumentRecord:
+    """Compact record of a processed document."""
+
+    __slots__ = ("original_path", "current_path", "filename", "content", "metadata", "features")
+
+    def __init__(
+        self,
+        original_path: str,
+        current_path: str,
+        filename: str,
+        content: str,
+        metadata: Any = None,
+        features: Optional[Dict[str, Any]] = None,
+    ):
+        self.original_path = original_path
+        self.current_path = current_path
+        self.filename = filename
+        self.content = content
+        self.metadata = _json_form(metadata_to_dict(metadata))
+        self.features = _json_form(features or {})
+
+    @classmethod
+    def from_dict(cls, document: Dict[str, Any]) -> "DocumentRecord":
+        """Build a record from the document dict used by the organization domain."""
+        return cls(
+            original_path=document.get("original_path", ""),
+            current_path=document.get("current_path", ""),
+            filename=document.get("filename", ""),
+            content=document.get("content", ""),
+            metadata=document.get("metadata"),
+            features=document.get("features"),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the document dict expected by OrganizationService."""
+        return {
+            "original_path": self.original_path,
+            "current_path": self.current_path,
+            "filename": self.filename,
+            "content": self.content,
+            "metadata": self.metadata,
+            "features": self.features,
+        }
+
+
+class ProcessedDocumentBuffer:
+    """Append-only document buffer that spills to disk beyond a fixed size."""
+
+    _COLUMNS = ("paths", "content", "metadata", "features")
+
+    def __init__(self, max_in_memory: int = DEFAULT_MAX_IN_MEMORY, spill_dir: Optional[str] = None):
+        """Initialize buffer.
+
+        Args:
+            max_in_memory: Records held in memory before spilling to disk
+            spill_dir: Parent directory for spill files (system temp dir if None)
+        """
+        self.max_in_memory = max(1, max_in_memory)
+        self.spill_dir = spill_dir
+        self.logger = logging.getLogger(__name__)
+
+        self._records: List[DocumentRecord] = []
+        self._spilled_count = 0
+        self._spill_path: Optional[str] = None
+
+    def append(self, record: DocumentRecord) -> None:
+        """Add a processed document, spilling buffered records if the limit is reached."""
+        self._records.append(record)
+        if len(self._records) >= self.max_in_memory:
+            self._spill()
+
+    def __len__(self) -> int:
+        return self._spilled_count + len(self._records)
+
+    def __iter__(self) -> Iterator[DocumentRecord]:
+        """Stream all records back in the order they were appended."""
+        if self._spilled_count:
+            yield from self._read_spilled()
+        yield from list(self._records)
+
+    def iter_dicts(self) -> Iterator[Dict[str, Any]]:
+        """Stream records as organization document dicts."""
+        for record in self:
+            yield record.to_dict()
+
+    @property
+    def spilled_count(self) -> int:
+        """Number of records currently stored on disk."""
+        return self._spilled_count
+
+    def close(self) -> None:
+        """Drop buffered records and remove spill files."""
+        self._records.clear()
+        self._spilled_count = 0
+        if self._spill_path:
+            shutil.rmtree(self._spill_path, ignore_errors=True)
+            self._spill_path = None
+
+    def __enter__(self) -> "ProcessedDocumentBuffer":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _column_path(self, column: str) -> str:
+        return os.path.join(self._spill_path, f"{column}.col")  # type: ignore[arg-type]
+
+    def _spill(self) -> None:
+        """Append in-memory records to the column files."""
+        if self._spill_path is None:
+            if self.spill_dir:
+                os.makedirs(self.spill_dir, exist_ok=True)
+            self._spill_path = tempfile.mkdtemp(prefix="document_buffer_", dir=self.spill_dir)
+
+        files = {column: open(self._column_path(column), "ab") for column in self._COLUMNS}
+        try:
+            for record in self._records:
+                files["paths"].write(
+                    self._json_line([record.original_path, record.current_path, record.filename])
+                )
+                blob = zlib.compress((record.content or "").encode("utf-8"), 1)
+                files["content"].write(_LENGTH.pack(len(blob)))
+                files["content"].write(blob)
+                files["metadata"].write(self._json_line(record.metadata))
+                files["features"].write(self._json_line(record.features))
+        finally:
+            for handle in files.values():
+                handle.close()
+
+        self._spilled_count += len(self._records)
+        self.logger.debug("Spilled %d document records to %s", len(self._records), self._spill_path)
+        self._records = []
+
+    @staticmethod
+    def _json_line(value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False).encode("utf-8") + b"\n"
+
+    def _read_spilled(self) -> Iterator[DocumentRecord]:
+        """Read spilled records back, walking all columns in lockstep."""
+        files = {column: open(self._column_path(column), "rb") for column in self._COLUMNS}
+        try:
+            for _ in range(self._spilled_count):
+                original_path, current_path, filename = json.loads(files["paths"].readline())
+                (length,) = _LENGTH.unpack(files["content"].read(_LENGTH.size))
+                content = zlib.decompress(files["content"].read(length)).decode("utf-8")
+                yield DocumentRecord(
+                    original_path=original_path,
+                    current_path=current_path,
+                    filename=filename,
+                    content=content,
+                    metadata=json.loads(files["metadata"].readline()),
+                    features=json.loads(files["features"].readline()),
+                )
+        finally:
+            for handle in files.values():
+                handle.close()
@@ -0,0 +1,250 @@
+"""
+Entity Scanner
+
+Single-pass extraction of dates, monetary amounts and numbers from document text.
+
+All patterns are combined into one precompiled alternation, so a document is
+scanned once at extraction time instead of once per pattern list in each
+consumer. Results are typed and position-annotated (dates parsed to
+``datetime``, amounts as float with an ISO currency code) and attach to
+document metadata as ``entity_scan`` for reuse by the content and
+organization domains.
+"""
+
+import datetime
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+_MONTH = (
+    r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?"
+    r"|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\.?"
+)
+_NUMBER = r"\d+(?:,\d{3})*(?:\.\d+)?"
+_CURRENCY_CODE = r"USD|EUR|GBP|CAD|AUD"
+
+# Alternatives are tried in order at each position: dates, then amounts, then bare numbers
+_ENTITY_PATTERN = re.compile(
+    rf"""
+    \b(?P<iso_y>\d{{4}})[-/](?P<iso_m>\d{{1,2}})[-/](?P<iso_d>\d{{1,2}})\b
+    | \b(?P<num_a>\d{{1,2}})[-/](?P<num_b>\d{{1,2}})[-/](?P<num_y>\d{{4}}|\d{{2}})\b
+    | \b(?P<mdy_m>{_MONTH})\s+(?P<mdy_d>\d{{1,2}})(?:st|nd|rd|th)?,?\s+(?P<mdy_y>\d{{4}})\b
+    | \b(?P<dmy_d>\d{{1,2}})(?:st|nd|rd|th)?\s+(?P<dmy_m>{_MONTH})\s+(?P<dmy_y>\d{{4}})\b
+    | (?P<sym>[$€£])\s?(?P<sym_value>{_NUMBER})
+    | \b(?P<code>{_CURRENCY_CODE})\s*(?P<code_value>{_NUMBER})
+    | \b(?P<suffix_value>{_NUMBER})\s*(?P<suffix_code>{_CURRENCY_CODE}|dollars?|euros?|pounds?)\b
+    | \bamount[:\s]+(?P<label_value>{_NUMBER})
+    | \b(?P<number>{_NUMBER})\b
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+_MONTHS = {
+    name: index
+    for index, name in enumerate(
+        ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], 1
+    )
+}
+_CURRENCIES = {
+    "$": "USD",
+    "€": "EUR",
+    "£": "GBP",
+    "dollar": "USD",
+    "dollars": "USD",
+    "euro": "EUR",
+    "euros": "EUR",
+    "pound": "GBP",
+    "pounds": "GBP",
+}
+
+
+@dataclass
+class ScannedEntity:
+    """A typed entity found in document text."""
+
+    kind: str  # "date", "amount" or "number"
+    text: str
+    start: int
+    end: int
+    value: Any = None  # datetime for dates, float for amounts and numbers
+    currency: Optional[str] = None  # ISO code for amounts, if stated
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly representation."""
+        value = self.value.isoformat() if isinstance(self.value, datetime.datetime) else self.value
+        return {
+            "kind": self.kind,
+            "text": self.text,
+            "start": self.start,
+            "end": self.end,
+            "value": value,
+            "currency": self.currency,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ScannedEntity":
+        """Rebuild from ``to_dict`` output."""
+        value = data.get("value")
+        if data.get("kind") == "date" and isinstance(value, str):
+            value = datetime.datetime.fromisoformat(value)
+        return cls(
+            kind=data["kind"],
+            text=data["text"],
+            start=data["start"],
+            end=data["end"],
+            value=value,
+            currency=data.get("currency"),
+        )
+
+
+@dataclass
+class EntityScanResult:
+    """Entities found in one document, in text order per type."""
+
+    dates: List[ScannedEntity] = field(default_factory=list)
+    amounts: List[ScannedEntity] = field(default_factory=list)
+    numbers: List[ScannedEntity] = field(default_factory=list)
+
+    def unique_texts(self, kind: str, limit: Optional[int] = None) -> List[str]:
+        """Distinct entity texts of one kind ("dates", "amounts", "numbers"), first seen first."""
+        texts = list(dict.fromkeys(entity.text for entity in getattr(self, kind)))
+        return texts[:limit] if limit is not None else texts
+
+    def to_dict(self) -> Dict[str, List[Dict[str, Any]]]:
+        """JSON-friendly representation."""
+        return {
+            "dates": [e.to_dict() for e in self.dates],
+            "amounts": [e.to_dict() for e in self.amounts],
+            "numbers": [e.to_dict() for e in self.numbers],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EntityScanResult":
+        """Rebuild from ``to_dict`` output."""
+        return cls(
+            **{
+                kind: [ScannedEntity.from_dict(e) for e in data.get(kind, [])]
+                for kind in ("dates", "amounts", "numbers")
+            }
+        )
+
+
+class EntityScanner:
+    """Precompiled single-pass scanner for dates, amounts and numbers."""
+
+    def scan(self, text: str) -> EntityScanResult:
+        """Scan text once for all entity types.
+
+        Args:
+            text: Document text
+
+        Returns:
+            EntityScanResult with typed, position-annotated entities
+        """
+        result = EntityScanResult()
+        if not text:
+            return result
+
+        for match in _ENTITY_PATTERN.finditer(text):
+            groups = match.groupdict()
+            start, end = match.span()
+
+            if groups["number"] is not None:
+                value = _to_float(groups["number"])
+                result.numbers.append(ScannedEntity("number", match.group(), start, end, value))
+                continue
+
+            date = _parse_date(groups)
+            if date is not None:
+                result.dates.append(ScannedEntity("date", match.group(), start, end, date))
+                continue
+
+            amount = _parse_amount(groups)
+            if amount is not None:
+                value, currency = amount
+                result.amounts.append(
+                    ScannedEntity("amount", match.group().strip(), start, end, value, currency)
+                )
+
+        return result
+
+
+def _to_float(number: str) -> float:
+    return float(number.replace(",", ""))
+
+
+def _parse_date(groups: Dict[str, Optional[str]]) -> Optional[datetime.datetime]:
+    """Build a datetime from whichever date alternative matched (None if not a valid date)."""
+    try:
+        if groups["iso_y"] is not None:
+            return datetime.datetime(
+                int(groups["iso_y"]), int(groups["iso_m"]), int(groups["iso_d"])
+            )
+        if groups["num_a"] is not None:
+            first, second = int(groups["num_a"]), int(groups["num_b"])
+            year = int(groups["num_y"])
+            if year < 100:
+                year += 2000 if year < 69 else 1900
+            # Month first (US) unless the first field cannot be a month
+            month, day = (first, second) if first <= 12 else (second, first)
+            return datetime.datetime(year, month, day)
+        if groups["mdy_m"] is not None:
+            month = _MONTHS[groups["mdy_m"][:3].lower()]
+            return datetime.datetime(int(groups["mdy_y"]), month, int(groups["mdy_d"]))
+        if groups["dmy_m"] is not None:
+            month = _MONTHS[groups["dmy_m"][:3].lower()]
+            return datetime.datetime(int(groups["dmy_y"]), month, int(groups["dmy_d"]))
+    except ValueError:
+        return None
+    return None
+
+
+def _parse_amount(groups: Dict[str, Optional[str]]):
+    """Return (value, currency) for whichever amount alternative matched."""
+    if groups["sym_value"] is not None:
+        return _to_float(groups["sym_value"]), _CURRENCIES[groups["sym"]]
+    if groups["code_value"] is not None:
+        return _to_float(groups["code_value"]), groups["code"].upper()
+    if groups["suffix_value"] is not None:
+        code = groups["suffix_code"]
+        return _to_float(groups["suffix_value"]), _CURRENCIES.get(code.lower(), code.upper())
+    if groups["label_value"] is not None:
+        return _to_float(groups["label_value"]), None
+    return None
+
+
+def entity_scan_from_metadata(metadata: Any) -> Optional[EntityScanResult]:
+    """Get the entity scan attached to document metadata (dataclass, dict or JSON form).
+
+    Args:
+        metadata: DocumentMetadata, metadata dict, or None
+
+    Returns:
+        EntityScanResult if the document was scanned at extraction time
+    """
+    if metadata is None:
+        return None
+    scan = (
+        metadata.get("entity_scan")
+        if isinstance(metadata, dict)
+        else getattr(metadata, "entity_scan", None)
+    )
+    if isinstance(scan, dict):
+        try:
+            return EntityScanResult.from_dict(scan)
+        except (KeyError, TypeError, ValueError):
+            return None
+    return scan if isinstance(scan, EntityScanResult) else None
+
+
+_SCANNER = EntityScanner()
+
+
+def get_entity_scanner() -> EntityScanner:
+    """Get the shared entity scanner (stateless, safe to use from any thread)."""
+    return _SCANNER
+
+
+def scan_entities(text: str) -> EntityScanResult:
+    """Scan text with the shared scanner."""
+    return _SCANNER.scan(text)
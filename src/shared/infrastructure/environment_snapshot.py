@@ -0,0 +1,358 @@
+"""
+Environment Snapshot - Cached Probing of External Tools and Hardware
+
+Probes that spawn subprocesses or walk the filesystem (dependency paths and
+versions, CPU brand, GPU) run once, concurrently and each under a deadline.
+The results persist in the user config directory and are shared by the
+hardware detector, the model service and the content processors until they
+expire or the environment fingerprint (platform, PATH, configured dependency
+paths) changes.
+
+Volatile state (free RAM, whether Ollama is serving) is not part of the
+snapshot; callers read it live.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import platform
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .dependency_manager import DependencyManager, get_dependency_manager
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_FILE = "environment.json"
+DEFAULT_TTL_S = 24 * 3600
+PROBE_TIMEOUT_S = 10.0
+PROBED_DEPENDENCIES = ("ollama", "tesseract")
+
+
+@dataclass
+class DependencyInfo:
+    """Resolved external executable."""
+
+    path: Optional[str] = None
+    version: Optional[str] = None
+
+
+@dataclass
+class GPUInfo:
+    """Detected GPU, if any."""
+
+    available: bool = False
+    name: Optional[str] = None
+    memory_gb: Optional[float] = None
+
+
+@dataclass
+class EnvironmentSnapshot:
+    """Results of one probing run."""
+
+    fingerprint: str
+    created_at: float
+    dependencies: Dict[str, DependencyInfo] = field(default_factory=dict)
+    cpu_brand: str = "Unknown CPU"
+    gpu: GPUInfo = field(default_factory=GPUInfo)
+    timed_out: List[str] = field(default_factory=list)  # Probes that missed the deadline
+
+    def dependency_path(self, name: str) -> Optional[str]:
+        """Path of a probed dependency, or None if it was not found."""
+        info = self.dependencies.get(name)
+        return info.path if info else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form for the snapshot file."""
+        return {"version": SNAPSHOT_VERSION, **asdict(self)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EnvironmentSnapshot":
+        """Rebuild a snapshot read from the snapshot file."""
+        return cls(
+            fingerprint=data["fingerprint"],
+            created_at=data["created_at"],
+            dependencies={
+                name: DependencyInfo(**info) for name, info in data["dependencies"].items()
+            },
+            cpu_brand=data["cpu_brand"],
+            gpu=GPUInfo(**data["gpu"]),
+            timed_out=list(data.get("timed_out", [])),
+        )
+
+
+class EnvironmentProbe:
+    """
+    Runs environment probes concurrently and caches the snapshot in memory and on disk.
+
+    A snapshot is reused while it is younger than the TTL, its fingerprint
+    matches, every dependency path it recorded still exists and no dependency it
+    missed has since appeared on PATH. Snapshots with timed-out probes are used
+    for the current run but not persisted.
+    """
+
+    def __init__(
+        self,
+        dependency_manager: Optional[DependencyManager] = None,
+        ttl_s: float = DEFAULT_TTL_S,
+        probe_timeout_s: float = PROBE_TIMEOUT_S,
+    ):
+        """
+        Initialize the probe.
+
+        Args:
+            dependency_manager: Source of dependency paths and the config directory
+            ttl_s: Maximum age of a reused snapshot in seconds
+            probe_timeout_s: Deadline for all probes of one run
+        """
+        self.dependency_manager = dependency_manager or get_dependency_manager()
+        self.ttl_s = ttl_s
+        self.probe_timeout_s = probe_timeout_s
+        self.snapshot_file = Path(self.dependency_manager.config_dir) / SNAPSHOT_FILE
+        self._snapshot: Optional[EnvironmentSnapshot] = None
+        self._lock = threading.Lock()
+
+    def get_snapshot(self, force_refresh: bool = False) -> EnvironmentSnapshot:
+        """
+        Current snapshot, probing only if no valid cached one exists.
+
+        Args:
+            force_refresh: Probe again even if a valid snapshot is cached
+
+        Returns:
+            Environment snapshot
+        """
+        with self._lock:
+            if not force_refresh:
+                if self._snapshot is not None and self._is_valid(self._snapshot):
+                    return self._snapshot
+                stored = self._load()
+                if stored is not None and self._is_valid(stored):
+                    self._snapshot = stored
+                    return stored
+
+            self._snapshot = self._probe()
+            if not self._snapshot.timed_out:
+                self._save(self._snapshot)
+            return self._snapshot
+
+    def invalidate(self) -> None:
+        """Drop the cached snapshot so the next access probes again."""
+        with self._lock:
+            self._snapshot = None
+            try:
+                self.snapshot_file.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logging.warning("Failed to remove environment snapshot: %s", e)
+
+    def fingerprint(self) -> str:
+        """Hash of the inputs that decide what the probes find."""
+        inputs = {
+            "version": SNAPSHOT_VERSION,
+            "platform": [platform.system(), platform.release(), platform.machine()],
+            "path": os.environ.get("PATH", ""),
+            "configured": self.dependency_manager.config,
+        }
+        encoded = json.dumps(inputs, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()[:16]
+
+    def _is_valid(self, snapshot: EnvironmentSnapshot) -> bool:
+        if time.time() - snapshot.created_at > self.ttl_s:
+            return False
+        if snapshot.fingerprint != self.fingerprint():
+            return False
+        # A missing dependency installed into a directory already on PATH leaves the
+        # fingerprint unchanged, so negative results are re-checked with a cheap lookup
+        return all(
+            os.path.exists(info.path) if info.path is not None else shutil.which(name) is None
+            for name, info in snapshot.dependencies.items()
+        )
+
+    def _probe(self) -> EnvironmentSnapshot:
+        # Path lookups read and update the dependency config, so they stay on
+        # this thread; only the slow probes run concurrently
+        paths = {
+            name: self.dependency_manager.find_dependency(name) for name in PROBED_DEPENDENCIES
+        }
+
+        probes: Dict[str, Callable[[], Any]] = {
+            "cpu_brand": _probe_cpu_brand,
+            "gpu": _probe_gpu,
+        }
+        for name, path in paths.items():
+            if path:
+                probes[f"version:{name}"] = (
+                    lambda name=name, path=path: self.dependency_manager._get_version(name, path)
+                )
+
+        executor = ThreadPoolExecutor(max_workers=len(probes), thread_name_prefix="env-probe")
+        futures = {executor.submit(probe): key for key, probe in probes.items()}
+        done, _pending = wait(futures, timeout=self.probe_timeout_s)
+        # Probes past the deadline keep running on their own subprocess timeouts;
+        # cancelled by hand since shutdown(cancel_futures=True) needs Python 3.9
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+        results: Dict[str, Any] = {}
+        timed_out = []
+        for future, key in futures.items():
+            if future not in done:
+                timed_out.append(key)
+                continue
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                logging.debug("Environment probe %s failed: %s", key, e)
+        if timed_out:
+            logging.warning("Environment probes timed out: %s", ", ".join(sorted(timed_out)))
+
+        return EnvironmentSnapshot(
+            fingerprint=self.fingerprint(),
+            created_at=time.time(),
+            dependencies={
+                name: DependencyInfo(path, results.get(f"version:{name}"))
+                for name, path in paths.items()
+            },
+            cpu_brand=results.get("cpu_brand") or "Unknown CPU",
+            gpu=results.get("gpu") or GPUInfo(),
+            timed_out=sorted(timed_out),
+        )
+
+    def _load(self) -> Optional[EnvironmentSnapshot]:
+        if not self.snapshot_file.exists():
+            return None
+        try:
+            with open(self.snapshot_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != SNAPSHOT_VERSION:
+                return None
+            return EnvironmentSnapshot.from_dict(data)
+        except (json.JSONDecodeError, OSError, KeyError, TypeError) as e:
+            logging.warning("Failed to load environment snapshot: %s", e)
+            return None
+
+    def _save(self, snapshot: EnvironmentSnapshot) -> None:
+        temp_file = self.snapshot_file.with_suffix(".tmp")
+        try:
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(snapshot.to_dict(), f, indent=2)
+            os.replace(temp_file, self.snapshot_file)
+        except OSError as e:
+            logging.warning("Failed to save environment snapshot: %s", e)
+
+
+def _probe_cpu_brand() -> str:
+    """CPU model name."""
+    system = platform.system()
+    if system == "Windows":
+        try:
+            import wmi  # type: ignore
+
+            for processor in wmi.WMI().Win32_Processor():
+                return processor.Name.strip()
+        except Exception:
+            pass
+    elif system == "Darwin":
+        from .security import run_system_command_safe
+
+        result = run_system_command_safe(
+            ["sysctl", "-n", "machdep.cpu.brand_string"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            check=False,
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip()
+    else:
+        try:
+            with open("/proc/cpuinfo", "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith("model name"):
+                        return line.split(":")[1].strip()
+        except OSError:
+            pass
+    return platform.processor() or "Unknown CPU"
+
+
+def _probe_gpu() -> GPUInfo:
+    """GPU presence, name and memory, trying the most precise source first."""
+    from .security import run_system_command_safe
+
+    def run(command: List[str], timeout: float = 5):
+        try:
+            return run_system_command_safe(
+                command, capture_output=True, text=True, timeout=timeout, check=False
+            )
+        except Exception:
+            return None  # Not installed or not in a trusted location
+
+    # NVIDIA: nvidia-smi reports name and memory on every platform
+    result = run(["nvidia-smi", "--query-gpu=memory.total,name", "--format=csv,noheader,nounits"])
+    if result is not None and result.returncode == 0 and result.stdout.strip():
+        parts = result.stdout.strip().split("\n")[0].split(", ")
+        if len(parts) >= 2:
+            try:
+                return GPUInfo(True, parts[1].strip(), float(parts[0]) / 1024)
+            except ValueError:
+                return GPUInfo(True, parts[1].strip())
+
+    try:
+        import GPUtil  # type: ignore
+
+        gpus = GPUtil.getGPUs()
+        if gpus:
+            return GPUInfo(True, f"NVIDIA {gpus[0].name}", gpus[0].memoryTotal / 1024)
+    except Exception:
+        pass
+
+    system = platform.system()
+    if system == "Linux":
+        if os.path.exists("/proc/driver/nvidia/version"):
+            return GPUInfo(True, "NVIDIA GPU (detected)")
+        result = run(["lspci"])
+        if result is not None and result.returncode == 0:
+            devices = result.stdout.lower()
+            if "amd" in devices and ("vga" in devices or "display" in devices):
+                return GPUInfo(True, "AMD GPU")
+        if os.path.exists("/dev/dri"):
+            return GPUInfo(True, "GPU (detected)")
+    elif system == "Darwin":
+        result = run(["system_profiler", "SPDisplaysDataType"], timeout=10)
+        if result is not None and result.returncode == 0 and "GPU" in result.stdout:
+            return GPUInfo(True, "macOS GPU (detected)")
+    elif system == "Windows":
+        result = run(["wmic", "path", "win32_VideoController", "get", "name"], timeout=10)
+        if result is not None and result.returncode == 0:
+            for line in result.stdout.strip().split("\n"):
+                line = line.strip()
+                if line and "Name" not in line and "Microsoft Basic" not in line:
+                    return GPUInfo(True, line)
+    return GPUInfo()
+
+
+# Global instance for easy access
+_environment_probe = None
+_environment_probe_lock = threading.Lock()
+
+
+def get_environment_probe() -> EnvironmentProbe:
+    """Get or create the global environment probe."""
+    global _environment_probe
+    with _environment_probe_lock:
+        if _environment_probe is None:
+            _environment_probe = EnvironmentProbe()
+        return _environment_probe
+
+
+def get_environment_snapshot(force_refresh: bool = False) -> EnvironmentSnapshot:
+    """Shortcut for ``get_environment_probe().get_snapshot()``."""
+    return get_environment_probe().get_snapshot(force_refresh)
@@ -18,14 +18,6 @@ except ImportError:
     psutil = None  # type: ignore
     HAVE_PSUTIL = False
 
-try:
-    import GPUtil  # type: ignore
-
-    HAVE_GPUTIL = True
-except ImportError:
-    GPUtil = None  # type: ignore
-    HAVE_GPUTIL = False
-
 
 @dataclass
 class SystemInfo:
@@ -171,90 +163,11 @@ class HardwareDetector:
         return 8.0
 
     def _detect_gpu(self) -> Tuple[bool, Optional[str]]:
-        """Detect GPU availability (basic detection)."""
-        gpu_info = None
-        has_gpu = False
-
-        try:
-            # Try nvidia-ml-py if available (for NVIDIA GPUs)
-            if HAVE_GPUTIL and GPUtil is not None:
-                gpus = GPUtil.getGPUs()
-                if gpus:
-                    has_gpu = True
-                    gpu_info = f"NVIDIA {gpus[0].name}"
-                    return has_gpu, gpu_info
-
-            # Try platform-specific detection
-            if platform.system() == "Linux":
-                # Check for GPU devices
-                gpu_paths = ["/proc/driver/nvidia/version", "/dev/dri"]
-                for path in gpu_paths:
-                    if os.path.exists(path):
-                        has_gpu = True
-                        if "nvidia" in path.lower():
-                            gpu_info = "NVIDIA GPU (detected)"
-                        else:
-                            gpu_info = "GPU (detected)"
-                        break
+        """GPU availability from the shared environment snapshot."""
+        from .environment_snapshot import get_environment_snapshot
 
-            elif platform.system() == "Darwin":  # macOS
-                # macOS always has integrated graphics, check for discrete
-                try:
-                    from .security import run_system_command_safe
-
-                    result = run_system_command_safe(
-                        ["system_profiler", "SPDisplaysDataType"],
-                        capture_output=True,
-                        text=True,
-                        timeout=10,
-                    )
-                    if result.returncode == 0 and "GPU" in result.stdout:
-                        has_gpu = True
-                        gpu_info = "macOS GPU (detected)"
-                except (Exception, FileNotFoundError):
-                    pass
-
-            elif platform.system() == "Windows":
-                # Check for common GPU registry entries or wmic
-                has_gpu, gpu_info = self._detect_windows_gpu_internal()
-                if has_gpu:
-                    return has_gpu, gpu_info
-
-        except (ImportError, OSError, PermissionError) as e:
-            # Log specific failures for security monitoring
-            import logging
-
-            logger = logging.getLogger(__name__)
-            logger.warning("GPU detection failed: %s: %s", type(e).__name__, e)
-        except Exception as e:
-            # Log unexpected exceptions for security monitoring
-            import logging
-
-            logger = logging.getLogger(__name__)
-            logger.error("Unexpected error in GPU detection: %s: %s", type(e).__name__, e)
-
-        return has_gpu, gpu_info
-
-    def _detect_windows_gpu_internal(self) -> Tuple[bool, Optional[str]]:
-        """Internal helper to detect Windows GPU."""
-        try:
-            from .security import run_system_command_safe
-
-            result = run_system_command_safe(
-                ["wmic", "path", "win32_VideoController", "get", "name"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0:
-                lines = result.stdout.strip().split("\n")
-                for line in lines:
-                    line = line.strip()
-                    if line and "Name" not in line and "Microsoft Basic" not in line:
-                        return True, line
-        except (Exception, FileNotFoundError):
-            pass
-        return False, None
+        gpu = get_environment_snapshot().gpu
+        return gpu.available, gpu.name
 
     def get_recommended_models(self) -> List[ModelRecommendation]:
         """Get recommended models based on detected hardware."""
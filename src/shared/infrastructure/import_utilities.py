@@ -2,11 +2,17 @@
 Content Tamer AI - Import Management Utilities
 
 Centralized import handling to eliminate try/except ImportError boilerplate.
+Also provides the helpers that keep startup light: availability checks that
+do not import the module, and package exports imported on first access.
 """
 
+import importlib
+import importlib.util
 import os
 import sys
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+
+_RAISE = object()
 
 
 def safe_import_with_fallback(
@@ -118,3 +124,60 @@ def import_with_error_context(module_name: str, context: str = ""):
             error_msg += ". Try running from the project root directory."
 
         raise ImportError(error_msg) from e
+
+
+def module_available(module_name: str) -> bool:
+    """
+    Check whether a module can be imported, without importing it.
+
+    Finding the module spec costs a path lookup, while importing SDKs and ML
+    libraries (openai, spaCy, scikit-learn, torch) takes up to seconds.
+
+    Args:
+        module_name: Dotted module name (e.g. 'google.genai')
+
+    Returns:
+        True if the module is installed
+    """
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        # Missing parent package, or a module in sys.modules without a spec
+        return module_name in sys.modules
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str], fallback: Any = _RAISE
+) -> Callable[[str], Any]:
+    """
+    Build a package ``__getattr__`` that imports exported names on first access.
+
+    Usage in a package ``__init__``::
+
+        __getattr__ = lazy_exports(__name__, {"ContentService": ".content_service"})
+
+    Args:
+        package: The package's ``__name__``
+        exports: Mapping of exported name to the (relative) module defining it
+        fallback: Value exported when the defining module cannot be imported
+            (re-raises the ImportError if not given)
+
+    Returns:
+        Module-level ``__getattr__`` function (PEP 562)
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        try:
+            value = getattr(importlib.import_module(module_name, package), name)
+        except ImportError:
+            if fallback is _RAISE:
+                raise
+            value = fallback
+        # Cache on the package so later lookups skip __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
@@ -7,11 +7,13 @@ of local LLM models through Ollama backend.
 
 import json
 import os
+import time
 from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List, Optional
 
-import requests
+# A successful Ollama check is trusted this long (seconds); failures always re-check
+OLLAMA_STATUS_TTL_S = 5.0
 
 
 class ModelStatus(Enum):
@@ -92,7 +94,10 @@ class ModelManager:
         """Initialize ModelManager with Ollama connection."""
         self.host = ollama_host
         self.base_url = f"http://{ollama_host}"
+        import requests  # Deferred: only local-model commands need an HTTP client
+
         self.session = requests.Session()
+        self._ollama_seen_at: Optional[float] = None
 
         # Try to create models directory in user's home
         self.models_dir = self._get_models_directory()
@@ -107,9 +112,17 @@ class ModelManager:
 
     def is_ollama_running(self) -> bool:
         """Check if Ollama service is running."""
+        import requests
+
+        if (
+            self._ollama_seen_at is not None
+            and time.monotonic() - self._ollama_seen_at < OLLAMA_STATUS_TTL_S
+        ):
+            return True
         try:
             response = self.session.get(f"{self.base_url}/api/tags", timeout=5)
             response.raise_for_status()
+            self._ollama_seen_at = time.monotonic()
             return True
         except requests.RequestException:
             return False
@@ -132,6 +145,8 @@ class ModelManager:
 
     def _get_model_status(self, model_name: str) -> ModelStatus:
         """Get the current status of a model."""
+        import requests
+
         from .model_name_mapper import ModelNameMapper
         
         if not self.is_ollama_running():
@@ -179,6 +194,8 @@ class ModelManager:
     
     def download_model(self, model_name: str, progress_callback=None) -> bool:
         """Download a model through Ollama."""
+        import requests
+
         from .model_name_mapper import ModelNameMapper
         
         # Convert to Ollama format for download
@@ -247,6 +264,8 @@ class ModelManager:
 
     def verify_model(self, model_name: str) -> bool:
         """Verify that a model is properly installed and functional."""
+        import requests
+
         if not self.is_ollama_running():
             return False
 
@@ -272,6 +291,8 @@ class ModelManager:
 
     def remove_model(self, model_name: str) -> bool:
         """Remove a model from Ollama."""
+        import requests
+
         from .model_name_mapper import ModelNameMapper
         
         if not self.is_ollama_running():
@@ -5,13 +5,17 @@ Provides input sanitization, validation, and security controls for file processi
 and AI prompt construction to prevent injection attacks and path traversal.
 """
 
+import hashlib
 import logging
+import mmap
 import os
 import re
 import subprocess
+import threading
+from collections import OrderedDict
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Set, cast
+from typing import Any, Dict, Optional, Set, cast
 
 # Security constants
 MAX_CONTENT_LENGTH = 4096  # Reduced from 8000 for safety
@@ -399,7 +403,73 @@ class PDFThreatAnalysis:
         return self.threat_level in [ThreatLevel.MEDIUM, ThreatLevel.HIGH]
 
 
-class PDFAnalyzer:
+class _PDFThreatVerdict:
+    """Threat level and summary from indicator counts (shared by all PDF analyzers)."""
+
+    def _calculate_threat_level(self, indicators: Dict[str, Any]) -> ThreatLevel:
+        """Calculate overall threat level based on indicators."""
+        if "parse_error" in indicators:
+            return ThreatLevel.LOW
+
+        # High threat indicators
+        high_risk_count = 0
+        if indicators.get("javascript", 0) > 0:
+            high_risk_count += 1
+        if indicators.get("launch_action", 0) > 0:
+            high_risk_count += 2  # Launch actions are very suspicious
+        if indicators.get("embedded_files", 0) > 0:
+            high_risk_count += 1
+
+        # Medium threat indicators
+        medium_risk_count = 0
+        if indicators.get("open_action", 0) > 0:
+            medium_risk_count += 1
+        if indicators.get("additional_actions", 0) > 0:
+            medium_risk_count += 1
+        if indicators.get("uri_references", 0) > 0:
+            medium_risk_count += 1
+        if indicators.get("submit_form", 0) > 0:
+            medium_risk_count += 1
+        if indicators.get("xfa_forms", 0) > 0:
+            medium_risk_count += 1
+
+        # Determine threat level
+        if high_risk_count >= 2:
+            return ThreatLevel.HIGH
+        if high_risk_count >= 1:
+            return ThreatLevel.MEDIUM
+        if medium_risk_count >= 3:
+            return ThreatLevel.MEDIUM
+        if medium_risk_count >= 1:
+            return ThreatLevel.LOW
+        return ThreatLevel.SAFE
+
+    def _generate_summary(self, threat_level: ThreatLevel, indicators: Dict[str, Any]) -> str:
+        """Generate human-readable summary of threats detected."""
+        if threat_level == ThreatLevel.SAFE:
+            return "PDF appears safe - no suspicious indicators detected"
+
+        threats = []
+
+        if indicators.get("javascript", 0) > 0:
+            threats.append(f"JavaScript code ({indicators['javascript']} instances)")
+        if indicators.get("launch_action", 0) > 0:
+            threats.append(f"Launch actions ({indicators['launch_action']} instances)")
+        if indicators.get("embedded_files", 0) > 0:
+            threats.append(f"Embedded files ({indicators['embedded_files']} instances)")
+        if indicators.get("open_action", 0) > 0:
+            threats.append(f"Auto-open actions ({indicators['open_action']} instances)")
+        if indicators.get("uri_references", 0) > 0:
+            threats.append(f"External URI references ({indicators['uri_references']} instances)")
+        if indicators.get("submit_form", 0) > 0:
+            threats.append(f"Form submissions ({indicators['submit_form']} instances)")
+
+        if threats:
+            return f"Potential threats detected: {', '.join(threats)}"
+        return f"PDF has {threat_level.value} risk indicators"
+
+
+class PDFAnalyzer(_PDFThreatVerdict):
     """Analyzes PDF files for potential security threats using PDFiD."""
 
     def __init__(self):
@@ -524,67 +594,144 @@ class PDFAnalyzer:
 
         return indicators
 
-    def _calculate_threat_level(self, indicators: Dict[str, Any]) -> ThreatLevel:
-        """Calculate overall threat level based on indicators."""
-        if "parse_error" in indicators:
-            return ThreatLevel.LOW
 
-        # High threat indicators
-        high_risk_count = 0
-        if indicators.get("javascript", 0) > 0:
-            high_risk_count += 1
-        if indicators.get("launch_action", 0) > 0:
-            high_risk_count += 2  # Launch actions are very suspicious
-        if indicators.get("embedded_files", 0) > 0:
-            high_risk_count += 1
+# PDF name delimiters (PDF 32000-1 7.2.2) plus whitespace, including NUL
+_PDF_NAME_END = rb"\x00\s()<>\[\]{}/%"
+
+# One pass over the raw file: plain threat names, or any name using #xx escapes
+_PDF_THREAT_NAME_PATTERN = re.compile(
+    rb"/(?:(?P<name>JS|JavaScript|OpenAction|AA|Launch|EmbeddedFile|XFA|URI|SubmitForm)"
+    rb"|(?P<escaped>[^" + _PDF_NAME_END + rb"#]*#[^" + _PDF_NAME_END + rb"]*))"
+    rb"(?![^" + _PDF_NAME_END + rb"])"
+)
+_PDF_HEX_ESCAPE = re.compile(rb"#([0-9A-Fa-f]{2})")
+
+# PDF name -> indicator key (same keys PDFAnalyzer extracts from PDFiD)
+PDF_THREAT_INDICATORS = {
+    b"JS": "javascript",
+    b"JavaScript": "javascript",
+    b"OpenAction": "open_action",
+    b"AA": "additional_actions",
+    b"Launch": "launch_action",
+    b"EmbeddedFile": "embedded_files",
+    b"XFA": "xfa_forms",
+    b"URI": "uri_references",
+    b"SubmitForm": "submit_form",
+}
 
-        # Medium threat indicators
-        medium_risk_count = 0
-        if indicators.get("open_action", 0) > 0:
-            medium_risk_count += 1
-        if indicators.get("additional_actions", 0) > 0:
-            medium_risk_count += 1
-        if indicators.get("uri_references", 0) > 0:
-            medium_risk_count += 1
-        if indicators.get("submit_form", 0) > 0:
-            medium_risk_count += 1
-        if indicators.get("xfa_forms", 0) > 0:
-            medium_risk_count += 1
 
-        # Determine threat level
-        if high_risk_count >= 2:
-            return ThreatLevel.HIGH
-        if high_risk_count >= 1:
-            return ThreatLevel.MEDIUM
-        if medium_risk_count >= 3:
-            return ThreatLevel.MEDIUM
-        if medium_risk_count >= 1:
-            return ThreatLevel.LOW
-        return ThreatLevel.SAFE
+class PDFThreatScanner(_PDFThreatVerdict):
+    """Native PDF threat scanner over a memory-mapped file.
 
-    def _generate_summary(self, threat_level: ThreatLevel, indicators: Dict[str, Any]) -> str:
-        """Generate human-readable summary of threats detected."""
-        if threat_level == ThreatLevel.SAFE:
-            return "PDF appears safe - no suspicious indicators detected"
+    Counts the same action/script name tokens PDFiD reports, including
+    #xx hex-escaped spellings used to hide them, in a single regex pass
+    without parsing the PDF or round-tripping through XML. Verdicts are
+    cached by content hash, so duplicates and re-scans are free.
+    """
 
-        threats = []
+    def __init__(self, cache_size: int = 1024):
+        """Initialize scanner.
 
-        if indicators.get("javascript", 0) > 0:
-            threats.append(f"JavaScript code ({indicators['javascript']} instances)")
-        if indicators.get("launch_action", 0) > 0:
-            threats.append(f"Launch actions ({indicators['launch_action']} instances)")
-        if indicators.get("embedded_files", 0) > 0:
-            threats.append(f"Embedded files ({indicators['embedded_files']} instances)")
-        if indicators.get("open_action", 0) > 0:
-            threats.append(f"Auto-open actions ({indicators['open_action']} instances)")
-        if indicators.get("uri_references", 0) > 0:
-            threats.append(f"External URI references ({indicators['uri_references']} instances)")
-        if indicators.get("submit_form", 0) > 0:
-            threats.append(f"Form submissions ({indicators['submit_form']} instances)")
+        Args:
+            cache_size: Maximum number of cached verdicts (least recently used evicted)
+        """
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, PDFThreatAnalysis]" = OrderedDict()
+        self._lock = threading.Lock()
 
-        if threats:
-            return f"Potential threats detected: {', '.join(threats)}"
-        return f"PDF has {threat_level.value} risk indicators"
+    def analyze_pdf(self, file_path: str) -> PDFThreatAnalysis:
+        """
+        Analyze PDF file for potential security threats.
+
+        Args:
+            file_path: Path to PDF file to analyze
+
+        Returns:
+            PDFThreatAnalysis with threat level and details
+        """
+        try:
+            with open(file_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return self._analyze_buffer(b"")
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return self._analyze_buffer(data)
+        except (OSError, ValueError) as e:
+            return PDFThreatAnalysis(
+                threat_level=ThreatLevel.LOW,
+                indicators={"analysis_error": str(e)},
+                summary=f"Analysis failed: {str(e)}",
+            )
+
+    def scan_indicators(self, data) -> Dict[str, int]:
+        """Count threat indicators in raw PDF bytes.
+
+        Args:
+            data: PDF content (bytes or a memory map)
+
+        Returns:
+            Indicator counts keyed like PDFiD-derived indicators, plus
+            ``hex_escaped_names`` for obfuscated spellings
+        """
+        indicators = dict.fromkeys(PDF_THREAT_INDICATORS.values(), 0)
+        indicators["hex_escaped_names"] = 0
+
+        for match in _PDF_THREAT_NAME_PATTERN.finditer(data):
+            name = match.group("name")
+            if name is None:
+                name = _PDF_HEX_ESCAPE.sub(
+                    lambda m: bytes([int(m.group(1), 16)]), match.group("escaped")
+                )
+                if name not in PDF_THREAT_INDICATORS:
+                    continue
+                indicators["hex_escaped_names"] += 1
+            indicators[PDF_THREAT_INDICATORS[name]] += 1
+
+        return indicators
+
+    def _analyze_buffer(self, data) -> PDFThreatAnalysis:
+        """Analyze content, reusing the cached verdict for identical content."""
+        content_hash = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            cached = self._cache.get(content_hash)
+            if cached is not None:
+                self._cache.move_to_end(content_hash)
+                return cached
+
+        indicators = self.scan_indicators(data)
+        threat_level = self._calculate_threat_level(indicators)
+        analysis = PDFThreatAnalysis(
+            threat_level, indicators, self._generate_summary(threat_level, indicators)
+        )
+
+        with self._lock:
+            self._cache[content_hash] = analysis
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return analysis
+
+
+def skip_high_threat_pdfs(analysis: PDFThreatAnalysis) -> bool:
+    """Threat policy that skips extraction for HIGH threat PDFs.
+
+    Args:
+        analysis: Threat analysis of the file about to be extracted
+
+    Returns:
+        True if extraction should proceed
+    """
+    return analysis.threat_level != ThreatLevel.HIGH
+
+
+# Module-level scanner so the verdict cache is shared across processors
+_pdf_threat_scanner: Optional[PDFThreatScanner] = None
+
+
+def get_pdf_threat_scanner() -> PDFThreatScanner:
+    """Get global PDF threat scanner instance."""
+    global _pdf_threat_scanner  # pylint: disable=global-statement
+    if _pdf_threat_scanner is None:
+        _pdf_threat_scanner = PDFThreatScanner()
+    return _pdf_threat_scanner
 
 
 # ============================================================================
@@ -2,16 +2,29 @@
 Text processing utilities for content handling.
 """
 
-import tiktoken
+import functools
 
-# Global encoding instance
-ENCODING = tiktoken.get_encoding("cl100k_base")
+
+@functools.lru_cache(maxsize=None)
+def get_encoding():
+    """Shared tiktoken encoding, loaded on first use (tiktoken is slow to import)."""
+    import tiktoken
+
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def __getattr__(name):
+    # Keeps ``from text_utilities import ENCODING`` working without an eager load
+    if name == "ENCODING":
+        return get_encoding()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def truncate_content_to_token_limit(content: str, max_tokens: int) -> str:
     """Ensures the text sent to the AI does not exceed its maximum token limit."""
     try:
-        token_count = len(ENCODING.encode(content))
+        encoding = get_encoding()
+        token_count = len(encoding.encode(content))
         if token_count <= max_tokens:
             return content
 
@@ -20,14 +33,14 @@ def truncate_content_to_token_limit(content: str, max_tokens: int) -> str:
             bytes_per_token = len(content.encode("utf-8")) / token_count
             target_bytes = int(max_tokens * bytes_per_token * 0.9)
             content = content[:target_bytes]
-            token_count = len(ENCODING.encode(content))
+            token_count = len(encoding.encode(content))
 
         # Fine-tune the truncation to get as close to the token limit as possible.
         if token_count > max_tokens:
             low, high = 0, len(content)
             while high - low > 100:
                 mid = (low + high) // 2
-                if len(ENCODING.encode(content[:mid])) <= max_tokens:
+                if len(encoding.encode(content[:mid])) <= max_tokens:
                     low = mid
                 else:
                     high = mid
@@ -0,0 +1,216 @@
+"""
+Tracing
+
+Lightweight stage spans for profiling a processing run.
+
+Code marks stages with ``with span("extract.ocr_page", page=3):``. Spans are
+only recorded while a tracer is active (``--profile``); otherwise ``span``
+returns a shared no-op context manager, so instrumentation costs one global
+lookup. A finished run exports to the Chrome trace event format (load in
+chrome://tracing or https://ui.perfetto.dev) and summarizes each stage as
+count, p50/p95/p99 latency and throughput.
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+
+@dataclass
+class SpanRecord:
+    """One completed span."""
+
+    name: str
+    category: str
+    start_ns: int  # time.perf_counter_ns() at entry
+    duration_ns: int
+    thread_id: int
+    args: Dict[str, Any] = field(default_factory=dict)
+
+
+class Tracer:
+    """Thread-safe collector of spans for one run."""
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self.started_ns = time.perf_counter_ns()
+        self.stopped_ns: Optional[int] = None
+        self._spans: List[SpanRecord] = []
+        self._thread_names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, category: str = "", **args: Any) -> Iterator[Dict[str, Any]]:
+        """Time the enclosed block. Yields the args dict, so results can be attached."""
+        start = time.perf_counter_ns()
+        try:
+            yield args
+        finally:
+            self.record(name, category or name.split(".", 1)[0], start, args)
+
+    def record(self, name: str, category: str, start_ns: int, args: Dict[str, Any]) -> None:
+        """Record a span that started at ``start_ns`` and ends now."""
+        end = time.perf_counter_ns()
+        thread = threading.current_thread()
+        with self._lock:
+            self._thread_names.setdefault(thread.ident, thread.name)
+            self._spans.append(
+                SpanRecord(name, category, start_ns, end - start_ns, thread.ident, args)
+            )
+
+    @property
+    def spans(self) -> List[SpanRecord]:
+        """Recorded spans in completion order."""
+        with self._lock:
+            return list(self._spans)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Chrome trace event format ("X" complete events, times in microseconds)."""
+        with self._lock:
+            spans = list(self._spans)
+            thread_names = dict(self._thread_names)
+
+        events: List[Dict[str, Any]] = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": self.pid,
+                "tid": tid,
+                "args": {"name": thread_name},
+            }
+            for tid, thread_name in thread_names.items()
+        ]
+        for record in spans:
+            events.append(
+                {
+                    "name": record.name,
+                    "cat": record.category,
+                    "ph": "X",
+                    "ts": (record.start_ns - self.started_ns) / 1000,
+                    "dur": record.duration_ns / 1000,
+                    "pid": self.pid,
+                    "tid": record.thread_id,
+                    "args": {key: _json_safe(value) for key, value in record.args.items()},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str) -> str:
+        """Write the trace as JSON. Returns the path written."""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
+        return path
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage statistics, in order of first occurrence.
+
+        Returns:
+            Mapping of span name to count, total_s, p50_ms, p95_ms, p99_ms and
+            per_second (completed spans per second of traced wall time)
+        """
+        spans = self.spans
+        end_ns = self.stopped_ns or time.perf_counter_ns()
+        wall_s = max((end_ns - self.started_ns) / 1e9, 1e-9)
+
+        durations: Dict[str, List[int]] = {}
+        for record in spans:
+            durations.setdefault(record.name, []).append(record.duration_ns)
+
+        stats: Dict[str, Dict[str, float]] = {}
+        for name, values in durations.items():
+            values.sort()
+            stats[name] = {
+                "count": len(values),
+                "total_s": round(sum(values) / 1e9, 6),
+                "p50_ms": round(_percentile(values, 50) / 1e6, 3),
+                "p95_ms": round(_percentile(values, 95) / 1e6, 3),
+                "p99_ms": round(_percentile(values, 99) / 1e6, 3),
+                "per_second": round(len(values) / wall_s, 3),
+            }
+        return stats
+
+    def format_summary(self) -> List[str]:
+        """Summary as aligned text lines for display."""
+        stats = self.summary()
+        if not stats:
+            return ["No spans recorded"]
+        width = max(len(name) for name in stats)
+        lines = [
+            f"{'stage':<{width}}  {'count':>6}  {'total s':>9}  {'p50 ms':>9}  "
+            f"{'p95 ms':>9}  {'p99 ms':>9}  {'per s':>8}"
+        ]
+        for name, s in stats.items():
+            lines.append(
+                f"{name:<{width}}  {s['count']:>6}  {s['total_s']:>9.3f}  {s['p50_ms']:>9.2f}  "
+                f"{s['p95_ms']:>9.2f}  {s['p99_ms']:>9.2f}  {s['per_second']:>8.2f}"
+            )
+        return lines
+
+
+def _percentile(sorted_values: List[int], percent: float) -> float:
+    """Linear-interpolated percentile of pre-sorted values."""
+    if len(sorted_values) == 1:
+        return float(sorted_values[0])
+    position = (len(sorted_values) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = position - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+
+
+def _json_safe(value: Any) -> Any:
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+_NULL_SPAN = contextlib.nullcontext()
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def span(name: str, category: str = "", **args: Any):
+    """Context manager timing a stage; a no-op unless tracing is active.
+
+    Args:
+        name: Stage name, dotted by component (e.g. "ai.attempt")
+        category: Trace category (defaults to the first name component)
+        **args: Values shown with the span in the trace viewer
+
+    Yields:
+        The span's args dict for attaching results, or None when tracing is off
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return tracer.span(name, category, **args)
+
+
+def start_tracing() -> Tracer:
+    """Start recording spans process-wide, replacing any active tracer."""
+    global _tracer
+    with _tracer_lock:
+        _tracer = Tracer()
+        return _tracer
+
+
+def stop_tracing() -> Optional[Tracer]:
+    """Stop recording and return the finished tracer (None if tracing was off)."""
+    global _tracer
+    with _tracer_lock:
+        tracer, _tracer = _tracer, None
+    if tracer is not None:
+        tracer.stopped_ns = time.perf_counter_ns()
+    return tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Get the active tracer, if any."""
+    return _tracer
@@ -0,0 +1,412 @@
+"""
+Worker Sizing - Resource-Aware Concurrency Limits
+
+Derives OCR workers, text extraction workers, in-flight AI requests and the
+embedding batch size from the detected cores, free memory and the resident
+footprint of the models a run keeps loaded (local LLM served by Ollama,
+spaCy, sentence-transformers). While a run progresses the limits follow the
+observed memory use (process RSS, free RAM) and CPU saturation. Limits set
+explicitly, e.g. by CLI flags, are never changed.
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, fields, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+from .hardware_detector import HardwareDetector, SystemInfo
+
+try:
+    import psutil
+
+    HAVE_PSUTIL = True
+except ImportError:
+    psutil = None  # type: ignore
+    HAVE_PSUTIL = False
+
+# Approximate resident memory per worker and per loaded model (GB)
+OCR_WORKER_GB = 0.4  # Tesseract on a 300 dpi page plus the rendered image
+EXTRACTION_WORKER_GB = 0.15  # Open PyMuPDF document and extracted text
+SPACY_MODEL_GB = 0.3
+EMBEDDING_MODEL_GB = 0.5
+EMBEDDING_ITEM_GB = 0.005  # Activations per text in a batch at 192 tokens
+DEFAULT_LOCAL_MODEL_GB = 4.0  # Local models missing from the model catalog
+PROCESS_BASE_GB = 0.5  # Interpreter, libraries and pipeline state
+
+# Share of the memory budget each stage may use
+OCR_MEMORY_SHARE = 0.6
+EXTRACTION_MEMORY_SHARE = 0.2
+EMBEDDING_MEMORY_SHARE = 0.2
+
+RESERVE_FRACTION = 0.1  # Of total RAM, left to the OS and page cache
+MIN_RESERVE_GB = 1.0
+
+# PyMuPDF holds the GIL for most of a text extraction, so more threads stop paying off
+MAX_EXTRACTION_WORKERS = 8
+REMOTE_AI_IN_FLIGHT = 8
+EMBEDDING_BATCH_SIZES = (8, 16, 32, 64)
+
+CPU_SATURATED_PERCENT = 95.0
+CPU_IDLE_PERCENT = 60.0
+ADJUST_INTERVAL_S = 2.0
+HISTORY_LIMIT = 100
+
+
+@dataclass(frozen=True)
+class WorkerLimits:
+    """Concurrency limits for one run."""
+
+    ocr_workers: int  # Background threads for OCR-heavy documents (0 = inline)
+    extraction_workers: int  # Threads extracting text documents ahead of the AI stage
+    ai_in_flight: int  # Concurrent AI requests
+    embedding_batch_size: int
+
+    def to_dict(self) -> Dict[str, int]:
+        """Limits as a plain dictionary (for results metadata)."""
+        return asdict(self)
+
+
+LIMIT_NAMES = tuple(f.name for f in fields(WorkerLimits))
+
+
+@dataclass
+class Workload:
+    """Models a run keeps resident next to its workers."""
+
+    local_model: Optional[str] = None  # Ollama model, when the local provider is used
+    spacy: bool = False
+    embeddings: bool = False
+
+    def footprint_gb(self) -> float:
+        """Resident memory of all loaded models."""
+        footprint = self.in_process_gb()
+        if self.local_model:
+            footprint += local_model_footprint_gb(self.local_model)
+        return footprint
+
+    def in_process_gb(self) -> float:
+        """Resident memory of the models loaded into this process (not the Ollama server)."""
+        footprint = 0.0
+        if self.spacy:
+            footprint += SPACY_MODEL_GB
+        if self.embeddings:
+            footprint += EMBEDDING_MODEL_GB
+        return footprint
+
+
+@dataclass
+class ResourceSample:
+    """Observed resource use at one point of a run."""
+
+    rss_gb: float  # This process and its children (OCR subprocesses)
+    available_gb: float
+    cpu_percent: float  # System-wide, since the previous sample
+
+
+def local_model_footprint_gb(model_name: str) -> float:
+    """Memory requirement of a local model from the model catalog."""
+    from .model_manager import ModelManager
+    from .model_name_mapper import ModelNameMapper
+
+    target = ModelNameMapper.to_ollama_format(model_name)
+    for name, spec in ModelManager.MODEL_SPECS.items():
+        if ModelNameMapper.to_ollama_format(name) == target:
+            return spec.memory_requirement_gb
+    return DEFAULT_LOCAL_MODEL_GB
+
+
+def sample_resources() -> Optional[ResourceSample]:
+    """Current process RSS, free memory and CPU use, or None without psutil."""
+    if not HAVE_PSUTIL or psutil is None:
+        return None
+    try:
+        process = psutil.Process()
+        rss = process.memory_info().rss
+        for child in process.children(recursive=True):
+            try:
+                rss += child.memory_info().rss
+            except psutil.Error:
+                pass  # Exited since listing
+        return ResourceSample(
+            rss_gb=rss / (1024**3),
+            available_gb=psutil.virtual_memory().available / (1024**3),
+            cpu_percent=psutil.cpu_percent(interval=None),
+        )
+    except psutil.Error as e:
+        logging.debug("Resource sampling failed: %s", e)
+        return None
+
+
+class ConcurrencyLimit:
+    """
+    Semaphore whose limit can change while it is held.
+
+    Lowering the limit never interrupts holders; new acquirers wait until
+    enough holders have released.
+    """
+
+    def __init__(self, limit: int):
+        """
+        Initialize the limit.
+
+        Args:
+            limit: Maximum concurrent holders (at least 1)
+        """
+        self._limit = max(1, limit)
+        self._active = 0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current maximum of concurrent holders."""
+        return self._limit
+
+    @property
+    def active(self) -> int:
+        """Current number of holders."""
+        return self._active
+
+    def set_limit(self, limit: int) -> None:
+        """Change the limit, waking waiters if it grew."""
+        with self._condition:
+            self._limit = max(1, limit)
+            self._condition.notify_all()
+
+    def acquire(self) -> None:
+        """Wait for a free slot and take it."""
+        with self._condition:
+            while self._active >= self._limit:
+                self._condition.wait()
+            self._active += 1
+
+    def release(self) -> None:
+        """Give a slot back."""
+        with self._condition:
+            self._active -= 1
+            self._condition.notify()
+
+    def __enter__(self) -> "ConcurrencyLimit":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.release()
+
+
+class WorkerSizingPolicy:
+    """
+    Plans worker limits from hardware and workload, and adapts them at runtime.
+
+    ``plan()`` sets the starting limits, which are also the ceiling for later
+    growth. ``adjust()`` halves the memory-heavy stages when RSS exceeds the
+    planned budget or free memory drops below the reserve, sheds an OCR worker
+    when the CPU is saturated, and grows back towards the ceiling while the
+    CPU is idle.
+    """
+
+    def __init__(
+        self,
+        system_info: Optional[SystemInfo] = None,
+        overrides: Optional[Dict[str, Optional[int]]] = None,
+        workload: Optional[Workload] = None,
+    ):
+        """
+        Initialize the policy and plan the starting limits.
+
+        Args:
+            system_info: Detected hardware (detected if None)
+            overrides: Fixed limits by WorkerLimits field name; None values are ignored
+            workload: Models the run loads (none if None)
+
+        Raises:
+            ValueError: If an override names an unknown limit or is negative
+        """
+        self.system_info = system_info or HardwareDetector().detect_system_info()
+        self.overrides = {
+            name: value for name, value in (overrides or {}).items() if value is not None
+        }
+        unknown = sorted(set(self.overrides) - set(LIMIT_NAMES))
+        if unknown:
+            raise ValueError(f"Unknown worker limits: {', '.join(unknown)}")
+        negative = sorted(name for name, value in self.overrides.items() if value < 0)
+        if negative:
+            raise ValueError(f"Worker limits must not be negative: {', '.join(negative)}")
+
+        self._lock = threading.Lock()
+        self.history: List[Tuple[float, WorkerLimits]] = []
+        self.workload = Workload()
+        self.memory_budget_gb = 0.0
+        self.ceiling = self.limits = self.plan(workload)
+
+    @property
+    def reserve_gb(self) -> float:
+        """Memory left free for the OS and page cache."""
+        return max(MIN_RESERVE_GB, self.system_info.total_ram_gb * RESERVE_FRACTION)
+
+    def plan(self, workload: Optional[Workload] = None) -> WorkerLimits:
+        """
+        Compute starting limits for a workload.
+
+        Args:
+            workload: Models the run loads (none if None)
+
+        Returns:
+            Planned limits, overrides applied
+        """
+        workload = workload or Workload()
+        cores = max(1, self.system_info.cpu_count)
+        models_gb = workload.footprint_gb()
+        budget = self.system_info.available_ram_gb - self.reserve_gb - models_gb
+        if budget <= 0:
+            logging.warning(
+                "Models need %.1fGB but only %.1fGB is free; running one worker per stage",
+                models_gb,
+                self.system_info.available_ram_gb,
+            )
+        budget = max(budget, 0.0)
+
+        # OCR is CPU bound: one engine per core, keeping a core for the pipeline
+        # loop, or half the cores when a local model is inferring alongside
+        ocr_cores = cores // 2 if workload.local_model else cores - 1
+        ocr_workers = min(ocr_cores, int(budget * OCR_MEMORY_SHARE / OCR_WORKER_GB))
+        extraction_workers = min(
+            cores,
+            MAX_EXTRACTION_WORKERS,
+            int(budget * EXTRACTION_MEMORY_SHARE / EXTRACTION_WORKER_GB),
+        )
+        # Ollama serves OLLAMA_NUM_PARALLEL requests per model at once, by default one
+        ai_in_flight = _ollama_num_parallel() if workload.local_model else REMOTE_AI_IN_FLIGHT
+        batch_sizes = [
+            size
+            for size in EMBEDDING_BATCH_SIZES
+            if size * EMBEDDING_ITEM_GB <= budget * EMBEDDING_MEMORY_SHARE
+        ]
+
+        limits = WorkerLimits(
+            ocr_workers=max(1, ocr_workers),
+            extraction_workers=max(1, extraction_workers),
+            ai_in_flight=max(1, ai_in_flight),
+            embedding_batch_size=batch_sizes[-1] if batch_sizes else EMBEDDING_BATCH_SIZES[0],
+        )
+        limits = replace(limits, **self.overrides)
+
+        with self._lock:
+            self.workload = workload
+            # RSS covers this process and its children, so the Ollama server is not counted
+            self.memory_budget_gb = PROCESS_BASE_GB + workload.in_process_gb() + budget
+            self.ceiling = self.limits = limits
+            self._record(limits)
+        logging.info(
+            "Worker limits for %d cores, %.1fGB free: %s",
+            cores,
+            self.system_info.available_ram_gb,
+            limits,
+        )
+        return limits
+
+    def adjust(self, sample: Optional[ResourceSample] = None) -> WorkerLimits:
+        """
+        Adapt the current limits to observed resource use.
+
+        Args:
+            sample: Observed resource use (sampled now if None)
+
+        Returns:
+            Current limits after the adjustment
+        """
+        sample = sample or sample_resources()
+        if sample is None:
+            return self.limits
+
+        with self._lock:
+            current, ceiling = self.limits, self.ceiling
+            if sample.available_gb < self.reserve_gb or sample.rss_gb > self.memory_budget_gb:
+                # Shrink memory-heavy stages before the OS starts swapping
+                changes = {
+                    "ocr_workers": max(1, current.ocr_workers // 2),
+                    "extraction_workers": max(1, current.extraction_workers // 2),
+                    "embedding_batch_size": max(
+                        EMBEDDING_BATCH_SIZES[0], current.embedding_batch_size // 2
+                    ),
+                }
+            elif sample.cpu_percent >= CPU_SATURATED_PERCENT:
+                changes = {"ocr_workers": max(1, current.ocr_workers - 1)}
+            elif (
+                sample.cpu_percent < CPU_IDLE_PERCENT
+                and sample.available_gb > self.reserve_gb + OCR_WORKER_GB
+            ):
+                changes = {
+                    "ocr_workers": min(ceiling.ocr_workers, current.ocr_workers + 1),
+                    "extraction_workers": min(
+                        ceiling.extraction_workers, current.extraction_workers + 1
+                    ),
+                    "embedding_batch_size": min(
+                        ceiling.embedding_batch_size, current.embedding_batch_size * 2
+                    ),
+                }
+            else:
+                changes = {}
+
+            changes = {
+                name: value for name, value in changes.items() if name not in self.overrides
+            }
+            self.limits = replace(current, **changes)
+            if self.limits != current:
+                logging.debug(
+                    "Worker limits adjusted (rss %.1fGB, free %.1fGB, cpu %.0f%%): %s",
+                    sample.rss_gb,
+                    sample.available_gb,
+                    sample.cpu_percent,
+                    self.limits,
+                )
+                self._record(self.limits)
+            return self.limits
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Planned and current limits with their change history."""
+        with self._lock:
+            return {
+                "cpu_count": self.system_info.cpu_count,
+                "available_ram_gb": round(self.system_info.available_ram_gb, 2),
+                "memory_budget_gb": round(self.memory_budget_gb, 2),
+                "overrides": dict(self.overrides),
+                "planned": self.ceiling.to_dict(),
+                "current": self.limits.to_dict(),
+                "history": [
+                    {"time": timestamp, **limits.to_dict()} for timestamp, limits in self.history
+                ],
+            }
+
+    def _record(self, limits: WorkerLimits) -> None:
+        self.history.append((time.time(), limits))
+        del self.history[:-HISTORY_LIMIT]
+
+
+def _ollama_num_parallel() -> int:
+    try:
+        return max(1, int(os.environ.get("OLLAMA_NUM_PARALLEL", "1")))
+    except ValueError:
+        return 1
+
+
+# Global instance for easy access
+_worker_sizing: Optional[WorkerSizingPolicy] = None
+_worker_sizing_lock = threading.Lock()
+
+
+def get_worker_sizing() -> WorkerSizingPolicy:
+    """Get the policy of the current run, creating a default one if none was set."""
+    global _worker_sizing
+    with _worker_sizing_lock:
+        if _worker_sizing is None:
+            _worker_sizing = WorkerSizingPolicy()
+        return _worker_sizing
+
+
+def set_worker_sizing(policy: Optional[WorkerSizingPolicy]) -> None:
+    """Make a policy the one components consult for their limits (None resets)."""
+    global _worker_sizing
+    with _worker_sizing_lock:
+        _worker_sizing = policy
@@ -0,0 +1,12 @@
+"""
+Performance benchmarks for Content Tamer AI.
+
+Run with ``python -m tests.benchmarks run`` from the repository root; see
+README.md in this directory.
+"""
+
+import os
+import sys
+
+# Benchmarks import the application the same way the test suite does
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
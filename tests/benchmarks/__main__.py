@@ -0,0 +1,71 @@
+"""
+Benchmark command line.
+
+    python -m tests.benchmarks run [--scale full|smoke] [--only NAME ...] [--output FILE]
+                                   [--baseline FILE] [--threshold 0.15]
+    python -m tests.benchmarks compare CURRENT BASELINE [--threshold 0.15]
+
+``compare`` (and ``run --baseline``) exit with status 1 when any metric got
+worse than the threshold allows.
+"""
+
+import argparse
+import logging
+import sys
+
+from .harness import (
+    DEFAULT_THRESHOLD,
+    compare_results,
+    format_comparison,
+    load_results,
+    save_results,
+)
+from .scenarios import SCALES, SCENARIOS, run_benchmarks
+
+
+def _compare(current_path: str, baseline_path: str, threshold: float) -> int:
+    current, baseline = load_results(current_path), load_results(baseline_path)
+    comparisons = compare_results(current, baseline, threshold)
+    for line in format_comparison(comparisons, threshold):
+        print(line)
+    return 1 if any(c.regression for c in comparisons) else 0
+
+
+def main(argv=None) -> int:
+    """Run benchmarks or compare result files."""
+    parser = argparse.ArgumentParser(prog="python -m tests.benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run benchmark scenarios and save results")
+    run.add_argument("--scale", choices=sorted(SCALES), default="full")
+    run.add_argument("--only", nargs="+", choices=sorted(SCENARIOS), metavar="NAME")
+    run.add_argument("--output", default="benchmark-results.json")
+    run.add_argument("--baseline", help="Compare against this results file after the run")
+    run.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    compare = commands.add_parser("compare", help="Flag regressions against a baseline")
+    compare.add_argument("current")
+    compare.add_argument("baseline")
+    compare.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    args = parser.parse_args(argv)
+    # Retries and fallbacks are expected under injected errors; keep output readable
+    logging.basicConfig(level=logging.ERROR)
+
+    if args.command == "compare":
+        return _compare(args.current, args.baseline, args.threshold)
+
+    results = run_benchmarks(args.only, args.scale)
+    save_results(results, args.output, args.scale)
+    for result in results:
+        print(f"{result.name}:")
+        for metric, value in result.metrics.items():
+            print(f"  {metric:<32} {value}")
+    print(f"Results written to {args.output}")
+    if args.baseline:
+        return _compare(args.output, args.baseline, args.threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,271 @@
+"""
+Synthetic Benchmark Corpus
+
+Deterministic document corpus for performance benchmarks. The same spec
+(including its seed) always produces byte-identical files, so timings from
+different runs and machines are comparable.
+
+Document kinds:
+- text_pdf: PDFs with a text layer, page counts drawn from ``page_counts``
+- scan_pdf: image-only PDFs (rendered page images, no text layer)
+- mixed_pdf: alternating text and scanned pages
+- png_photo / jpeg_photo: photographed pages (tinted, slightly rotated)
+- duplicate: byte copies of earlier documents under a different name
+"""
+
+import io
+import os
+import random
+import shutil
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+import fitz
+from PIL import Image, ImageDraw, ImageFont
+
+# Document families with the vocabulary the organization rules key on
+DOCUMENT_TEMPLATES: Dict[str, List[str]] = {
+    "invoice": [
+        "INVOICE #{number}",
+        "Invoice date: {date}",
+        "Bill to: {company}",
+        "Consulting services {amount}",
+        "Total amount due: ${amount}",
+        "Payment terms: net 30",
+    ],
+    "receipt": [
+        "RECEIPT",
+        "{company} store #{number}",
+        "Date: {date}",
+        "Groceries {amount}",
+        "Total paid: ${amount}",
+        "Thank you for your purchase",
+    ],
+    "bank_statement": [
+        "Monthly account statement",
+        "{company} Bank account ending {number}",
+        "Statement period ending {date}",
+        "Opening balance ${amount}",
+        "Deposits and withdrawals",
+        "Closing balance ${amount}",
+    ],
+    "contract": [
+        "SERVICE AGREEMENT",
+        "This agreement is entered into on {date}",
+        "between {company} and the client",
+        "The parties agree to the terms and conditions below",
+        "Contract value: ${amount}",
+        "Signature of both parties",
+    ],
+    "medical": [
+        "Patient visit summary",
+        "{company} Medical Center",
+        "Date of service: {date}",
+        "Diagnosis and treatment plan",
+        "Prescription refill authorized",
+        "Amount billed to insurance ${amount}",
+    ],
+    "tax": [
+        "Form 1099 tax document",
+        "Tax year {year}",
+        "Payer: {company}",
+        "Federal income tax withheld ${amount}",
+        "Taxpayer identification number {number}",
+        "Keep for your tax records",
+    ],
+}
+
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella", "Stark Industries", "Wayne Enterprises"]
+
+PAGE_SIZE = (612, 792)  # US Letter in points
+SCAN_DPI = 150
+
+
+@dataclass
+class CorpusSpec:
+    """Number of documents of each kind and their generation parameters."""
+
+    text_pdfs: int = 20
+    scan_pdfs: int = 5
+    mixed_pdfs: int = 5
+    png_photos: int = 5
+    jpeg_photos: int = 5
+    duplicates: int = 3
+    page_counts: Tuple[int, ...] = (1, 1, 2, 3, 5, 12)  # Sampled uniformly per PDF
+    seed: int = 1234
+
+
+@dataclass
+class CorpusDocument:
+    """One generated document."""
+
+    path: str
+    kind: str
+    family: str
+    pages: int = 1
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+def generate_corpus(directory: str, spec: CorpusSpec) -> List[CorpusDocument]:
+    """Write a synthetic corpus into ``directory``.
+
+    Args:
+        directory: Target directory (created if missing)
+        spec: Corpus composition
+
+    Returns:
+        Generated documents in creation order
+    """
+    os.makedirs(directory, exist_ok=True)
+    rng = random.Random(spec.seed)
+    documents: List[CorpusDocument] = []
+
+    def add(kind: str, count: int, extension: str, writer) -> None:
+        for index in range(count):
+            family = rng.choice(sorted(DOCUMENT_TEMPLATES))
+            pages = rng.choice(spec.page_counts) if extension == ".pdf" else 1
+            path = os.path.join(directory, f"{kind}_{index:04d}{extension}")
+            writer(path, family, pages, rng)
+            documents.append(CorpusDocument(path, kind, family, pages))
+
+    add("text_pdf", spec.text_pdfs, ".pdf", _write_text_pdf)
+    add("scan_pdf", spec.scan_pdfs, ".pdf", _write_scan_pdf)
+    add("mixed_pdf", spec.mixed_pdfs, ".pdf", _write_mixed_pdf)
+    add("png_photo", spec.png_photos, ".png", _write_photo)
+    add("jpeg_photo", spec.jpeg_photos, ".jpg", _write_photo)
+
+    originals = list(documents)
+    for index in range(min(spec.duplicates, len(originals))):
+        source = rng.choice(originals)
+        extension = os.path.splitext(source.path)[1]
+        path = os.path.join(directory, f"duplicate_{index:04d}{extension}")
+        shutil.copyfile(source.path, path)
+        documents.append(
+            CorpusDocument(
+                path, "duplicate", source.family, source.pages, {"duplicate_of": source.path}
+            )
+        )
+    return documents
+
+
+def synthetic_documents(count: int, seed: int = 1234) -> List[Dict[str, Any]]:
+    """Processed-document records for organization benchmarks (no files on disk).
+
+    Args:
+        count: Number of documents
+        seed: Random seed
+
+    Returns:
+        Document dicts in the shape the processing pipeline hands to organization
+    """
+    rng = random.Random(seed)
+    families = sorted(DOCUMENT_TEMPLATES)
+    documents = []
+    for index in range(count):
+        family = families[index % len(families)] if rng.random() < 0.8 else rng.choice(families)
+        lines = _page_lines(family, rng)
+        filename = f"{family}_{lines[0].split()[-1].strip('#$')}_{index}.pdf"
+        documents.append(
+            {
+                "id": f"/bench/out/{filename}",
+                "current_path": f"/bench/out/{filename}",
+                "original_path": f"/bench/in/doc_{index:06d}.pdf",
+                "filename": filename,
+                "content": "\n".join(lines),
+                "metadata": {"word_count": sum(len(line.split()) for line in lines)},
+            }
+        )
+    return documents
+
+
+def _page_lines(family: str, rng: random.Random) -> List[str]:
+    year = rng.randint(2019, 2025)
+    values = {
+        "number": str(rng.randint(1000, 99999)),
+        "date": f"{year}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        "year": str(year),
+        "company": rng.choice(COMPANIES),
+        "amount": f"{rng.randint(5, 9999)}.{rng.randint(0, 99):02d}",
+    }
+    return [line.format(**values) for line in DOCUMENT_TEMPLATES[family]]
+
+
+def _fixed_metadata(doc) -> None:
+    # Fixed metadata keeps output byte-identical across runs
+    doc.set_metadata({"producer": "content-tamer-benchmarks", "creationDate": "", "modDate": ""})
+
+
+def _add_text_page(doc, family: str, rng: random.Random) -> None:
+    page = doc.new_page(width=PAGE_SIZE[0], height=PAGE_SIZE[1])
+    y = 72
+    for _ in range(4):  # Several paragraphs per page
+        for line in _page_lines(family, rng):
+            page.insert_text((72, y), line, fontsize=11)
+            y += 16
+        y += 12
+
+
+def _add_scan_page(doc, family: str, rng: random.Random) -> None:
+    image = _render_page_image(family, rng)
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    page = doc.new_page(width=PAGE_SIZE[0], height=PAGE_SIZE[1])
+    page.insert_image(page.rect, stream=buffer.getvalue())
+
+
+def _write_pdf(path: str, family: str, pages: int, rng: random.Random, page_writer) -> None:
+    doc = fitz.open()
+    try:
+        for number in range(pages):
+            page_writer(number)(doc, family, rng)
+        _fixed_metadata(doc)
+        doc.save(path, garbage=3, deflate=True, no_new_id=True)
+    finally:
+        doc.close()
+
+
+def _write_text_pdf(path: str, family: str, pages: int, rng: random.Random) -> None:
+    _write_pdf(path, family, pages, rng, lambda number: _add_text_page)
+
+
+def _write_scan_pdf(path: str, family: str, pages: int, rng: random.Random) -> None:
+    _write_pdf(path, family, pages, rng, lambda number: _add_scan_page)
+
+
+def _write_mixed_pdf(path: str, family: str, pages: int, rng: random.Random) -> None:
+    pages = max(pages, 2)
+    _write_pdf(
+        path,
+        family,
+        pages,
+        rng,
+        lambda number: _add_text_page if number % 2 == 0 else _add_scan_page,
+    )
+
+
+def _write_photo(path: str, family: str, pages: int, rng: random.Random) -> None:
+    page = _render_page_image(family, rng).convert("RGB")
+    # Paper tint and a slight camera rotation
+    tint = Image.new("RGB", page.size, (rng.randint(200, 240), rng.randint(190, 230), 180))
+    photo = Image.blend(page, tint, 0.25)
+    angle = rng.uniform(-4, 4)
+    photo = photo.rotate(angle, resample=Image.BICUBIC, expand=True, fillcolor=(60, 60, 60))
+    if path.endswith(".png"):
+        photo.save(path, format="PNG")
+    else:
+        photo.save(path, format="JPEG", quality=85)
+
+
+def _render_page_image(family: str, rng: random.Random) -> Image.Image:
+    """Grayscale page image with the family's text, as a scanner would produce."""
+    width, height = (int(side * SCAN_DPI / 72) for side in PAGE_SIZE)
+    image = Image.new("L", (width, height), 250)
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default(size=24)
+    y = 150
+    for _ in range(3):
+        for line in _page_lines(family, rng):
+            draw.text((150, y), line, fill=20, font=font)
+            y += 36
+        y += 24
+    return image
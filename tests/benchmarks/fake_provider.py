@@ -0,0 +1,156 @@
+"""
+Latency-Injecting Fake Provider
+
+An ``AIProvider`` stand-in for benchmarks. It sleeps for a latency drawn from
+a configurable distribution, fails a configurable fraction of requests with
+retryable server errors, and answers with HTTP 429 errors when requests
+exceed a token-bucket rate limit, the way hosted providers do under load.
+Errors use the same wording as the real provider wrappers, so the request
+service classifies and retries them as it would in production.
+"""
+
+import hashlib
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+from domains.ai_integration.base_provider import AIProvider
+from shared.infrastructure.filename_config import validate_generated_filename
+
+
+@dataclass
+class LatencyProfile:
+    """Distribution of simulated response times.
+
+    ``distribution`` is "constant" (always ``median_s``), "uniform"
+    (``low_s`` to ``high_s``) or "lognormal" (``median_s`` with spread
+    ``sigma``). With probability ``tail_probability`` a response is a
+    straggler, taking ``tail_multiplier`` times as long.
+    """
+
+    distribution: str = "lognormal"
+    median_s: float = 0.8
+    sigma: float = 0.4
+    low_s: float = 0.2
+    high_s: float = 1.5
+    tail_probability: float = 0.0
+    tail_multiplier: float = 8.0
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency in seconds."""
+        if self.distribution == "constant":
+            latency = self.median_s
+        elif self.distribution == "uniform":
+            latency = rng.uniform(self.low_s, self.high_s)
+        elif self.distribution == "lognormal":
+            latency = rng.lognormvariate(math.log(self.median_s), self.sigma)
+        else:
+            raise ValueError(f"Unknown latency distribution: {self.distribution}")
+        if self.tail_probability and rng.random() < self.tail_probability:
+            latency *= self.tail_multiplier
+        return latency
+
+
+class FakeAIProvider(AIProvider):
+    """Deterministic filename provider with injected latency, errors and rate limits."""
+
+    def __init__(
+        self,
+        latency: Optional[LatencyProfile] = None,
+        error_rate: float = 0.0,
+        rate_limit_per_second: Optional[float] = None,
+        burst: int = 5,
+        seed: int = 1234,
+        sleep: Callable[[float], None] = time.sleep,
+        model_name: str = "fake-model",
+    ):
+        """Initialize the fake provider.
+
+        Args:
+            latency: Response time distribution (defaults to lognormal around 0.8s)
+            error_rate: Fraction of requests failing with a retryable 503
+            rate_limit_per_second: Sustained request rate before 429s (None = unlimited)
+            burst: Token bucket size for the rate limit
+            seed: Random seed for latencies and errors
+            sleep: Sleep function (inject a no-op to measure overhead only)
+            model_name: Model name reported to the pipeline
+        """
+        super().__init__("fake-key", model_name)
+        self.latency = latency or LatencyProfile()
+        self.error_rate = error_rate
+        self.rate_limit_per_second = rate_limit_per_second
+        self.burst = burst
+        self.sleep = sleep
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._in_flight = 0
+        self.stats: Dict[str, float] = {
+            "requests": 0,
+            "successes": 0,
+            "errors": 0,
+            "rate_limited": 0,
+            "max_in_flight": 0,
+            "simulated_latency_s": 0.0,
+        }
+
+    def generate_filename(self, content: str, original_filename: str) -> str:
+        """Return a filename derived from the content after the simulated delay."""
+        with self._lock:
+            self.stats["requests"] += 1
+            if not self._take_token():
+                self.stats["rate_limited"] += 1
+                raise RuntimeError("Error code: 429 - Rate limit exceeded, please try again")
+            latency = self.latency.sample(self._rng)
+            fails = self._rng.random() < self.error_rate
+            self._in_flight += 1
+            self.stats["max_in_flight"] = max(self.stats["max_in_flight"], self._in_flight)
+            self.stats["simulated_latency_s"] += latency
+
+        try:
+            self.sleep(latency)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+        if fails:
+            with self._lock:
+                self.stats["errors"] += 1
+            raise RuntimeError("Error code: 503 - Service unavailable")
+
+        with self._lock:
+            self.stats["successes"] += 1
+        return validate_generated_filename(_filename_for(content, original_filename))
+
+    def validate_api_key(self) -> bool:
+        """Fake keys are always valid."""
+        return True
+
+    def get_provider_name(self) -> str:
+        """Get the provider name."""
+        return "fake"
+
+    def _take_token(self) -> bool:
+        if self.rate_limit_per_second is None:
+            return True
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.burst),
+            self._tokens + (now - self._refilled_at) * self.rate_limit_per_second,
+        )
+        self._refilled_at = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+def _filename_for(content: str, original_filename: str) -> str:
+    words = [word for word in content.split() if word.isalpha()][:4]
+    digest = hashlib.sha1(f"{original_filename}\0{content}".encode("utf-8")).hexdigest()[:8]
+    return "_".join(words + [digest])
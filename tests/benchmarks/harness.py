@@ -0,0 +1,163 @@
+"""
+Benchmark Results
+
+Result records, JSON persistence and baseline comparison for the benchmark
+suite.
+
+Metric direction is encoded in the name: ``*_per_s`` metrics are throughput
+(higher is better), ``*_s``, ``*_ms`` and ``*_mb`` metrics are costs (lower
+is better). Other metrics (counts) are recorded for context but never
+flagged as regressions.
+"""
+
+import json
+import os
+import platform
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+RESULTS_VERSION = 1
+DEFAULT_THRESHOLD = 0.15  # Relative change treated as a regression
+
+
+@dataclass
+class BenchmarkResult:
+    """Metrics from one benchmark scenario."""
+
+    name: str
+    metrics: Dict[str, float]
+    params: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class MetricComparison:
+    """One metric compared against the baseline."""
+
+    benchmark: str
+    metric: str
+    baseline: float
+    current: float
+    change: float  # Relative change, positive = worse
+    regression: bool
+
+
+def timed(func: Callable[[], Any]) -> Tuple[float, Any]:
+    """Run ``func`` and return (elapsed seconds, result)."""
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def percentile(values: Iterable[float], percent: float) -> float:
+    """Linear-interpolated percentile (0 for no values)."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def latency_metrics(prefix: str, durations_s: List[float]) -> Dict[str, float]:
+    """p50/p95/p99 in milliseconds for a list of durations in seconds."""
+    return {
+        f"{prefix}_p50_ms": round(percentile(durations_s, 50) * 1000, 3),
+        f"{prefix}_p95_ms": round(percentile(durations_s, 95) * 1000, 3),
+        f"{prefix}_p99_ms": round(percentile(durations_s, 99) * 1000, 3),
+    }
+
+
+def save_results(results: List[BenchmarkResult], path: str, scale: str) -> str:
+    """Write results with the environment they were measured in."""
+    payload = {
+        "version": RESULTS_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "scale": scale,
+        "environment": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": [asdict(result) for result in results],
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+    return path
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """Load a results file written by ``save_results``."""
+    with open(path, encoding="utf-8") as f:
+        payload = json.load(f)
+    if payload.get("version") != RESULTS_VERSION:
+        raise ValueError(f"Unsupported benchmark results version in {path}")
+    return payload
+
+
+def metric_direction(metric: str) -> Optional[int]:
+    """+1 if higher is better, -1 if lower is better, None if not compared."""
+    if metric.endswith("_per_s"):
+        return 1
+    if metric.endswith(("_s", "_ms", "_mb")):
+        return -1
+    return None
+
+
+def compare_results(
+    current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD
+) -> List[MetricComparison]:
+    """Compare two results payloads metric by metric.
+
+    Args:
+        current: Payload from ``load_results`` for the new run
+        baseline: Payload for the saved baseline
+        threshold: Relative worsening that counts as a regression
+
+    Returns:
+        Comparisons for every directional metric present in both runs
+    """
+    baseline_metrics = {result["name"]: result["metrics"] for result in baseline["results"]}
+    comparisons = []
+    for result in current["results"]:
+        previous = baseline_metrics.get(result["name"])
+        if previous is None:
+            continue
+        for metric, value in result["metrics"].items():
+            direction = metric_direction(metric)
+            if direction is None or metric not in previous:
+                continue
+            before = previous[metric]
+            if before == 0:
+                change = -direction * float("inf") if value else 0.0
+            else:
+                change = (before - value) / before * direction
+            comparisons.append(
+                MetricComparison(
+                    result["name"], metric, before, value, change, change > threshold
+                )
+            )
+    return comparisons
+
+
+def format_comparison(comparisons: List[MetricComparison], threshold: float) -> List[str]:
+    """Comparison table as text lines, regressions marked."""
+    if not comparisons:
+        return ["No comparable metrics"]
+    width = max(len(f"{c.benchmark}.{c.metric}") for c in comparisons)
+    lines = [f"{'metric':<{width}}  {'baseline':>12}  {'current':>12}  {'change':>8}"]
+    for c in comparisons:
+        flag = "  REGRESSION" if c.regression else ""
+        lines.append(
+            f"{c.benchmark + '.' + c.metric:<{width}}  {c.baseline:>12.4g}  {c.current:>12.4g}"
+            f"  {c.change:>+8.1%}{flag}"
+        )
+    regressions = sum(1 for c in comparisons if c.regression)
+    lines.append(f"{regressions} regression(s) beyond {threshold:.0%}")
+    return lines
@@ -0,0 +1,161 @@
+"""
+Tests for the benchmark suite.
+
+Tests that the corpus is deterministic, the fake provider injects latency,
+errors and 429s the request service recognizes, baseline comparison flags
+regressions, and the scenarios run end to end at smoke scale.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import unittest
+
+import pytest
+
+from domains.ai_integration.request_service import RequestService, RetryConfig
+
+from .corpus import CorpusSpec, generate_corpus, synthetic_documents
+from .fake_provider import FakeAIProvider, LatencyProfile
+from .harness import BenchmarkResult, compare_results, load_results, save_results
+from .scenarios import run_benchmarks
+
+try:
+    import fitz
+
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+SMALL_CORPUS = CorpusSpec(
+    text_pdfs=2, scan_pdfs=1, mixed_pdfs=1, png_photos=1, jpeg_photos=1, duplicates=1
+)
+
+
+def _digests(documents):
+    digests = []
+    for document in documents:
+        with open(document.path, "rb") as f:
+            digests.append((os.path.basename(document.path), hashlib.sha256(f.read()).hexdigest()))
+    return digests
+
+
+@unittest.skipUnless(PYMUPDF_AVAILABLE, "PyMuPDF required")
+class TestCorpus(unittest.TestCase):
+    """Test synthetic corpus generation."""
+
+    def test_corpus_is_deterministic(self):
+        """Test the same spec produces byte-identical files."""
+        with tempfile.TemporaryDirectory() as first, tempfile.TemporaryDirectory() as second:
+            documents = generate_corpus(first, SMALL_CORPUS)
+            self.assertEqual(_digests(documents), _digests(generate_corpus(second, SMALL_CORPUS)))
+
+    def test_document_kinds(self):
+        """Test scans have no text layer and duplicates copy an original."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            documents = {d.kind: d for d in generate_corpus(temp_dir, SMALL_CORPUS)}
+
+            with fitz.open(documents["text_pdf"].path) as doc:
+                self.assertTrue(doc[0].get_text().strip())
+            with fitz.open(documents["scan_pdf"].path) as doc:
+                self.assertEqual(doc[0].get_text().strip(), "")
+                self.assertTrue(doc[0].get_images())
+            duplicate = documents["duplicate"]
+            original = duplicate.metadata["duplicate_of"]
+            with open(duplicate.path, "rb") as copy, open(original, "rb") as source:
+                self.assertEqual(copy.read(), source.read())
+
+    def test_synthetic_documents(self):
+        """Test organization records are seeded and unique."""
+        documents = synthetic_documents(100, seed=7)
+
+        self.assertEqual(documents, synthetic_documents(100, seed=7))
+        self.assertEqual(len({d["current_path"] for d in documents}), 100)
+
+
+class TestFakeProvider(unittest.TestCase):
+    """Test injected latency, errors and rate limiting."""
+
+    def test_latency_is_sampled_and_slept(self):
+        """Test each request sleeps for a latency from the profile."""
+        slept = []
+        provider = FakeAIProvider(
+            LatencyProfile("uniform", low_s=0.5, high_s=1.0), sleep=slept.append
+        )
+
+        name = provider.generate_filename("Invoice from Acme Corp total due", "scan.pdf")
+
+        self.assertEqual(len(slept), 1)
+        self.assertTrue(0.5 <= slept[0] <= 1.0)
+        self.assertTrue(name.startswith("Invoice_from_Acme_Corp"))
+        self.assertEqual(
+            name, provider.generate_filename("Invoice from Acme Corp total due", "scan.pdf")
+        )
+
+    def test_errors_and_rate_limits_are_retryable(self):
+        """Test injected 503s and 429s are errors the request service retries."""
+        failing = FakeAIProvider(error_rate=1.0, sleep=lambda _s: None)
+        limited = FakeAIProvider(rate_limit_per_second=0.001, burst=2, sleep=lambda _s: None)
+        limited.generate_filename("a", "a.pdf")
+        limited.generate_filename("b", "b.pdf")
+        service = RequestService()
+
+        with self.assertRaises(RuntimeError) as server_error:
+            failing.generate_filename("content", "a.pdf")
+        with self.assertRaises(RuntimeError) as rate_limited:
+            limited.generate_filename("c", "c.pdf")
+
+        self.assertIn("429", str(rate_limited.exception))
+        self.assertEqual(limited.stats["rate_limited"], 1)
+        for error in (server_error.exception, rate_limited.exception):
+            self.assertTrue(service._should_retry_error(error, RetryConfig()))
+
+
+class TestResultComparison(unittest.TestCase):
+    """Test results persistence and regression detection."""
+
+    def test_regressions_flagged_by_metric_direction(self):
+        """Test slower stages and lower throughput are flagged, counts are not."""
+        baseline = [BenchmarkResult("kernel", {"wall_s": 10.0, "docs_per_s": 4.0, "documents": 40})]
+        current = [BenchmarkResult("kernel", {"wall_s": 12.0, "docs_per_s": 3.9, "documents": 80})]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            baseline_path = save_results(baseline, os.path.join(temp_dir, "base.json"), "full")
+            current_path = save_results(current, os.path.join(temp_dir, "cur.json"), "full")
+            with open(current_path, encoding="utf-8") as f:
+                self.assertEqual(json.load(f)["results"][0]["name"], "kernel")
+            comparisons = compare_results(
+                load_results(current_path), load_results(baseline_path), threshold=0.1
+            )
+
+        by_metric = {c.metric: c for c in comparisons}
+        self.assertEqual(set(by_metric), {"wall_s", "docs_per_s"})
+        self.assertTrue(by_metric["wall_s"].regression)
+        self.assertAlmostEqual(by_metric["wall_s"].change, 0.2)
+        self.assertFalse(by_metric["docs_per_s"].regression)
+
+
+@pytest.mark.performance
+@unittest.skipUnless(PYMUPDF_AVAILABLE, "PyMuPDF required")
+class TestScenariosSmoke(unittest.TestCase):
+    """Run the scenarios at smoke scale so they keep working."""
+
+    def test_scenarios_run(self):
+        """Test extraction, kernel and organization scenarios report their metrics."""
+        results = {
+            r.name: r for r in run_benchmarks(["extraction", "kernel", "organization"], "smoke")
+        }
+
+        self.assertEqual(set(results), {"extraction", "kernel", "organization_200"})
+        self.assertEqual(results["extraction"].metrics["documents"], 8)
+        self.assertGreater(results["extraction"].metrics["text_pdf_p50_ms"], 0)
+        kernel = results["kernel"].metrics
+        self.assertEqual(kernel["documents"], 8)
+        self.assertGreaterEqual(kernel["files_processed"], 3)
+        self.assertIn("pipeline.ai_filename_p95_ms", kernel)
+        self.assertEqual(results["organization_200"].metrics["documents"], 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
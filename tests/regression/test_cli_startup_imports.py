@@ -0,0 +1,109 @@
+"""
+Regression test for CLI startup time.
+
+Bug: ``--help`` took over four seconds because package __init__ files and
+provider detection imported PyMuPDF, scikit-learn, spaCy, tiktoken and the
+provider SDKs before argument parsing.
+Fix: availability checks use importlib.util.find_spec and heavy modules are
+imported on first use.
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+from typing import Dict, List, Tuple
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+# Time the application's own imports may take (interpreter startup excluded)
+IMPORT_BUDGET_S = 1.0
+
+HEAVY_MODULES = [
+    "anthropic",
+    "fitz",
+    "google.genai",
+    "numpy",
+    "onnxruntime",
+    "openai",
+    "requests",
+    "sentence_transformers",
+    "sklearn",
+    "spacy",
+    "tiktoken",
+    "torch",
+]
+
+
+def _import_tree(stderr: str) -> List[Tuple[str, int, List[str]]]:
+    """Top-level imports as (name, cumulative microseconds, modules in subtree).
+
+    ``-X importtime`` lists modules after their own imports finish, indenting
+    nested imports by two spaces per level.
+    """
+    pending: List[Tuple[int, str, int, List[str]]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _self_us, cumulative, raw_name = line[len("import time:") :].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # Header row
+        depth = (len(raw_name) - len(raw_name.lstrip()) - 1) // 2
+        name = raw_name.strip()
+        subtree = [name]
+        while pending and pending[-1][0] > depth:
+            subtree.extend(pending.pop()[3])
+        pending.append((depth, name, int(cumulative), subtree))
+    return [(name, cumulative, subtree) for _depth, name, cumulative, subtree in pending]
+
+
+def _profile_cli(*args: str) -> Dict[str, object]:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", os.path.join(SRC_DIR, "main.py"), *args],
+        cwd=SRC_DIR,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=False,
+    )
+    # site (and any sitecustomize it runs) belongs to interpreter startup
+    tree = [entry for entry in _import_tree(completed.stderr) if entry[0] != "site"]
+    return {
+        "import_s": sum(cumulative for _name, cumulative, _subtree in tree) / 1e6,
+        "modules": {module for _name, _cumulative, subtree in tree for module in subtree},
+        "stdout": completed.stdout,
+    }
+
+
+class TestCliStartupImports(unittest.TestCase):
+    """Test that informational CLI commands only import what they need."""
+
+    def _assert_fast_startup(self, *args: str) -> Dict[str, object]:
+        profile = _profile_cli(*args)
+        loaded = sorted(
+            module
+            for module in HEAVY_MODULES
+            if any(m == module or m.startswith(module + ".") for m in profile["modules"])
+        )
+        self.assertEqual(loaded, [], f"{' '.join(args)} imported heavy modules")
+        self.assertLess(
+            profile["import_s"],
+            IMPORT_BUDGET_S,
+            f"{' '.join(args)} spent {profile['import_s']:.2f}s importing",
+        )
+        return profile
+
+    def test_help_startup(self):
+        """Test --help stays within the import budget without heavy modules."""
+        profile = self._assert_fast_startup("--help")
+        self.assertIn("--list-models", profile["stdout"])
+
+    def test_list_models_startup(self):
+        """Test --list-models prints the model tables without importing provider SDKs."""
+        profile = self._assert_fast_startup("--list-models")
+        self.assertIn("gpt-5-mini (default)", profile["stdout"])
+
+
+if __name__ == "__main__":
+    unittest.main()
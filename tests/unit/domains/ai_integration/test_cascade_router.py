@@ -0,0 +1,195 @@
+"""
+Tests for the model cascade router.
+
+Tests tier selection (including unavailable cheap models), when a cheap
+tier's filename is escalated, and the recorded routing decisions, escalation
+rates and per-tier latency.
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "src"))
+
+from domains.ai_integration.ai_integration_service import AIIntegrationService
+from domains.ai_integration.cascade_router import (
+    CascadeRouter,
+    CascadeTier,
+    cascade_tiers,
+    escalation_reason,
+)
+from domains.ai_integration.request_service import (
+    RequestResult,
+    RequestService,
+    RequestStatus,
+    is_model_not_found,
+)
+
+CHEAP = CascadeTier("openai", "gpt-5-mini")
+STRONG = CascadeTier("openai", "gpt-5")
+
+
+class ScriptedModels:
+    """Single-model request answering per model and recording calls."""
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.calls = []
+
+    def __call__(self, content, original_filename, provider, model, api_key, **options):
+        self.calls.append((provider, model, api_key))
+        answer = self.answers.get(model, "missing")
+        if answer is None:
+            return RequestResult(status=RequestStatus.FAILED, error="Rate limit", attempts=3)
+        if answer == "missing":
+            error = f"Model '{model}' is not available. Download it with: ollama pull {model}"
+            return RequestResult(status=RequestStatus.FAILED, error=error, attempts=1)
+        return RequestResult(status=RequestStatus.SUCCESS, content=answer, attempts=1)
+
+
+class TestCascadeTiers(unittest.TestCase):
+    """Test tier selection and filename checks."""
+
+    def test_tiers(self):
+        """Test cheap and strong tiers for configured, default and overridden models."""
+        self.assertEqual(cascade_tiers("openai", "gpt-5", "gpt-5-mini"), [CHEAP, STRONG])
+        self.assertEqual(cascade_tiers("openai", None, "gpt-5-mini"), [CHEAP])
+        self.assertEqual(cascade_tiers("openai", "gpt-5-mini", "gpt-5-mini"), [CHEAP])
+        self.assertEqual(
+            cascade_tiers("openai", "gpt-5", "gpt-5-mini", "local:gemma2-2b"),
+            [CascadeTier("local", "gemma2-2b"), STRONG],
+        )
+        self.assertEqual(
+            cascade_tiers("claude", "claude-3-opus", "claude-3.5-haiku", "claude-3-haiku"),
+            [CascadeTier("claude", "claude-3-haiku"), CascadeTier("claude", "claude-3-opus")],
+        )
+        self.assertEqual(
+            cascade_tiers("deepseek", None, "deepseek-chat"),
+            [CascadeTier("deepseek", "deepseek-chat")],
+        )
+
+    def test_unavailable_cheap_tier_gives_single_tier(self):
+        """Test a cheap model that is not installed is left out of the cascade."""
+        strong = CascadeTier("local", "llama3.1-8b")
+        self.assertEqual(
+            cascade_tiers("local", "llama3.1-8b", "llama3.1-8b", is_available=lambda t: False),
+            [strong],
+        )
+        self.assertEqual(
+            cascade_tiers("local", "llama3.1-8b", "llama3.1-8b", is_available=lambda t: True),
+            [CascadeTier("local", "gemma2-2b"), strong],
+        )
+
+    def test_escalation_reason(self):
+        """Test specific names pass while generic and invalid names escalate."""
+        self.assertIsNone(escalation_reason("Invoice_ACME_Corp_2024-03-01"))
+        for generic in ("document", "unnamed_document", "scan_001", "Scanned_Document_20240301"):
+            self.assertEqual(escalation_reason(generic), "generic", generic)
+        self.assertEqual(escalation_reason("bad name!.pdf"), "invalid")
+        self.assertEqual(escalation_reason(""), "invalid")
+
+
+class TestCascadeRouter(unittest.TestCase):
+    """Test routing and statistics."""
+
+    def test_routing_and_statistics(self):
+        """Test acceptance, escalation for generic and failed answers, and quality routing."""
+        models = ScriptedModels({"gpt-5-mini": "Invoice_ACME_2024-03", "gpt-5": "Lease_Agreement"})
+        router = CascadeRouter(models)
+
+        result = router.generate_filename("Invoice ...", "a.pdf", [CHEAP, STRONG], "key")
+        self.assertEqual(result.content, "Invoice_ACME_2024-03")
+        self.assertEqual(result.metadata["cascade_tier"], CHEAP.key)
+        self.assertEqual(len(models.calls), 1)
+
+        models.answers["gpt-5-mini"] = "scan_0001"
+        result = router.generate_filename("Lease ...", "b.pdf", [CHEAP, STRONG], "key")
+        self.assertEqual(result.content, "Lease_Agreement")
+        self.assertEqual(result.metadata["escalation_reason"], "generic")
+
+        models.answers["gpt-5-mini"] = None
+        result = router.generate_filename("Lease ...", "c.pdf", [CHEAP, STRONG], "key")
+        self.assertEqual((result.content, result.attempts), ("Lease_Agreement", 4))
+
+        models.calls.clear()
+        router.generate_filename("L3ase ...", "d.pdf", [CHEAP, STRONG], "key", "poor")
+        self.assertEqual(models.calls, [("openai", "gpt-5", "key")])
+
+        stats = router.get_statistics()
+        self.assertEqual((stats["requests"], stats["escalated"]), (4, 3))
+        self.assertEqual(stats["escalation_rate"], 0.75)
+        self.assertEqual(
+            stats["escalation_reasons"], {"generic": 1, "failed": 1, "quality_poor": 1}
+        )
+        self.assertEqual(stats["tiers"][CHEAP.key]["requests"], 3)
+        self.assertEqual(stats["tiers"][CHEAP.key]["accepted"], 1)
+        self.assertEqual(stats["tiers"][STRONG.key]["requests"], 3)
+        self.assertIn("p95_latency_s", stats["tiers"][STRONG.key])
+        self.assertEqual(stats["recent_decisions"][1]["steps"][0]["outcome"], "generic")
+
+    def test_missing_model_escalates_without_retry(self):
+        """Test a cheap tier whose model is missing escalates at once and is then skipped."""
+        models = ScriptedModels({"gpt-5": "Lease_Agreement"})
+        router = CascadeRouter(models)
+
+        for name in ("a.pdf", "b.pdf"):
+            result = router.generate_filename("Lease ...", name, [CHEAP, STRONG], "key")
+            self.assertEqual(result.content, "Lease_Agreement")
+            self.assertEqual(result.metadata["escalation_reason"], "model_not_found")
+
+        self.assertEqual(
+            models.calls,
+            [("openai", "gpt-5-mini", "key"), ("openai", "gpt-5", "key"), ("openai", "gpt-5", "key")],
+        )
+        error = Exception("model 'gemma2:2b' not found, try pulling it first")
+        self.assertTrue(is_model_not_found(str(error)))
+        self.assertFalse(RequestService()._should_retry_error(error, RequestService().retry_config))
+
+    def test_single_tier_is_logged_and_never_escalated(self):
+        """Test a cascade on the cheap model makes one request and logs its tiers once."""
+        models = ScriptedModels({"gpt-5-mini": "scan_0001"})
+        router = CascadeRouter(models)
+
+        with self.assertLogs("domains.ai_integration.cascade_router", "INFO") as logs:
+            for name in ("a.pdf", "b.pdf"):
+                result = router.generate_filename("Scan ...", name, [CHEAP], "key", "poor")
+
+        self.assertEqual(result.content, "scan_0001")
+        self.assertEqual(models.calls, [("openai", "gpt-5-mini", "key")] * 2)
+        self.assertEqual(
+            logs.output,
+            ["INFO:domains.ai_integration.cascade_router:"
+             "Model cascade: single tier openai:gpt-5-mini (no cheaper model)"],
+        )
+
+    def test_service_cascade(self):
+        """Test the service routes through the cascade; other providers use their own key."""
+        service = AIIntegrationService()
+        models = ScriptedModels({"gemma2-2b": "document", "gpt-5": "Insurance_Policy_Renewal"})
+
+        with patch.object(service, "generate_filename_with_ai", side_effect=models), patch.object(
+            service, "_local_model_installed", return_value=True
+        ):
+            result = service.generate_filename_with_cascade(
+                "Policy ...", "e.pdf", "openai", "gpt-5", "key", first_tier="local:gemma2-2b"
+            )
+
+        self.assertEqual(result.content, "Insurance_Policy_Renewal")
+        self.assertEqual(models.calls, [("local", "gemma2-2b", None), ("openai", "gpt-5", "key")])
+
+    def test_service_skips_local_tier_that_is_not_installed(self):
+        """Test a local cheap model that was never pulled is not tried, and is checked once."""
+        service = AIIntegrationService()
+        models = ScriptedModels({"llama3.1-8b": "Insurance_Policy_Renewal"})
+
+        with patch.object(service, "generate_filename_with_ai", side_effect=models), patch.object(
+            service, "_local_model_installed", return_value=False
+        ) as installed:
+            for name in ("e.pdf", "f.pdf"):
+                service.generate_filename_with_cascade("Policy ...", name, "local", "llama3.1-8b")
+
+        self.assertEqual(models.calls, [("local", "llama3.1-8b", None)] * 2)
+        installed.assert_called_once_with("gemma2-2b")
@@ -0,0 +1,229 @@
+"""
+Tests for adaptive AI request concurrency.
+
+Tests additive increase and multiplicative decrease of the per provider and
+model limit, Retry-After and rate-limit header parsing, pauses, and the
+request service's use of the controller.
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "src"))
+
+from domains.ai_integration.concurrency_controller import (
+    ConcurrencyConfig,
+    ConcurrencyController,
+    classify_error,
+    retry_after_from_error,
+)
+from domains.ai_integration.request_service import RequestService, RequestStatus, RetryConfig
+
+
+class FakeResponse:
+    """HTTP response as attached to SDK exceptions."""
+
+    def __init__(self, status_code, headers):
+        self.status_code = status_code
+        self.headers = headers
+
+
+class FakeAPIError(Exception):
+    """SDK error carrying the HTTP response."""
+
+    def __init__(self, message, status_code=429, headers=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.response = FakeResponse(status_code, headers or {})
+
+
+def wrapped(error):
+    """Wrap an SDK error the way the providers do."""
+    try:
+        raise RuntimeError(f"OpenAI error: {error}") from error
+    except RuntimeError as e:
+        return e
+
+
+class TestAdaptiveLimit(unittest.TestCase):
+    """Test AIMD adjustments of a provider and model's limit."""
+
+    def _controller(self, **overrides):
+        settings = {"max_limit": 8, "min_latency_samples": 1000}
+        settings.update(overrides)
+        return ConcurrencyController(ConcurrencyConfig(**settings))
+
+    def test_additive_increase_per_healthy_window(self):
+        """Test the limit grows by one after as many successes as the limit."""
+        controller = self._controller()
+
+        for _ in range(2):
+            with controller.request("openai:gpt-5-mini"):
+                pass
+        self.assertEqual(controller.limiter("openai:gpt-5-mini").limit, 3)
+
+        for _ in range(3):
+            with controller.request("openai:gpt-5-mini"):
+                pass
+        self.assertEqual(controller.limiter("openai:gpt-5-mini").limit, 4)
+
+    def test_multiplicative_decrease_once_per_burst(self):
+        """Test 429s and timeouts halve the limit, once for requests started before a cut."""
+        controller = self._controller(initial_limit=8)
+        limiter = controller.limiter("claude:haiku")
+        burst_start = time.monotonic()
+
+        limiter.on_failure(FakeAPIError("Too many requests"), burst_start)
+        limiter.on_failure(FakeAPIError("Too many requests"), burst_start)
+        self.assertEqual(limiter.limit, 4)
+
+        limiter.on_failure(TimeoutError("Request timed out"), time.monotonic())
+        self.assertEqual(limiter.limit, 2)
+
+        limiter.on_failure(ValueError("Invalid filename"), time.monotonic())
+        stats = limiter.statistics()
+        self.assertEqual(stats["limit"], 2)
+        self.assertEqual((stats["rate_limited"], stats["timeouts"], stats["failures"]), (2, 1, 4))
+        self.assertEqual([entry["limit"] for entry in stats["history"]], [8, 4, 2])
+
+    def test_latency_rise_cuts_limit(self):
+        """Test a p95 far above the best observed p95 counts as congestion."""
+        controller = self._controller(initial_limit=4, min_latency_samples=3, latency_window=3)
+        limiter = controller.limiter("gemini:flash")
+
+        for _ in range(3):
+            limiter.on_success(time.monotonic() - 0.01)
+        for _ in range(3):
+            limiter.on_success(time.monotonic() - 0.5)
+
+        self.assertLess(limiter.limit, 4)
+        self.assertTrue(limiter.statistics()["history"][-1]["reason"].startswith("p95"))
+
+    def test_state_is_per_key_and_retry_after_pauses(self):
+        """Test a Retry-After pauses only its own provider and model."""
+        controller = self._controller()
+        error = FakeAPIError("Rate limit reached", headers={"Retry-After": "0.3"})
+        with self.assertRaises(FakeAPIError):
+            with controller.request("openai:gpt-5"):
+                raise error
+
+        start = time.monotonic()
+        with controller.request("openai:gpt-5-mini"):
+            pass
+        self.assertLess(time.monotonic() - start, 0.1)
+
+        with controller.request("openai:gpt-5"):
+            pass
+        self.assertGreaterEqual(time.monotonic() - start, 0.25)
+
+        stats = controller.get_statistics()
+        self.assertEqual(stats["openai:gpt-5"]["limit"], 1)
+        self.assertEqual(stats["openai:gpt-5-mini"]["rate_limited"], 0)
+
+    def test_ceiling_follows_worker_sizing(self):
+        """Test a lower ceiling planned for a later run caps an existing limit."""
+        controller = self._controller(initial_limit=6)
+        limiter = controller.limiter("local:llama3.2-3b")
+
+        controller.config.max_limit = 3
+        self.assertIs(controller.limiter("local:llama3.2-3b"), limiter)
+        self.assertEqual(limiter.limit, 3)
+
+
+class TestRetryAfterParsing(unittest.TestCase):
+    """Test provider hints are found on wrapped SDK errors."""
+
+    def test_retry_after_headers(self):
+        """Test seconds, milliseconds and HTTP-date Retry-After values."""
+        error = wrapped(FakeAPIError("x", headers={"retry-after": "3"}))
+        self.assertEqual(retry_after_from_error(error), 3.0)
+        self.assertEqual(
+            retry_after_from_error(FakeAPIError("x", headers={"retry-after-ms": "250"})), 0.25
+        )
+        date = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+        delay = retry_after_from_error(FakeAPIError("x", headers={"Retry-After": date}))
+        self.assertAlmostEqual(delay, 30, delta=2)
+
+    def test_rate_limit_reset_headers(self):
+        """Test OpenAI durations and Anthropic timestamps once the remaining count is zero."""
+        openai_headers = {
+            "x-ratelimit-remaining-requests": "0",
+            "x-ratelimit-reset-requests": "1m30s",
+            "x-ratelimit-remaining-tokens": "1200",
+            "x-ratelimit-reset-tokens": "6m0s",
+        }
+        self.assertEqual(retry_after_from_error(FakeAPIError("x", headers=openai_headers)), 90.0)
+
+        reset = (datetime.now(timezone.utc) + timedelta(seconds=10)).isoformat()
+        anthropic_headers = {
+            "anthropic-ratelimit-requests-remaining": "0",
+            "anthropic-ratelimit-requests-reset": reset.replace("+00:00", "Z"),
+        }
+        delay = retry_after_from_error(FakeAPIError("x", headers=anthropic_headers))
+        self.assertAlmostEqual(delay, 10, delta=2)
+
+    def test_gemini_retry_delay_and_classification(self):
+        """Test Gemini RetryInfo details, and errors without hints."""
+        error = Exception("429 RESOURCE_EXHAUSTED")
+        error.details = {"error": {"details": [{"retryDelay": "17s"}]}}
+        self.assertEqual(retry_after_from_error(wrapped(error)), 17.0)
+        self.assertEqual(classify_error(wrapped(error)), "rate_limit")
+
+        self.assertIsNone(retry_after_from_error(RuntimeError("Connection reset")))
+        self.assertEqual(classify_error(RuntimeError("Request timed out")), "timeout")
+        self.assertEqual(classify_error(RuntimeError("Invalid API key")), "error")
+
+
+class TestRequestServiceConcurrency(unittest.TestCase):
+    """Test the request service holds attempts to the adaptive limit."""
+
+    def test_retry_waits_for_retry_after(self):
+        """Test the provider's Retry-After replaces a shorter backoff and is recorded."""
+        service = RequestService(
+            RetryConfig(base_delay=0.01, jitter=False),
+            ConcurrencyController(ConcurrencyConfig(max_limit=4)),
+        )
+        responses = [
+            FakeAPIError("Too many requests", headers={"retry-after": "0.3"}),
+            "invoice.pdf",
+        ]
+
+        def provider_call():
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise wrapped(response)
+            return response
+
+        start = time.monotonic()
+        result = service.make_ai_request(provider_call, concurrency_key="openai:gpt-5-mini")
+
+        self.assertEqual(result.status, RequestStatus.SUCCESS)
+        self.assertGreaterEqual(time.monotonic() - start, 0.3)
+        stats = service.get_request_statistics()["concurrency"]["openai:gpt-5-mini"]
+        self.assertEqual((stats["rate_limited"], stats["successes"]), (1, 1))
+
+    def test_timeout_from_worker_thread(self):
+        """Test requests made off the main thread still time out."""
+        service = RequestService(RetryConfig(max_attempts=1))
+        results = []
+
+        def request():
+            results.append(service.make_ai_request(lambda: time.sleep(1) or "late", timeout=0.1))
+
+        worker = threading.Thread(target=request)
+        worker.start()
+        worker.join(timeout=0.8)
+
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(results[0].status, RequestStatus.FAILED)
+        self.assertIn("timed out", results[0].error)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+Tests for hedged AI requests.
+
+Tests that a slow attempt gets a duplicate whose usable result wins, that
+the hedge delay follows the observed latency percentile, that the hedge
+rate is capped, that duplicates are accounted for and that hedged timeouts
+reach the adaptive concurrency limit.
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "src"))
+
+from domains.ai_integration.ai_integration_service import AIIntegrationService
+from domains.ai_integration.concurrency_controller import ConcurrencyConfig, ConcurrencyController
+from domains.ai_integration.request_service import (
+    HedgeConfig,
+    RequestService,
+    RequestStatus,
+    RetryConfig,
+)
+
+KEY = "openai:gpt-5-mini"
+
+
+class ScriptedCall:
+    """Provider call whose n-th invocation sleeps and answers as scripted."""
+
+    def __init__(self, script):
+        self.script = list(script)
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, *_args):
+        with self._lock:
+            delay, answer = self.script[min(self.calls, len(self.script) - 1)]
+            self.calls += 1
+        time.sleep(delay)
+        return answer
+
+
+def service(**hedge_settings) -> RequestService:
+    return RequestService(
+        RetryConfig(max_attempts=1, timeout=5.0),
+        ConcurrencyController(ConcurrencyConfig(initial_limit=4, max_limit=4)),
+        HedgeConfig(**hedge_settings),
+    )
+
+
+class TestRequestHedging(unittest.TestCase):
+    """Test hedging in the request service."""
+
+    def test_slow_attempt_is_hedged_and_duplicate_wins(self):
+        """Test the duplicate's result is used without waiting for the slow call."""
+        requests = service(initial_delay=0.1, max_hedge_rate=1.0)
+        call = ScriptedCall([(2.0, "slow_name"), (0.0, "fast_name")])
+
+        start = time.monotonic()
+        result = requests.make_ai_request(
+            call, concurrency_key=KEY, hedge_func=call, hedge_cost=50
+        )
+
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(result.content, "fast_name")
+        stats = requests.get_hedging_statistics()
+        self.assertEqual((stats["hedges_sent"], stats["hedge_wins"], stats["cancelled"]), (1, 1, 1))
+        self.assertEqual(stats["extra_cost"], 50)
+
+    def test_hedge_delay_follows_observed_latency(self):
+        """Test fast calls are not hedged and the delay drops to their p95."""
+        requests = service(initial_delay=10.0, min_samples=5, min_delay=0.01)
+        call = ScriptedCall([(0.02, "quick_name")])
+
+        for _ in range(5):
+            requests.make_ai_request(call, concurrency_key=KEY, hedge_func=call)
+
+        stats = requests.get_hedging_statistics()
+        self.assertEqual((call.calls, stats["hedges_sent"]), (5, 0))
+        self.assertLess(stats["hedge_delay_s"][KEY], 0.2)
+
+    def test_hedge_rate_is_capped(self):
+        """Test no more than max_hedge_rate of attempts get a duplicate."""
+        requests = service(initial_delay=0.02, min_delay=0.01, max_hedge_rate=0.1)
+        call = ScriptedCall([(0.1, "slow_name")])
+
+        for _ in range(10):
+            result = requests.make_ai_request(call, concurrency_key=KEY, hedge_func=call)
+            self.assertEqual(result.status, RequestStatus.SUCCESS)
+
+        stats = requests.get_hedging_statistics()
+        self.assertEqual((stats["attempts"], stats["hedges_started"]), (10, 1))
+        self.assertEqual(requests.get_request_statistics()["hedging"]["hedge_rate"], 0.1)
+
+    def test_hedged_timeout_halves_limit(self):
+        """Test requests still running at the deadline count as timeouts and free their slots."""
+        requests = RequestService(
+            RetryConfig(max_attempts=1, timeout=0.3),
+            ConcurrencyController(ConcurrencyConfig(initial_limit=4, max_limit=4)),
+            HedgeConfig(initial_delay=0.05, min_delay=0.01, max_hedge_rate=1.0),
+        )
+        call = ScriptedCall([(1.0, "slow_name")])
+
+        result = requests.make_ai_request(call, concurrency_key=KEY, hedge_func=call)
+
+        self.assertEqual(result.status, RequestStatus.FAILED)
+        self.assertEqual(call.calls, 2)
+        stats = requests.concurrency.limiter(KEY).statistics()
+        self.assertEqual((stats["limit"], stats["timeouts"], stats["in_flight"]), (2, 2, 0))
+
+    def test_placeholder_loses_to_real_name(self):
+        """Test a duplicate answering with a placeholder does not win."""
+        ai_service = AIIntegrationService()
+        ai_service.request_service.hedge_config = HedgeConfig(initial_delay=0.05, min_delay=0.01)
+        primary = ScriptedCall([(0.3, "invoice_acme_2024")])
+        secondary = ScriptedCall([(0.0, "unnamed_document")])
+
+        def setup_provider(provider, model, api_key):
+            generate = primary if provider == "openai" else secondary
+            return type("Provider", (), {"generate_filename": staticmethod(generate)})()
+
+        with patch.object(ai_service, "setup_provider", side_effect=setup_provider) as setup:
+            result = ai_service.generate_filename_with_ai(
+                "Invoice from ACME",
+                "scan.pdf",
+                "openai",
+                "gpt-5-mini",
+                "key",
+                hedge_provider="claude",
+                hedge_model="claude-3.5-haiku",
+            )
+
+        self.assertEqual(result.content, "invoice_acme_2024")
+        self.assertEqual([c.args[0] for c in setup.call_args_list], ["openai", "claude"])
+        self.assertEqual(secondary.calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+Tests for the OCR backend abstraction.
+
+Tests that the tesserocr engine pool initializes one engine per language and
+mode and reuses it across pages, bounds concurrent engines, falls back to
+pytesseract when an engine cannot be created, and that processors OCR through
+the shared backend.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from PIL import Image
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "src"))
+
+from domains.content import extraction_service
+from domains.content.extraction_service import (
+    ImageContentProcessor,
+    OCRBackend,
+    TesserocrPoolBackend,
+    _parse_tesseract_modes,
+)
+
+
+class FakeEngine:
+    """Stand-in for tesserocr.PyTessBaseAPI."""
+
+    instances = []
+
+    def __init__(self, lang, oem, psm):
+        if lang == "xxx":
+            raise RuntimeError("Failed to init API, possibly an invalid tessdata path")
+        self.lang, self.oem, self.psm = lang, oem, psm
+        self.image = None
+        FakeEngine.instances.append(self)
+
+    def SetImage(self, image):
+        self.image = image
+
+    def GetUTF8Text(self):
+        return f"{self.lang}:{self.image}"
+
+    def Clear(self):
+        self.image = None
+
+    def End(self):
+        pass
+
+
+class TestTesserocrPoolBackend(unittest.TestCase):
+    """Test persistent engine reuse and fallback."""
+
+    def setUp(self):
+        """Set up a pool over fake engines."""
+        FakeEngine.instances = []
+        patcher = patch.object(extraction_service, "tesserocr", Mock(PyTessBaseAPI=FakeEngine))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.fallback = Mock(spec=OCRBackend)
+        self.fallback.image_to_string.return_value = "fallback text"
+        self.backend = TesserocrPoolBackend(max_engines=2, fallback=self.fallback)
+
+    def test_engine_reused_per_language_and_mode(self):
+        """Test language data is loaded once per (lang, oem, psm), not once per page."""
+        texts = [self.backend.image_to_string(f"page{i}", "eng") for i in range(5)]
+        self.backend.image_to_string("page", "eng+fra")
+        self.backend.image_to_string("page", "eng", "--oem 1 --psm 4")
+
+        self.assertEqual(texts[3], "eng:page3")
+        self.assertEqual(
+            [(e.lang, e.oem, e.psm) for e in FakeEngine.instances],
+            [("eng", 3, 6), ("eng+fra", 3, 6), ("eng", 1, 4)],
+        )
+        self.fallback.image_to_string.assert_not_called()
+
+    def test_concurrent_callers_bounded_by_max_engines(self):
+        """Test concurrent OCR creates at most max_engines engines for one language."""
+        barrier = threading.Barrier(4)
+
+        def worker():
+            barrier.wait()
+            for i in range(20):
+                self.backend.image_to_string(i, "eng")
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertLessEqual(len(FakeEngine.instances), 2)
+
+    def test_falls_back_when_engine_unavailable(self):
+        """Test languages without an engine use the fallback, without retrying init."""
+        self.assertEqual(self.backend.image_to_string("page", "xxx"), "fallback text")
+        self.assertEqual(self.backend.image_to_string("page", "xxx"), "fallback text")
+
+        self.assertEqual(self.fallback.image_to_string.call_count, 2)
+        self.assertEqual(FakeEngine.instances, [])
+
+    def test_parse_modes(self):
+        """Test oem/psm are read from config strings with Tesseract defaults."""
+        self.assertEqual(_parse_tesseract_modes("--oem 3 --psm 6"), (3, 6))
+        self.assertEqual(_parse_tesseract_modes(""), (3, 3))
+
+
+class TestProcessorsUseBackend(unittest.TestCase):
+    """Test image OCR goes through the shared backend with in-memory images."""
+
+    def test_image_processor(self):
+        """Test the image processor passes the decoded image to the backend."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "scan.png")
+            Image.new("L", (40, 20), "white").save(path)
+
+            processor = ImageContentProcessor()
+            processor.have_tesseract = True
+            processor.ocr_backend = Mock(spec=OCRBackend)
+            processor.ocr_backend.name = "fake"
+            processor.ocr_backend.image_to_string.return_value = "Receipt total paid\nThank you"
+
+            result = processor.extract_content(path)
+
+        image, lang, config = processor.ocr_backend.image_to_string.call_args[0]
+        self.assertEqual((image.size, lang), ((40, 20), "eng"))
+        self.assertEqual(config, "--oem 3 --psm 6")
+        self.assertEqual(result.metadata["ocr_backend"], "fake")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+"""
+Tests for OCR preprocessing.
+
+Tests render resolution selection from text size and embedded scan
+resolution, the pixel cap, photo normalization, Otsu binarization and
+deskew estimation.
+"""
+
+import io
+import os
+import sys
+import unittest
+
+from PIL import Image, ImageDraw
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "src"))
+
+from domains.content.ocr_preprocessing import (
+    OCRPreprocessing,
+    choose_render_dpi,
+    estimate_skew,
+    otsu_threshold,
+    preprocess_image,
+    render_page_for_ocr,
+)
+
+try:
+    import fitz
+
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+
+def _text_lines_image(width=1200, height=900):
+    """White page with dark bars laid out like lines of text."""
+    image = Image.new("L", (width, height), 255)
+    draw = ImageDraw.Draw(image)
+    for top in range(60, height - 60, 45):
+        draw.rectangle((80, top, width - 80, top + 18), fill=20)
+    return image
+
+
+@unittest.skipUnless(PYMUPDF_AVAILABLE, "PyMuPDF required")
+class TestRenderResolution(unittest.TestCase):
+    """Test per-page render DPI selection."""
+
+    def setUp(self):
+        """Set up an empty document."""
+        self.doc = fitz.open()
+
+    def tearDown(self):
+        """Close the document."""
+        self.doc.close()
+
+    def _scan_page(self, image_px_width, display_inches=2.0):
+        page = self.doc.new_page()
+        buffer = io.BytesIO()
+        Image.new("L", (image_px_width, image_px_width // 2), 200).save(buffer, format="PNG")
+        side = display_inches * 72
+        page.insert_image(fitz.Rect(72, 72, 72 + side, 72 + side / 2), stream=buffer.getvalue())
+        return self.doc[page.number]
+
+    def test_dpi_from_font_size(self):
+        """Test small text renders at higher resolution than headline text."""
+        self.doc.new_page().insert_text((72, 72), "fine print", fontsize=8)
+        self.doc.new_page().insert_text((72, 72), "HEADLINE", fontsize=40)
+
+        self.assertAlmostEqual(choose_render_dpi(self.doc[0]), 30 * 72 / (8 * 0.7))
+        self.assertEqual(choose_render_dpi(self.doc[1]), 150)
+
+    def test_dpi_follows_embedded_scan_resolution(self):
+        """Test scans are not rendered above their native resolution."""
+        self.assertAlmostEqual(choose_render_dpi(self._scan_page(400)), 200)
+        self.assertEqual(choose_render_dpi(self._scan_page(2000)), 400)
+        blank = self.doc.new_page().number
+        self.assertEqual(choose_render_dpi(self.doc[blank]), 300)
+
+    def test_pixel_cap_and_grayscale_render(self):
+        """Test oversized pages are capped and rendered as single-channel images."""
+        poster = self.doc.new_page(width=2384, height=3370)  # A0
+        options = OCRPreprocessing(max_pixels=4_000_000)
+
+        image = render_page_for_ocr(poster, options)
+
+        self.assertEqual(image.mode, "L")
+        self.assertLessEqual(image.width * image.height, 4_000_000 * 1.01)
+
+
+class TestImagePreprocessing(unittest.TestCase):
+    """Test photo normalization, binarization and deskew."""
+
+    def test_photo_is_grayscale_and_capped(self):
+        """Test large color photos are converted to grayscale and downscaled."""
+        photo = Image.new("RGB", (4000, 3000), (200, 180, 160))
+
+        image = preprocess_image(photo, OCRPreprocessing(max_pixels=3_000_000))
+
+        self.assertEqual(image.mode, "L")
+        self.assertEqual(image.size, (2000, 1500))
+
+    def test_exif_orientation_applied(self):
+        """Test phone photos stored sideways are rotated upright."""
+        buffer = io.BytesIO()
+        exif = Image.Exif()
+        exif[0x0112] = 6  # Rotate 90 CW
+        Image.new("RGB", (300, 100)).save(buffer, format="JPEG", exif=exif)
+
+        image = preprocess_image(Image.open(io.BytesIO(buffer.getvalue())))
+
+        self.assertEqual(image.size, (100, 300))
+
+    def test_binarize(self):
+        """Test Otsu separates ink from paper."""
+        image = _text_lines_image()
+        threshold = otsu_threshold(image)
+
+        binary = preprocess_image(image, OCRPreprocessing(binarize=True))
+
+        self.assertTrue(20 <= threshold < 255)
+        histogram = binary.histogram()
+        self.assertEqual(histogram[0] + histogram[255], sum(histogram))
+
+    def test_deskew(self):
+        """Test the skew of rotated text lines is estimated and corrected."""
+        skewed = _text_lines_image().rotate(3, resample=Image.BICUBIC, expand=True, fillcolor=255)
+
+        self.assertEqual(estimate_skew(skewed), -3.0)
+        straightened = preprocess_image(skewed, OCRPreprocessing(deskew=True))
+        self.assertEqual(estimate_skew(straightened), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+Tests for the memory-mapped PDF threat scanner.
+
+Tests single-pass indicator counting (including hex-escaped names), verdict
+caching by content hash, and the extraction threat policy hook.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "src"))
+
+from domains.content.extraction_service import (
+    ContentQuality,
+    ExtractedContent,
+    PDFContentProcessor,
+)
+from shared.infrastructure.security import (
+    PDFThreatScanner,
+    ThreatLevel,
+    skip_high_threat_pdfs,
+)
+
+MALICIOUS_PDF = (
+    b"%PDF-1.4\n1 0 obj << /Type /Catalog /OpenAction 2 0 R /Names << /J#61vaScript 3 0 R >> >>"
+    b"\nendobj\n2 0 obj << /S /Launch /F (cmd.exe) >>\nendobj\n%%EOF\n"
+)
+CLEAN_PDF = b"%PDF-1.4\n1 0 obj << /Type /Catalog /Pages 2 0 R >>\nendobj\n%%EOF\n"
+
+
+class TestPDFThreatScanner(unittest.TestCase):
+    """Test native indicator scanning and verdicts."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.scanner = PDFThreatScanner()
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, name, content):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, "wb") as f:
+            f.write(content)
+        return path
+
+    def test_counts_whole_names_and_hex_escapes(self):
+        """Test names are matched as whole tokens and #xx escapes are decoded."""
+        indicators = self.scanner.scan_indicators(
+            b"/JS (a) /J#53(b) /JSFoo /URI/URI /EmbeddedFiles /EmbeddedFile\x00/AA<<>>"
+        )
+
+        self.assertEqual(indicators["javascript"], 2)
+        self.assertEqual(indicators["uri_references"], 2)
+        self.assertEqual(indicators["embedded_files"], 1)
+        self.assertEqual(indicators["additional_actions"], 1)
+        self.assertEqual(indicators["hex_escaped_names"], 1)
+        self.assertEqual(indicators["launch_action"], 0)
+
+    def test_file_verdicts(self):
+        """Test threat levels for malicious, clean, empty and missing files."""
+        malicious = self.scanner.analyze_pdf(self._write("bad.pdf", MALICIOUS_PDF))
+        clean = self.scanner.analyze_pdf(self._write("clean.pdf", CLEAN_PDF))
+        empty = self.scanner.analyze_pdf(self._write("empty.pdf", b""))
+        missing = self.scanner.analyze_pdf(os.path.join(self.temp_dir, "missing.pdf"))
+
+        self.assertEqual(malicious.threat_level, ThreatLevel.HIGH)
+        self.assertIn("JavaScript", malicious.summary)
+        self.assertEqual(clean.threat_level, ThreatLevel.SAFE)
+        self.assertEqual(empty.threat_level, ThreatLevel.SAFE)
+        self.assertEqual(missing.threat_level, ThreatLevel.LOW)
+        self.assertIn("analysis_error", missing.indicators)
+
+    def test_verdicts_cached_by_content_hash(self):
+        """Test identical content is scanned once regardless of path."""
+        first = self._write("a.pdf", MALICIOUS_PDF)
+        copy = self._write("b.pdf", MALICIOUS_PDF)
+
+        with patch.object(
+            self.scanner, "scan_indicators", wraps=self.scanner.scan_indicators
+        ) as scan:
+            analysis = self.scanner.analyze_pdf(first)
+            self.assertIs(self.scanner.analyze_pdf(copy), analysis)
+            self.scanner.analyze_pdf(self._write("c.pdf", CLEAN_PDF))
+
+        self.assertEqual(scan.call_count, 2)
+
+
+class TestThreatPolicy(unittest.TestCase):
+    """Test the extraction threat policy hook."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "bad.pdf")
+        with open(self.path, "wb") as f:
+            f.write(MALICIOUS_PDF)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_policy_skips_high_threat_extraction(self):
+        """Test a rejecting policy skips extraction entirely."""
+        processor = PDFContentProcessor(threat_policy=skip_high_threat_pdfs)
+
+        with patch.object(processor, "_extract_best") as extract:
+            result = processor.extract_content(self.path)
+
+        extract.assert_not_called()
+        self.assertEqual(result.quality, ContentQuality.FAILED)
+        self.assertEqual(result.metadata["threat_level"], "high")
+        self.assertTrue(result.security_warnings)
+
+    def test_verdict_attached_without_policy(self):
+        """Test files are still extracted by default with the verdict recorded."""
+        processor = PDFContentProcessor()
+        extracted = ExtractedContent(text="text", quality=ContentQuality.GOOD)
+
+        # The sample has no page tree, so bypass triage (which would skip it)
+        with patch.object(processor, "_extract_best", return_value=extracted), patch(
+            "domains.content.extraction_service.triage_pdf", return_value=None
+        ):
+            result = processor.extract_content(self.path)
+
+        self.assertIs(result, extracted)
+        self.assertEqual(result.metadata["threat_level"], "high")
+        self.assertEqual(result.metadata["threat_indicators"]["launch_action"], 1)
+        self.assertIn("Launch actions", result.security_warnings[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,214 @@
+"""
+Tests for pre-flight PDF triage.
+
+Tests page classification (text layer, image-only, blank), skip decisions for
+encrypted and empty files, how the extraction plan and worker lane follow
+from the triage result, and page-selective OCR of mixed documents.
+"""
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "src"))
+
+from domains.content.extraction_service import (
+    ContentQuality,
+    ExtractedContent,
+    ExtractionService,
+    OCRBudget,
+    PDFContentProcessor,
+)
+from domains.content.pdf_triage import PLAN_OCR, PLAN_SKIP, PLAN_TEXT, triage_pdf
+
+try:
+    import fitz
+    from PIL import Image
+
+    FIXTURES_AVAILABLE = True
+except ImportError:
+    FIXTURES_AVAILABLE = False
+
+
+def _png_bytes():
+    buffer = io.BytesIO()
+    Image.new("RGB", (200, 100), "white").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _make_pdf(path, pages, **save_options):
+    """Build a PDF whose pages are "text", "image" or "blank"."""
+    doc = fitz.open()
+    for kind in pages:
+        page = doc.new_page()
+        if kind == "text":
+            page.insert_text((72, 72), "Invoice 2024-03-15 total $120.00")
+        elif kind == "image":
+            page.insert_image(fitz.Rect(72, 72, 472, 272), stream=_png_bytes())
+    doc.save(path, **save_options)
+    doc.close()
+    return path
+
+
+class _TempDirTestCase(unittest.TestCase):
+    """Base case providing a scratch directory for generated PDFs."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _make_pdf(self, name, pages, **save_options):
+        return _make_pdf(os.path.join(self.temp_dir, name), pages, **save_options)
+
+
+@unittest.skipUnless(FIXTURES_AVAILABLE, "PyMuPDF and Pillow required")
+class TestPDFTriage(_TempDirTestCase):
+    """Test page classification and extraction plans."""
+
+    def test_classifies_pages(self):
+        """Test a mixed document plans OCR for its image-only pages only."""
+        triage = triage_pdf(self._make_pdf("mixed.pdf", ["text", "image", "blank"]))
+
+        self.assertEqual(triage.plan, PLAN_OCR)
+        self.assertEqual(triage.text_pages, [0])
+        self.assertEqual(triage.ocr_pages, [1])
+        self.assertEqual(triage.blank_pages, [2])
+        self.assertTrue(triage.ocr_heavy)
+
+    def test_text_only_document(self):
+        """Test documents without image-only pages go to text extraction."""
+        triage = triage_pdf(self._make_pdf("text.pdf", ["text", "blank"]))
+
+        self.assertEqual(triage.plan, PLAN_TEXT)
+        self.assertEqual(triage.pages_inspected, 2)
+        self.assertFalse(triage.ocr_heavy)
+
+    def test_skips_encrypted_and_empty_files(self):
+        """Test password-protected and empty files are skipped."""
+        encrypted = self._make_pdf(
+            "locked.pdf",
+            ["text"],
+            encryption=fitz.PDF_ENCRYPT_AES_256,
+            user_pw="secret",
+            owner_pw="owner",
+        )
+        empty = os.path.join(self.temp_dir, "empty.pdf")
+        open(empty, "wb").close()
+
+        self.assertEqual(triage_pdf(encrypted).plan, PLAN_SKIP)
+        self.assertEqual(triage_pdf(encrypted).reason, "encrypted")
+        self.assertEqual(triage_pdf(empty).plan, PLAN_SKIP)
+
+
+@unittest.skipUnless(FIXTURES_AVAILABLE, "PyMuPDF and Pillow required")
+class TestTriagedExtraction(_TempDirTestCase):
+    """Test the extraction service follows the triage plan."""
+
+    def test_text_plan_never_runs_ocr(self):
+        """Test OCR is not attempted for documents with a full text layer."""
+        processor = PDFContentProcessor()
+        path = self._make_pdf("text.pdf", ["text"])
+
+        with patch.object(processor, "_extract_with_ocr") as ocr:
+            result = processor.extract_content(path)
+
+        ocr.assert_not_called()
+        self.assertEqual(result.metadata["triage_plan"], PLAN_TEXT)
+
+    def test_scanned_document_tries_ocr_first(self):
+        """Test image-only documents start with OCR instead of the text cascade."""
+        processor = PDFContentProcessor()
+        path = self._make_pdf("scan.pdf", ["image", "image"])
+        ocr_result = ExtractedContent(text="scanned text", quality=ContentQuality.GOOD)
+        processor.have_tesseract = True
+        processor._extract_with_ocr = lambda file_path: ocr_result
+
+        with patch.object(processor, "_extract_with_pymupdf") as text:
+            result = processor.extract_content(path)
+
+        text.assert_not_called()
+        self.assertIs(result, ocr_result)
+
+    def test_skipped_document_is_not_extracted(self):
+        """Test skip plans fail fast without running any extractor."""
+        processor = PDFContentProcessor()
+        path = self._make_pdf(
+            "locked.pdf", ["text"], encryption=fitz.PDF_ENCRYPT_AES_256, user_pw="secret"
+        )
+
+        with patch.object(processor, "_extract_best") as extract:
+            result = processor.extract_content(path)
+
+        extract.assert_not_called()
+        self.assertEqual(result.quality, ContentQuality.FAILED)
+        self.assertIn("encrypted", result.error_message)
+
+    def test_extraction_lanes(self):
+        """Test scans and images are routed to the OCR lane."""
+        service = ExtractionService()
+        image = os.path.join(self.temp_dir, "photo.png")
+        with open(image, "wb") as f:
+            f.write(_png_bytes())
+
+        self.assertEqual(service.extraction_lane(self._make_pdf("t.pdf", ["text"])), "text")
+        self.assertEqual(service.extraction_lane(self._make_pdf("s.pdf", ["image"])), "ocr")
+        self.assertEqual(service.extraction_lane(image), "ocr")
+
+
+@unittest.skipUnless(FIXTURES_AVAILABLE, "PyMuPDF and Pillow required")
+class TestPageSelectiveOCR(_TempDirTestCase):
+    """Test OCR runs only on pages without a usable text layer."""
+
+    def _extract(self, pages, budget=None):
+        processor = PDFContentProcessor(ocr_budget=budget)
+        processor.have_tesseract = True
+        path = self._make_pdf("mixed.pdf", pages)
+        ocr_calls = []
+
+        def fake_ocr(image, lang, config):
+            ocr_calls.append(image.size)
+            return f"scanned receipt {len(ocr_calls)}"
+
+        processor.ocr_backend = Mock(image_to_string=Mock(side_effect=fake_ocr))
+        return processor._extract_with_ocr(path), ocr_calls
+
+    def test_ocr_limited_to_image_pages_and_merged_in_order(self):
+        """Test text-layer pages are not OCR'd and text keeps page order."""
+        result, ocr_calls = self._extract(["text", "image", "blank", "image"])
+
+        self.assertEqual(len(ocr_calls), 2)
+        self.assertEqual(result.metadata["text_layer_pages"], [0])
+        self.assertEqual(result.metadata["ocr_pages"], [1, 3])
+        lines = [line for line in result.text.splitlines() if line]
+        self.assertEqual(lines[0], "Invoice 2024-03-15 total $120.00")
+        self.assertEqual(lines[1:], ["scanned receipt 1", "scanned receipt 2"])
+
+    def test_page_budget(self):
+        """Test pages beyond the OCR budget are reported, not OCR'd."""
+        result, ocr_calls = self._extract(
+            ["image", "image", "image"], OCRBudget(max_pages=1)
+        )
+
+        self.assertEqual(len(ocr_calls), 1)
+        self.assertEqual(result.metadata["ocr_pages"], [0])
+        self.assertEqual(result.metadata["ocr_pages_skipped"], [1, 2])
+
+    def test_time_budget(self):
+        """Test no new page is started once the OCR time budget is spent."""
+        result, ocr_calls = self._extract(["image", "image"], OCRBudget(max_seconds=0))
+
+        self.assertEqual(ocr_calls, [])
+        self.assertEqual(result.metadata["ocr_pages_skipped"], [0, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests for Cluster Selection Engine
+
+Tests that the scalable k-search matches the reference path (independent
+KMeans fits scored by exact silhouette) on a labeled fixture corpus, and
+that assignments are deterministic.
+"""
+
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# Add src to path for imports - correct path for domain structure
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "src"))
+
+from domains.organization.content_analysis.cluster_selection import (
+    SKLEARN_AVAILABLE,
+    ClusterSelectionConfig,
+    ClusterSelectionEngine,
+)
+from domains.organization.content_analysis.ml_refiner import SelectiveMLRefinement
+
+
+def _labeled_corpus(n_docs, n_categories=5, dims=64, seed=7):
+    """Embedding-like corpus with known category labels."""
+    rng = np.random.RandomState(seed)
+    centers = rng.normal(0, 10, size=(n_categories, dims))
+    labels = rng.randint(0, n_categories, size=n_docs)
+    embeddings = centers[labels] + rng.normal(0, 3.0, size=(n_docs, dims))
+    return embeddings.astype(np.float32), labels
+
+
+def _reference_selection(embeddings, max_k=8):
+    """Previous refiner behaviour: full KMeans + exact silhouette for every k."""
+    from sklearn.cluster import KMeans
+    from sklearn.metrics import silhouette_score
+
+    best_k, best_score = 2, -1
+    for k in range(2, min(max_k, len(embeddings) // 2) + 1):
+        labels = KMeans(n_clusters=k, random_state=42, n_init="auto").fit_predict(embeddings)
+        score = silhouette_score(embeddings, labels)
+        if score > best_score:
+            best_k, best_score = k, score
+    return KMeans(n_clusters=best_k, random_state=42, n_init="auto").fit_predict(embeddings)
+
+
+@unittest.skipUnless(SKLEARN_AVAILABLE, "scikit-learn not available")
+class TestClusterSelectionEngine(unittest.TestCase):
+    """Test accuracy parity and determinism."""
+
+    def _agreement(self, labels_a, labels_b):
+        from sklearn.metrics import adjusted_rand_score
+
+        return adjusted_rand_score(labels_a, labels_b)
+
+    def test_parity_with_reference_path(self):
+        """Test the default engine recovers the same clusters as the reference path."""
+        embeddings, truth = _labeled_corpus(300)
+
+        selection = ClusterSelectionEngine().select(embeddings)
+        reference = _reference_selection(embeddings)
+
+        self.assertEqual(selection.k, 5)
+        self.assertGreaterEqual(self._agreement(truth, selection.labels), 0.95)
+        self.assertGreaterEqual(
+            self._agreement(truth, selection.labels), self._agreement(truth, reference) - 0.02
+        )
+
+    def test_large_corpus_modes_agree(self):
+        """Test MiniBatchKMeans with sampled and simplified silhouette on a large corpus."""
+        embeddings, truth = _labeled_corpus(3000)
+
+        for silhouette in ("sampled", "simplified"):
+            config = ClusterSelectionConfig(
+                silhouette=silhouette, silhouette_sample_size=500, minibatch_threshold=1000
+            )
+            selection = ClusterSelectionEngine(config).select(embeddings)
+            self.assertEqual(selection.k, 5, silhouette)
+            self.assertGreaterEqual(self._agreement(truth, selection.labels), 0.95, silhouette)
+
+    def test_parallel_k_search(self):
+        """Test evaluating k values in parallel selects the same k."""
+        embeddings, truth = _labeled_corpus(300)
+
+        selection = ClusterSelectionEngine(ClusterSelectionConfig(parallel_k=4)).select(embeddings)
+
+        self.assertEqual(selection.k, 5)
+        self.assertEqual(sorted(selection.scores_by_k), list(range(2, 9)))
+        self.assertGreaterEqual(self._agreement(truth, selection.labels), 0.95)
+
+    def test_assignments_are_deterministic(self):
+        """Test repeated runs with fixed seeds produce identical labels."""
+        embeddings, _ = _labeled_corpus(2500)
+        config = ClusterSelectionConfig(minibatch_threshold=1000, silhouette_sample_size=500)
+
+        first = ClusterSelectionEngine(config).select(embeddings)
+        second = ClusterSelectionEngine(config).select(embeddings)
+
+        self.assertEqual(first.labels, second.labels)
+        self.assertEqual(first.scores_by_k, second.scores_by_k)
+
+    def test_small_inputs_form_single_cluster(self):
+        """Test too few documents skip the k-search."""
+        embeddings, _ = _labeled_corpus(3)
+
+        selection = ClusterSelectionEngine().select(embeddings)
+
+        self.assertEqual(selection.k, 1)
+        self.assertEqual(selection.labels, [0, 0, 0])
+
+    def test_refiner_uses_engine_assignment(self):
+        """Test the refiner's clustering step returns the engine's labels without refitting."""
+        embeddings, truth = _labeled_corpus(60)
+        refiner = SelectiveMLRefinement()
+
+        labels = refiner._apply_smart_clustering(embeddings, [{}] * len(embeddings))
+
+        self.assertEqual(refiner._determine_optimal_cluster_count(embeddings, len(embeddings)), 5)
+        self.assertGreaterEqual(self._agreement(truth, labels), 0.95)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Tests for Embedding Backend
+
+Tests hardware-tier model selection, that ONNX is opt-in, backend identities,
+and the backend benchmark's throughput and agreement report.
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+# Add src to path for imports - correct path for domain structure
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "src"))
+
+from domains.organization.content_analysis import embedding_backend
+from domains.organization.content_analysis.embedding_backend import (
+    REFERENCE_MODEL,
+    EmbeddingBackendConfig,
+    OnnxEmbeddingBackend,
+    SentenceTransformerBackend,
+    create_embedding_backend,
+    select_model_for_hardware,
+)
+from tools.embedding_benchmark import benchmark_backends, build_corpus
+
+
+class _TemplateEmbedder:
+    """Embeds a text by its document type keyword, with optional noise."""
+
+    KEYWORDS = ["invoice", "contract", "report", "letter", "lab_results", "tax_return"]
+
+    def __init__(self, noise=0.0):
+        self.rng = np.random.RandomState(0)
+        self.noise = noise
+
+    def encode(self, texts, convert_to_numpy=True):
+        vectors = np.array(
+            [[1.0 if k in t else 0.0 for k in self.KEYWORDS] for t in texts], dtype=np.float32
+        )
+        return vectors + self.rng.normal(0, self.noise, size=vectors.shape)
+
+
+class TestEmbeddingBackendSelection(unittest.TestCase):
+    """Test model and backend selection."""
+
+    def test_model_selected_by_hardware_tier(self):
+        """Test smaller models are chosen on lower hardware tiers."""
+        detector = MagicMock()
+        for tier, expected in (
+            ("premium", REFERENCE_MODEL),
+            ("standard", "all-MiniLM-L12-v2"),
+            ("ultra_lightweight", "all-MiniLM-L6-v2"),
+        ):
+            detector.get_system_tier.return_value = tier
+            self.assertEqual(select_model_for_hardware(detector), expected)
+
+        detector.get_system_tier.side_effect = RuntimeError("no psutil")
+        self.assertEqual(select_model_for_hardware(detector), REFERENCE_MODEL)
+
+    @patch.object(embedding_backend, "SENTENCE_TRANSFORMERS_AVAILABLE", False)
+    def test_no_backend_without_sentence_transformers(self):
+        """Test None is returned when no embedding runtime is installed."""
+        self.assertIsNone(create_embedding_backend())
+
+    @patch.object(embedding_backend, "SENTENCE_TRANSFORMERS_AVAILABLE", True)
+    @patch.object(embedding_backend, "ONNXRUNTIME_AVAILABLE", True)
+    def test_auto_keeps_fp32_reference_backend(self):
+        """Test auto uses PyTorch fp32 even when ONNX Runtime is installed."""
+        config = EmbeddingBackendConfig(model_name="all-MiniLM-L6-v2")
+        with patch.object(embedding_backend, "OnnxEmbeddingBackend") as onnx, patch.object(
+            embedding_backend, "SentenceTransformerBackend"
+        ) as torch_backend:
+            backend = create_embedding_backend(config)
+
+        onnx.assert_not_called()
+        torch_backend.assert_called_once_with("all-MiniLM-L6-v2", config)
+        self.assertIs(backend, torch_backend.return_value)
+        self.assertFalse(config.quantized)
+
+    def test_identity_separates_backends_and_quantization(self):
+        """Test only the fp32 reference backend is identified by the model alone."""
+        identities = []
+        for backend_class, name in (
+            (SentenceTransformerBackend, "sentence_transformers"),
+            (OnnxEmbeddingBackend, "onnx"),
+            (OnnxEmbeddingBackend, "onnx_int8"),
+        ):
+            backend = backend_class.__new__(backend_class)
+            backend.model_name, backend.name = REFERENCE_MODEL, name
+            identities.append(backend.identity)
+
+        self.assertEqual(
+            identities,
+            [REFERENCE_MODEL, f"{REFERENCE_MODEL}:onnx", f"{REFERENCE_MODEL}:onnx_int8"],
+        )
+
+    @patch.object(embedding_backend, "SENTENCE_TRANSFORMERS_AVAILABLE", True)
+    @patch.object(embedding_backend, "ONNXRUNTIME_AVAILABLE", False)
+    def test_explicit_onnx_requires_onnxruntime(self):
+        """Test an explicit ONNX request is not silently served by PyTorch."""
+        with patch.object(embedding_backend, "SentenceTransformerBackend") as torch_backend:
+            self.assertIsNone(create_embedding_backend(EmbeddingBackendConfig(backend="onnx")))
+        torch_backend.assert_not_called()
+
+
+class TestEmbeddingBenchmark(unittest.TestCase):
+    """Test the backend benchmark report."""
+
+    def test_reports_throughput_and_reference_agreement(self):
+        """Test each backend gets docs/sec, accuracy and agreement with the first backend."""
+        texts, labels = build_corpus(120)
+
+        results = benchmark_backends(
+            {"reference": _TemplateEmbedder(), "noisy": _TemplateEmbedder(noise=2.0)},
+            texts,
+            labels,
+        )
+
+        self.assertEqual([r["backend"] for r in results], ["reference", "noisy"])
+        self.assertEqual(results[0]["reference_agreement"], 1.0)
+        self.assertEqual(results[0]["accuracy"], 1.0)
+        self.assertLess(results[1]["reference_agreement"], 1.0)
+        self.assertTrue(all(r["docs_per_sec"] > 0 for r in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
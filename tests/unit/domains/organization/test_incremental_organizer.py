@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tests for Incremental Organizer
+
+Tests that documents are moved in micro-batches while processing continues,
+uncertain documents are refined in batches, and reassignments are reconciled.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add src to path for imports - correct path for domain structure
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "src"))
+
+from domains.organization.clustering_service import (
+    ClassificationResult,
+    ClusteringConfig,
+    ClusteringMethod,
+    ClusteringService,
+)
+from domains.organization.folder_service import FolderService
+from domains.organization.incremental_organizer import IncrementalOrganizer
+
+
+def _result(category, confidence, method=ClusteringMethod.RULE_BASED):
+    return ClassificationResult(
+        category=category,
+        confidence=confidence,
+        method=method,
+        reasoning="test",
+        alternative_categories=[],
+        metadata={},
+    )
+
+
+class TestIncrementalOrganizer(unittest.TestCase):
+    """Test incremental organization behaviour."""
+
+    def setUp(self):
+        """Create target folder and organizer with stubbed classification."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.target = self.temp_dir.name
+        self.clustering = ClusteringService(ClusteringConfig(ml_threshold=0.7, min_ml_documents=2))
+        self.rule_results = {}
+        self.classify_patch = patch.object(
+            self.clustering,
+            "classify_document",
+            side_effect=lambda doc, allow_ml=True: self.rule_results[doc["filename"]],
+        )
+        self.classify_patch.start()
+        self.organizer = IncrementalOrganizer(
+            self.target, self.clustering, FolderService(), micro_batch_size=2, ml_batch_size=2
+        )
+
+    def tearDown(self):
+        """Clean up."""
+        self.classify_patch.stop()
+        self.temp_dir.cleanup()
+
+    def _add(self, filename, category, confidence):
+        path = os.path.join(self.target, filename)
+        with open(path, "w") as f:
+            f.write(filename)
+        self.rule_results[filename] = _result(category, confidence)
+        self.organizer.add_document({"current_path": path, "filename": filename, "content": "x"})
+        return path
+
+    def test_documents_move_in_micro_batches(self):
+        """Test moves happen as soon as a micro-batch fills, before finalize."""
+        first = self._add("invoice_1.pdf", "financial", 0.9)
+        self.assertTrue(os.path.exists(first))
+
+        self._add("invoice_2.pdf", "financial", 0.9)
+
+        self.assertFalse(os.path.exists(first))
+        self.assertTrue(os.path.exists(os.path.join(self.target, "financial", "invoice_1.pdf")))
+        self.assertEqual(self.organizer.stats["micro_batches"], 1)
+
+    def test_ml_refinement_reassigns_moved_documents(self):
+        """Test refined categories move provisionally placed documents during reconciliation."""
+        self.organizer.ml_batch_size = 3
+        self._add("invoice_1.pdf", "financial", 0.9)
+        self._add("invoice_2.pdf", "financial", 0.9)
+        self._add("scan_1.pdf", "financial", 0.5)
+        scan_2 = self._add("scan_2.pdf", "financial", 0.5)
+        self.assertTrue(os.path.exists(os.path.join(self.target, "financial", "scan_2.pdf")))
+
+        refined = {scan_2: _result("legal", 0.8, ClusteringMethod.ML_ENHANCED)}
+        with patch.object(
+            self.clustering, "refine_uncertain_documents", return_value=refined
+        ) as refine:
+            self._add("scan_3.pdf", "financial", 0.5)
+            refine.assert_called_once()
+            self.assertEqual(len(refine.call_args[0][0]), 3)
+
+            results = self.organizer.finalize(enable_learning=False)
+
+        self.assertTrue(results["success"])
+        self.assertEqual(results["incremental_stats"]["reassignments"], 1)
+        self.assertEqual(results["classification_results"][scan_2].category, "legal")
+        self.assertEqual(
+            results["final_locations"][scan_2], os.path.join(self.target, "legal", "scan_2.pdf")
+        )
+        self.assertTrue(os.path.exists(os.path.join(self.target, "legal", "scan_2.pdf")))
+        self.assertFalse(os.path.exists(os.path.join(self.target, "financial", "scan_2.pdf")))
+        self.assertEqual(results["files_organized"], 6)
+
+    def test_finalize_flushes_partial_batch(self):
+        """Test documents left in an incomplete micro-batch are moved at finalize."""
+        path = self._add("invoice_1.pdf", "financial", 0.9)
+
+        results = self.organizer.finalize(enable_learning=False)
+
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(results["documents_processed"], 1)
+        with self.assertRaises(RuntimeError):
+            self._add("invoice_2.pdf", "financial", 0.9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Tests for Reference Index
+
+Tests batched nearest-neighbour lookup, persistence across sessions, the IVF
+layout for large histories, and cluster interpretation in the ML refiner.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+# Add src to path for imports - correct path for domain structure
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "src"))
+
+from domains.organization.content_analysis.ml_refiner import SelectiveMLRefinement
+from domains.organization.content_analysis.reference_index import (
+    INDEX_FILE,
+    SKLEARN_AVAILABLE,
+    ReferenceIndex,
+)
+
+CATEGORIES = ["invoices", "contracts", "reports"]
+
+
+def _category_corpus(n_per_category, dims=32, seed=3):
+    """Embeddings scattered around one direction per category."""
+    rng = np.random.RandomState(seed)
+    centers = rng.normal(0, 1, size=(len(CATEGORIES), dims))
+    embeddings, labels = [], []
+    for i, category in enumerate(CATEGORIES):
+        embeddings.append(centers[i] + rng.normal(0, 0.2, size=(n_per_category, dims)))
+        labels.extend([category] * n_per_category)
+    return np.vstack(embeddings).astype(np.float32), labels, centers
+
+
+class _KeywordEmbedder:
+    """Deterministic stand-in for the sentence-transformer model."""
+
+    def __init__(self):
+        self.encoded = 0
+
+    def encode(self, texts, convert_to_numpy=True):
+        self.encoded += len(texts)
+        rows = []
+        for text in texts:
+            text = text.lower()
+            rows.append(
+                [
+                    1.0 + text.count("invoice"),
+                    1.0 + text.count("contract"),
+                    1.0 + text.count("report"),
+                    0.5,
+                ]
+            )
+        vectors = np.array(rows, dtype=np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True) * 3
+
+
+class TestReferenceIndex(unittest.TestCase):
+    """Test index lookup and persistence."""
+
+    def setUp(self):
+        """Create temporary state directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.state_dir = os.path.join(self.temp_dir.name, ".content_tamer")
+
+    def tearDown(self):
+        """Clean up."""
+        self.temp_dir.cleanup()
+
+    def test_batched_query_returns_nearest_categories(self):
+        """Test one query call labels every embedding by its nearest references."""
+        embeddings, labels, centers = _category_corpus(20)
+        index = ReferenceIndex(self.state_dir)
+        index.add(embeddings, labels)
+
+        neighbours = index.query(centers, top_k=5)
+
+        self.assertEqual(len(neighbours), 3)
+        for category, result in zip(CATEGORIES, neighbours):
+            self.assertEqual(len(result), 5)
+            self.assertEqual({c for c, _ in result}, {category})
+            similarities = [s for _, s in result]
+            self.assertEqual(similarities, sorted(similarities, reverse=True))
+
+        category, similarity = index.vote(centers[1:2] + 0.05)
+        self.assertEqual(category, "contracts")
+        self.assertGreater(similarity, 0.9)
+
+    def test_index_persists_and_grows_across_sessions(self):
+        """Test saved references load in a later session and new ones append."""
+        embeddings, labels, centers = _category_corpus(10)
+        first = ReferenceIndex(self.state_dir, model_name="model-a")
+        self.assertFalse(first.save())  # Nothing to write yet
+        self.assertFalse(os.path.exists(self.state_dir))
+        first.add(embeddings[:10], labels[:10])
+        self.assertTrue(first.save())
+
+        second = ReferenceIndex(self.state_dir, model_name="model-a")
+        self.assertEqual(len(second), 10)
+        second.add(embeddings[10:], labels[10:])
+        second.save()
+
+        third = ReferenceIndex(self.state_dir, model_name="model-a")
+        self.assertEqual(len(third), 30)
+        self.assertEqual(third.vote(centers[2:3])[0], "reports")
+
+        other_model = ReferenceIndex(self.state_dir, model_name="model-b")
+        self.assertEqual(len(other_model), 0)
+
+    def test_max_entries_keeps_newest(self):
+        """Test the oldest references are dropped beyond the size limit."""
+        embeddings, labels, _ = _category_corpus(10)
+        index = ReferenceIndex(self.state_dir, max_entries=15)
+
+        index.add(embeddings, labels)
+
+        self.assertEqual(len(index), 15)
+        kept = {c for c, _ in index.query(embeddings[-1:], top_k=15)[0]}
+        self.assertEqual(kept, {"contracts", "reports"})
+
+    @unittest.skipUnless(SKLEARN_AVAILABLE, "scikit-learn not available")
+    def test_ivf_matches_flat_search(self):
+        """Test the inverted-file layout returns the same labels as exact search."""
+        embeddings, labels, centers = _category_corpus(200)
+        queries = centers + np.random.RandomState(9).normal(0, 0.2, size=centers.shape)
+        flat = ReferenceIndex(self.state_dir)
+        ivf = ReferenceIndex(self.state_dir, ivf_threshold=100, ivf_probe=4)
+        flat.add(embeddings, labels)
+        ivf.add(embeddings, labels)
+
+        for query in queries:
+            self.assertEqual(ivf.vote(query[None, :])[0], flat.vote(query[None, :])[0])
+
+
+class TestRefinerReferenceIndex(unittest.TestCase):
+    """Test the ML refiner labels clusters from the reference index."""
+
+    def setUp(self):
+        """Create refiner with a deterministic embedder."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.index = ReferenceIndex(os.path.join(self.temp_dir.name, ".content_tamer"))
+        self.refiner = SelectiveMLRefinement(reference_index=self.index)
+        self.embedder = _KeywordEmbedder()
+        self.refiner.embedding_model = self.embedder
+
+    def tearDown(self):
+        """Clean up."""
+        self.temp_dir.cleanup()
+
+    def test_clusters_labeled_from_previous_session_references(self):
+        """Test references from an earlier session label new uncertain documents."""
+        previous = [
+            {
+                "filename": f"{kind}_{i}.pdf",
+                "content_preview": kind,
+                "category": category,
+                "confidence": 0.9,
+            }
+            for kind, category in (("contract", "legal"), ("invoice", "financial"))
+            for i in range(3)
+        ]
+        self.assertEqual(self.refiner.add_reference_documents(previous), 6)
+
+        uncertain = [
+            {
+                "id": f"/t/scan_{i}.pdf",
+                "filename": f"scan_{i}.pdf",
+                "content_preview": "contract contract",
+            }
+            for i in range(4)
+        ]
+        embeddings = self.embedder.encode([d["content_preview"] for d in uncertain])
+        results = self.refiner._interpret_clusters_semantically(
+            uncertain, [0, 0, 0, 0], embeddings, []
+        )
+
+        self.assertEqual(set(results), {d["id"] for d in uncertain})
+        self.assertTrue(all(r["category"] == "legal" for r in results.values()))
+        self.assertGreaterEqual(results["/t/scan_0.pdf"]["confidence"], 0.4)
+
+        self.assertTrue(self.index.save())
+        reloaded = ReferenceIndex(self.index.state_dir, model_name=self.index.model_name)
+        self.assertEqual(len(reloaded), 6)
+
+    def test_cluster_labeling_does_not_re_add_session_references(self):
+        """Test references recorded by the classifier are not embedded and added again."""
+        session = [
+            {
+                "filename": f"contract_{i}.pdf",
+                "content_preview": "contract",
+                "category": "legal",
+                "confidence": 0.9,
+            }
+            for i in range(3)
+        ]
+        self.refiner.add_reference_documents(session)
+        uncertain = [{"id": "/t/scan.pdf", "filename": "scan.pdf", "content_preview": "contract"}]
+        embeddings = self.embedder.encode(["contract"])
+
+        self.refiner._interpret_clusters_semantically(uncertain, [0], embeddings, session)
+
+        self.assertEqual(len(self.index), 3)
+        self.assertFalse(os.path.exists(os.path.join(self.index.state_dir, INDEX_FILE)))
+
+    def test_low_confidence_documents_not_indexed(self):
+        """Test only confident classifications become references."""
+        docs = [
+            {
+                "filename": "a.pdf",
+                "content_preview": "report",
+                "category": "reports",
+                "confidence": 0.5,
+            }
+        ]
+
+        self.assertEqual(self.refiner.add_reference_documents(docs), 0)
+        self.assertEqual(len(self.index), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
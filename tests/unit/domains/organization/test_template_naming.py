@@ -0,0 +1,146 @@
+"""
+Tests for the template naming fast path.
+
+Tests that templates are derived from AI-generated names, that a recurring
+vendor is named from its template once enough AI names agree, that audits
+are sampled and compared, and that templates persist across runs.
+"""
+
+import calendar
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Add src to path for imports - correct path for domain structure
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "src"))
+
+from domains.organization.learning_service import LearningService
+from domains.organization.template_naming import (
+    TemplateNamingConfig,
+    TemplateNamingService,
+    derive_template,
+    template_fields,
+    vendor_from_text,
+)
+from shared.infrastructure.entity_scanner import scan_entities
+
+
+def utility_bill(month: int) -> str:
+    return (
+        "ACME ENERGY LLC\n"
+        "123 Main St, Springfield\n"
+        f"Invoice #48{month:03d}   Invoice Date: 2024-{month:02d}-01\n"
+        f"Amount due: $1{month}2.17   Due date: 2024-{month:02d}-21\n"
+        "Payment terms: Net 20. Total charges for the billing period. Please remit payment."
+    )
+
+
+def ai_name(month: int) -> str:
+    return f"Acme_Energy_Electric_Bill_{calendar.month_name[month]}_2024"
+
+
+class TestTemplateDerivation(unittest.TestCase):
+    """Test vendors and templates are found in documents and AI names."""
+
+    def test_vendor_from_letterhead(self):
+        """Test legal suffixes are dropped and vendor words kept."""
+        self.assertEqual(vendor_from_text(utility_bill(3)), "acme energy")
+        self.assertEqual(vendor_from_text("First National Bank\nStatement"), "first national bank")
+        self.assertIsNone(vendor_from_text("Meeting notes\nDear team, please review"))
+
+    def test_fields_become_placeholders(self):
+        """Test dates, amounts and the reference number are replaced, longest first."""
+        fields = template_fields(scan_entities(utility_bill(3)), "48003")
+
+        template = derive_template("Acme_Invoice_48003_2024-03-01_132_17", fields)
+
+        self.assertEqual(template, "Acme_Invoice_{reference}_{date0_ymd}_{amount0}")
+        self.assertEqual(template.format(**fields), "Acme_Invoice_48003_2024-03-01_132_17")
+
+    def test_name_without_fields_gives_no_template(self):
+        """Test a constant AI name is not learned as a template."""
+        fields = template_fields(scan_entities(utility_bill(3)), "48003")
+
+        self.assertIsNone(derive_template("Acme_Energy_Bill", fields))
+
+
+class TestTemplateNamingService(unittest.TestCase):
+    """Test the fast path learns from the AI and takes over recurring documents."""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def _service(self, **settings) -> TemplateNamingService:
+        return TemplateNamingService(
+            LearningService(self.folder), TemplateNamingConfig(**settings)
+        )
+
+    def _run(self, service, months):
+        decisions = []
+        for month in months:
+            decision = service.propose(utility_bill(month), "scan.pdf")
+            if not decision.use_template:
+                service.observe(decision, ai_name(month))
+            decisions.append(decision)
+        return decisions
+
+    def test_recurring_vendor_skips_ai_above_threshold(self):
+        """Test the template is used once four consistent AI names give 0.8 confidence."""
+        service = self._service(audit_rate=0.0)
+
+        decisions = self._run(service, range(1, 8))
+
+        self.assertEqual(
+            [d.reason for d in decisions[:5]],
+            ["new_vendor", "low_confidence", "low_confidence", "low_confidence", "accepted"],
+        )
+        self.assertTrue(all(d.use_template for d in decisions[4:]))
+        self.assertEqual(decisions[5].filename, ai_name(6))
+        stats = service.get_statistics()
+        self.assertEqual((stats["fast_path"], stats["observed"]), (3, 4))
+
+    def test_constant_ai_names_never_reach_fast_path(self):
+        """Test observations without field values are counted but never accepted."""
+        service = self._service(audit_rate=0.0)
+
+        for month in range(1, 8):
+            decision = service.propose(utility_bill(month), "scan.pdf")
+            self.assertFalse(decision.use_template)
+            service.observe(decision, "Acme_Energy_Bill")
+
+        self.assertEqual(service.get_statistics()["observed"], 7)
+
+    def test_audits_are_sampled_and_disagreement_lowers_confidence(self):
+        """Test every n-th template name goes to the AI and a different AI name counts."""
+        service = self._service(audit_rate=0.5)
+        self._run(service, range(1, 6))
+
+        audit = service.propose(utility_bill(6), "scan.pdf")
+        self.assertTrue(audit.audit)
+        self.assertFalse(audit.use_template)
+        service.observe(audit, "Acme_Energy_Statement_June")
+
+        stats = service.get_statistics()
+        self.assertEqual((stats["audited"], stats["audit_matches"]), (1, 0))
+        self.assertFalse(stats["recent_audits"][-1]["matched"])
+        self.assertEqual(service.propose(utility_bill(7), "scan.pdf").reason, "low_confidence")
+
+    def test_templates_persist_for_the_next_run(self):
+        """Test a new service for the same folder names the vendor from saved templates."""
+        service = self._service(audit_rate=0.0)
+        self._run(service, range(1, 5))
+        self.assertTrue(service.save())
+
+        decision = self._service(audit_rate=0.0).propose(utility_bill(9), "scan.pdf")
+
+        self.assertTrue(decision.use_template)
+        self.assertEqual(decision.filename, ai_name(9))
+
+
+if __name__ == "__main__":
+    unittest.main()
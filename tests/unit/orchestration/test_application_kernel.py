@@ -7,14 +7,17 @@ Tests the main application orchestration and domain service coordination.
 import os
 import sys
 import tempfile
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, Mock, patch
 
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "src"))
 
 from core.application_container import ApplicationContainer
-from orchestration.application_kernel import ApplicationKernel
+from orchestration.application_kernel import ApplicationKernel, _LanePrefetcher
+from shared.infrastructure.worker_sizing import ConcurrencyLimit
 
 
 class TestApplicationKernel(unittest.TestCase):
@@ -219,6 +222,166 @@ class TestApplicationKernel(unittest.TestCase):
         self.assertIsInstance(health["issues"], list)
         self.assertIsInstance(health["warnings"], list)
 
+    def test_schedule_extraction_lanes(self):
+        """Test OCR-lane documents are extracted in the background after text documents."""
+        content_service = Mock()
+        content_service.extraction_lane.side_effect = lambda path: (
+            "ocr" if path.endswith(".png") else "text"
+        )
+        content_service.process_document_complete.side_effect = lambda path: {"path": path}
+        self.kernel._content_service = content_service
+        config = Mock(ocr_workers=2)
+
+        ordered, text_lane, prefetcher, prefetched = self.kernel._schedule_extraction_lanes(
+            ["scan.png", "a.pdf", "photo.png", "b.pdf"], config
+        )
+        try:
+            self.assertEqual(ordered, ["a.pdf", "b.pdf", "scan.png", "photo.png"])
+            self.assertEqual(text_lane, ["a.pdf", "b.pdf"])
+            self.assertEqual(set(prefetched), {"scan.png", "photo.png"})
+            self.assertEqual(prefetched["scan.png"].result(), {"path": "scan.png"})
+        finally:
+            prefetcher.shutdown()
+
+        config.ocr_workers = 0
+        lanes = self.kernel._schedule_extraction_lanes(["scan.png"], config)
+        self.assertEqual(lanes, (["scan.png"], ["scan.png"], None, {}))
+
+    def test_ocr_prefetch_is_bounded(self):
+        """Test OCR documents start early but stay at most two per worker ahead of the loop."""
+        content_service = Mock()
+        content_service.extraction_lane.side_effect = lambda path: (
+            "ocr" if path.endswith(".png") else "text"
+        )
+        content_service.process_document_complete.side_effect = lambda path: {"path": path}
+        self.kernel._content_service = content_service
+        config = Mock(ocr_workers=1)
+        scans = [f"scan_{i}.png" for i in range(6)]
+
+        ordered, _text_lane, prefetcher, prefetched = self.kernel._schedule_extraction_lanes(
+            ["a.pdf", "b.pdf"] + scans, config
+        )
+        try:
+            self.assertEqual(sorted(prefetched), scans[:2])
+            prefetcher.advance(1)
+            self.assertEqual(sorted(prefetched), scans[:2])
+            for position in range(2, 5):
+                prefetched.pop(ordered[position]).result()
+                prefetcher.advance(position + 1)
+            self.assertEqual(sorted(prefetched), scans[3:5])
+        finally:
+            prefetcher.shutdown()
+
+    def test_each_document_is_extracted_once(self):
+        """Test scans beyond the OCR look-ahead are not also queued on the text lane."""
+        content_service = Mock()
+        content_service.extraction_lane.side_effect = lambda path: (
+            "ocr" if path.endswith(".png") else "text"
+        )
+        content_service.process_document_complete.side_effect = lambda path: {"path": path}
+        self.kernel._content_service = content_service
+        config = Mock(ocr_workers=1, extraction_workers=1)
+        texts = [f"text_{i}.pdf" for i in range(3)]
+        scans = [f"scan_{i}.png" for i in range(6)]
+
+        ordered, text_lane, ocr_prefetcher, prefetched = self.kernel._schedule_extraction_lanes(
+            scans + texts, config
+        )
+        text_prefetcher = self.kernel._start_text_prefetch(text_lane, prefetched)
+        try:
+            self.assertEqual(text_prefetcher.documents, texts)
+            for position, doc_path in enumerate(ordered):
+                text_prefetcher.advance(position)
+                ocr_prefetcher.advance(position)
+                self.assertEqual(prefetched.pop(doc_path).result(), {"path": doc_path})
+        finally:
+            text_prefetcher.shutdown()
+            ocr_prefetcher.shutdown()
+
+        extracted = [c.args[0] for c in content_service.process_document_complete.call_args_list]
+        self.assertEqual(sorted(extracted), sorted(texts + scans))
+
+    def test_text_prefetch_is_bounded(self):
+        """Test text documents are extracted at most two per worker ahead of the loop."""
+        content_service = Mock()
+        content_service.extraction_lane.return_value = "text"
+        content_service.process_document_complete.side_effect = lambda path: {"path": path}
+        self.kernel._content_service = content_service
+        config = Mock(ocr_workers=1, extraction_workers=2)
+        documents = [f"doc_{i}.pdf" for i in range(10)]
+
+        _ordered, text_lane, _ocr, prefetched = self.kernel._schedule_extraction_lanes(
+            documents, config
+        )
+        prefetcher = self.kernel._start_text_prefetch(text_lane, prefetched)
+        try:
+            prefetcher.advance(0)
+            self.assertEqual(sorted(prefetched), documents[:4])
+            prefetcher.advance(8)
+            self.assertEqual(len(prefetched), 10)
+            self.assertEqual(prefetched["doc_9.pdf"].result(), {"path": "doc_9.pdf"})
+        finally:
+            prefetcher.shutdown()
+        self.assertEqual(self.kernel.worker_policy.limits.extraction_workers, 2)
+
+    def test_prefetch_shutdown_drops_unstarted_documents(self):
+        """Test shutdown cancels queued extractions without cancel_futures (Python 3.8)."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def extract(path):
+            started.set()
+            release.wait(5)
+            return {"path": path}
+
+        prefetched = {}
+        prefetcher = _LanePrefetcher(
+            ["a.pdf", "b.pdf", "c.pdf"],
+            ThreadPoolExecutor(max_workers=1),
+            ConcurrencyLimit(1),
+            extract,
+            lookahead=3,
+            prefetched=prefetched,
+        )
+        prefetcher.advance(0)
+        started.wait(5)
+
+        with patch.object(
+            ThreadPoolExecutor, "shutdown", autospec=True, side_effect=ThreadPoolExecutor.shutdown
+        ) as shutdown:
+            threading.Timer(0.1, release.set).start()
+            prefetcher.shutdown()
+
+        shutdown.assert_called_once_with(prefetcher.pool, wait=True)
+        self.assertEqual(prefetched["a.pdf"].result(), {"path": "a.pdf"})
+        self.assertTrue(prefetched["b.pdf"].cancelled())
+        self.assertTrue(prefetched["c.pdf"].cancelled())
+
+    def test_handoff_store_closed_when_pipeline_fails(self):
+        """Test the content handoff store is discarded even if processing raises."""
+        self.kernel.display_manager = Mock()
+        self.kernel._ai_service = Mock()
+        text_prefetcher = Mock()
+        text_prefetcher.advance.side_effect = RuntimeError("boom")
+        config = Mock(organization_enabled=True, incremental_organization=False)
+        config.output_dir = "/tmp/out"
+
+        with patch.object(
+            self.kernel, "_schedule_extraction_lanes", return_value=(["a.pdf"], ["a.pdf"], None, {})
+        ), patch.object(
+            self.kernel, "_start_text_prefetch", return_value=text_prefetcher
+        ), patch.object(
+            self.kernel, "_create_template_naming", return_value=None
+        ), patch(
+            "orchestration.application_kernel.open_content_handoff_store"
+        ), patch(
+            "orchestration.application_kernel.close_content_handoff_store"
+        ) as close_store:
+            result = self.kernel._execute_processing_pipeline(["a.pdf"], config)
+
+        self.assertFalse(result.success)
+        close_store.assert_called_once_with("/tmp/out", discard=True)
+
     def test_get_progress_status(self):
         """Test getting progress status."""
         status = self.kernel.get_progress_status()
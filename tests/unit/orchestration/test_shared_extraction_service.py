@@ -0,0 +1,100 @@
+"""
+Tests for the shared extraction service.
+
+Tests that the legacy workflow path and content services reuse one
+extraction service (and its processors) from the application container
+instead of building them for every file.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "src"))
+
+import fitz
+
+from core import application_container
+from core.application_container import ApplicationContainer
+from domains.content.extraction_service import PDFContentProcessor
+from orchestration.workflow_processor import _extract_file_content, pdfs_to_text_string
+
+FILE_COUNT = 6
+
+
+class TestSharedExtractionService(unittest.TestCase):
+    """Test per-file setup is done once per container."""
+
+    def setUp(self):
+        """Create a test container and a few text PDFs."""
+        self.container = ApplicationContainer(test_mode=True)
+        container_patcher = patch.object(application_container, "_global_container", self.container)
+        container_patcher.start()
+        self.addCleanup(container_patcher.stop)
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.paths = []
+        for i in range(FILE_COUNT):
+            path = os.path.join(self.temp_dir.name, f"doc_{i}.pdf")
+            document = fitz.open()
+            page = document.new_page()
+            page.insert_text((72, 72), f"Quarterly report number {i}")
+            page.insert_text((72, 96), "Revenue, costs and staffing for the quarter. " * 3)
+            document.save(path)
+            document.close()
+            self.paths.append(path)
+
+        original_init = PDFContentProcessor.__init__
+        self.processor_inits = 0
+
+        def counting_init(processor, *args, **kwargs):
+            self.processor_inits += 1
+            original_init(processor, *args, **kwargs)
+
+        patcher = patch.object(PDFContentProcessor, "__init__", counting_init)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_workers_share_one_service(self):
+        """Test files extracted on several threads build the processors once."""
+        results = {}
+
+        def extract(path):
+            results[path] = _extract_file_content(path, "eng", Mock())
+
+        threads = [threading.Thread(target=extract, args=(path,)) for path in self.paths]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.processor_inits, 1)
+        for i, path in enumerate(self.paths):
+            self.assertIn(f"Quarterly report number {i}", results[path][0])
+
+    def test_content_services_reuse_extraction_service(self):
+        """Test content services share the container's service per OCR language."""
+        first = self.container.create_content_service()
+        second = self.container.create_content_service()
+
+        self.assertIs(first.extraction_service, second.extraction_service)
+        self.assertIs(first.extraction_service, self.container.get_extraction_service())
+        self.assertIsNot(first.extraction_service, self.container.get_extraction_service("deu"))
+        self.assertEqual(self.processor_inits, 2)
+
+
+    def test_missing_container_uses_fallbacks(self):
+        """Test an unimportable container gives the callers' documented fallbacks."""
+        with patch.dict(sys.modules, {"core.application_container": None}):
+            self.assertEqual(pdfs_to_text_string(self.paths[0]), "")
+            with self.assertRaises(ValueError):
+                _extract_file_content(self.paths[0], "eng", Mock())
+
+
+if __name__ == "__main__":
+    unittest.main()
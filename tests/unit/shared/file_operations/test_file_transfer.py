@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Tests for FileTransferService
+
+Tests the zero-copy transfer layer used for moves and copies across
+the processing and organization pipelines.
+"""
+
+import errno
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "src"))
+
+from shared.file_operations.file_transfer import (
+    FileTransferService,
+    TransferMethod,
+    get_transfer_service,
+)
+from shared.file_operations.safe_file_manager import SafeFileManager
+
+
+class TestFileTransferService(unittest.TestCase):
+    """Test transfer method selection and reporting."""
+
+    def setUp(self):
+        """Set up temporary directory and source file."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.temp_dir.name, "source.pdf")
+        self.payload = b"%PDF-1.4 " + os.urandom(256 * 1024)
+        with open(self.source, "wb") as f:
+            f.write(self.payload)
+        self.service = FileTransferService(chunk_size=64 * 1024)
+
+    def tearDown(self):
+        """Clean up temporary directory."""
+        self.temp_dir.cleanup()
+
+    def _read(self, path):
+        with open(path, "rb") as f:
+            return f.read()
+
+    def test_same_filesystem_move_uses_rename(self):
+        """Test moves within a filesystem never copy data."""
+        target = os.path.join(self.temp_dir.name, "target.pdf")
+
+        result = self.service.move(self.source, target)
+
+        self.assertEqual(result.method, TransferMethod.RENAME)
+        self.assertEqual(result.bytes_moved, 0)
+        self.assertFalse(os.path.exists(self.source))
+        self.assertEqual(self._read(target), self.payload)
+
+    def test_cross_device_move_copies_and_removes_source(self):
+        """Test EXDEV falls back to a data copy followed by source removal."""
+        target = os.path.join(self.temp_dir.name, "target.pdf")
+        exdev = OSError(errno.EXDEV, "Invalid cross-device link")
+
+        with patch("shared.file_operations.file_transfer.os.replace", side_effect=exdev):
+            result = self.service.move(self.source, target)
+
+        self.assertNotEqual(result.method, TransferMethod.RENAME)
+        self.assertEqual(result.bytes_moved, len(self.payload))
+        self.assertFalse(os.path.exists(self.source))
+        self.assertEqual(self._read(target), self.payload)
+
+    def test_cross_device_move_syncs_copy_before_removing_source(self):
+        """Test the copy is durable before the only other copy is unlinked."""
+        target = os.path.join(self.temp_dir.name, "target.pdf")
+        exdev = OSError(errno.EXDEV, "Invalid cross-device link")
+        calls = []
+        real_remove = os.remove
+
+        def remove(path):
+            calls.append(("remove", path))
+            real_remove(path)
+
+        with patch("shared.file_operations.file_transfer.os.replace", side_effect=exdev), patch(
+            "shared.file_operations.file_transfer.os.remove", side_effect=remove
+        ), patch.object(
+            FileTransferService, "_fsync", side_effect=lambda path: calls.append(("fsync", path))
+        ):
+            self.service.move(self.source, target)
+
+        self.assertEqual(calls, [("fsync", target), ("remove", self.source)])
+        self.assertEqual(self.service.get_transfer_statistics()["pending_sync"], 0)
+
+    def test_file_managers_share_one_transfer_service(self):
+        """Test default file managers reach the same commit point."""
+        self.assertIs(SafeFileManager().transfer_service, get_transfer_service())
+
+    def test_copy_preserves_content_with_checksum_verification(self):
+        """Test copies are byte-identical and verified when requested."""
+        service = FileTransferService(chunk_size=64 * 1024, verify_checksums=True)
+        target = os.path.join(self.temp_dir.name, "copy.pdf")
+
+        result = service.copy(self.source, target)
+
+        self.assertTrue(result.checksum_verified)
+        self.assertTrue(os.path.exists(self.source))
+        self.assertEqual(self._read(target), self.payload)
+
+    def test_buffered_copy_fallback(self):
+        """Test portable fallback when no kernel copy primitive is available."""
+        self.service._reflink_supported = False
+        self.service._copy_file_range_supported = False
+        self.service._sendfile_supported = False
+        target = os.path.join(self.temp_dir.name, "copy.pdf")
+
+        result = self.service.copy(self.source, target)
+
+        self.assertEqual(result.method, TransferMethod.BUFFERED_COPY)
+        self.assertEqual(self._read(target), self.payload)
+
+    def test_commit_syncs_pending_transfers_once(self):
+        """Test fsync is deferred to commit and pending state is cleared."""
+        target = os.path.join(self.temp_dir.name, "target.pdf")
+        self.service.move(self.source, target)
+
+        self.assertEqual(self.service.get_transfer_statistics()["pending_sync"], 1)
+        self.assertEqual(self.service.commit(), 1)
+        self.assertEqual(self.service.commit(), 0)
+
+    def test_statistics_report_bytes_and_methods(self):
+        """Test per-method statistics aggregate transfers."""
+        self.service.copy(self.source, os.path.join(self.temp_dir.name, "a.pdf"))
+        self.service.move(self.source, os.path.join(self.temp_dir.name, "b.pdf"))
+
+        stats = self.service.get_transfer_statistics()
+
+        self.assertEqual(stats["files_transferred"], 2)
+        self.assertEqual(stats["bytes_moved"], len(self.payload))
+        self.assertEqual(stats["by_method"]["rename"]["files"], 1)
+
+
+class TestSafeFileManagerTransfers(unittest.TestCase):
+    """Test SafeFileManager reports transfer details."""
+
+    def test_safe_move_records_last_transfer(self):
+        """Test safe_move exposes the method used for the move."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = os.path.join(temp_dir, "in.pdf")
+            with open(source, "wb") as f:
+                f.write(b"data")
+
+            manager = SafeFileManager()
+            self.assertTrue(manager.safe_move(source, os.path.join(temp_dir, "out", "in.pdf")))
+
+            self.assertEqual(manager.get_last_transfer().method, TransferMethod.RENAME)
+            self.assertEqual(manager.get_operation_statistics()["transfers"]["files_transferred"], 1)
+
+    def test_statistics_count_only_this_managers_transfers(self):
+        """Test transfers by other users of the shared service are not counted."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = os.path.join(temp_dir, "in.pdf")
+            with open(source, "wb") as f:
+                f.write(b"data")
+            get_transfer_service().copy(source, os.path.join(temp_dir, "other.pdf"))
+
+            manager = SafeFileManager()
+            self.assertTrue(manager.safe_copy(source, os.path.join(temp_dir, "copy.pdf")))
+
+            transfers = manager.get_operation_statistics()["transfers"]
+            self.assertEqual(transfers["files_transferred"], 1)
+            self.assertEqual(transfers["bytes_moved"], manager.get_last_transfer().bytes_moved)
+
+
+if __name__ == "__main__":
+    unittest.main()
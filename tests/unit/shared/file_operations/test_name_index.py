@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Tests for OutputNameIndex
+
+Tests collision-free name reservation for output directories, including
+concurrent reservations and index updates as files are moved.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "src"))
+
+from shared.file_operations.file_organizer import FileManager, FilenameHandler, FileOrganizer
+from shared.file_operations.file_transfer import FileTransferService
+from shared.file_operations.name_index import (
+    OutputNameIndex,
+    get_name_index,
+    reset_name_indexes,
+)
+
+
+class TestOutputNameIndex(unittest.TestCase):
+    """Test name reservation behaviour."""
+
+    def setUp(self):
+        """Create an output directory with existing files."""
+        reset_name_indexes()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = self.temp_dir.name
+        for name in ["Invoice.pdf", "Invoice_1.pdf", "Invoice_2.pdf", "Receipt.png"]:
+            with open(os.path.join(self.output_dir, name), "w") as f:
+                f.write("x")
+
+    def tearDown(self):
+        """Clean up."""
+        reset_name_indexes()
+        self.temp_dir.cleanup()
+
+    def test_free_name_is_returned_unchanged(self):
+        """Test names that don't collide are not suffixed."""
+        index = OutputNameIndex(self.output_dir)
+        self.assertEqual(index.reserve("Statement", ".pdf"), "Statement")
+
+    def test_collision_gets_next_free_suffix(self):
+        """Test existing files found by the initial scan are skipped."""
+        index = OutputNameIndex(self.output_dir)
+        self.assertEqual(index.reserve("Invoice", ".pdf"), "Invoice_3")
+        self.assertEqual(index.reserve("Invoice", ".pdf"), "Invoice_4")
+        # Same stem with a different extension has its own namespace
+        self.assertEqual(index.reserve("Receipt", ".pdf"), "Receipt")
+
+    def test_counter_avoids_rescanning_suffixes(self):
+        """Test repeated collisions start from the stored counter."""
+        index = OutputNameIndex(self.output_dir)
+        for _ in range(50):
+            index.reserve("Invoice", ".pdf")
+
+        with patch("shared.file_operations.name_index.os.path.exists", return_value=False) as exists:
+            index.reserve("Invoice", ".pdf")
+        self.assertEqual(exists.call_count, 1)
+
+    def test_concurrent_reservations_are_unique(self):
+        """Test workers racing on the same name never receive duplicates."""
+        index = get_name_index(self.output_dir)
+        results = []
+        lock = threading.Lock()
+
+        def worker():
+            names = [index.reserve("Invoice", ".pdf") for _ in range(25)]
+            with lock:
+                results.extend(names)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(results), 200)
+        self.assertEqual(len(set(results)), 200)
+
+    def test_moves_update_loaded_index(self):
+        """Test transfers free the source name and record the target name."""
+        index = get_name_index(self.output_dir)
+        target_dir = os.path.join(self.output_dir, "Financial")
+        os.makedirs(target_dir)
+
+        FileTransferService().move(
+            os.path.join(self.output_dir, "Invoice.pdf"), os.path.join(target_dir, "Invoice.pdf")
+        )
+
+        self.assertNotIn("Invoice.pdf", index)
+        self.assertEqual(index.reserve("Invoice", ".pdf"), "Invoice")
+
+    def test_filename_handler_uses_index(self):
+        """Test legacy duplicate handling reserves names through the index."""
+        first = FilenameHandler.handle_duplicate_filename("Invoice", self.output_dir, ".pdf")
+        second = FilenameHandler.handle_duplicate_filename("Invoice", self.output_dir, ".pdf")
+
+        self.assertEqual(first, "Invoice_3")
+        self.assertEqual(second, "Invoice_4")
+
+    def test_move_to_category_reserves_name_once(self):
+        """Test the returned name is the file on disk, without a spurious suffix."""
+        organizer = FileOrganizer()
+        target_dir = os.path.join(self.output_dir, "renamed")
+        os.makedirs(target_dir)
+        names = []
+        for source in ("Invoice.pdf", "Invoice_1.pdf"):
+            names.append(
+                organizer.move_file_to_category(
+                    os.path.join(self.output_dir, source), source, target_dir, "Invoice_Acme"
+                )
+            )
+
+        self.assertEqual(names, ["Invoice_Acme", "Invoice_Acme_1"])
+        self.assertEqual(sorted(os.listdir(target_dir)), ["Invoice_Acme.pdf", "Invoice_Acme_1.pdf"])
+        self.assertEqual(organizer.last_moved_path, os.path.join(target_dir, "Invoice_Acme_1.pdf"))
+
+
+    def test_failed_legacy_move_releases_name(self):
+        """Test a legacy move that fails completely does not keep its name reserved."""
+        manager = FileManager()
+        manager._unified_manager = None
+        target = os.path.join(self.output_dir, "Contract.pdf")
+        failure = OSError("device busy")
+
+        with patch("shared.file_operations.file_organizer.shutil.move", side_effect=failure), patch(
+            "shared.file_operations.file_organizer.shutil.copy2", side_effect=failure
+        ), patch("shared.file_operations.file_organizer.time.sleep"):
+            with self.assertRaises(OSError):
+                manager.safe_move(os.path.join(self.output_dir, "Receipt.png"), target, attempts=1)
+
+        self.assertEqual(get_name_index(self.output_dir).reserve_path(target), target)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+"""
+Tests for the content handoff store.
+
+Tests that phase-1 extraction results are stored compactly, read back by
+organization without re-extraction, and removed when the session commits.
+"""
+
+import datetime
+import os
+import sys
+import tempfile
+import unittest
+from dataclasses import dataclass
+from typing import List
+from unittest.mock import Mock, patch
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "src"))
+
+from domains.organization.organization_service import OrganizationService
+from orchestration.workflow_processor import process_file_enhanced_core
+from shared.file_operations.file_organizer import FileOrganizer
+from shared.infrastructure.content_handoff import (
+    ContentHandoffStore,
+    close_content_handoff_store,
+    get_content_handoff_store,
+    open_content_handoff_store,
+    record_content_handoff,
+)
+
+
+@dataclass
+class _Metadata:
+    created: datetime.date
+    dates_found: List[str]
+    currency_found: List[str]
+
+
+class TestContentHandoffStore(unittest.TestCase):
+    """Test storing and reading handed-off content."""
+
+    def setUp(self):
+        """Create a target folder with a processed document."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.target = self.temp_dir.name
+        self.doc_path = os.path.join(self.target, "Invoice_ACME.pdf")
+        with open(self.doc_path, "wb") as f:
+            f.write(b"%PDF-1.4")
+
+    def tearDown(self):
+        """Clean up."""
+        close_content_handoff_store(self.target)
+        self.temp_dir.cleanup()
+
+    def test_round_trip_with_dataclass_metadata(self):
+        """Test content, metadata and metadata-derived entities survive storage."""
+        store = ContentHandoffStore(self.target)
+        metadata = _Metadata(datetime.date(2024, 3, 1), ["2024-03-01"], ["$120.00"])
+
+        self.assertTrue(store.put(self.doc_path, "Invoice total $120.00 " * 200, metadata))
+        record = store.get(self.doc_path)
+
+        self.assertEqual(record.content, "Invoice total $120.00 " * 200)
+        self.assertEqual(record.metadata["created"], "2024-03-01")
+        self.assertEqual(record.entities, {"dates": ["2024-03-01"], "currency": ["$120.00"]})
+        self.assertEqual(len(store), 1)
+        store.close()
+
+    def test_reading_does_not_create_store(self):
+        """Test lookups against a folder without a store leave no files behind."""
+        store = ContentHandoffStore(self.target)
+
+        self.assertIsNone(store.get(self.doc_path))
+        self.assertFalse(os.path.exists(store.db_path))
+
+    def test_recording_requires_open_store(self):
+        """Test producers only record into folders a consumer has opened."""
+        self.assertFalse(record_content_handoff(self.doc_path, "text"))
+
+        open_content_handoff_store(self.target)
+        self.assertTrue(record_content_handoff(self.doc_path, "text"))
+        self.assertEqual(get_content_handoff_store(self.target).get_content(self.doc_path), "text")
+
+    def test_processing_keys_handoff_on_moved_path(self):
+        """Test the handoff is recorded under the collision-free name the file got on disk."""
+        source_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(source_dir.cleanup)
+        source = os.path.join(source_dir.name, "scan.pdf")
+        with open(source, "wb") as f:
+            f.write(b"%PDF-1.4")
+        open_content_handoff_store(self.target)
+
+        with patch(
+            "orchestration.workflow_processor._extract_file_content", return_value=("text", "")
+        ), patch(
+            "orchestration.workflow_processor._generate_filename", return_value="Invoice_ACME"
+        ):
+            success, name = process_file_enhanced_core(
+                source, "scan.pdf", source_dir.name, self.target, None, "eng", None,
+                FileOrganizer(), Mock(),
+            )
+
+        self.assertTrue(success)
+        self.assertEqual(name, "Invoice_ACME_1")
+        moved_path = os.path.join(self.target, "Invoice_ACME_1.pdf")
+        self.assertTrue(os.path.exists(moved_path))
+        self.assertEqual(get_content_handoff_store(self.target).get_content(moved_path), "text")
+
+    def test_discard_removes_database(self):
+        """Test committing a session deletes the store."""
+        store = open_content_handoff_store(self.target)
+        store.put(self.doc_path, "text")
+
+        close_content_handoff_store(self.target, discard=True)
+
+        self.assertFalse(os.path.exists(store.db_path))
+
+
+class TestOrganizationUsesHandoff(unittest.TestCase):
+    """Test organization reads phase-1 content instead of re-extracting."""
+
+    def setUp(self):
+        """Create a target folder with a handed-off document."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.target = self.temp_dir.name
+        self.doc_path = os.path.join(self.target, "scan_001.pdf")
+        with open(self.doc_path, "wb") as f:
+            f.write(b"%PDF-1.4")
+        self.store = open_content_handoff_store(self.target)
+        self.store.put(self.doc_path, "Tax invoice from ACME Pty Ltd", {"currency_found": ["$99"]})
+
+    def tearDown(self):
+        """Clean up."""
+        close_content_handoff_store(self.target)
+        self.temp_dir.cleanup()
+
+    def test_hydrate_replaces_placeholder_content(self):
+        """Test placeholder content is replaced by the stored text and entities."""
+        service = OrganizationService(self.target)
+        documents = [
+            {"path": self.doc_path, "filename": "scan_001.pdf", "content": "Document: scan_001.pdf, Size: 8 bytes"}
+        ]
+
+        self.assertEqual(service._hydrate_documents(documents), 1)
+        self.assertEqual(documents[0]["content"], "Tax invoice from ACME Pty Ltd")
+        self.assertEqual(documents[0]["entities"], {"currency": ["$99"]})
+
+    def test_hydrate_keeps_real_content(self):
+        """Test documents that already carry content are left alone."""
+        service = OrganizationService(self.target)
+        documents = [{"path": self.doc_path, "content": "In-memory text"}]
+
+        self.assertEqual(service._hydrate_documents(documents), 0)
+        self.assertEqual(documents[0]["content"], "In-memory text")
+
+    def test_file_organizer_skips_re_extraction(self):
+        """Test post-processing organization passes stored content to the engine."""
+        organizer = FileOrganizer()
+        captured = {}
+
+        def fake_organize(self_, documents, **kwargs):
+            captured["documents"] = documents
+            return {"success": True}
+
+        with patch.object(
+            OrganizationService, "organize_processed_documents", fake_organize
+        ), patch.object(organizer, "_extract_file_content_for_organization") as extract:
+            result = organizer.run_post_processing_organization([self.doc_path], self.target)
+
+        self.assertTrue(result["success"])
+        extract.assert_not_called()
+        self.assertEqual(captured["documents"][0]["content"], "Tax invoice from ACME Pty Ltd")
+
+
+if __name__ == "__main__":
+    unittest.main()
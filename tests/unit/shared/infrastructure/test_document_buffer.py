@@ -0,0 +1,199 @@
+"""
+Tests for the processed document buffer.
+
+Tests that records beyond the in-memory limit spill to disk and stream back
+intact and in order, and that organization consumes the stream in chunks.
+"""
+
+import datetime
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "src"))
+
+from domains.organization import organization_service
+from domains.organization.clustering_service import ClassificationResult, ClusteringMethod
+from domains.organization.folder_service import FiscalYearType, FolderStructure, FolderStructureType
+from domains.organization.organization_service import OrganizationService
+from shared.infrastructure.document_buffer import DocumentRecord, ProcessedDocumentBuffer
+from shared.infrastructure.entity_scanner import entity_scan_from_metadata, scan_entities
+
+
+def _record(index):
+    return DocumentRecord(
+        original_path=f"/in/doc_{index}.pdf",
+        current_path=f"/out/Invoice_{index}.pdf",
+        filename=f"Invoice_{index}.pdf",
+        content=f"Invoice number {index} " * 50,
+        metadata={"word_count": 150, "quality": "good"},
+        features={"currency": [f"${index}.00"]},
+    )
+
+
+class TestProcessedDocumentBuffer(unittest.TestCase):
+    """Test bounded buffering and spill behaviour."""
+
+    def setUp(self):
+        """Create spill directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Clean up."""
+        self.temp_dir.cleanup()
+
+    def test_records_stay_in_memory_below_limit(self):
+        """Test small batches never touch disk."""
+        with ProcessedDocumentBuffer(max_in_memory=10, spill_dir=self.temp_dir.name) as buffer:
+            for index in range(5):
+                buffer.append(_record(index))
+
+            self.assertEqual(len(buffer), 5)
+            self.assertEqual(buffer.spilled_count, 0)
+            self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+    def test_spilled_records_stream_back_in_order(self):
+        """Test memory is bounded and every record round-trips through the spill files."""
+        buffer = ProcessedDocumentBuffer(max_in_memory=8, spill_dir=self.temp_dir.name)
+        for index in range(50):
+            buffer.append(_record(index))
+            self.assertLess(len(buffer._records), 8)
+
+        documents = list(buffer.iter_dicts())
+
+        self.assertEqual(len(buffer), 50)
+        self.assertEqual(buffer.spilled_count, 48)
+        self.assertEqual([doc["filename"] for doc in documents], [f"Invoice_{i}.pdf" for i in range(50)])
+        self.assertEqual(documents[17]["content"], _record(17).content)
+        self.assertEqual(documents[17]["metadata"], {"word_count": 150, "quality": "good"})
+        self.assertEqual(documents[17]["features"], {"currency": ["$17.00"]})
+
+        buffer.close()
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+    def test_spilled_and_in_memory_records_have_same_types(self):
+        """Test a spilled record reads back exactly like one that stayed in memory."""
+        metadata = {
+            "created": datetime.datetime(2024, 3, 1, 9, 30),
+            "pages": (1, 2),
+            "entity_scan": scan_entities("Invoice Date: 2024-03-01  Amount due: $120.00"),
+        }
+        buffer = ProcessedDocumentBuffer(max_in_memory=2, spill_dir=self.temp_dir.name)
+        for index in range(3):
+            record = _record(index)
+            buffer.append(DocumentRecord(
+                record.original_path, record.current_path, record.filename, record.content, metadata
+            ))
+
+        spilled, _, in_memory = list(buffer.iter_dicts())
+
+        self.assertEqual(buffer.spilled_count, 2)
+        self.assertEqual(spilled["metadata"], in_memory["metadata"])
+        self.assertEqual(in_memory["metadata"]["created"], "2024-03-01T09:30:00")
+        self.assertEqual(in_memory["metadata"]["pages"], [1, 2])
+        self.assertEqual(
+            entity_scan_from_metadata(spilled["metadata"]),
+            entity_scan_from_metadata(in_memory["metadata"]),
+        )
+        buffer.close()
+
+    def test_records_use_slots(self):
+        """Test records carry no per-instance dict."""
+        self.assertFalse(hasattr(_record(0), "__dict__"))
+
+
+class TestOrganizationConsumesBuffer(unittest.TestCase):
+    """Test batch organization streams the buffer instead of materialising it."""
+
+    def setUp(self):
+        """Create target and spill directories."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.service = OrganizationService(self.temp_dir.name)
+
+    def tearDown(self):
+        """Clean up."""
+        self.temp_dir.cleanup()
+
+    def test_stream_is_classified_in_chunks(self):
+        """Test the rule pass sees one chunk at a time and ML refinement sees the whole run."""
+        buffer = ProcessedDocumentBuffer(max_in_memory=2, spill_dir=self.temp_dir.name)
+        for index in range(5):
+            buffer.append(_record(index))
+        chunk_sizes = []
+        refined_batches = []
+
+        def classify(documents, start_index=0):
+            chunk_sizes.append(len(documents))
+            results, uncertain = {}, []
+            for offset, doc in enumerate(documents):
+                confidence = 0.9 if (start_index + offset) % 2 == 0 else 0.4
+                result = ClassificationResult(
+                    "financial", confidence, ClusteringMethod.RULE_BASED, "Invoice", [], {}
+                )
+                results[doc["current_path"]] = result
+                if confidence < 0.7:
+                    uncertain.append((doc["current_path"], doc, result))
+            return results, uncertain, []
+
+        def refine(results, uncertain, references):
+            refined_batches.append([doc_id for doc_id, _, _ in uncertain])
+            for doc_id, _, _ in uncertain:
+                results[doc_id] = ClassificationResult(
+                    "legal", 0.8, ClusteringMethod.ML_ENHANCED, "Refined", [], {}
+                )
+            return results
+
+        structure = FolderStructure(
+            FolderStructureType.CATEGORY_FIRST, FiscalYearType.CALENDAR, "year",
+            self.temp_dir.name, ["financial"], {},
+        )
+        with patch.object(organization_service, "CLASSIFY_CHUNK_SIZE", 2), patch.object(
+            self.service.clustering_service, "classify_with_rules", side_effect=classify
+        ), patch.object(
+            self.service.clustering_service, "refine_batch_results", side_effect=refine
+        ), patch.object(
+            self.service.clustering_service,
+            "validate_clustering_quality",
+            return_value={"valid": True, "overall_score": 90.0},
+        ), patch.object(
+            self.service.folder_service, "create_folder_structure", return_value=(structure, [])
+        ), patch.object(
+            self.service.folder_service, "validate_folder_structure", return_value={"valid": True}
+        ), patch.object(
+            self.service.folder_service,
+            "execute_file_operations",
+            return_value={
+                "total_operations": 5,
+                "successful_operations": 5,
+                "moved_files": 5,
+                "created_directories": 1,
+                "errors": [],
+            },
+        ) as execute:
+            results = self.service.organize_processed_documents(
+                buffer.iter_dicts(), enable_learning=False
+            )
+
+        execute.assert_called_once()
+        self.assertEqual(chunk_sizes, [2, 2, 1])
+        self.assertEqual(refined_batches, [[_record(1).current_path, _record(3).current_path]])
+        self.assertEqual(
+            {path: result.category for path, result in results["classification_results"].items()},
+            {
+                _record(i).current_path: "legal" if i % 2 else "financial"
+                for i in range(5)
+            },
+        )
+        self.assertEqual(results["documents_processed"], 5)
+        self.assertEqual(
+            sorted(results["classification_results"]),
+            sorted(_record(i).current_path for i in range(5)),
+        )
+        buffer.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
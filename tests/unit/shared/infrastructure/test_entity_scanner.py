@@ -0,0 +1,126 @@
+"""
+Tests for the single-pass entity scanner.
+
+Tests that dates, amounts and numbers are found in one pass with typed values
+and positions, survive serialization with document metadata, and are reused
+by the content metadata service and the temporal analyzer.
+"""
+
+import datetime
+import json
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "src"))
+
+from domains.content import metadata_service
+from domains.content.extraction_service import ContentQuality, ExtractedContent
+from domains.content.metadata_service import MetadataService
+from domains.organization.content_analysis.metadata_extractor import ContentMetadataExtractor
+from domains.organization.content_analysis.temporal_analyzer import AdvancedTemporalAnalyzer
+from shared.infrastructure.content_handoff import json_default, metadata_to_dict
+from shared.infrastructure.entity_scanner import (
+    EntityScanResult,
+    entity_scan_from_metadata,
+    scan_entities,
+)
+
+SAMPLE = (
+    "Invoice dated 03/15/2024, due April 5th, 2024. Service period ended 7 Jan 2024.\n"
+    "Total $1,234.56 plus 200.00 USD and EUR 50. Reference 884213, 2024-12-31."
+)
+
+
+class TestEntityScanner(unittest.TestCase):
+    """Test typed, position-annotated scanning."""
+
+    def test_scans_dates_amounts_and_numbers(self):
+        """Test each entity type is parsed with its value and source span."""
+        result = scan_entities(SAMPLE)
+
+        self.assertEqual(
+            [e.value for e in result.dates],
+            [
+                datetime.datetime(2024, 3, 15),
+                datetime.datetime(2024, 4, 5),
+                datetime.datetime(2024, 1, 7),
+                datetime.datetime(2024, 12, 31),
+            ],
+        )
+        self.assertEqual(
+            [(e.value, e.currency) for e in result.amounts],
+            [(1234.56, "USD"), (200.0, "USD"), (50.0, "EUR")],
+        )
+        self.assertEqual([e.text for e in result.numbers], ["884213"])
+        for entity in result.dates + result.amounts + result.numbers:
+            self.assertEqual(SAMPLE[entity.start : entity.end].strip(), entity.text)
+
+    def test_day_first_and_invalid_dates(self):
+        """Test day-first dates are recognized and impossible dates are dropped."""
+        result = scan_entities("Paid 31/12/23, not 13/13/2024.")
+
+        self.assertEqual([e.value for e in result.dates], [datetime.datetime(2023, 12, 31)])
+
+    def test_roundtrip_through_metadata_json(self):
+        """Test a scan attached to metadata survives JSON spill/handoff serialization."""
+        scan = scan_entities(SAMPLE)
+        metadata = {"entity_scan": scan, "dates_found": ["03/15/2024"]}
+
+        restored = json.loads(json.dumps(metadata_to_dict(metadata), default=json_default))
+
+        self.assertEqual(entity_scan_from_metadata(restored), scan)
+        self.assertIs(entity_scan_from_metadata(metadata), scan)
+        self.assertIsNone(entity_scan_from_metadata({"dates_found": []}))
+
+
+class TestEntityScanConsumers(unittest.TestCase):
+    """Test the content and organization domains share one scan per document."""
+
+    def test_amounts_formatted_in_their_currency(self):
+        """Test organization metadata formats each amount with its detected currency."""
+        scan = scan_entities(SAMPLE + " Fee 12 CAD, amount: 3")
+
+        amounts = ContentMetadataExtractor()._extract_amounts(scan)
+
+        self.assertEqual(
+            [a["formatted"] for a in amounts],
+            ["$1,234.56", "$200.00", "€50.00", "CAD 12.00", "$3.00"],
+        )
+
+    def test_metadata_service_scans_once(self):
+        """Test structure flags and entity lists come from a single attached scan."""
+        content = ExtractedContent(text=SAMPLE, quality=ContentQuality.GOOD, file_type="pdf")
+
+        with patch.object(
+            metadata_service, "scan_entities", wraps=metadata_service.scan_entities
+        ) as scan:
+            metadata = MetadataService().analyze_document("/nonexistent/invoice.pdf", content)
+
+        scan.assert_called_once_with(SAMPLE)
+        self.assertIsInstance(metadata.entity_scan, EntityScanResult)
+        self.assertTrue(metadata.has_dates)
+        self.assertTrue(metadata.has_currency)
+        self.assertEqual(metadata.dates_found[0], "03/15/2024")
+        self.assertEqual(metadata.currency_found, ["$1,234.56", "200.00 USD", "EUR 50"])
+
+    def test_temporal_analyzer_uses_attached_scan(self):
+        """Test temporal analysis reads typed dates from extraction-time metadata."""
+        content = ExtractedContent(text=SAMPLE, quality=ContentQuality.GOOD, file_type="pdf")
+        metadata = MetadataService().analyze_document("/nonexistent/invoice.pdf", content)
+
+        columns = AdvancedTemporalAnalyzer()._extract_temporal_columns(
+            [{"filename": "invoice.pdf", "category": "invoices", "metadata": metadata}]
+        )
+
+        self.assertEqual(
+            sorted(columns.dates.astype("datetime64[D]").astype(str).tolist()),
+            ["2024-01-07", "2024-03-15", "2024-04-05", "2024-12-31"],
+        )
+        self.assertEqual(columns.quarters.tolist()[0], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
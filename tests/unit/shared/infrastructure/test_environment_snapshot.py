@@ -0,0 +1,156 @@
+"""
+Tests for the cached environment snapshot.
+
+Tests that probes run concurrently under a deadline, that snapshots persist
+and are reused across instances, and that TTL expiry, fingerprint changes
+(PATH, configured dependency paths) and newly installed dependencies trigger
+a new probe.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "src"))
+
+from shared.infrastructure import environment_snapshot
+from shared.infrastructure.dependency_manager import DependencyManager
+from shared.infrastructure.environment_snapshot import EnvironmentProbe, GPUInfo
+
+
+class CountingProbes:
+    """Replacement CPU and GPU probes that count calls and can be slowed down."""
+
+    def __init__(self, delay_s: float = 0.0):
+        self.delay_s = delay_s
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _call(self):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay_s)
+
+    def cpu_brand(self):
+        self._call()
+        return "Test CPU"
+
+    def gpu(self):
+        self._call()
+        return GPUInfo(True, "Test GPU", 8.0)
+
+
+class TestEnvironmentProbe(unittest.TestCase):
+    """Test probing, persistence and invalidation."""
+
+    def setUp(self):
+        """Use a scratch config directory and counting probes."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.probes = CountingProbes()
+        replacements = {"_probe_cpu_brand": self.probes.cpu_brand, "_probe_gpu": self.probes.gpu}
+        for name, probe in replacements.items():
+            patcher = patch.object(environment_snapshot, name, probe)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Remove the scratch directory."""
+        self.temp_dir.cleanup()
+
+    def _probe(self, **kwargs) -> EnvironmentProbe:
+        return EnvironmentProbe(DependencyManager(config_dir=self.temp_dir.name), **kwargs)
+
+    def test_snapshot_persisted_and_reused(self):
+        """Test a second process-level instance loads the snapshot instead of probing."""
+        first = self._probe().get_snapshot()
+        second = self._probe().get_snapshot()
+
+        self.assertEqual(self.probes.calls, 2)  # CPU and GPU, once
+        self.assertEqual(first, second)
+        self.assertEqual(second.cpu_brand, "Test CPU")
+        self.assertEqual(second.gpu.memory_gb, 8.0)
+
+    def test_expired_snapshot_is_reprobed(self):
+        """Test snapshots older than the TTL are not reused."""
+        self._probe().get_snapshot()
+
+        with patch.object(environment_snapshot.time, "time", return_value=time.time() + 120):
+            self._probe(ttl_s=60).get_snapshot()
+
+        self.assertEqual(self.probes.calls, 4)
+
+    def test_fingerprint_change_invalidates(self):
+        """Test PATH and configured dependency changes invalidate the snapshot."""
+        probe = self._probe()
+        probe.get_snapshot()
+
+        with patch.dict(os.environ, {"PATH": os.environ.get("PATH", "") + os.pathsep + "/opt/x"}):
+            probe.get_snapshot()
+        self.assertEqual(self.probes.calls, 4)
+
+        tool = os.path.join(self.temp_dir.name, "tesseract")
+        with open(tool, "w", encoding="utf-8") as f:
+            f.write("")
+        probe.dependency_manager.configure_dependency("tesseract", tool)
+        with patch.object(probe.dependency_manager, "_get_version", return_value="5.3.0"):
+            snapshot = probe.get_snapshot()
+
+        self.assertEqual(self.probes.calls, 6)
+        self.assertEqual(snapshot.dependency_path("tesseract"), tool)
+        self.assertEqual(snapshot.dependencies["tesseract"].version, "5.3.0")
+
+    def test_dependency_installed_on_path_invalidates(self):
+        """Test a dependency missing from the snapshot is re-checked on PATH."""
+        probe = self._probe()
+        with patch.object(probe.dependency_manager, "find_dependency", return_value=None):
+            probe.get_snapshot()
+            with patch.object(environment_snapshot.shutil, "which", return_value=None):
+                self._probe().get_snapshot()
+            self.assertEqual(self.probes.calls, 2)
+
+            with patch.object(
+                environment_snapshot.shutil,
+                "which",
+                side_effect=lambda name: "/usr/bin/tesseract" if name == "tesseract" else None,
+            ):
+                self._probe().get_snapshot()
+
+        self.assertEqual(self.probes.calls, 4)
+
+    def test_probes_run_concurrently_under_deadline(self):
+        """Test slow probes overlap, and timed-out results are used but not persisted."""
+        self.probes.delay_s = 0.3
+
+        start = time.perf_counter()
+        snapshot = self._probe(probe_timeout_s=2.0).get_snapshot()
+        self.assertLess(time.perf_counter() - start, 0.55)
+        self.assertEqual(snapshot.timed_out, [])
+
+        self.probes.delay_s = 1.0
+        probe = self._probe(probe_timeout_s=0.1)
+        snapshot = probe.get_snapshot(force_refresh=True)
+
+        self.assertEqual(snapshot.timed_out, ["cpu_brand", "gpu"])
+        self.assertEqual(snapshot.cpu_brand, "Unknown CPU")
+        self.assertFalse(snapshot.gpu.available)
+        # The file still holds the complete earlier snapshot
+        self.assertEqual(self._probe().get_snapshot().cpu_brand, "Test CPU")
+
+    def test_refresh_dependencies_invalidates(self):
+        """Test refreshing dependencies removes the persisted snapshot."""
+        probe = self._probe()
+        probe.get_snapshot()
+        self.assertTrue(probe.snapshot_file.exists())
+
+        probe.dependency_manager.refresh_all_dependencies()
+
+        self.assertFalse(probe.snapshot_file.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
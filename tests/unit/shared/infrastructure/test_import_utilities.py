@@ -0,0 +1,88 @@
+"""
+Tests for startup import helpers.
+
+Tests that availability checks do not import the module and that lazy
+package exports import on first access, cache the value and honour the
+fallback for missing dependencies.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "src"))
+
+from shared.infrastructure.import_utilities import lazy_exports, module_available
+
+PACKAGE = "lazy_exports_fixture"
+
+
+class TestModuleAvailable(unittest.TestCase):
+    """Test find_spec based availability checks."""
+
+    def test_available_module_is_not_imported(self):
+        """Test an installed but unimported module is reported without importing it."""
+        sys.modules.pop("wave", None)
+
+        self.assertTrue(module_available("wave"))
+        self.assertNotIn("wave", sys.modules)
+
+    def test_missing_modules(self):
+        """Test missing top-level modules and submodules of missing packages."""
+        self.assertFalse(module_available("no_such_module_xyz"))
+        self.assertFalse(module_available("no_such_package_xyz.child"))
+
+
+class TestLazyExports(unittest.TestCase):
+    """Test PEP 562 package exports."""
+
+    def setUp(self):
+        """Create a package whose submodules record when they are imported."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        package_dir = os.path.join(self.temp_dir.name, PACKAGE)
+        os.makedirs(package_dir)
+        with open(os.path.join(package_dir, "__init__.py"), "w", encoding="utf-8") as f:
+            f.write("")
+        with open(os.path.join(package_dir, "service.py"), "w", encoding="utf-8") as f:
+            f.write("class Service:\n    pass\n")
+        with open(os.path.join(package_dir, "broken.py"), "w", encoding="utf-8") as f:
+            f.write("import no_such_dependency_xyz\n\nclass Broken:\n    pass\n")
+        sys.path.insert(0, self.temp_dir.name)
+
+    def tearDown(self):
+        """Remove the fixture package."""
+        sys.path.remove(self.temp_dir.name)
+        for name in [m for m in sys.modules if m.split(".")[0] == PACKAGE]:
+            del sys.modules[name]
+        self.temp_dir.cleanup()
+
+    def test_import_on_first_access(self):
+        """Test the defining module is imported on access and the value cached."""
+        import lazy_exports_fixture as package
+
+        getter = lazy_exports(PACKAGE, {"Service": ".service", "Broken": ".broken"})
+        package.__getattr__ = getter
+
+        self.assertNotIn(f"{PACKAGE}.service", sys.modules)
+        from lazy_exports_fixture import Service
+
+        self.assertIs(Service, sys.modules[f"{PACKAGE}.service"].Service)
+        self.assertIs(package.__dict__["Service"], Service)
+        with self.assertRaises(ImportError):
+            getter("Broken")
+        with self.assertRaises(AttributeError):
+            getter("Unknown")
+
+    def test_fallback_for_missing_dependency(self):
+        """Test the fallback is exported when the defining module cannot be imported."""
+        import lazy_exports_fixture as package
+
+        package.__getattr__ = lazy_exports(PACKAGE, {"Broken": ".broken"}, fallback=None)
+
+        self.assertIsNone(package.Broken)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Tests for stage tracing.
+
+Tests that spans are free no-ops while tracing is off, are recorded across
+threads while it is on, export to the Chrome trace event format and
+summarize into per-stage percentiles.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "src"))
+
+from shared.infrastructure import tracing
+from shared.infrastructure.tracing import Tracer, span, start_tracing, stop_tracing
+
+
+class TestTracing(unittest.TestCase):
+    """Test span recording, export and summary."""
+
+    def tearDown(self):
+        """Make sure no tracer leaks into other tests."""
+        stop_tracing()
+
+    def test_span_is_noop_when_tracing_off(self):
+        """Test spans record nothing and share one context manager when tracing is off."""
+        self.assertIsNone(tracing.get_tracer())
+        with span("extract.file") as args:
+            self.assertIsNone(args)
+        self.assertIs(span("a"), span("b", page=1))
+        self.assertIsNone(stop_tracing())
+
+    def test_spans_recorded_across_threads(self):
+        """Test spans from worker threads are collected with their thread and args."""
+        tracer = start_tracing()
+
+        def worker():
+            with span("extract.ocr_page", page=1) as args:
+                args["chars"] = 120
+
+        thread = threading.Thread(target=worker, name="ocr-0")
+        with span("pipeline.run"):
+            thread.start()
+            thread.join()
+
+        self.assertIs(stop_tracing(), tracer)
+        names = [record.name for record in tracer.spans]
+        self.assertEqual(names, ["extract.ocr_page", "pipeline.run"])
+        ocr = tracer.spans[0]
+        self.assertEqual(ocr.category, "extract")
+        self.assertEqual(ocr.args, {"page": 1, "chars": 120})
+        self.assertNotEqual(ocr.thread_id, tracer.spans[1].thread_id)
+
+        with span("after.stop"):
+            pass
+        self.assertEqual(len(tracer.spans), 2)
+
+    def test_chrome_trace_export(self):
+        """Test the exported file loads as complete events with thread names."""
+        start_tracing()
+        with span("ai.attempt", attempt=1, provider=object()):
+            pass
+        tracer = stop_tracing()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = tracer.export_chrome_trace(os.path.join(temp_dir, "run", "trace.json"))
+            with open(path, encoding="utf-8") as f:
+                trace = json.load(f)
+
+        events = trace["traceEvents"]
+        complete = [e for e in events if e["ph"] == "X"]
+        metadata = [e for e in events if e["ph"] == "M"]
+        self.assertEqual(len(complete), 1)
+        self.assertEqual(complete[0]["name"], "ai.attempt")
+        self.assertEqual(complete[0]["cat"], "ai")
+        self.assertGreaterEqual(complete[0]["ts"], 0)
+        self.assertEqual(complete[0]["args"]["attempt"], 1)
+        self.assertIsInstance(complete[0]["args"]["provider"], str)
+        self.assertEqual(metadata[0]["args"]["name"], threading.current_thread().name)
+
+    def test_summary_percentiles(self):
+        """Test per-stage count and interpolated percentiles."""
+        tracer = Tracer()
+        for ms in range(1, 101):
+            tracer.record("extract.file", "extract", 0, {})
+            tracer._spans[-1].duration_ns = ms * 1_000_000
+        tracer.stopped_ns = tracer.started_ns + 2_000_000_000
+
+        stats = tracer.summary()["extract.file"]
+
+        self.assertEqual(stats["count"], 100)
+        self.assertAlmostEqual(stats["p50_ms"], 50.5)
+        self.assertAlmostEqual(stats["p95_ms"], 95.05)
+        self.assertAlmostEqual(stats["p99_ms"], 99.01)
+        self.assertAlmostEqual(stats["total_s"], 5.05)
+        self.assertAlmostEqual(stats["per_second"], 50.0)
+        self.assertTrue(tracer.format_summary()[1].startswith("extract.file"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+"""
+Tests for resource-aware worker sizing.
+
+Tests that limits follow cores, free memory and model footprints, that
+runtime adjustment reacts to memory pressure and CPU use without touching
+overrides, and that concurrency gates can be resized while held.
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "src"))
+
+from shared.infrastructure.hardware_detector import SystemInfo
+from shared.infrastructure.worker_sizing import (
+    ConcurrencyLimit,
+    ResourceSample,
+    WorkerLimits,
+    WorkerSizingPolicy,
+    Workload,
+)
+
+
+def system(cores: int, total_gb: float, available_gb: float) -> SystemInfo:
+    """Hardware description without detection."""
+    return SystemInfo(
+        total_ram_gb=total_gb,
+        available_ram_gb=available_gb,
+        cpu_count=cores,
+        platform_system="Linux",
+        platform_machine="x86_64",
+    )
+
+
+class TestWorkerSizingPlan(unittest.TestCase):
+    """Test starting limits."""
+
+    def test_large_host_runs_parallel(self):
+        """Test a 32-core host with free memory uses its cores."""
+        policy = WorkerSizingPolicy(system(32, 64.0, 48.0))
+
+        self.assertEqual(policy.limits, WorkerLimits(31, 8, 8, 64))
+        self.assertEqual(policy.ceiling, policy.limits)
+
+    def test_memory_bounds_workers(self):
+        """Test OCR workers are bounded by free memory, not cores, on a loaded host."""
+        policy = WorkerSizingPolicy(system(32, 64.0, 8.0))
+
+        # 8GB free - 6.4GB reserve leaves 1.6GB, 60% of it for 0.4GB OCR workers
+        self.assertEqual(policy.limits.ocr_workers, 2)
+        self.assertEqual(policy.limits.extraction_workers, 2)
+        self.assertEqual(policy.limits.embedding_batch_size, 32)
+
+    def test_local_model_footprint(self):
+        """Test a local model takes memory, half the cores and Ollama's parallelism."""
+        policy = WorkerSizingPolicy(system(16, 16.0, 12.0))
+        remote = policy.limits
+        local = policy.plan(Workload(local_model="llama3.1-8b", spacy=True))
+
+        self.assertEqual(remote.ocr_workers, 15)
+        self.assertEqual(local.ocr_workers, 3)  # (12 - 1.6 - 7.8) * 0.6 / 0.4
+        self.assertEqual(local.ai_in_flight, 1)
+        self.assertEqual(policy.ceiling, local)
+
+    def test_models_exceeding_memory_run_one_worker(self):
+        """Test a workload that does not fit falls back to one worker per stage."""
+        workload = Workload(local_model="mistral-7b")
+        policy = WorkerSizingPolicy(system(8, 8.0, 4.0), workload=workload)
+
+        self.assertEqual(policy.limits, WorkerLimits(1, 1, 1, 8))
+
+    def test_overrides(self):
+        """Test overrides replace planned limits and invalid ones are rejected."""
+        policy = WorkerSizingPolicy(
+            system(32, 64.0, 48.0), overrides={"ocr_workers": 0, "ai_in_flight": None}
+        )
+        self.assertEqual(policy.limits.ocr_workers, 0)
+        self.assertEqual(policy.limits.ai_in_flight, 8)
+
+        with self.assertRaises(ValueError):
+            WorkerSizingPolicy(system(4, 8.0, 6.0), overrides={"threads": 2})
+        with self.assertRaises(ValueError):
+            WorkerSizingPolicy(system(4, 8.0, 6.0), overrides={"extraction_workers": -1})
+
+
+class TestWorkerSizingAdjust(unittest.TestCase):
+    """Test runtime adjustment."""
+
+    def setUp(self):
+        """Plan a 32-core host with the extraction workers pinned."""
+        self.policy = WorkerSizingPolicy(
+            system(32, 64.0, 48.0), overrides={"extraction_workers": 6}
+        )
+
+    def test_memory_pressure_halves_and_idle_recovers(self):
+        """Test RSS over budget halves memory-heavy stages and idle CPU grows them back."""
+        limits = self.policy.adjust(ResourceSample(rss_gb=60.0, available_gb=20.0, cpu_percent=50))
+        self.assertEqual(limits.ocr_workers, 15)
+        self.assertEqual(limits.embedding_batch_size, 32)
+        self.assertEqual(limits.extraction_workers, 6)  # Pinned
+
+        limits = self.policy.adjust(ResourceSample(rss_gb=2.0, available_gb=1.0, cpu_percent=50))
+        self.assertEqual(limits.ocr_workers, 7)  # Free memory below the reserve
+
+        for _ in range(30):
+            limits = self.policy.adjust(
+                ResourceSample(rss_gb=2.0, available_gb=40.0, cpu_percent=10)
+            )
+        self.assertEqual(limits, self.policy.ceiling)
+
+        stats = self.policy.get_statistics()
+        self.assertEqual(stats["overrides"], {"extraction_workers": 6})
+        self.assertEqual(stats["history"][1]["ocr_workers"], 15)
+
+    def test_cpu_saturation_sheds_ocr_worker(self):
+        """Test a saturated CPU removes one OCR worker at a time."""
+        sample = ResourceSample(rss_gb=2.0, available_gb=40.0, cpu_percent=99)
+
+        self.policy.adjust(sample)
+        limits = self.policy.adjust(sample)
+
+        self.assertEqual(limits.ocr_workers, 29)
+        self.assertEqual(limits.embedding_batch_size, 64)
+
+
+class TestConcurrencyLimit(unittest.TestCase):
+    """Test the resizable gate."""
+
+    def test_resize_while_held(self):
+        """Test lowering the limit blocks new holders until enough release."""
+        gate = ConcurrencyLimit(2)
+        gate.acquire()
+        gate.acquire()
+        gate.set_limit(1)
+        gate.release()
+
+        acquired = threading.Event()
+
+        def holder():
+            with gate:
+                acquired.set()
+
+        thread = threading.Thread(target=holder)
+        thread.start()
+        time.sleep(0.05)
+        self.assertFalse(acquired.is_set())  # One holder left, limit 1
+
+        gate.release()
+        thread.join(timeout=1)
+        self.assertTrue(acquired.is_set())
+        self.assertEqual(gate.active, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()